@@ -46,15 +46,17 @@ class FingerprintAuth:
     # 아두이노로부터 시리얼 데이터 수신
     # ####################################
     def read_serial(self, timeout=5):
-        """아두이노로부터 시리얼 데이터를 읽고 출력합니다."""
+        """
+        아두이노로부터 시리얼 데이터를 읽고 출력합니다.
+        in_waiting을 돌며 폴링하지 않고 readline으로 블로킹해, 줄이 도착하면 바로 깨어납니다. (포트 timeout마다 한 번 확인)
+        """
         lines = []
         start_time = time.time()
         while (time.time() - start_time) < timeout:
-            if self.ser.in_waiting > 0:
-                line = self.ser.readline().decode('utf-8', errors='ignore').strip()
-                if line:
-                    lines.append(line)
-                    print(f"  [Arduino]: {line}")
+            line = self.ser.readline().decode('utf-8', errors='ignore').strip()
+            if line:
+                lines.append(line)
+                print(f"  [Arduino]: {line}")
             if lines and ("RESULT:" in lines[-1] or "CMD:" in lines[-1]):
                 break
         return "\n".join(lines)
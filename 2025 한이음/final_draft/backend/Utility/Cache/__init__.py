@@ -0,0 +1,14 @@
+# 이 파일은 'Cache' 폴더를 파이썬 패키지로 만들어줍니다.
+# 비싼 외부 호출(TTS 등)의 결과를 메모리/디스크에 보관하는 공용 캐시 계층입니다.
+
+# 디스크 계층: 재시작 후에도 유지되며 전체 크기 기준으로 오래된 항목을 지웁니다.
+from .imp_disk_store import DiskBytesCache
+# 만료 캐시와 동시 요청 합치기(singleflight): 외부 API 조회 결과를 잠시 공유합니다.
+from .imp_ttl import TTLCache, SingleFlight
+# 공유 상태 저장소: 캐시를 프로세스 안(memory) 또는 워커들이 함께 쓰는 SQLite 파일(sqlite)에 둡니다.
+from .factory import create_state_backend, create_shared_cache
+from .def_interface import ISharedCache, IStateBackend
+from .imp_state_memory import MemoryStateBackend
+from .imp_state_sqlite import SQLiteStateBackend, SQLiteCache
+# 타입 정의: 내용 기반 키 생성 함수와 적중률 통계, state 설정 구조입니다.
+from .def_types import CacheStats, content_key, StateConfig
@@ -0,0 +1,61 @@
+from abc import ABC, abstractmethod
+from typing import Any, Hashable, Optional
+
+from .def_types import CacheStats
+
+
+# --- 공유 캐시 인터페이스 ---
+class ISharedCache(ABC):
+    """
+    상태 저장소(backend) 위의 이름 공간 하나. TTS/날씨 캐시가 이 인터페이스로만 읽고 씁니다.
+    값은 bytes 또는 JSON으로 표현 가능한 값(dict, list, str, 숫자)이어야 합니다.
+    """
+    stats: CacheStats
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[Any]:
+        """값을 반환합니다. 없거나 만료되었으면 None."""
+        pass
+
+    @abstractmethod
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """값을 저장합니다. ttl을 주면 이 항목만 기본 만료 시간 대신 ttl초 뒤 만료됩니다."""
+        pass
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+    async def aget(self, key: Hashable) -> Optional[Any]:
+        """
+        get의 비동기 버전 (이벤트 루프에서 부를 때 사용). 기본 구현은 get을 그대로 부릅니다.
+        파일/네트워크를 거치는 저장소는 이벤트 루프를 막지 않도록 직접 구현합니다.
+        """
+        return self.get(key)
+
+    async def aput(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """put의 비동기 버전. 기본 구현은 put을 그대로 부릅니다."""
+        self.put(key, value, ttl)
+
+
+# --- 상태 저장소 인터페이스 ---
+class IStateBackend(ABC):
+    """이름 공간별 캐시를 만들어 주는 상태 저장소. (memory: 프로세스 안, sqlite: 같은 서버의 워커들이 공유)"""
+    name: str
+
+    @abstractmethod
+    def cache(self, namespace: str, ttl_seconds: Optional[float] = None, max_items: int = 0,
+              max_bytes: int = 0) -> ISharedCache:
+        """
+        이름 공간 하나를 엽니다. 같은 이름이면 같은 인스턴스를 반환합니다.
+        ttl_seconds=None이면 만료 없음, max_items/max_bytes=0이면 해당 상한 없음 (넘치면 가장 오래 안 쓴 항목부터 버림)
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
@@ -0,0 +1,53 @@
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, TypedDict
+
+
+def content_key(*parts: object) -> str:
+    """
+    캐시 키를 내용 기반으로 만듭니다. (content-addressed)
+    같은 (텍스트, 모델, 음성, 포맷) 조합이면 언제나 같은 키가 나옵니다.
+    """
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\x1f")   # 구분자: ("ab", "c")와 ("a", "bc")가 같은 키가 되지 않도록
+    return h.hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """캐시 계층별 적중/미스 통계."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    items: int = 0
+    bytes: int = 0
+
+    def as_dict(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 3) if total else 0.0,
+            "evictions": self.evictions,
+            "items": self.items,
+            "bytes": self.bytes,
+        }
+
+
+# 이름 공간별 상한 덮어쓰기 (state.namespaces.<이름>)
+class NamespaceConfig(TypedDict, total=False):
+    ttl_seconds: float
+    max_items: int
+    max_bytes: int
+
+
+# 공유 상태 저장소 설정 (config.yaml의 state 섹션)
+class StateConfig(TypedDict, total=False):
+    backend: str          # memory | sqlite
+    sqlite_path: str
+    touch_interval_s: float
+    prune_interval_s: float   # 만료/상한 정리 간격 (sqlite)
+    workers: int              # aget/aput을 실행할 저장소 전용 스레드 수 (sqlite)
+    namespaces: Dict[str, NamespaceConfig]
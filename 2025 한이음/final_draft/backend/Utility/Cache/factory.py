@@ -0,0 +1,57 @@
+import os
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from .def_interface import ISharedCache, IStateBackend
+from .imp_state_memory import MemoryStateBackend
+from .imp_state_sqlite import SQLiteStateBackend
+
+# backend 폴더 기준 기본 DB 위치
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEFAULT_STATE_PATH = os.path.join(_BACKEND_DIR, "data", "state.db")
+
+_backend_instance: Optional[IStateBackend] = None
+_namespace_overrides: Dict[str, Dict[str, Any]] = {}
+
+
+def create_state_backend(config: Optional[Dict[str, Any]] = None) -> IStateBackend:
+    """
+    공유 상태 저장소를 생성합니다. (싱글턴)
+    main.py가 설정을 읽은 뒤 엔진보다 먼저 한 번 호출하고, 다른 모듈은 인자 없이 호출해 같은 인스턴스를 받습니다.
+    state.backend: memory(기본, 프로세스마다 따로) | sqlite(같은 서버의 워커들이 파일 하나를 공유)
+    """
+    global _backend_instance
+    if _backend_instance is not None:
+        return _backend_instance
+
+    state_config = (config or {}).get("state") or {}
+    _namespace_overrides.update(state_config.get("namespaces") or {})
+    kind = state_config.get("backend", "memory")
+    if kind == "sqlite":
+        path = state_config.get("sqlite_path") or DEFAULT_STATE_PATH
+        if not os.path.isabs(path):
+            path = os.path.join(_BACKEND_DIR, path)
+        _backend_instance = SQLiteStateBackend(path, touch_interval_s=state_config.get("touch_interval_s", 1.0),
+                                               prune_interval_s=state_config.get("prune_interval_s", 5.0),
+                                               workers=state_config.get("workers", 2))
+    else:
+        if kind != "memory":
+            logger.warning(f"알 수 없는 state.backend '{kind}' → memory를 사용합니다.")
+        _backend_instance = MemoryStateBackend()
+    return _backend_instance
+
+
+def create_shared_cache(namespace: str, ttl_seconds: Optional[float] = None, max_items: int = 0,
+                        max_bytes: int = 0) -> ISharedCache:
+    """
+    공유 상태 저장소의 이름 공간 하나를 엽니다.
+    인자는 호출한 모듈의 기본값이며, state.namespaces.<이름> 에 ttl_seconds/max_items/max_bytes가 있으면 그 값을 씁니다.
+    """
+    override = _namespace_overrides.get(namespace) or {}
+    return create_state_backend().cache(
+        namespace,
+        ttl_seconds=override.get("ttl_seconds", ttl_seconds),
+        max_items=override.get("max_items", max_items),
+        max_bytes=override.get("max_bytes", max_bytes),
+    )
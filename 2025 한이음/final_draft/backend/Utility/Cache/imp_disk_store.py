@@ -0,0 +1,135 @@
+# Backend/Utility/Cache/imp_disk_store.py
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from .def_types import CacheStats
+
+
+class DiskBytesCache:
+    """
+    재시작 후에도 유지되는 디스크 캐시.
+    - 키(해시)별로 파일 하나를 저장하고, 디렉터리 전체 크기가 max_bytes를 넘으면 가장 오래 안 쓴 파일부터 삭제합니다.
+    - 최근 사용 시각은 파일의 mtime으로 기록하므로 재시작해도 LRU 순서가 이어집니다.
+    - 쓰기는 임시 파일 → os.replace 로 원자적으로 처리해, 중간에 죽어도 깨진 파일이 남지 않습니다.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = ".bin") -> None:
+        self.directory = directory
+        self.max_bytes = max(0, int(max_bytes))
+        self.suffix = suffix
+        self._index: Dict[str, Tuple[int, float]] = {}   # key -> (크기, 최근 사용 시각)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+        os.makedirs(self.directory, exist_ok=True)
+        self._scan()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + self.suffix)
+
+    def _scan(self) -> None:
+        """시작 시 디스크에 남아 있는 캐시 파일로 색인을 다시 만듭니다."""
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(".tmp"):
+                    # 이전 실행에서 쓰다 만 임시 파일
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                    continue
+                if not name.endswith(self.suffix):
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                self._index[name[: -len(self.suffix)]] = (st.st_size, st.st_mtime)
+                self._size += st.st_size
+        self._evict()
+        self._update_stats()
+        logger.info(f"디스크 캐시 로드: {self.directory} ({len(self._index)}개, {self._size} bytes)")
+
+    def _update_stats(self) -> None:
+        self.stats.items = len(self._index)
+        self.stats.bytes = self._size
+
+    def _evict(self) -> None:
+        if self._size <= self.max_bytes:
+            return
+        for key, (size, _) in sorted(self._index.items(), key=lambda kv: kv[1][1]):
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            del self._index[key]
+            self._size -= size
+            self.stats.evictions += 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            if key not in self._index:
+                self.stats.misses += 1
+                return None
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            # 외부에서 지워진 경우 색인에서도 제거
+            with self._lock:
+                entry = self._index.pop(key, None)
+                if entry:
+                    self._size -= entry[0]
+                self.stats.misses += 1
+                self._update_stats()
+            return None
+
+        now = time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            if key in self._index:
+                self._index[key] = (self._index[key][0], now)
+            self.stats.hits += 1
+        return data
+
+    def put(self, key: str, value: bytes) -> None:
+        if len(value) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(value)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"디스크 캐시 저장 실패 ({key[:12]}…): {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            old = self._index.get(key)
+            if old:
+                self._size -= old[0]
+            self._index[key] = (len(value), time.time())
+            self._size += len(value)
+            self._evict()
+            self._update_stats()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._index
@@ -0,0 +1,33 @@
+# Backend/Utility/Cache/imp_state_memory.py
+import threading
+from typing import Dict, Optional
+
+from .def_interface import IStateBackend
+from .imp_ttl import TTLCache
+
+
+class MemoryStateBackend(IStateBackend):
+    """
+    프로세스 안에만 두는 상태 저장소. (기본값, 워커 1개일 때 가장 빠름)
+    이름 공간마다 TTLCache 하나를 만들며, 워커가 여러 개면 워커마다 따로 채워집니다.
+    """
+    name = "memory"
+
+    def __init__(self) -> None:
+        self._caches: Dict[str, TTLCache] = {}
+        self._lock = threading.Lock()
+
+    def cache(self, namespace: str, ttl_seconds: Optional[float] = None, max_items: int = 0,
+              max_bytes: int = 0) -> TTLCache:
+        with self._lock:
+            cache = self._caches.get(namespace)
+            if cache is None:
+                cache = TTLCache(ttl_seconds, max_items=max_items, max_bytes=max_bytes)
+                self._caches[namespace] = cache
+            return cache
+
+    def close(self) -> None:
+        with self._lock:
+            for cache in self._caches.values():
+                cache.clear()
+            self._caches.clear()
@@ -0,0 +1,228 @@
+# Backend/Utility/Cache/imp_state_sqlite.py
+import os
+import json
+import time
+import asyncio
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar
+
+from loguru import logger
+
+from .def_interface import ISharedCache, IStateBackend
+from .def_types import CacheStats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace   TEXT NOT NULL,
+    key         TEXT NOT NULL,
+    value       BLOB NOT NULL,
+    is_json     INTEGER NOT NULL,
+    size        INTEGER NOT NULL,
+    expires_at  REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    UNIQUE (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (namespace, accessed_at, size);
+"""
+
+_SELECT = "SELECT value, is_json, expires_at, accessed_at FROM entries WHERE namespace = ? AND key = ?"
+_TOUCH = "UPDATE entries SET accessed_at = ? WHERE namespace = ? AND key = ?"
+_UPSERT = """
+INSERT INTO entries (namespace, key, value, is_json, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(namespace, key) DO UPDATE SET
+    value = excluded.value, is_json = excluded.is_json, size = excluded.size,
+    expires_at = excluded.expires_at, accessed_at = excluded.accessed_at
+"""
+_DELETE = "DELETE FROM entries WHERE namespace = ? AND key = ?"
+_DELETE_EXPIRED = "DELETE FROM entries WHERE namespace = ? AND expires_at <= ?"
+_TOTALS = "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE namespace = ?"
+_OLDEST = "SELECT key, size FROM entries WHERE namespace = ? ORDER BY accessed_at LIMIT ?"
+
+# 만료 없음 (REAL 범위 안의 충분히 먼 시각)
+_NEVER = 1e18
+
+T = TypeVar("T")
+
+
+def _encode_key(key: Hashable) -> str:
+    if isinstance(key, tuple):
+        return "\x1f".join(str(part) for part in key)
+    return str(key)
+
+
+def _encode_value(value: Any) -> Tuple[bytes, int]:
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value), 0
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 1
+
+
+class SQLiteCache(ISharedCache):
+    """
+    SQLite 상태 저장소의 이름 공간 하나. 같은 DB 파일을 여는 모든 워커가 같은 항목을 봅니다.
+    - 만료 시각은 벽시계(time.time) 기준이라 프로세스가 달라도 같은 기준으로 만료됩니다.
+    - 최근 사용 시각은 touch_interval_s보다 오래되었을 때만 갱신해, 자주 읽는 항목이 쓰기 잠금을 잡지 않게 합니다.
+    - 만료 항목 삭제와 상한(max_items/max_bytes) 검사는 쓰기 때 하되, prune_interval_s에 한 번만 합니다.
+      (그 사이에는 상한을 잠시 넘을 수 있고, 만료 항목은 읽을 때 미스로 처리됨)
+    - 이벤트 루프에서는 aget/aput을 씁니다. 저장소 전용 스레드에서 실행되어 busy_timeout 대기가 루프를 막지 않습니다.
+    적중/미스 통계는 프로세스별, items/bytes는 DB 전체 기준입니다.
+    items/bytes는 get/put이 실행되는 스레드에서 prune_interval_s에 한 번 세어 두고, stats는 그 값을 돌려줍니다.
+    (/metrics가 이벤트 루프에서 stats를 읽어도 DB 조회를 하지 않음)
+    """
+
+    def __init__(self, backend: "SQLiteStateBackend", namespace: str, ttl_seconds: Optional[float],
+                 max_items: int = 0, max_bytes: int = 0) -> None:
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl_seconds
+        self.max_items = max_items
+        self.max_bytes = max(0, int(max_bytes))
+        self._stats = CacheStats()
+        self._next_prune = 0.0
+        self._next_count = 0.0
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    def _count(self, conn: sqlite3.Connection, now: float) -> None:
+        """DB 전체 items/bytes를 prune_interval_s에 한 번 세어 stats에 반영합니다."""
+        if now < self._next_count:
+            return
+        self._next_count = now + self.backend.prune_interval_s
+        self._stats.items, self._stats.bytes = conn.execute(_TOTALS, (self.namespace,)).fetchone()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        conn = self.backend._conn()
+        encoded = _encode_key(key)
+        row = conn.execute(_SELECT, (self.namespace, encoded)).fetchone()
+        now = time.time()
+        self._count(conn, now)
+        if row is None or row[2] <= now:
+            self._stats.misses += 1
+            return None
+        value, is_json, _, accessed_at = row
+        if now - accessed_at >= self.backend.touch_interval_s:
+            with conn:
+                conn.execute(_TOUCH, (now, self.namespace, encoded))
+        self._stats.hits += 1
+        return json.loads(value) if is_json else bytes(value)
+
+    async def aget(self, key: Hashable) -> Optional[Any]:
+        return await self.backend.run(self.get, key)
+
+    async def aput(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        await self.backend.run(self.put, key, value, ttl)
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        data, is_json = _encode_value(value)
+        if self.max_bytes and len(data) > self.max_bytes:
+            return
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        expires_at = _NEVER if ttl is None else now + ttl
+        conn = self.backend._conn()
+        with conn:
+            conn.execute(_UPSERT, (self.namespace, _encode_key(key), data, is_json, len(data), expires_at, now))
+            if now >= self._next_prune:
+                self._next_prune = now + self.backend.prune_interval_s
+                self._prune(conn, now)
+                self._next_count = 0.0
+        self._count(conn, now)
+
+    def _prune(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute(_DELETE_EXPIRED, (self.namespace, now))
+        if not (self.max_items or self.max_bytes):
+            return
+        items, size = conn.execute(_TOTALS, (self.namespace,)).fetchone()
+        excess_items = max(0, items - self.max_items) if self.max_items else 0
+        excess_bytes = max(0, size - self.max_bytes) if self.max_bytes else 0
+        if not (excess_items or excess_bytes):
+            return
+        victims: List[str] = []
+        limit = excess_items if not excess_bytes else items
+        for key, entry_size in conn.execute(_OLDEST, (self.namespace, limit)):
+            if len(victims) >= excess_items and excess_bytes <= 0:
+                break
+            victims.append(key)
+            excess_bytes -= entry_size
+        conn.executemany(_DELETE, [(self.namespace, key) for key in victims])
+        self._stats.evictions += len(victims)
+
+    def delete(self, key: Hashable) -> None:
+        conn = self.backend._conn()
+        with conn:
+            conn.execute(_DELETE, (self.namespace, _encode_key(key)))
+
+    def clear(self) -> None:
+        conn = self.backend._conn()
+        with conn:
+            conn.execute("DELETE FROM entries WHERE namespace = ?", (self.namespace,))
+
+
+class SQLiteStateBackend(IStateBackend):
+    """
+    SQLite(WAL 모드) 파일 하나를 같은 서버의 uvicorn 워커들이 함께 쓰는 상태 저장소.
+    워커를 늘려도 TTS/날씨 캐시가 워커 수만큼 나뉘지 않고, 한 워커가 채운 항목을 다른 워커가 그대로 씁니다.
+    (UserStore와 같은 방식: 스레드마다 연결을 따로 두고 busy_timeout으로 쓰기 경합을 기다림)
+    비동기 호출(aget/aput)은 저장소 전용 스레드 풀(workers개)에서 실행합니다.
+    """
+    name = "sqlite"
+
+    def __init__(self, db_path: str, touch_interval_s: float = 1.0, prune_interval_s: float = 5.0,
+                 workers: int = 2) -> None:
+        self.db_path = db_path
+        self.touch_interval_s = touch_interval_s
+        self.prune_interval_s = prune_interval_s
+        self.workers = max(1, workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._caches: Dict[str, SQLiteCache] = {}
+        self._lock = threading.Lock()
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+        logger.info(f"공유 상태 저장소(SQLite) 준비 완료: {db_path}")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=64, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """func를 저장소 전용 스레드에서 실행하고 결과를 기다립니다."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="state-sqlite")
+            executor = self._executor
+        return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+    def cache(self, namespace: str, ttl_seconds: Optional[float] = None, max_items: int = 0,
+              max_bytes: int = 0) -> SQLiteCache:
+        with self._lock:
+            cache = self._caches.get(namespace)
+            if cache is None:
+                cache = SQLiteCache(self, namespace, ttl_seconds, max_items, max_bytes)
+                self._caches[namespace] = cache
+            return cache
+
+    def close(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
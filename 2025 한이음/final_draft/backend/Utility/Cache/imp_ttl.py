@@ -0,0 +1,154 @@
+# Backend/Utility/Cache/imp_ttl.py
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, Optional, Tuple
+
+from .def_interface import ISharedCache
+from .def_types import CacheStats
+
+
+def _size_of(value: Any) -> int:
+    return len(value) if isinstance(value, (bytes, str)) else 0
+
+
+class TTLCache(ISharedCache):
+    """
+    만료 시간(ttl_seconds)이 있는 메모리 캐시. max_items를 넘으면 가장 오래 안 쓴 항목부터 버립니다.
+    날씨 관측값처럼 '잠시 동안은 같은 값을 써도 되는' 외부 조회 결과에 사용합니다.
+    ttl_seconds=None이면 만료 없이 LRU로만 동작하고, max_bytes를 주면 bytes/str 값의 전체 크기로도 상한을 둡니다.
+    (상태 저장소 memory 구현의 이름 공간)
+    """
+
+    def __init__(self, ttl_seconds: Optional[float], max_items: int = 256, max_bytes: int = 0) -> None:
+        self.ttl = ttl_seconds
+        self.max_items = max_items
+        self.max_bytes = max(0, int(max_bytes))
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()   # key -> (만료 시각, 값)
+        self._size = 0
+        self._lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def _remove(self, key: Hashable) -> None:
+        _, value = self._data.pop(key)
+        self._size -= _size_of(value)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+                    self.stats.items = len(self._data)
+                    self.stats.bytes = self._size
+                self.stats.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.stats.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = float("inf") if ttl is None else time.monotonic() + ttl
+        size = _size_of(value)
+        # 한 항목이 전체 상한보다 크면 캐시하지 않음 (다른 항목을 모두 밀어내지 않도록)
+        if self.max_bytes and size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (expires_at, value)
+            self._size += size
+            while (self.max_items and len(self._data) > self.max_items) or \
+                    (self.max_bytes and self._size > self.max_bytes):
+                self._remove(next(iter(self._data)))
+                self.stats.evictions += 1
+            self.stats.items = len(self._data)
+            self.stats.bytes = self._size
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+                self.stats.items = len(self._data)
+                self.stats.bytes = self._size
+
+    def age_of(self, key: Hashable) -> Optional[float]:
+        """항목이 저장된 지 몇 초 지났는지 반환합니다. (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None:
+            return None
+        remaining = entry[0] - time.monotonic()
+        if self.ttl is None or remaining == float("inf"):
+            return None
+        return None if remaining <= 0 else self.ttl - remaining
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._size = 0
+            self.stats.items = 0
+            self.stats.bytes = 0
+
+
+class SingleFlight:
+    """
+    같은 키에 대한 동시 비동기 호출을 하나로 합칩니다. (request coalescing)
+    처음 호출한 쪽만 실제 작업을 실행하고, 그 사이에 들어온 호출은 같은 결과(또는 예외)를 나눠 받습니다.
+    처음 호출한 쪽이 끝나기 전에 취소/중단되면 기다리던 쪽은 abort_error()가 만든 예외를 받습니다.
+    (abort_error가 없으면 기다리던 쪽도 취소됨)
+    """
+
+    def __init__(self, abort_error: Optional[Callable[[], BaseException]] = None) -> None:
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self.abort_error = abort_error
+        self.coalesced = 0   # 다른 호출의 결과를 재사용한 횟수
+
+    async def wait(self, key: Hashable, default: Any = None) -> Any:
+        """같은 키를 이미 실행 중이면 그 결과를 기다려 반환하고, 아니면 default를 바로 반환합니다."""
+        pending = self._inflight.get(key)
+        if pending is None:
+            return default
+        self.coalesced += 1
+        return await asyncio.shield(pending)
+
+    @contextmanager
+    def lead(self, key: Hashable) -> Iterator[asyncio.Future]:
+        """
+        처음 호출한 쪽이 직접 작업을 실행할 때 씁니다. (스트리밍처럼 do()로 감쌀 수 없는 경우)
+        블록 안에서 future.set_result(결과)를 호출해야 하며, 예외로 끝나면 그 예외를,
+        결과 없이 끝나면(취소, 스트림을 중간에 닫음) 중단을 기다리던 쪽에 알립니다.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            yield future
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+                future.exception()   # 기다리는 쪽이 없어도 경고가 남지 않도록 처리 표시
+            raise
+        finally:
+            if not future.done():
+                if self.abort_error is None:
+                    future.cancel()
+                else:
+                    future.set_exception(self.abort_error())
+                    future.exception()
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        with self.lead(key) as future:
+            result = await func()
+            future.set_result(result)
+            return result
@@ -0,0 +1,13 @@
+# 이 파일은 'Intent' 폴더를 파이썬 패키지로 만들어줍니다.
+# 사용자 발화의 민원 목적을 값싼 단계(키워드)부터 비싼 단계(LLM) 순서로 판별합니다.
+
+# 팩토리 함수: 단계들을 조립한 의도 분석 파이프라인을 생성합니다.
+from .factory import create_intent_pipeline, create_keyword_table, create_fuzzy_tier
+# 인터페이스 정의: 각 단계가 따라야 할 설계도(추상 클래스)입니다.
+from .def_interface import IIntentTier
+# 키워드 오토마톤: YAML 키워드 사전을 컴파일한 다중 패턴 매처입니다.
+from .imp_keyword_automaton import KeywordAutomaton, KeywordMatch, KeywordTable
+# 근접 키워드 색인: 자모 편집 거리로 STT 근접 오인식을 정규 키워드로 바로잡습니다.
+from .imp_fuzzy_lexicon import FuzzyLexicon, FuzzyMatch, decompose_jamo
+# 타입 정의: 단계별 결과와 최종 결정, 설정 구조입니다.
+from .def_types import IntentResult, IntentDecision, IntentConfig, UNKNOWN_PURPOSE
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from .def_types import IntentResult
+
+# --- 의도 분석 단계 인터페이스 ---
+class IIntentTier(ABC):
+    """
+    의도 분석 파이프라인의 한 단계(tier)를 위한 인터페이스.
+    값싼 단계(키워드)부터 비싼 단계(LLM) 순서로 호출되며,
+    앞 단계의 후보 결과(hint)를 참고할 수 있습니다.
+    """
+    name: str = "tier"
+
+    def initialize(self) -> None:
+        """모델 로딩 등 시작 시 한 번 필요한 준비 작업. (필요한 단계만 재정의)"""
+        pass
+
+    @abstractmethod
+    async def classify(self, text: str, hint: Optional[IntentResult] = None) -> Optional[IntentResult]:
+        """텍스트의 민원 목적을 판별합니다. 판별하지 못하면 None을 반환합니다."""
+        pass
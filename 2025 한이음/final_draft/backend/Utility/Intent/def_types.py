@@ -0,0 +1,48 @@
+from dataclasses import dataclass, field
+from typing import TypedDict, Optional, Dict, List, Tuple
+
+# 민원 목적을 판별하지 못했을 때 LLM이 돌려주는 표준 문구
+UNKNOWN_PURPOSE = "민원 목적을 알 수 없음"
+
+@dataclass
+class IntentResult:
+    """의도 분석 단계(tier) 하나가 내놓은 결과."""
+    purpose: Optional[str]                  # 예: "주민등록등본 발급 요청"
+    confidence: float                       # 0.0 ~ 1.0
+    tier: str                               # 결과를 낸 단계 이름 (keyword, llm ...)
+    matched_keyword: Optional[str] = None   # 키워드 단계에서 매칭된 원문 키워드
+    spans: List[Tuple[int, int]] = field(default_factory=list)  # 입력 원문 기준 매칭 구간
+
+@dataclass
+class IntentDecision:
+    """파이프라인 최종 결과와 단계별 소요 시간(ms)."""
+    result: Optional[IntentResult]
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+
+# config.yaml 의 intent.embedding 섹션
+class EmbeddingConfig(TypedDict, total=False):
+    enabled: bool
+    model: str
+    backend: str
+    file_name: str
+    min_similarity: float
+
+# config.yaml 의 intent.fuzzy 섹션
+class FuzzyConfig(TypedDict, total=False):
+    enabled: bool
+    max_distance: int
+    min_term_length: int
+    min_score: float
+    max_tokens: int
+    short_term_length: int
+    max_confidence: float
+
+# config.yaml 의 intent 섹션
+class IntentConfig(TypedDict, total=False):
+    min_confidence: float
+    keywords_path: str
+    reload_interval: float
+    llm_model: str
+    llm_timeout: float
+    fuzzy: FuzzyConfig
+    embedding: EmbeddingConfig
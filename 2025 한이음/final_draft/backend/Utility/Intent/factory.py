@@ -0,0 +1,58 @@
+import os
+from typing import Any, Dict, Optional
+
+from .imp_keyword_automaton import KeywordTable
+from .imp_keyword_tier import KeywordIntentTier
+from .imp_fuzzy_tier import FuzzyKeywordIntentTier
+from .imp_embedding_tier import EmbeddingIntentTier
+from .imp_llm_tier import LLMIntentTier
+from .imp_pipeline import IntentPipeline
+
+# 기본 키워드 파일: 이 패키지 폴더의 keywords.yaml
+DEFAULT_KEYWORDS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "keywords.yaml")
+
+_keyword_table_instance: Optional[KeywordTable] = None
+_fuzzy_tier_instance: Optional[FuzzyKeywordIntentTier] = None
+_pipeline_instance: Optional[IntentPipeline] = None
+
+def _intent_config(config: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    return (config or {}).get("intent") or {}
+
+def create_keyword_table(config: Optional[Dict[str, Any]]) -> KeywordTable:
+    """YAML 키워드 파일을 컴파일한 오토마톤 테이블을 생성합니다. (싱글턴, 파일 변경 시 자동 재컴파일)"""
+    global _keyword_table_instance
+    if _keyword_table_instance is None:
+        intent_config = _intent_config(config)
+        _keyword_table_instance = KeywordTable(
+            intent_config.get("keywords_path") or DEFAULT_KEYWORDS_PATH,
+            intent_config.get("reload_interval", 2.0),
+        )
+    return _keyword_table_instance
+
+def create_fuzzy_tier(config: Optional[Dict[str, Any]]) -> Optional[FuzzyKeywordIntentTier]:
+    """근접 키워드 단계를 생성합니다. (싱글턴, 의도 파이프라인과 STT 후처리가 같은 색인을 공유, 꺼져 있으면 None)"""
+    global _fuzzy_tier_instance
+    fuzzy_config = _intent_config(config).get("fuzzy") or {}
+    if not fuzzy_config.get("enabled", True):
+        return None
+    if _fuzzy_tier_instance is None:
+        _fuzzy_tier_instance = FuzzyKeywordIntentTier(create_keyword_table(config), fuzzy_config)
+    return _fuzzy_tier_instance
+
+def create_intent_pipeline(config: Optional[Dict[str, Any]], few_shot_prompt: str,
+                           api_key: Optional[str]) -> IntentPipeline:
+    """키워드 → 근접 키워드 → 로컬 임베딩 → LLM 순서의 의도 분석 파이프라인을 생성합니다. (싱글턴)"""
+    global _pipeline_instance
+    if _pipeline_instance is None:
+        intent_config = _intent_config(config)
+        embedding_config = intent_config.get("embedding") or {}
+        fuzzy_tier = create_fuzzy_tier(config)
+
+        tiers = [KeywordIntentTier(create_keyword_table(config))]
+        if fuzzy_tier is not None:
+            tiers.append(fuzzy_tier)
+        if embedding_config.get("enabled", True):
+            tiers.append(EmbeddingIntentTier(few_shot_prompt, embedding_config))
+        tiers.append(LLMIntentTier(api_key, few_shot_prompt, intent_config))
+        _pipeline_instance = IntentPipeline(tiers, intent_config)
+    return _pipeline_instance
@@ -0,0 +1,91 @@
+# Backend/Utility/Intent/imp_embedding_tier.py
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .def_interface import IIntentTier
+from .def_types import IntentResult, UNKNOWN_PURPOSE
+from ..STT_TTS.imp_offload import run_blocking
+
+# 문장 임베딩 모델은 선택 의존성 (없으면 이 단계는 비활성화되고 LLM으로 넘어감)
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    SentenceTransformer = None
+
+# LLM_PROMPT 의 예시 줄: - "등본 뽑아줘" → "주민등록등본 발급 요청"
+_EXAMPLE_LINE = re.compile(r'^\s*-\s*"(.+?)"\s*→\s*"(.+?)"\s*$', re.MULTILINE)
+
+
+def parse_few_shot_examples(prompt: str) -> List[Tuple[str, str]]:
+    """few-shot 프롬프트에서 (발화, 민원 목적) 예시 쌍을 추출합니다."""
+    return _EXAMPLE_LINE.findall(prompt)
+
+
+class EmbeddingIntentTier(IIntentTier):
+    """
+    few-shot 예시를 시작 시 한 번만 임베딩해 두고, 새 발화를 최근접 이웃 검색으로 분류하는 로컬 단계.
+    - CPU용 소형 문장 임베딩 모델(양자화 ONNX)을 사용하므로 오프라인에서 수 ms 안에 응답합니다.
+    - 가장 가까운 예시와의 코사인 유사도가 min_similarity 미만이면 '모르는 의도'로 보고 None을 반환합니다.
+    - '민원 목적을 알 수 없음' 예시는 음성 예시로만 색인합니다. 가장 가까운 예시가 이쪽이면 유사도와 무관하게
+      None을 반환해, 바로 끝내지 않고 LLM 단계가 판단하게 합니다.
+    """
+    name = "embedding"
+
+    def __init__(self, few_shot_prompt: str, config: Dict[str, Any]) -> None:
+        self.examples = parse_few_shot_examples(few_shot_prompt)
+        self.model_name = config.get("model", "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2")
+        self.backend = config.get("backend", "onnx")
+        self.file_name = config.get("file_name", "onnx/model_qint8_arm64.onnx")
+        self.min_similarity = config.get("min_similarity", 0.75)
+        self.model = None
+        self._matrix: Optional[np.ndarray] = None   # (예시 수, 차원) 정규화된 float32 행렬
+        self._purposes: List[str] = []
+
+    def initialize(self) -> None:
+        """임베딩 모델을 로드하고 예시 문장들을 한 번만 임베딩합니다."""
+        if self.model is not None:
+            return
+        if SentenceTransformer is None:
+            logger.warning("sentence-transformers가 설치되지 않아 임베딩 의도 분석 단계를 건너뜁니다.")
+            return
+        if not self.examples:
+            logger.warning("few-shot 예시가 없어 임베딩 의도 분석 단계를 건너뜁니다.")
+            return
+        try:
+            model_kwargs = {"file_name": self.file_name} if self.backend == "onnx" and self.file_name else None
+            self.model = SentenceTransformer(
+                self.model_name, device="cpu", backend=self.backend, model_kwargs=model_kwargs
+            )
+        except Exception as e:
+            logger.error(f"임베딩 모델 로드 실패 ({self.model_name}): {e}")
+            return
+
+        utterances = [u for u, _ in self.examples]
+        self._purposes = [p for _, p in self.examples]
+        self._matrix = self._encode(utterances)
+        logger.info(f"임베딩 의도 분석 초기화 완료: 예시 {len(utterances)}개, 차원 {self._matrix.shape[1]}")
+
+    def is_initialized(self) -> bool:
+        return self._matrix is not None
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        vectors = self.model.encode(texts, normalize_embeddings=True, convert_to_numpy=True)
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+    def nearest(self, text: str) -> Tuple[str, float]:
+        """가장 가까운 예시의 민원 목적과 코사인 유사도를 반환합니다. (동기)"""
+        query = self._encode([text])[0]
+        scores = self._matrix @ query
+        idx = int(np.argmax(scores))
+        return self._purposes[idx], float(scores[idx])
+
+    async def classify(self, text: str, hint: Optional[IntentResult] = None) -> Optional[IntentResult]:
+        if not self.is_initialized():
+            return None
+        purpose, similarity = await run_blocking(self.nearest, text)
+        if similarity < self.min_similarity or UNKNOWN_PURPOSE in purpose:
+            return None
+        return IntentResult(purpose, round(similarity, 3), self.name)
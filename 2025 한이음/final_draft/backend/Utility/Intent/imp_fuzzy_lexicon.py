@@ -0,0 +1,211 @@
+# Backend/Utility/Intent/imp_fuzzy_lexicon.py
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+# 한글 음절 → 자모 분해 상수 (유니코드 한글 음절 = 0xAC00 + (초성*21 + 중성)*28 + 종성)
+_HANGUL_BASE, _HANGUL_LAST = 0xAC00, 0xD7A3
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+
+# 키워드 뒤에 붙는 조사/어미 (긴 것부터 떼어 봄)
+_SUFFIXES = sorted([
+    "을", "를", "이", "가", "은", "는", "도", "만", "좀", "요", "에", "의", "로", "으로", "에서", "하고",
+    "이랑", "랑", "부터", "까지", "이요", "이에요", "예요", "좀요",
+], key=len, reverse=True)
+
+
+def decompose_jamo(text: str) -> str:
+    """한글 음절을 초성/중성/종성 자모로 풀어 씁니다. ("등본" → "ㄷㅡㅇㅂㅗㄴ", 그 외 글자는 소문자 그대로)"""
+    out = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            index = code - _HANGUL_BASE
+            out.append(_CHOSEONG[index // 588])
+            out.append(_JUNGSEONG[(index // 28) % 21])
+            if index % 28:
+                out.append(_JONGSEONG[index % 28])
+        else:
+            out.append(ch.lower())
+    return "".join(out)
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    인접 전치를 포함한 편집 거리 (Damerau-Levenshtein OSA). limit을 넘으면 limit + 1을 반환합니다.
+    대각선에서 limit 이상 떨어진 칸은 답에 영향을 줄 수 없으므로 그 띠(band) 안만 계산합니다.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    over = limit + 1
+    previous2: List[int] = []
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        current = [over] * (len(b) + 1)
+        if i <= limit:
+            current[0] = i
+        row_min = current[0]
+        ca = a[i - 1]
+        for j in range(max(1, i - limit), min(len(b), i + limit) + 1):
+            cb = b[j - 1]
+            value = previous[j - 1] if ca == cb else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb and previous2[j - 2] + 1 < value:
+                value = previous2[j - 2] + 1
+            current[j] = value if value < over else over
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _deletes(term: str, max_distance: int) -> Set[str]:
+    """term에서 글자를 최대 max_distance개 지운 모든 문자열 (symmetric delete 색인 키)"""
+    found = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {word[:i] + word[i + 1:] for word in frontier for i in range(len(word))}
+        found |= frontier
+    return found
+
+
+@dataclass
+class FuzzyMatch:
+    """원문 기준 구간 [start, end) 이 키워드(keyword)와 자모 편집 거리 distance로 가깝다는 결과."""
+    start: int
+    end: int
+    text: str
+    keyword: str
+    purpose: str
+    distance: int
+    confidence: float
+
+
+class FuzzyLexicon:
+    """
+    키워드 사전의 근접 오인식(예: "가족관개증명서", "주민등록등뽄을")을 정규 키워드로 바로잡는 색인.
+    - 키워드를 자모로 풀어 쓴 뒤, 글자를 max_distance개까지 지운 변형을 모두 미리 색인합니다. (SymSpell 방식)
+      조회 시에는 입력의 삭제 변형만 사전에서 찾아보고, 후보에 대해서만 실제 편집 거리를 계산합니다.
+      삭제 변형은 앞쪽 prefix_length 자모에 대해서만 만들어 색인 크기와 조회 비용을 고정합니다. (SymSpell 기본값 7)
+    - 신뢰도 = 1 - 거리 / 키워드 자모 수. min_score 미만이거나 min_term_length보다 짧은 키워드는 다루지 않습니다.
+      (짧은 키워드는 "공연"/"공원"처럼 한 글자 차이로 다른 단어가 되므로 정확히 일치할 때만 키워드 단계에서 처리)
+    - 허용 거리는 키워드 길이에 따라 줄입니다. short_term_length 글자 이하 키워드는 1까지만 허용합니다.
+      ("오늘날짜"는 "오늘날씨"와 자모 2개 차이지만 다른 말)
+    """
+
+    def __init__(self, keywords: Dict[str, str], max_distance: int = 2, min_term_length: int = 3,
+                 min_score: float = 0.8, max_tokens: int = 3, prefix_length: int = 7,
+                 short_term_length: int = 4) -> None:
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.min_score = min_score
+        self.max_tokens = max_tokens
+        # 자모 문자열 → (원문 키워드, 민원 목적)
+        self._terms: Dict[str, Tuple[str, str]] = {}
+        # 자모 문자열 → 그 키워드에 허용하는 최대 거리
+        self._limits: Dict[str, int] = {}
+        self._index: Dict[str, List[str]] = {}
+        for keyword, purpose in keywords.items():
+            compact = "".join(keyword.split())
+            if len(compact) < min_term_length:
+                continue
+            term = decompose_jamo(compact)
+            if term in self._terms:
+                continue
+            self._terms[term] = (keyword, purpose)
+            self._limits[term] = min(max_distance, 1 if len(compact) <= short_term_length else max_distance)
+            for key in _deletes(term[:prefix_length], max_distance):
+                self._index.setdefault(key, []).append(term)
+        self._lengths = {len(term) for term in self._terms}
+        self.size = len(self._terms)
+
+    def lookup(self, word: str) -> Optional[Tuple[str, str, int, float]]:
+        """공백을 뺀 한 단어에 가장 가까운 키워드를 (키워드, 목적, 거리, 신뢰도)로 반환합니다."""
+        term = decompose_jamo(word)
+        if not any(abs(len(term) - length) <= self.max_distance for length in self._lengths):
+            return None
+        exact = self._terms.get(term)
+        if exact:
+            return exact[0], exact[1], 0, 1.0
+
+        best: Optional[Tuple[str, str, int, float]] = None
+        best_rank: Tuple[int, int] = (self.max_distance + 1, 0)
+        seen: Set[str] = set()
+        for key in _deletes(term[:self.prefix_length], self.max_distance):
+            for candidate in self._index.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                limit = self._limits[candidate]
+                distance = edit_distance(term, candidate, limit)
+                if distance > limit:
+                    continue
+                confidence = 1.0 - distance / len(candidate)
+                if confidence < self.min_score:
+                    continue
+                # 거리가 작을수록, 같으면 긴 키워드일수록 우선
+                if (distance, -len(candidate)) < best_rank:
+                    keyword, purpose = self._terms[candidate]
+                    best, best_rank = (keyword, purpose, distance, round(confidence, 2)), (distance, -len(candidate))
+        return best
+
+    def _strip_suffix(self, word: str) -> List[str]:
+        variants = [word]
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) > len(suffix):
+                variants.append(word[:-len(suffix)])
+        return variants
+
+    def find(self, text: str) -> List[FuzzyMatch]:
+        """
+        공백 단위 단어를 최대 max_tokens개까지 이어 붙여(예: "가족 관개 증명서") 가장 가까운 키워드를 찾습니다.
+        겹치지 않게 신뢰도가 높고 긴 매칭부터 고릅니다.
+        """
+        words: List[Tuple[int, int, str]] = []
+        position = 0
+        for word in text.split():
+            start = text.index(word, position)
+            position = start + len(word)
+            words.append((start, position, word))
+
+        candidates: List[FuzzyMatch] = []
+        for i in range(len(words)):
+            for n in range(1, self.max_tokens + 1):
+                if i + n > len(words):
+                    break
+                start, end = words[i][0], words[i + n - 1][1]
+                joined = "".join(w for _, _, w in words[i:i + n])
+                for variant in self._strip_suffix(joined):
+                    hit = self.lookup(variant)
+                    if hit:
+                        keyword, purpose, distance, confidence = hit
+                        # 떼어 낸 조사는 매칭 구간에서 제외
+                        candidates.append(FuzzyMatch(start, end - (len(joined) - len(variant)), text[start:end],
+                                                     keyword, purpose, distance, confidence))
+                        break
+
+        selected: List[FuzzyMatch] = []
+        for m in sorted(candidates, key=lambda m: (-m.confidence, -(m.end - m.start), m.start)):
+            if all(m.end <= s.start or m.start >= s.end for s in selected):
+                m.text = text[m.start:m.end]
+                selected.append(m)
+        return sorted(selected, key=lambda m: m.start)
+
+    def correct(self, text: str) -> Tuple[str, List[FuzzyMatch]]:
+        """
+        근접 오인식 구간을 정규 키워드로 바꾼 문장과 매칭 목록을 반환합니다.
+        구간과 키워드의 글자(음절) 수가 같을 때만 바꿉니다. 음절 안의 자모만 고치고, 붙어 있던 음절을
+        떨어뜨리거나 덧붙이지 않게 합니다. ("등본 발급해" → "등본 발급" 방지)
+        """
+        matches = [m for m in self.find(text)
+                   if m.distance > 0 and len("".join(m.text.split())) == len("".join(m.keyword.split()))]
+        out = text
+        for m in reversed(matches):
+            out = out[:m.start] + m.keyword + out[m.end:]
+        return out, matches
@@ -0,0 +1,77 @@
+# Backend/Utility/Intent/imp_fuzzy_tier.py
+import threading
+from typing import Any, Dict, Optional
+from loguru import logger
+
+from .def_interface import IIntentTier
+from .def_types import IntentResult
+from .imp_fuzzy_lexicon import FuzzyLexicon
+from .imp_keyword_automaton import KeywordTable
+
+
+class FuzzyKeywordIntentTier(IIntentTier):
+    """
+    키워드 사전과 자모 편집 거리로 가까운 표현(STT 근접 오인식)을 찾아 민원 목적을 판별하는 단계.
+    키워드 단계에서 정확히 맞는 키워드가 없을 때, 비싼 임베딩/LLM 단계 전에 실행됩니다.
+    - 신뢰도 = 키워드 단계와 같은 길이 기준 신뢰도 × 근접 신뢰도(1 - 거리 / 자모 수)
+      대표 매칭이 정확히 일치하지 않으면 max_confidence를 넘지 않게 해, 근접 매칭만으로는 파이프라인을 끝내지 않습니다.
+    - 키워드 파일이 다시 컴파일되면 색인도 다음 호출에서 새로 만듭니다.
+    """
+    name = "fuzzy"
+    AMBIGUITY_PENALTY = 0.6
+
+    def __init__(self, table: KeywordTable, config: Dict[str, Any]) -> None:
+        self.table = table
+        self.max_distance = config.get("max_distance", 2)
+        self.min_term_length = config.get("min_term_length", 3)
+        self.min_score = config.get("min_score", 0.8)
+        self.max_tokens = config.get("max_tokens", 3)
+        self.short_term_length = config.get("short_term_length", 4)
+        self.max_confidence = config.get("max_confidence", 0.65)
+        self._lock = threading.Lock()
+        self._keywords: Optional[Dict[str, str]] = None
+        self._lexicon: Optional[FuzzyLexicon] = None
+
+    def lexicon(self) -> FuzzyLexicon:
+        keywords = self.table.keywords
+        if keywords is not self._keywords:
+            with self._lock:
+                if keywords is not self._keywords:
+                    self._lexicon = FuzzyLexicon(keywords, self.max_distance, self.min_term_length,
+                                                 self.min_score, self.max_tokens,
+                                                 short_term_length=self.short_term_length)
+                    self._keywords = keywords
+        return self._lexicon
+
+    def initialize(self) -> None:
+        self.table.automaton()  # 파일 변경 확인
+        self.lexicon()
+
+    def match(self, text: str) -> Optional[IntentResult]:
+        """동기 매칭 함수. 근접 신뢰도가 가장 높은(같으면 가장 긴) 매칭을 대표 결과로 사용합니다."""
+        self.table.automaton()
+        hits = self.lexicon().find(text)
+        if not hits:
+            return None
+
+        best = max(hits, key=lambda m: (m.confidence, m.end - m.start))
+        confidence = (0.6 + 0.1 * min(len(best.keyword.replace(" ", "")), 4)) * best.confidence
+        if len({m.purpose for m in hits}) > 1:
+            confidence *= self.AMBIGUITY_PENALTY
+        if best.distance > 0:
+            confidence = min(confidence, self.max_confidence)
+        return IntentResult(
+            best.purpose, round(confidence, 2), self.name, best.keyword,
+            spans=[(m.start, m.end) for m in hits],
+        )
+
+    def correct(self, text: str) -> str:
+        """STT 후처리용: 근접 오인식 구간을 정규 키워드로 바꾼 문장을 반환합니다. (의도 판별과 같은 색인 사용)"""
+        self.table.automaton()
+        corrected, matches = self.lexicon().correct(text)
+        if matches:
+            logger.debug(f"근접 키워드 교정: {[(m.text, m.keyword) for m in matches]}")
+        return corrected
+
+    async def classify(self, text: str, hint: Optional[IntentResult] = None) -> Optional[IntentResult]:
+        return self.match(text)
@@ -0,0 +1,168 @@
+# Backend/Utility/Intent/imp_keyword_automaton.py
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+from loguru import logger
+
+
+@dataclass
+class KeywordMatch:
+    """원문 기준 매칭 구간 [start, end) 과 매칭된 키워드/민원 목적."""
+    start: int
+    end: int
+    keyword: str
+    purpose: str
+
+
+def _normalize(text: str) -> Tuple[str, List[int]]:
+    """공백을 제거하고 소문자로 바꾼 문자열과, 각 글자의 원문 위치를 함께 반환합니다."""
+    chars, positions = [], []
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            continue
+        chars.append(ch.lower())
+        positions.append(i)
+    return "".join(chars), positions
+
+
+class KeywordAutomaton:
+    """
+    키워드 사전으로부터 한 번만 컴파일하는 Aho-Corasick 다중 패턴 매칭 오토마톤.
+    입력을 한 번만 훑어 모든 키워드 출현 위치를 찾고, 가장 왼쪽·가장 긴 매칭을 우선합니다.
+    ("건강보험득실확인서"가 "건강보험"보다 먼저 선택됨) 공백은 무시하고 매칭합니다.
+    """
+    def __init__(self, keywords: Dict[str, str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # 노드에서 끝나는 모든 패턴 (길이, 원문 키워드, 목적) - 실패 링크 출력까지 병합
+        self._out: List[List[Tuple[int, str, str]]] = [[]]
+        self.size = 0
+
+        for keyword, purpose in keywords.items():
+            pattern, _ = _normalize(keyword)
+            if pattern:
+                self._add(pattern, keyword, purpose)
+        self._build_fail_links()
+
+    def _add(self, pattern: str, keyword: str, purpose: str) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        if not any(length == len(pattern) for length, _, _ in self._out[node]):
+            self._out[node].append((len(pattern), keyword, purpose))
+            self.size += 1
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> List[KeywordMatch]:
+        """입력을 한 번 훑어 겹치는 것까지 포함한 모든 키워드 출현 위치를 반환합니다."""
+        norm, positions = _normalize(text)
+        matches: List[KeywordMatch] = []
+        node = 0
+        for i, ch in enumerate(norm):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, keyword, purpose in self._out[node]:
+                start = i - length + 1
+                matches.append(KeywordMatch(positions[start], positions[i] + 1, keyword, purpose))
+        return matches
+
+    def longest_matches(self, text: str) -> List[KeywordMatch]:
+        """겹치지 않는 가장 왼쪽·가장 긴 매칭 목록을 반환합니다."""
+        selected: List[KeywordMatch] = []
+        last_end = -1
+        for m in sorted(self.find_all(text), key=lambda m: (m.start, -(m.end - m.start))):
+            if m.start >= last_end:
+                selected.append(m)
+                last_end = m.end
+        return selected
+
+
+def load_keyword_table(path: str) -> Dict[str, str]:
+    """
+    YAML 키워드 파일을 {키워드: 민원 목적} 사전으로 읽습니다.
+    파일 구조: purposes: {민원 목적: [키워드/별칭, ...]}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    table: Dict[str, str] = {}
+    for purpose, keywords in (data.get("purposes") or {}).items():
+        for keyword in keywords or []:
+            table[str(keyword)] = purpose
+    return table
+
+
+class KeywordTable:
+    """
+    YAML 키워드 파일을 오토마톤으로 컴파일해 보관하고, 파일이 바뀌면 서버 재시작 없이 다시 컴파일합니다.
+    파일 수정 시각은 reload_interval 초마다 한 번만 확인하며, 새 오토마톤을 다 만든 뒤 교체합니다.
+    """
+    def __init__(self, path: str, reload_interval: float = 2.0) -> None:
+        self.path = path
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._mtime = 0.0
+        self._checked_at = 0.0
+        self._automaton = KeywordAutomaton({})
+        self.keywords: Dict[str, str] = {}
+        self.reload()
+
+    def reload(self) -> bool:
+        """키워드 파일을 다시 읽어 오토마톤을 교체합니다. 실패하면 기존 오토마톤을 유지합니다."""
+        with self._lock:
+            try:
+                mtime = os.path.getmtime(self.path)
+                keywords = load_keyword_table(self.path)
+                automaton = KeywordAutomaton(keywords)
+            except Exception as e:
+                logger.error(f"키워드 파일 로드 실패 ({self.path}): {e}")
+                return False
+            self.keywords, self._automaton, self._mtime = keywords, automaton, mtime
+            logger.info(f"키워드 오토마톤 컴파일 완료: {automaton.size}개 패턴")
+            return True
+
+    def automaton(self) -> KeywordAutomaton:
+        """현재 오토마톤을 반환합니다. 주기적으로 파일 변경 여부를 확인합니다."""
+        now = time.monotonic()
+        if now - self._checked_at >= self.reload_interval:
+            self._checked_at = now
+            try:
+                changed = os.path.getmtime(self.path) != self._mtime
+            except OSError:
+                changed = False
+            if changed:
+                self.reload()
+        return self._automaton
+
+    def match(self, text: str) -> List[KeywordMatch]:
+        return self.automaton().longest_matches(text)
+
+    def purpose_of(self, text: str) -> Optional[str]:
+        """가장 왼쪽·가장 긴 키워드의 민원 목적을 반환합니다."""
+        matches = self.match(text)
+        if not matches:
+            return None
+        return max(matches, key=lambda m: m.end - m.start).purpose
@@ -0,0 +1,37 @@
+# Backend/Utility/Intent/imp_keyword_tier.py
+from typing import Optional
+
+from .def_interface import IIntentTier
+from .def_types import IntentResult
+from .imp_keyword_automaton import KeywordTable
+
+
+class KeywordIntentTier(IIntentTier):
+    """
+    키워드 오토마톤으로 민원 목적을 즉시 판별하는 결정적(deterministic) 단계.
+    - 긴 키워드일수록 신뢰도가 높습니다. (2글자 0.8, 3글자 0.9, 4글자 이상 1.0)
+    - 서로 다른 목적의 키워드가 함께 등장하면 모호하므로 신뢰도를 낮춰 다음 단계로 넘깁니다.
+    """
+    name = "keyword"
+    AMBIGUITY_PENALTY = 0.6
+
+    def __init__(self, table: KeywordTable) -> None:
+        self.table = table
+
+    def match(self, text: str) -> Optional[IntentResult]:
+        """동기 매칭 함수. 가장 긴 키워드를 대표 결과로 사용합니다."""
+        hits = self.table.match(text)
+        if not hits:
+            return None
+
+        best = max(hits, key=lambda m: m.end - m.start)
+        confidence = 0.6 + 0.1 * min(len(best.keyword.replace(" ", "")), 4)
+        if len({m.purpose for m in hits}) > 1:
+            confidence *= self.AMBIGUITY_PENALTY
+        return IntentResult(
+            best.purpose, round(confidence, 2), self.name, best.keyword,
+            spans=[(m.start, m.end) for m in hits],
+        )
+
+    async def classify(self, text: str, hint: Optional[IntentResult] = None) -> Optional[IntentResult]:
+        return self.match(text)
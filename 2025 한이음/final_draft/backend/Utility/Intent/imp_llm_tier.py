@@ -0,0 +1,56 @@
+# Backend/Utility/Intent/imp_llm_tier.py
+import asyncio
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from .def_interface import IIntentTier
+from .def_types import IntentResult, UNKNOWN_PURPOSE
+from ..OpenAIGateway import create_openai_gateway
+
+SYSTEM_PROMPT = ("너는 공공기관 키오스크 AI야. 사용자 목적만 예시처럼 "
+                 "한 줄로 써줘. 예시 없는 건 '민원 목적을 알 수 없음'만 쓰면 된다.")
+
+
+class LLMIntentTier(IIntentTier):
+    """
+    AsyncOpenAI 채팅 모델로 민원 목적을 요약하는 마지막 단계.
+    이벤트 루프를 막지 않도록 비동기로 호출하며, 시간 초과/오류 시 None을 반환합니다.
+    """
+    name = "llm"
+
+    def __init__(self, api_key: Optional[str], few_shot_prompt: str, config: Dict[str, Any]) -> None:
+        self.client = create_openai_gateway().async_client(api_key)
+        self.few_shot_prompt = few_shot_prompt
+        self.model = config.get("llm_model", "gpt-4o")
+        self.timeout = config.get("llm_timeout", 8.0)
+
+    def _build_user_prompt(self, text: str, hint: Optional[IntentResult]) -> str:
+        if hint and hint.purpose:
+            return f"{self.few_shot_prompt}\n[예상 목적: {hint.purpose}]\n\"{text}\""
+        return f"{self.few_shot_prompt}\n\"{text}\""
+
+    async def classify(self, text: str, hint: Optional[IntentResult] = None) -> Optional[IntentResult]:
+        try:
+            response = await asyncio.wait_for(
+                self.client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": SYSTEM_PROMPT},
+                        {"role": "user", "content": self._build_user_prompt(text, hint)},
+                    ],
+                ),
+                timeout=self.timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"LLM 의도 분석 시간 초과 ({self.timeout}s)")
+            return None
+        except Exception as e:
+            logger.error(f"LLM 의도 분석 실패: {e}")
+            return None
+
+        summary = (response.choices[0].message.content or "").strip().strip('"')
+        if not summary:
+            return None
+        confidence = 0.0 if UNKNOWN_PURPOSE in summary else 0.9
+        return IntentResult(summary, confidence, self.name)
@@ -0,0 +1,53 @@
+# Backend/Utility/Intent/imp_pipeline.py
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from .def_interface import IIntentTier
+from .def_types import IntentDecision, IntentResult, UNKNOWN_PURPOSE
+from ..Metrics import record_stage
+
+
+class IntentPipeline:
+    """
+    값싼 단계부터 순서대로 의도 분석을 수행하는 계층형 파이프라인.
+    어떤 단계의 신뢰도가 min_confidence 이상이면 즉시 종료(short-circuit)하고,
+    그렇지 않으면 지금까지의 최선 결과를 힌트로 다음 단계에 넘깁니다.
+    목적이 없거나 UNKNOWN_PURPOSE인 결과는 "결과 없음"으로 보며, 다른 후보가 하나도 없을 때만 최종 결과로 씁니다.
+    """
+    def __init__(self, tiers: List[IIntentTier], config: Dict[str, Any]) -> None:
+        self.tiers = tiers
+        self.min_confidence = config.get("min_confidence", 0.7)
+
+    def initialize(self) -> None:
+        """각 단계의 준비 작업(임베딩 모델 로딩 등)을 수행합니다. 앱 시작 시 한 번 호출합니다."""
+        for tier in self.tiers:
+            tier.initialize()
+
+    async def classify(self, text: str) -> IntentDecision:
+        best: Optional[IntentResult] = None
+        unknown: Optional[IntentResult] = None
+        timings: Dict[str, float] = {}
+
+        for tier in self.tiers:
+            started_at = time.perf_counter()
+            result = await tier.classify(text, best)
+            elapsed = time.perf_counter() - started_at
+            timings[tier.name] = round(elapsed * 1000, 2)
+            record_stage(f"intent.{tier.name}", elapsed)
+
+            if result is None:
+                continue
+            if not result.purpose or UNKNOWN_PURPOSE in result.purpose:
+                unknown = unknown or result
+                continue
+            # 마지막 단계(LLM)가 실제 목적을 내놓았다면 신뢰도와 무관하게 앞 단계 후보보다 우선합니다.
+            if best is None or result.confidence >= best.confidence or tier is self.tiers[-1]:
+                best = result
+            if best.confidence >= self.min_confidence:
+                break
+
+        best = best or unknown
+        logger.info(f"의도 분석: {best} / 단계별 소요 {timings}")
+        return IntentDecision(best, timings)
@@ -0,0 +1,9 @@
+# 이 파일은 'Metrics' 폴더를 파이썬 패키지로 만들어줍니다.
+# 요청/처리 단계별 소요 시간을 프로세스 내 히스토그램에 기록하고 Prometheus 형식으로 내보냅니다.
+
+# 타이밍 API: with stage("stt"): ... 로 단계 시간을 재고, 미들웨어가 요청 단위로 묶습니다.
+from .imp_timing import stage, record_stage, current_timings, TimingMiddleware
+# 레지스트리: 히스토그램과 캐시 통계 콜백을 모아 /metrics 텍스트를 만듭니다.
+from .imp_registry import REGISTRY, MetricsRegistry, Histogram, DEFAULT_BUCKETS
+# 타입 정의: config.yaml의 metrics 섹션 구조입니다.
+from .def_types import MetricsConfig
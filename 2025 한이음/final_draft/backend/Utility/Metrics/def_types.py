@@ -0,0 +1,8 @@
+from typing import TypedDict
+
+
+class MetricsConfig(TypedDict, total=False):
+    # /metrics 엔드포인트와 요청/단계별 히스토그램 기록 여부
+    enabled: bool
+    # 응답에 Server-Timing 헤더를 붙일지 여부 (브라우저 개발자 도구에서 단계별 시간 확인용)
+    server_timing: bool
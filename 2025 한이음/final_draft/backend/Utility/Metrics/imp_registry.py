@@ -0,0 +1,137 @@
+# Backend/Utility/Metrics/imp_registry.py
+import bisect
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# 키오스크 요청 지연 분포에 맞춘 기본 버킷 (초): 수 ms 키워드 매칭 ~ 수십 초 LLM/STT
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+Labels = Tuple[Tuple[str, str], ...]
+# (라벨, 값) - 수집 시점에 값을 읽어오는 콜백이 반환하는 샘플
+Sample = Tuple[Dict[str, str], float]
+Collector = Callable[[], Iterable[Sample]]
+
+# CacheStats.as_dict() 키 → (메트릭 타입, 설명)
+_CACHE_METRICS = (
+    ("hits", "counter", "캐시 적중 횟수"),
+    ("misses", "counter", "캐시 미스 횟수"),
+    ("evictions", "counter", "용량/만료로 제거된 항목 수"),
+    ("items", "gauge", "현재 보관 중인 항목 수"),
+    ("bytes", "gauge", "현재 보관 중인 바이트 수"),
+)
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+class Histogram:
+    """
+    라벨 조합별 누적 히스토그램. observe()는 이분 탐색 한 번과 짧은 잠금 안의 증가 몇 번이면 끝나므로
+    운영 중에 켜 두어도 부담이 거의 없습니다. (오프로드 스레드에서 동시에 기록해도 값이 유실되지 않도록 잠금)
+    """
+
+    def __init__(self, name: str, help_text: str, buckets: Iterable[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 → [버킷별 개수..., +Inf 개수], 합계, 개수
+        self._series: Dict[Labels, List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            snapshot = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items()]
+        for labels, counts, total, count in sorted(snapshot):
+            cumulative = 0
+            for bound, n in zip(self.buckets, counts):
+                cumulative += n
+                lines.append(f"{self.name}_bucket{_format_labels(labels, ('le', repr(bound)))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(labels, ('le', '+Inf'))} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total:.6f}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    히스토그램과 '수집 시점 콜백'(캐시 적중 카운터 등 다른 모듈이 이미 세고 있는 통계)을 모아
+    Prometheus 텍스트 형식으로 내보냅니다. 콜백은 /metrics 요청 때만 호출되므로 평소 비용이 없습니다.
+    """
+
+    def __init__(self) -> None:
+        self._histograms: Dict[str, Histogram] = {}
+        # 메트릭 이름 → (타입, 설명, 콜백 목록). 같은 이름에 여러 출처(라벨만 다름)를 등록할 수 있음
+        self._collectors: Dict[str, Tuple[str, str, List[Collector]]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, help_text: str, buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        with self._lock:
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = Histogram(name, help_text, buckets)
+            return hist
+
+    def register_collector(self, name: str, metric_type: str, help_text: str, collect: Collector) -> None:
+        """
+        collect()는 (라벨, 값) 목록을 반환합니다. (metric_type: counter | gauge)
+        """
+        with self._lock:
+            entry = self._collectors.setdefault(name, (metric_type, help_text, []))
+            entry[2].append(collect)
+
+    def register_cache_stats(self, cache: str, get_stats: Callable[[], Optional[Dict[str, Any]]]) -> None:
+        """
+        CacheStats.as_dict() 형식의 통계를 kiosk_cache_* 메트릭으로 내보냅니다.
+        get_stats가 None을 반환하면(비활성 계층 등) 해당 캐시는 건너뜁니다.
+        """
+        for key, metric_type, help_text in _CACHE_METRICS:
+            def collect(key: str = key) -> List[Sample]:
+                stats = get_stats()
+                return [({"cache": cache}, stats[key])] if stats else []
+            self.register_collector(f"kiosk_cache_{key}" + ("_total" if metric_type == "counter" else ""),
+                                    metric_type, help_text, collect)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for hist in list(self._histograms.values()):
+            lines.extend(hist.render())
+        for name, (metric_type, help_text, collectors) in list(self._collectors.items()):
+            samples: List[Sample] = []
+            for collect in list(collectors):
+                try:
+                    samples.extend(collect())
+                except Exception:
+                    continue   # 통계 하나를 못 읽어도 /metrics 전체가 실패하지 않도록
+            if not samples:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            for labels, value in samples:
+                lines.append(f"{name}{_format_labels(tuple(sorted(labels.items())))} {value}")
+        return "\n".join(lines) + "\n"
+
+
+# 프로세스 전역 기본 레지스트리
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,99 @@
+# Backend/Utility/Metrics/imp_timing.py
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional, Tuple
+
+from .imp_registry import REGISTRY
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "kiosk_stage_seconds", "처리 단계별 소요 시간 (transcode, stt, stt.post_correction, intent.*, weather.*, tts ...)"
+)
+REQUEST_SECONDS = REGISTRY.histogram(
+    "kiosk_request_seconds", "HTTP 요청 전체 처리 시간 (응답 헤더 전송 시점까지)"
+)
+
+# 현재 요청에서 기록된 (단계, 초) 목록. 미들웨어 밖(백그라운드 작업 등)에서는 None
+_current_timings: ContextVar[Optional[List[Tuple[str, float]]]] = ContextVar("kiosk_timings", default=None)
+
+
+def record_stage(name: str, seconds: float) -> None:
+    """이미 측정된 단계 시간을 기록합니다. (IntentDecision.timings_ms처럼 다른 곳에서 잰 값용)"""
+    STAGE_SECONDS.observe(seconds, stage=name)
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.append((name, seconds))
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """
+    with 블록의 소요 시간을 단계 히스토그램과 현재 요청의 Server-Timing 목록에 기록합니다.
+    블록 안에서 await 해도 되므로 동기/비동기 코드 모두에서 그대로 사용합니다.
+
+        with stage("stt"):
+            text = await _stt.atranscribe(wav_bytes)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - started)
+
+
+def current_timings() -> List[Tuple[str, float]]:
+    return list(_current_timings.get() or ())
+
+
+def _server_timing_value(timings: List[Tuple[str, float]], total: float) -> bytes:
+    # Server-Timing 토큰에는 '.'이 허용되지만 공백/따옴표는 안 되므로 이름은 그대로 사용
+    parts = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings]
+    parts.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(parts).encode("latin-1")
+
+
+class TimingMiddleware:
+    """
+    요청 전체 시간과 단계별 시간을 기록하는 순수 ASGI 미들웨어.
+    (BaseHTTPMiddleware는 요청마다 태스크/스트림을 추가로 만들어 느리므로 사용하지 않음)
+
+    - route 라벨은 매칭된 경로 템플릿을 사용해 라벨 수가 늘어나지 않게 합니다. (매칭 실패 → "unmatched")
+    - server_timing=True이면 응답에 Server-Timing 헤더를 붙입니다. (스트리밍 응답은 첫 바이트 전까지의 단계만 포함)
+    """
+
+    def __init__(self, app, server_timing: bool = False, exclude_paths: Tuple[str, ...] = ("/metrics",)) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.exclude_paths = exclude_paths
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope.get("path") in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+
+        timings: List[Tuple[str, float]] = []
+        token = _current_timings.set(timings)
+        started = time.perf_counter()
+        status = [500]
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+                if self.server_timing:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing",
+                                    _server_timing_value(timings, time.perf_counter() - started)))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_timings.reset(token)
+            route = scope.get("route")
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                route=getattr(route, "path", "unmatched"),
+                status=str(status[0]),
+            )
@@ -0,0 +1,11 @@
+# 이 파일은 'OpenAIGateway' 폴더를 파이썬 패키지로 만들어줍니다.
+# STT/TTS/의도 분석/날씨 요약이 함께 쓰는 OpenAI 호출 관문(공유 연결 풀 + 동시 실행/요청 한도 + 우선순위)입니다.
+
+# 팩토리 함수: 설정을 읽어 공유 관문 인스턴스를 생성합니다.
+from .factory import create_openai_gateway
+# 관문 구현: 공유 클라이언트 발급과 엔드포인트별 제한, 우선순위 지정 컨텍스트입니다.
+from .imp_gateway import OpenAIGateway, request_priority, endpoint_of, DEFAULT_PRIORITY
+# 요청 한도: rate-limit 헤더로 맞추는 토큰 버킷과 우선순위 세마포어입니다.
+from .imp_rate_limit import TokenBucket, PrioritySemaphore, parse_reset
+# 타입 정의: config.yaml의 openai 섹션 구조입니다.
+from .def_types import OpenAIGatewayConfig
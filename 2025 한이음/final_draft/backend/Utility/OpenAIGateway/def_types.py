@@ -0,0 +1,17 @@
+from typing import Dict, TypedDict
+
+
+# config.yaml 의 openai 섹션 (공유 OpenAI 호출 관문)
+class OpenAIGatewayConfig(TypedDict, total=False):
+    # 연결 풀 크기이자 모든 엔드포인트를 합친 동시 요청 수
+    max_connections: int
+    max_keepalive_connections: int
+    keepalive_expiry: float
+    timeout: float
+    max_retries: int
+    # 엔드포인트(stt | tts | chat | responses | other)별 동시 요청 수
+    concurrency: Dict[str, int]
+    # 엔드포인트별 초기 분당 요청 한도 (0이면 응답 헤더를 받을 때까지 제한 없음)
+    requests_per_minute: Dict[str, float]
+    # 엔드포인트별 대기열 우선순위 (작을수록 먼저)
+    priority: Dict[str, int]
@@ -0,0 +1,16 @@
+from typing import Any, Dict, Optional
+
+from .imp_gateway import OpenAIGateway
+
+_gateway_instance: Optional[OpenAIGateway] = None
+
+
+def create_openai_gateway(config: Optional[Dict[str, Any]] = None) -> OpenAIGateway:
+    """
+    공유 OpenAI 호출 관문을 생성합니다. (싱글턴)
+    main.py가 설정을 읽은 뒤 먼저 한 번 호출하고, 다른 모듈은 인자 없이 호출해 같은 인스턴스를 받습니다.
+    """
+    global _gateway_instance
+    if _gateway_instance is None:
+        _gateway_instance = OpenAIGateway((config or {}).get("openai") or {})
+    return _gateway_instance
@@ -0,0 +1,300 @@
+# Backend/Utility/OpenAIGateway/imp_gateway.py
+import time
+import asyncio
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import httpx
+from loguru import logger
+from openai import AsyncOpenAI, OpenAI
+
+from .imp_rate_limit import PrioritySemaphore, TokenBucket, parse_reset
+from ..Metrics import record_stage
+
+# URL 경로 → 엔드포인트 이름 (동시 실행 수/한도/우선순위를 이 단위로 관리)
+_ENDPOINTS = (
+    ("/audio/transcriptions", "stt"),
+    ("/audio/speech", "tts"),
+    ("/chat/completions", "chat"),
+    ("/responses", "responses"),
+)
+DEFAULT_CONCURRENCY = {"stt": 4, "tts": 4, "chat": 8, "responses": 2, "other": 4}
+# 작을수록 먼저: 사용자가 기다리는 STT/TTS → 의도 분석 → 배경 요약
+DEFAULT_PRIORITY = {"stt": 0, "tts": 1, "chat": 2, "responses": 5, "other": 3}
+
+_priority_override: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("openai_priority", default=None)
+
+
+def endpoint_of(path: str) -> str:
+    for suffix, name in _ENDPOINTS:
+        if path.endswith(suffix):
+            return name
+    return "other"
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """이 블록 안에서 보내는 OpenAI 요청의 우선순위를 바꿉니다. (예: 미리 합성하는 안내 문구는 낮게)"""
+    token = _priority_override.set(priority)
+    try:
+        yield
+    finally:
+        _priority_override.reset(token)
+
+
+class _EndpointState:
+    def __init__(self, name: str, concurrency: int, rate_per_minute: float, priority: int) -> None:
+        self.name = name
+        self.priority = priority
+        # 동기/비동기 클라이언트가 같은 자리 수를 나눠 씀
+        self.semaphore = PrioritySemaphore(concurrency)
+        self.bucket = TokenBucket(rate_per_minute)
+        self.requests: Dict[str, int] = {}
+        self.queued_seconds = 0.0
+        self.throttled_seconds = 0.0
+
+    def observe(self, response: httpx.Response) -> None:
+        status = str(response.status_code)
+        self.requests[status] = self.requests.get(status, 0) + 1
+        self.bucket.update(response.headers)
+        if response.status_code == 429:
+            delay = parse_reset(response.headers.get("retry-after")) \
+                or parse_reset(response.headers.get("x-ratelimit-reset-requests")) or 1.0
+            self.bucket.block(delay)
+            logger.warning(f"OpenAI {self.name} 요청 한도 초과(429) → {delay:.1f}초 동안 새 요청을 보류합니다.")
+
+
+class _ReleasingAsyncStream(httpx.AsyncByteStream):
+    """스트리밍 응답(TTS 등)은 본문을 다 읽거나 닫을 때까지 동시 실행 자리를 유지합니다."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _ReleasingSyncStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+def _once(func):
+    done = False
+
+    def wrapper() -> None:
+        nonlocal done
+        if not done:
+            done = True
+            func()
+    return wrapper
+
+
+class _GatedAsyncTransport(httpx.AsyncBaseTransport):
+    def __init__(self, gateway: "OpenAIGateway", inner: httpx.AsyncBaseTransport) -> None:
+        self.gateway = gateway
+        self.inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        state, priority = self.gateway._route(request)
+        started = time.perf_counter()
+        release = await self.gateway._acquire(state, priority)
+        try:
+            queued = time.perf_counter() - started
+            delay = state.bucket.reserve()
+            if delay > 0:
+                state.throttled_seconds += delay
+                await asyncio.sleep(delay)
+            state.queued_seconds += queued
+            record_stage(f"openai.queue.{state.name}", time.perf_counter() - started)
+            response = await self.inner.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        state.observe(response)
+        return httpx.Response(
+            response.status_code, headers=response.headers,
+            stream=_ReleasingAsyncStream(response.stream, release), extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class _GatedSyncTransport(httpx.BaseTransport):
+    """동기 클라이언트용 (CLI/스레드 경로). 비동기 경로와 같은 자리 수와 우선순위 대기열을 씁니다."""
+
+    def __init__(self, gateway: "OpenAIGateway", inner: httpx.BaseTransport) -> None:
+        self.gateway = gateway
+        self.inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        state, priority = self.gateway._route(request)
+        started = time.perf_counter()
+        release = self.gateway._acquire_sync(state, priority)
+        try:
+            delay = state.bucket.reserve()
+            if delay > 0:
+                state.throttled_seconds += delay
+                time.sleep(delay)
+            state.queued_seconds += time.perf_counter() - started
+            response = self.inner.handle_request(request)
+        except BaseException:
+            release()
+            raise
+        state.observe(response)
+        return httpx.Response(
+            response.status_code, headers=response.headers,
+            stream=_ReleasingSyncStream(response.stream, release), extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class OpenAIGateway:
+    """
+    프로세스 전체가 함께 쓰는 OpenAI 호출 관문.
+    - keep-alive 연결 풀 하나(httpx)를 모든 OpenAI/AsyncOpenAI 클라이언트가 공유합니다.
+    - 엔드포인트(stt | tts | chat | responses)별 동시 실행 수 제한 + 우선순위 대기열
+    - 전체 동시 실행 수 = 연결 풀 크기(max_connections): 모든 엔드포인트가 우선순위 대기열 하나를 함께 써서,
+      자리가 모자라면 httpx 풀 안에서 도착 순서로 기다리지 않고 우선순위가 높은 요청(STT/TTS)부터 보냄
+    - 동기/비동기 클라이언트가 같은 자리 수를 나눠 씁니다.
+    - 응답 rate-limit 헤더로 맞추는 토큰 버킷, 429를 받으면 retry-after 동안 새 요청 보류
+      (SDK의 자동 재시도도 이 관문을 거치므로 한도가 풀릴 때까지 기다렸다가 보냄)
+    제한은 HTTP 전송 계층(transport)에서 걸기 때문에 각 모듈은 client()로 받은 클라이언트를 그대로 쓰면 됩니다.
+    """
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        concurrency = {**DEFAULT_CONCURRENCY, **(config.get("concurrency") or {})}
+        priority = {**DEFAULT_PRIORITY, **(config.get("priority") or {})}
+        rate = config.get("requests_per_minute") or {}
+        self.endpoints: Dict[str, _EndpointState] = {
+            name: _EndpointState(name, concurrency.get(name, DEFAULT_CONCURRENCY["other"]),
+                                 rate.get(name, 0), priority.get(name, DEFAULT_PRIORITY["other"]))
+            for name in set(concurrency) | set(priority) | set(rate)
+        }
+        self.timeout = config.get("timeout", 60.0)
+        self.max_retries = config.get("max_retries", 2)
+        max_connections = config.get("max_connections", 20)
+        self.total = PrioritySemaphore(max_connections)
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=config.get("max_keepalive_connections", 10),
+            keepalive_expiry=config.get("keepalive_expiry", 30.0),
+        )
+        self._http_async: Optional[httpx.AsyncClient] = None
+        self._http_sync: Optional[httpx.Client] = None
+        self._async_clients: Dict[Optional[str], AsyncOpenAI] = {}
+        self._sync_clients: Dict[Optional[str], OpenAI] = {}
+        self._lock = threading.Lock()
+
+    def _route(self, request: httpx.Request) -> Tuple[_EndpointState, int]:
+        state = self.endpoints.get(endpoint_of(request.url.path)) or self.endpoints["other"]
+        override = _priority_override.get()
+        return state, state.priority if override is None else override
+
+    # --- 동시 실행 자리: 엔드포인트 자리 → 전체 자리 순서로 얻고, 반대 순서로 돌려줌 ---
+    def _releaser(self, state: _EndpointState):
+        def release() -> None:
+            self.total.release()
+            state.semaphore.release()
+        return _once(release)
+
+    async def _acquire(self, state: _EndpointState, priority: int):
+        await state.semaphore.acquire(priority)
+        try:
+            await self.total.acquire(priority)
+        except BaseException:
+            state.semaphore.release()
+            raise
+        return self._releaser(state)
+
+    def _acquire_sync(self, state: _EndpointState, priority: int):
+        state.semaphore.acquire_sync(priority)
+        try:
+            self.total.acquire_sync(priority)
+        except BaseException:
+            state.semaphore.release()
+            raise
+        return self._releaser(state)
+
+    # --- 공유 연결 풀 ---
+    def _async_http(self) -> httpx.AsyncClient:
+        if self._http_async is None:
+            self._http_async = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=_GatedAsyncTransport(self, httpx.AsyncHTTPTransport(limits=self._limits)),
+            )
+        return self._http_async
+
+    def _sync_http(self) -> httpx.Client:
+        if self._http_sync is None:
+            self._http_sync = httpx.Client(
+                timeout=self.timeout,
+                transport=_GatedSyncTransport(self, httpx.HTTPTransport(limits=self._limits)),
+            )
+        return self._http_sync
+
+    def async_client(self, api_key: Optional[str] = None) -> AsyncOpenAI:
+        """공유 연결 풀을 쓰는 AsyncOpenAI 클라이언트 (API 키별로 하나, base_url은 OPENAI_BASE_URL을 따름)"""
+        with self._lock:
+            client = self._async_clients.get(api_key)
+            if client is None:
+                client = AsyncOpenAI(api_key=api_key, http_client=self._async_http(), max_retries=self.max_retries)
+                self._async_clients[api_key] = client
+            return client
+
+    def sync_client(self, api_key: Optional[str] = None) -> OpenAI:
+        """공유 연결 풀을 쓰는 동기 OpenAI 클라이언트"""
+        with self._lock:
+            client = self._sync_clients.get(api_key)
+            if client is None:
+                client = OpenAI(api_key=api_key, http_client=self._sync_http(), max_retries=self.max_retries)
+                self._sync_clients[api_key] = client
+            return client
+
+    # --- 상태 ---
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """엔드포인트별 상태와 전체 자리(total) 사용량"""
+        return {
+            "total": {"in_flight": self.total.in_use, "queued": self.total.waiting, "limit": self.total.limit},
+            **{name: {
+                "in_flight": state.semaphore.in_use,
+                "queued": state.semaphore.waiting,
+                "requests": dict(state.requests),
+                "queued_seconds": round(state.queued_seconds, 3),
+                "throttled_seconds": round(state.throttled_seconds, 3),
+                "rate_limit_per_minute": state.bucket.capacity,
+            } for name, state in sorted(self.endpoints.items())},
+        }
+
+    async def aclose(self) -> None:
+        if self._http_async is not None:
+            await self._http_async.aclose()
+            self._http_async = None
+        if self._http_sync is not None:
+            self._http_sync.close()
+            self._http_sync = None
+        self._async_clients.clear()
+        self._sync_clients.clear()
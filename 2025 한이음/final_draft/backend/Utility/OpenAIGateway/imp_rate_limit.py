@@ -0,0 +1,185 @@
+# Backend/Utility/OpenAIGateway/imp_rate_limit.py
+import re
+import time
+import asyncio
+import heapq
+import itertools
+import threading
+from typing import List, Mapping, Optional, Tuple
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_UNIT_SECONDS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    """OpenAI 리셋 시간 표기("1s", "6m0s", "120ms", "0.5")를 초 단위로 바꿉니다."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(number) * _UNIT_SECONDS[unit] for number, unit in parts)
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> Optional[int]:
+    try:
+        return int(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    요청 수 기준 토큰 버킷. 응답의 rate-limit 헤더로 한도/남은 양을 계속 맞춥니다.
+    - x-ratelimit-limit-requests: 용량, 초당 충전량 = 용량 / window_s
+    - x-ratelimit-remaining-requests: 남은 토큰 (보낸 뒤 아직 응답이 없는 요청까지 반영해 더 작은 값을 사용)
+    - 429 응답: retry-after(또는 리셋 시간) 동안 토큰을 0으로 묶어 맹목적인 재시도를 막습니다.
+    한도를 모르는 동안(rate_per_minute=0, 헤더 전)에는 제한하지 않습니다.
+    스레드/이벤트 루프 양쪽에서 쓰므로 reserve()는 대기 시간만 계산하고 실제 대기는 호출한 쪽이 합니다.
+    """
+
+    def __init__(self, rate_per_minute: float = 0.0, window_s: float = 60.0) -> None:
+        self.window_s = window_s
+        self.capacity = float(rate_per_minute)
+        self.tokens = float(rate_per_minute)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def limited(self) -> bool:
+        return self.capacity > 0 or self._blocked_until > time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        if self.capacity > 0:
+            self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.capacity / self.window_s)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고, 예약이 유효해질 때까지 기다려야 할 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self.capacity <= 0:
+                return wait
+            self._refill(now)
+            self.tokens -= 1.0
+            if self.tokens < 0:
+                wait = max(wait, -self.tokens * self.window_s / self.capacity)
+            return wait
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        limit = _int_header(headers, "x-ratelimit-limit-requests")
+        remaining = _int_header(headers, "x-ratelimit-remaining-requests")
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if limit:
+                self.capacity = float(limit)
+            if remaining is not None and self.capacity > 0:
+                self.tokens = min(self.tokens, float(remaining))
+
+    def block(self, seconds: float) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._refill(now)
+            self.tokens = min(self.tokens, 0.0)
+
+
+class _Waiter:
+    """대기자 하나. 이벤트 루프 대기자는 future, 스레드 대기자는 Event로 깨웁니다."""
+    __slots__ = ("future", "loop", "event", "state")
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+        self.loop = loop
+        self.future = loop.create_future() if loop is not None else None
+        self.event = threading.Event() if loop is None else None
+        self.state = "waiting"  # waiting | granted | abandoned
+
+    def wake(self) -> bool:
+        """자리를 넘겨줍니다. 루프가 이미 닫혀 깨울 수 없으면 False."""
+        if self.event is not None:
+            self.event.set()
+            return True
+        try:
+            self.loop.call_soon_threadsafe(_resolve, self.future)
+            return True
+        except RuntimeError:
+            return False
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class PrioritySemaphore:
+    """
+    우선순위가 있는 세마포어. 자리가 없으면 (우선순위, 도착 순서)가 작은 대기자부터 깨웁니다.
+    대화형 STT/TTS가 배경 작업(날씨 요약 등)보다 먼저 자리를 얻게 하는 데 사용합니다.
+    이벤트 루프(acquire)와 스레드(acquire_sync)가 같은 자리 수를 나눠 쓰고, release는 어느 쪽에서 불러도 됩니다.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._available = limit
+        self._waiters: List[Tuple[int, int, _Waiter]] = []
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    @property
+    def in_use(self) -> int:
+        return self.limit - self._available
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if waiter.state == "waiting")
+
+    def _try_acquire(self, priority: int, loop: Optional[asyncio.AbstractEventLoop]) -> Optional[_Waiter]:
+        """바로 자리를 얻으면 None, 아니면 대기열에 넣은 대기자를 반환합니다."""
+        with self._lock:
+            if self._available > 0 and not self.waiting:
+                self._available -= 1
+                return None
+            waiter = _Waiter(loop)
+            heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+            return waiter
+
+    async def acquire(self, priority: int = 0) -> None:
+        waiter = self._try_acquire(priority, asyncio.get_running_loop())
+        if waiter is None:
+            return
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.state == "granted"
+                waiter.state = "abandoned"
+            # 자리를 넘겨받은 직후 취소되었다면 다음 대기자에게 다시 넘김
+            if granted:
+                self.release()
+            raise
+
+    def acquire_sync(self, priority: int = 0) -> None:
+        """스레드용 acquire. 자리를 얻을 때까지 현재 스레드를 막습니다."""
+        waiter = self._try_acquire(priority, None)
+        if waiter is not None:
+            waiter.event.wait()
+
+    def release(self) -> None:
+        with self._lock:
+            while self._waiters:
+                _, _, waiter = heapq.heappop(self._waiters)
+                if waiter.state != "waiting":
+                    continue
+                waiter.state = "granted"
+                if waiter.wake():
+                    return
+                waiter.state = "abandoned"
+            self._available += 1
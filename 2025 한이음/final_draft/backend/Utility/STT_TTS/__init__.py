@@ -3,10 +3,21 @@
 # 이 파일에 정의된 것들을 간편하게 가져올 수 있도록 설정합니다.
 
 # 팩토리 함수: 각 모듈(STT, TTS, VAD)의 인스턴스를 생성하고 설정을 로드합니다.
-from .factory import create_stt, create_tts, create_vad, load_config, setup_logging
+from .factory import create_stt, create_tts, create_vad, create_segmenter, create_transcoder, load_config, setup_logging
 # 인터페이스 정의: 각 모듈이 따라야 할 설계도(추상 클래스)입니다.
-from .def_interface import ISTT, ITTS, IVAD
+from .def_interface import ISTT, ITTS, IVAD, IFrameScorer
+# STT 장애 대체: 원격 STT가 느리거나 실패하면 로컬 Whisper(int8)로 넘깁니다.
+from .imp_stt_failover import FailoverSTT
+from .imp_stt_whisper_local import LocalWhisperSTT
+# STT 입력 검사: 앞뒤 무음을 자르고 음성이 없는 녹음은 STT 호출 없이 건너뜁니다.
+from .imp_audio_gate import SilenceGatedSTT, EnergyGate
+# 긴 녹음 분할 전사: 쉬는 구간에서 잘라 동시에 전사하고 순서대로 이어 붙입니다.
+from .imp_stt_chunked import ChunkedSTT, plan_chunks, merge_transcripts
+# 헤지 요청/서킷 브레이커: 느린 원격 호출은 한 번 더 보내고, 연속 실패하면 바로 실패(또는 대체)합니다.
+from .imp_resilience import ResilientSTT, ResilientTTS, CircuitBreaker, LatencyTracker
+# TTS 캐시 래퍼: 같은 문장의 합성 결과를 메모리/디스크에서 재사용합니다.
+from .imp_tts_cached import CachedTTS
 # 사용자 정의 예외: 이 패키지에서 발생할 수 있는 특정 오류들을 정의합니다.
-from .def_exceptions import KioskException, TranscriptionError, TTSError, VADStreamError
+from .def_exceptions import KioskException, TranscriptionError, TTSError, TranscodeError, VADStreamError
 # 타입 정의: 설정 파일(config.yaml)의 구조를 미리 정의하여 코드 안정성을 높입니다.
 from .def_types import AppConfig
\ No newline at end of file
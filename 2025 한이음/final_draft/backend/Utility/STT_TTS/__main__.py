@@ -0,0 +1,263 @@
+# Backend/Utility/STT_TTS/__main__.py
+"""
+STT 엔진 비교 도구. (backend 폴더에서 실행)
+
+    python -m Utility.STT_TTS eval <테스트셋 폴더> [--engines remote local failover] [--repeat 1] [--json out.json]
+    python -m Utility.STT_TTS correction-bench [--corpus transcripts.txt] [--rules corrections.yaml]
+
+eval: 테스트셋 폴더에는 <이름>.wav 와 정답 문장 <이름>.txt (UTF-8) 를 짝지어 둡니다.
+      엔진별로 지연 시간(p50/p95, 실시간 배율)과 단어 오류율(WER)/글자 오류율(CER)을 출력합니다.
+correction-bench: 컴파일된 후처리기(PostCorrector)와 예전 방식(규칙마다 re.sub)의 결과를 비교하고
+      문장당 처리 시간을 측정합니다. 규칙을 늘렸을 때의 추세는 --extra-rules 로 확인합니다.
+"""
+import os
+import re
+import sys
+import json
+import time
+import wave
+import random
+import asyncio
+import argparse
+from typing import Dict, List, Tuple
+
+from .factory import load_config, create_transcoder, create_fuzzy_corrector
+from .def_interface import ISTT
+from .imp_stt_openai import SpeechToText as OpenAiSTT
+from .imp_stt_whisper_local import LocalWhisperSTT
+from .imp_stt_failover import FailoverSTT
+from .imp_post_correction import PostCorrector, load_correction_rules, DEFAULT_CORRECTIONS_PATH
+
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEFAULT_CONFIG = os.path.join(_BACKEND_DIR, "..", "config.yaml")
+
+
+def _normalize(text: str) -> str:
+    # 문장부호/대소문자 차이는 오류로 세지 않음
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", "", text.lower())).strip()
+
+
+def _edit_distance(ref: List[str], hyp: List[str]) -> int:
+    previous = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (r != h))
+        previous = current
+    return previous[-1]
+
+
+def load_testset(directory: str) -> List[Tuple[str, bytes, float, str]]:
+    """(이름, WAV 바이트, 길이(초), 정답) 목록을 반환합니다."""
+    items = []
+    for name in sorted(os.listdir(directory)):
+        stem, ext = os.path.splitext(name)
+        reference_path = os.path.join(directory, stem + ".txt")
+        if ext.lower() != ".wav" or not os.path.exists(reference_path):
+            continue
+        with open(os.path.join(directory, name), "rb") as f:
+            audio = f.read()
+        with wave.open(os.path.join(directory, name), "rb") as wf:
+            seconds = wf.getnframes() / wf.getframerate()
+        with open(reference_path, "r", encoding="utf-8") as f:
+            items.append((stem, audio, seconds, f.read().strip()))
+    return items
+
+
+def build_engines(config, names: List[str]) -> Tuple[Dict[str, ISTT], List[ISTT]]:
+    """
+    비교할 엔진들과, 닫아야 할 실제 엔진 목록을 반환합니다.
+    failover는 remote/local 인스턴스를 함께 쓰므로, 닫기는 실제 엔진(remote, local)마다 한 번만 합니다.
+    """
+    stt_config = config["stt"]
+    engines: Dict[str, ISTT] = {}
+    fuzzy_correct = create_fuzzy_corrector(config)
+    remote = OpenAiSTT(stt_config, fuzzy_correct) if {"remote", "failover"} & set(names) else None
+    local = None
+    if {"local", "failover"} & set(names):
+        local = LocalWhisperSTT(
+            {**(stt_config.get("local") or {}), "enabled": True},
+            language=OpenAiSTT._normalize_lang(stt_config.get("language_code", "ko"), "ko"),
+            initial_prompt=remote._build_prompt() if remote else None,
+            post_correct=remote._post_correction if remote else fuzzy_correct,
+        )
+    for name in names:
+        if name == "remote":
+            engines[name] = remote
+        elif name == "local":
+            engines[name] = local
+        elif name == "failover":
+            engines[name] = FailoverSTT(remote, local, stt_config.get("failover") or {}, create_transcoder(config))
+    for engine in engines.values():
+        engine.initialize()
+    return engines, [engine for engine in (remote, local) if engine is not None]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float("nan")
+
+
+async def evaluate(engine: ISTT, testset, repeat: int) -> Dict[str, object]:
+    latencies, rtfs, rows = [], [], []
+    word_edits = word_total = char_edits = char_total = errors = 0
+    for _ in range(repeat):
+        for stem, audio, seconds, reference in testset:
+            started = time.perf_counter()
+            try:
+                hypothesis = await engine.atranscribe(audio, "wav")
+            except Exception as e:
+                errors += 1
+                rows.append({"file": stem, "error": str(e)})
+                continue
+            elapsed = time.perf_counter() - started
+            latencies.append(elapsed)
+            rtfs.append(elapsed / seconds if seconds else 0.0)
+
+            ref, hyp = _normalize(reference), _normalize(hypothesis)
+            w = _edit_distance(ref.split(), hyp.split())
+            c = _edit_distance(list(ref.replace(" ", "")), list(hyp.replace(" ", "")))
+            word_edits += w
+            word_total += len(ref.split())
+            char_edits += c
+            char_total += len(ref.replace(" ", ""))
+            rows.append({"file": stem, "ms": round(elapsed * 1000, 1), "reference": reference,
+                         "hypothesis": hypothesis, "word_errors": w, "char_errors": c})
+    return {
+        "files": len(testset) * repeat,
+        "errors": errors,
+        "p50_ms": round(_percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(_percentile(latencies, 0.95) * 1000, 1),
+        "rtf": round(sum(rtfs) / len(rtfs), 3) if rtfs else None,
+        "wer": round(word_edits / word_total, 4) if word_total else None,
+        "cer": round(char_edits / char_total, 4) if char_total else None,
+        "rows": rows,
+    }
+
+
+async def run_eval(args: argparse.Namespace) -> None:
+    testset = load_testset(args.testset)
+    if not testset:
+        raise SystemExit(f"{args.testset} 에 (wav, txt) 짝이 없습니다.")
+    engines, owned = build_engines(load_config(args.config), args.engines)
+    total_seconds = sum(item[2] for item in testset)
+    print(f"테스트셋 {len(testset)}개 ({total_seconds:.1f}초), 반복 {args.repeat}회\n")
+    print(f"{'engine':<10}{'files':>7}{'err':>5}{'p50 ms':>10}{'p95 ms':>10}{'RTF':>8}{'WER':>8}{'CER':>8}")
+
+    results = {}
+    for name, engine in engines.items():
+        result = await evaluate(engine, testset, args.repeat)
+        results[name] = result
+        fmt = lambda v, spec: format(v, spec) if v is not None else "-"
+        print(f"{name:<10}{result['files']:>7}{result['errors']:>5}{result['p50_ms']:>10.1f}{result['p95_ms']:>10.1f}"
+              f"{fmt(result['rtf'], '>8.3f')}{fmt(result['wer'], '>8.1%')}{fmt(result['cer'], '>8.1%')}")
+        if isinstance(engine, FailoverSTT):
+            print(f"{'':<10}{json.dumps(engine.stats(), ensure_ascii=False)}")
+    # 모든 엔진 평가가 끝난 뒤 공유 엔진을 한 번씩만 닫음 (failover를 먼저 닫으면 뒤의 remote/local이 닫힌 채로 평가됨)
+    for engine in owned:
+        engine.close()
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+
+# ---------------------------------------------------------------- 후처리 parity/벤치마크
+_FILLERS = ["저기요", "네", "음", "좀", "해주세요", "주세요", "지금", "오늘", "여기서", "뽑아", "필요해요",
+            "어디서", "하려고요", "알려줘", "Print", "KIOSK", "그리고", "발급", "서류"]
+
+
+def sequential_correction(rules: Dict[str, str], text: str) -> str:
+    """예전 SpeechToText._post_correction 과 같은 동작 (규칙마다 문장 전체를 다시 훑음, parity 기준)"""
+    out = text
+    for wrong, right in rules.items():
+        out = re.sub(re.escape(wrong), right, out, flags=re.IGNORECASE)
+    return re.sub(r"\s+", " ", out).strip()
+
+
+def synthetic_corpus(rules: Dict[str, str], size: int, seed: int = 13) -> List[str]:
+    """규칙 표현/정답 표현/일상어를 섞은 가짜 전사 문장 (절반 정도는 치환 대상이 없는 문장)"""
+    rng = random.Random(seed)
+    phrases = list(rules) + sorted(set(rules.values()))
+    corpus = []
+    for _ in range(size):
+        words = [rng.choice(_FILLERS) for _ in range(rng.randint(2, 8))]
+        for _ in range(rng.choice([0, 0, 1, 1, 2])):
+            words.insert(rng.randint(0, len(words)), rng.choice(phrases))
+        corpus.append((" " if rng.random() < 0.9 else "  ").join(words))
+    return corpus
+
+
+def _extra_rules(count: int, seed: int = 29) -> Dict[str, str]:
+    # 실제로는 거의 맞지 않는 한글 표현 (규칙 수 증가에 따른 비용 측정용)
+    rng = random.Random(seed)
+    return {"".join(chr(rng.randint(0xAC00, 0xD7A3)) for _ in range(rng.randint(2, 5))): "날씨"
+            for _ in range(count)}
+
+
+def _time_per_line_us(func, corpus: List[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for line in corpus:
+            func(line)
+        best = min(best, time.perf_counter() - started)
+    return best / len(corpus) * 1e6
+
+
+def run_correction_bench(args: argparse.Namespace) -> None:
+    rules = load_correction_rules(args.rules)
+    if args.corpus:
+        with open(args.corpus, "r", encoding="utf-8") as f:
+            corpus = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        corpus = synthetic_corpus(rules, args.size)
+
+    corrector = PostCorrector(rules)
+    diffs = [(line, sequential_correction(rules, line), corrector.apply(line)) for line in corpus]
+    diffs = [d for d in diffs if d[1] != d[2]]
+    print(f"규칙 {len(rules)}개, 문장 {len(corpus)}개 → 결과 일치 {len(corpus) - len(diffs)}/{len(corpus)}")
+    for line, old, new in diffs[:args.show]:
+        print(f"  입력 '{line}'\n    예전 '{old}'\n    현재 '{new}'")
+
+    print(f"\n{'rules':>7}{'re.sub x N (µs/문장)':>24}{'compiled (µs/문장)':>22}{'배율':>8}")
+    for extra in [0] + args.extra_rules:
+        table = {**rules, **_extra_rules(extra)} if extra else rules
+        compiled = PostCorrector(table)
+        old_us = _time_per_line_us(lambda t: sequential_correction(table, t), corpus, args.repeat)
+        new_us = _time_per_line_us(compiled.apply, corpus, args.repeat)
+        print(f"{len(table):>7}{old_us:>24.2f}{new_us:>22.2f}{old_us / new_us:>7.1f}x")
+    if diffs:
+        sys.exit(1)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog="python -m Utility.STT_TTS")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_eval = sub.add_parser("eval", help="STT 엔진별 지연 시간/정확도 비교")
+    p_eval.add_argument("testset", help="<이름>.wav + <이름>.txt 가 들어 있는 폴더")
+    p_eval.add_argument("--engines", nargs="+", choices=["remote", "local", "failover"],
+                        default=["remote", "local"])
+    p_eval.add_argument("--config", default=DEFAULT_CONFIG, help="config.yaml 경로")
+    p_eval.add_argument("--repeat", type=int, default=1)
+    p_eval.add_argument("--json", help="파일별 결과를 JSON으로 저장")
+
+    p_bench = sub.add_parser("correction-bench", help="후처리 치환 parity 확인 및 벤치마크")
+    p_bench.add_argument("--rules", default=DEFAULT_CORRECTIONS_PATH, help="치환 규칙 YAML")
+    p_bench.add_argument("--corpus", help="한 줄에 전사 문장 하나 (없으면 가짜 문장 생성)")
+    p_bench.add_argument("--size", type=int, default=5000, help="가짜 문장 수")
+    p_bench.add_argument("--repeat", type=int, default=3)
+    p_bench.add_argument("--extra-rules", type=int, nargs="*", default=[200, 500], help="추가로 붙일 규칙 수")
+    p_bench.add_argument("--show", type=int, default=10, help="출력할 불일치 예시 수")
+
+    args = parser.parse_args(argv)
+    if args.command == "eval":
+        asyncio.run(run_eval(args))
+    else:
+        run_correction_bench(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -10,6 +10,10 @@ class TTSError(KioskException):
     """TTS(텍스트->음성) 생성 또는 재생 실패 시 발생하는 전용 예외"""
     pass
 
+class TranscodeError(KioskException):
+    """ffmpeg 오디오 포맷 변환 실패 시 발생하는 전용 예외"""
+    pass
+
 class VADStreamError(KioskException):
     """VAD 마이크 스트림(입력)에서 오류 발생 시 던져지는 전용 예외"""
     pass
\ No newline at end of file
@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Generator, Optional, Coroutine
+from typing import AsyncIterator, Generator, Optional, Coroutine
+
+import numpy as np
+
+from .imp_offload import run_blocking
 
 # --- 기본 모델 인터페이스 ---
 class IModel(ABC):
@@ -27,11 +31,32 @@ class ISTT(IModel):
     """
     STT(Speech-to-Text) 모듈을 위한 인터페이스.
     """
+    # 엔진이 변환 없이 그대로 받을 수 있는 오디오 컨테이너 목록 (기본: WAV만 허용)
+    SUPPORTED_FORMATS: frozenset = frozenset({"wav"})
+
     @abstractmethod
-    def transcribe(self, audio_bytes: bytes) -> str:
-        """오디오 바이트를 텍스트로 변환하는 메서드."""
+    def transcribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        """오디오 바이트를 텍스트로 변환하는 메서드. audio_format은 컨테이너 이름(wav, webm, ogg 등)."""
         pass
 
+    async def atranscribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        """
+        transcribe의 비동기 버전. 기본 구현은 동기 transcribe를 제한된 스레드 풀로 오프로드합니다.
+        비동기 클라이언트를 가진 엔진은 이 메서드를 직접 구현합니다.
+        """
+        return await run_blocking(self.transcribe, audio_bytes, audio_format)
+
+    def supported_formats(self) -> frozenset:
+        """엔진이 직접 받을 수 있는 오디오 포맷 목록을 반환합니다. (포맷 협상용)"""
+        return self.SUPPORTED_FORMATS
+
+    def accepts_raw_upload(self) -> bool:
+        """
+        True면 업로드 원본을 그대로 받아 직접 풀고 엔진 포맷으로 협상합니다. (무음 검사 래퍼 등)
+        호출 측은 포맷 협상을 건너뛰고 원본과 그 포맷을 넘깁니다.
+        """
+        return False
+
 # --- TTS 인터페이스 ---
 # 웹 환경에 맞게, 음성을 직접 재생하는 'speak' 대신
 # 음성 데이터(bytes)를 생성하여 반환하는 'synthesize'로 메서드를 변경합니다.
@@ -39,11 +64,28 @@ class ITTS(IModel):
     """
     TTS(Text-to-Speech) 모듈을 위한 인터페이스.
     """
+    # synthesize가 반환하는 오디오 컨테이너 (캐시 키와 응답 media_type에 사용)
+    AUDIO_FORMAT: str = "mp3"
+
     @abstractmethod
     def synthesize(self, text: str) -> bytes:
         """텍스트를 음성 데이터(bytes)로 변환하여 반환하는 메서드."""
         pass
 
+    async def asynthesize(self, text: str) -> bytes:
+        """
+        synthesize의 비동기 버전. 기본 구현은 동기 synthesize를 제한된 스레드 풀로 오프로드합니다.
+        비동기 클라이언트를 가진 엔진은 이 메서드를 직접 구현합니다.
+        """
+        return await run_blocking(self.synthesize, text)
+
+    async def astream_synthesize(self, text: str) -> AsyncIterator[bytes]:
+        """
+        합성된 오디오를 청크 단위로 내보내는 비동기 제너레이터.
+        기본 구현은 asynthesize 결과를 한 번에 내보내며, 스트리밍 응답을 지원하는 엔진은 직접 구현합니다.
+        """
+        yield await self.asynthesize(text)
+
 # --- VAD 인터페이스 ---
 class IVAD(IModel):
     """
@@ -52,4 +94,24 @@ class IVAD(IModel):
     @abstractmethod
     async def listen(self) -> Optional[bytes]:
         """음성이 감지될 때까지 비동기 대기하고, 감지된 오디오 데이터를 반환합니다."""
-        pass
\ No newline at end of file
+        pass
+
+# --- VAD 프레임 판정 인터페이스 ---
+class IFrameScorer(ABC):
+    """
+    고정 길이 16bit PCM 프레임 하나의 '음성일 확률'(0~1)을 계산하는 인터페이스. (UtteranceSegmenter가 사용)
+    threshold보다 높으면 음성 프레임으로 봅니다.
+    """
+    name: str = "base"
+    sample_rate: int = 16000
+    frame_length: int = 512
+    threshold: float = 0.5
+
+    @abstractmethod
+    def score(self, frame: np.ndarray) -> float:
+        """프레임(int16, frame_length 샘플)의 음성 확률을 반환합니다."""
+        pass
+
+    def close(self) -> None:
+        """판정기가 잡은 리소스를 해제합니다. (기본: 없음)"""
+        pass
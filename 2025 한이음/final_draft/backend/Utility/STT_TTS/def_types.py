@@ -1,4 +1,4 @@
-from typing import TypedDict, Optional
+from typing import TypedDict, Optional, List
 
 # class STTConfig(TypedDict):
 #     api_url: str
@@ -10,27 +10,118 @@ from typing import TypedDict, Optional
 #     sample_rate: int
 #     device: str
 
+# 로컬 Whisper(faster-whisper, CTranslate2) 대체 엔진 설정
+class LocalSTTConfig(TypedDict, total=False):
+    enabled: bool
+    model: str
+    compute_type: str
+    cpu_threads: int
+    num_workers: int
+    beam_size: int
+    download_root: str
+
+# 원격 → 로컬 STT 장애 대체 정책
+class STTFailoverConfig(TypedDict, total=False):
+    latency_budget_s: float
+    timeout_s: float
+    failure_threshold: int
+    cooldown_s: float
+
+# STT 호출 전 무음 검사 (앞뒤 무음 제거, 빈 녹음 건너뛰기)
+class STTGateConfig(TypedDict, total=False):
+    enabled: bool
+    energy_threshold_db: float
+    frame_ms: int
+    min_speech_ms: int
+    padding_ms: int
+    decode_compressed: bool
+
+# 긴 녹음 구간 분할 전사 (쉬는 구간에서 잘라 동시에 전사)
+class STTChunkedConfig(TypedDict, total=False):
+    enabled: bool
+    min_duration_s: float
+    min_chunk_s: float
+    max_chunk_s: float
+    min_pause_ms: int
+    energy_threshold_db: float
+    frame_ms: int
+    overlap_ms: int
+    max_parallel: int
+    max_overlap_words: int
+    decode_compressed: bool
+
+# 헤지 요청 + 서킷 브레이커 설정 (STT/TTS 공통)
+class ResilienceConfig(TypedDict, total=False):
+    enabled: bool
+    hedge: bool
+    deadline_multiplier: float
+    min_deadline_s: float
+    max_deadline_s: float
+    initial_deadline_s: float
+    window: int
+    quantile: float
+    min_samples: int
+    max_hedge_ratio: float
+    attempt_timeout_s: float
+    failure_threshold: int
+    reset_timeout_s: float
+
 # STT 설정 타입을 OpenAI Whisper 모델에 맞게 수정합니다.
 class STTConfig(TypedDict):
     model: str
     language_code: str
+    fuzzy_correction: bool
+    local: LocalSTTConfig
+    failover: STTFailoverConfig
+    gate: STTGateConfig
+    chunked: STTChunkedConfig
+    resilience: ResilienceConfig
+
+# TTS 합성 결과 캐시 설정 (메모리 LRU + 디스크)
+class TTSCacheConfig(TypedDict, total=False):
+    enabled: bool
+    memory_max_mb: float
+    disk_dir: str
+    disk_max_mb: float
+    prewarm: List[str]
+    prewarm_background: bool
+    prewarm_concurrency: int
 
 # TTS 설정 타입을 OpenAI TTS 모델에 맞게 수정합니다.
 class TTSConfig(TypedDict):
     model: str
     voice: str
+    cache: TTSCacheConfig
+    resilience: ResilienceConfig
     
 class VADConfig(TypedDict):
     threshold: float
     min_silence_duration_ms: int
     hardware_rate: int
     # rate: int
+    # 스트리밍 STT(/ws/stt) 발화 분리 설정
+    engine: str
+    energy_threshold_db: float
+    pre_roll_ms: int
+    min_speech_ms: int
+    max_utterance_ms: int
+
+# 업로드 오디오 변환(ffmpeg 파이프) 설정
+class AudioConfig(TypedDict, total=False):
+    ffmpeg_path: str
+    sample_rate: int
+    transcode_workers: int
+    transcode_timeout: int
+    prefer_opus: bool
+    opus_bitrate: str
 
-class GeneralConfig(TypedDict):
+class GeneralConfig(TypedDict, total=False):
     timezone: str
+    offload_workers: int
 
 class AppConfig(TypedDict):
     stt: STTConfig
     tts: TTSConfig
     vad: VADConfig
+    audio: AudioConfig
     general: GeneralConfig
\ No newline at end of file
@@ -1,19 +1,28 @@
 import yaml
 import sys
 from loguru import logger
-from typing import Optional
+from typing import Callable, Optional
 
 # 각 모듈의 실제 구현 클래스를 가져옵니다.
 from .imp_stt_openai import SpeechToText as OpenAiSTT
+from .imp_stt_whisper_local import LocalWhisperSTT
+from .imp_stt_failover import FailoverSTT
+from .imp_audio_gate import SilenceGatedSTT
+from .imp_stt_chunked import ChunkedSTT
+from .imp_resilience import ResilientSTT, ResilientTTS
 # 아래 줄의 클래스 이름을 TextToSpeech로 수정했습니다.
 from .imp_tts_openai import TextToSpeech as OpenAiTTS
 from .imp_vad_cobra import VoiceActivityDetector as CobraVAD
+from .imp_transcoder_ffmpeg import AudioTranscoder
+from .imp_tts_cached import CachedTTS
+from .imp_vad_segmenter import UtteranceSegmenter, create_frame_scorer
 
 from .def_interface import ISTT, ITTS, IVAD
 from .def_types import AppConfig
 
 _stt_instance: Optional[ISTT] = None
 _tts_instance: Optional[ITTS] = None
+_transcoder_instance: Optional[AudioTranscoder] = None
 
 def load_config(config_path: str) -> AppConfig:
     """YAML 설정 파일을 로드하고 AppConfig 타입으로 반환합니다."""
@@ -22,23 +31,107 @@ def load_config(config_path: str) -> AppConfig:
     return config
 
 def create_stt(config: AppConfig) -> ISTT:
-    """STT 모듈 인스턴스를 생성합니다. (싱글턴)"""
+    """
+    STT 모듈 인스턴스를 생성합니다. (싱글턴)
+    stt.local.enabled면 로컬 Whisper를 대체 엔진으로 붙인 FailoverSTT를 반환하고,
+    OPENAI_API_KEY가 없으면 로컬 엔진만 사용합니다.
+    stt.resilience.enabled면 원격 STT에 헤지 요청/서킷 브레이커(ResilientSTT)를 적용합니다.
+    로컬 대체 엔진이 있으면 FailoverSTT가 지연 예산(로컬과 경쟁)/연속 실패 차단/시간 제한을 맡으므로
+    ResilientSTT를 겹쳐 쓰지 않습니다. (겹치면 브레이커와 시간 제한이 둘이 되고, 헤지 + 로컬 경쟁으로
+    한 녹음을 동시에 세 번 전사할 수 있음)
+    stt.gate.enabled(기본)면 앞뒤 무음을 자르고 빈 녹음을 걸러내는 SilenceGatedSTT로 한 번 더 감쌉니다.
+    stt.chunked.enabled면 가장 바깥에서 긴 녹음을 쉬는 구간 단위로 나눠 동시에 전사합니다. (ChunkedSTT)
+    """
     global _stt_instance
     if _stt_instance is None:
-        _stt_instance = OpenAiSTT(config['stt'])
+        stt_config = config['stt']
+        gate_config = stt_config.get('gate') or {}
+        chunk_config = stt_config.get('chunked') or {}
+        _stt_instance = _create_stt_engine(config)
+        if gate_config.get('enabled', True):
+            _stt_instance = SilenceGatedSTT(_stt_instance, gate_config, create_transcoder(config))
+        if chunk_config.get('enabled', False):
+            _stt_instance = ChunkedSTT(_stt_instance, chunk_config, create_transcoder(config))
     return _stt_instance
 
+def _resilient_stt(stt: ISTT, stt_config) -> ISTT:
+    resilience_config = stt_config.get('resilience') or {}
+    if not resilience_config.get('enabled', False):
+        return stt
+    return ResilientSTT(stt, resilience_config)
+
+def create_fuzzy_corrector(config: AppConfig) -> Optional[Callable[[str], str]]:
+    """STT 후처리에 쓸 근접 키워드 교정 함수 (stt.fuzzy_correction, intent.fuzzy.enabled가 모두 켜져 있을 때)"""
+    if not config['stt'].get('fuzzy_correction', True):
+        return None
+    # 함수 안에서 가져옴: Intent의 임베딩 단계가 이 패키지의 imp_offload를 쓰므로 모듈 수준에서는 순환 import
+    from ..Intent import create_fuzzy_tier
+    fuzzy_tier = create_fuzzy_tier(config)
+    return fuzzy_tier.correct if fuzzy_tier is not None else None
+
+def _create_stt_engine(config: AppConfig) -> ISTT:
+    stt_config = config['stt']
+    local_config = stt_config.get('local') or {}
+    fuzzy_correct = create_fuzzy_corrector(config)
+    if not local_config.get('enabled', False):
+        return _resilient_stt(OpenAiSTT(stt_config, fuzzy_correct), stt_config)
+
+    try:
+        remote: Optional[OpenAiSTT] = OpenAiSTT(stt_config, fuzzy_correct)
+    except ValueError as e:
+        logger.warning(f"원격 STT를 만들 수 없어 로컬 STT만 사용합니다: {e}")
+        remote = None
+
+    # 로컬 엔진도 같은 도메인 용어 힌트와 후처리 사전을 사용
+    local = LocalWhisperSTT(
+        local_config,
+        language=OpenAiSTT._normalize_lang(stt_config.get('language_code', 'ko'), 'ko'),
+        initial_prompt=remote._build_prompt() if remote else None,
+        post_correct=remote._post_correction if remote else fuzzy_correct,
+    )
+    if remote is None:
+        return local
+    return FailoverSTT(remote, local, stt_config.get('failover') or {}, create_transcoder(config))
+
 def create_tts(config: AppConfig) -> ITTS:
-    """TTS 모듈 인스턴스를 생성합니다. (싱글턴)"""
+    """
+    TTS 모듈 인스턴스를 생성합니다. (싱글턴)
+    tts.resilience.enabled면 헤지 요청/서킷 브레이커(ResilientTTS)를, tts.cache.enabled면 그 바깥에 캐시 래퍼를 씌웁니다.
+    """
     global _tts_instance
     if _tts_instance is None:
-        _tts_instance = OpenAiTTS(config['tts'])
+        tts: ITTS = OpenAiTTS(config['tts'])
+        resilience_config = config['tts'].get('resilience') or {}
+        if resilience_config.get('enabled', False):
+            tts = ResilientTTS(tts, resilience_config)
+        cache_config = config['tts'].get('cache') or {}
+        if cache_config.get('enabled', False):
+            tts = CachedTTS(tts, cache_config)
+        _tts_instance = tts
     return _tts_instance
 
 def create_vad(config: AppConfig, device_index: Optional[int] = None) -> IVAD:
     """VAD 모듈 인스턴스를 생성합니다."""
     return CobraVAD(config['vad'], device_index)
 
+def create_segmenter(config: AppConfig) -> UtteranceSegmenter:
+    """스트리밍 STT 세션용 발화 분리기를 생성합니다. (세션마다 새 인스턴스, Cobra 실패 시 에너지 VAD)"""
+    vad_config = config.get('vad') or {}
+    return UtteranceSegmenter(
+        create_frame_scorer(vad_config),
+        min_silence_duration_ms=vad_config.get('min_silence_duration_ms', 1000),
+        pre_roll_ms=vad_config.get('pre_roll_ms', 200),
+        min_speech_ms=vad_config.get('min_speech_ms', 250),
+        max_utterance_ms=vad_config.get('max_utterance_ms', 15000),
+    )
+
+def create_transcoder(config: AppConfig) -> AudioTranscoder:
+    """업로드 오디오 변환기 인스턴스를 생성합니다. (싱글턴)"""
+    global _transcoder_instance
+    if _transcoder_instance is None:
+        _transcoder_instance = AudioTranscoder(config.get('audio') or {})
+    return _transcoder_instance
+
 def setup_logging() -> None:
     """loguru 로거를 설정합니다."""
     logger.remove()
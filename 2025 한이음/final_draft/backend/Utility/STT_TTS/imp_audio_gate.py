@@ -0,0 +1,210 @@
+# Backend/Utility/STT_TTS/imp_audio_gate.py
+import io
+import time
+import wave
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from .def_interface import ISTT
+from .imp_transcoder_ffmpeg import pcm_to_wav, pick_decoded
+from ..Metrics import record_stage
+
+
+def frame_levels_db(samples: np.ndarray, frame_length: int) -> np.ndarray:
+    """16bit 샘플을 frame_length 단위 프레임으로 나눠 프레임별 RMS 에너지(dBFS)를 반환합니다. (남는 꼬리는 버림)"""
+    n_frames = len(samples) // frame_length
+    frames = samples[:n_frames * frame_length].astype(np.float32).reshape(n_frames, frame_length) / 32768.0
+    rms = np.sqrt(np.mean(frames * frames, axis=1))
+    return 20.0 * np.log10(np.maximum(rms, 1e-10))
+
+
+@dataclass
+class GateResult:
+    """무음 검사 결과. pcm은 앞뒤 무음을 잘라낸 16bit 모노 PCM입니다."""
+    pcm: bytes
+    sample_rate: int
+    has_speech: bool
+    input_ms: float
+    output_ms: float
+    voiced_ms: float
+
+
+class EnergyGate:
+    """
+    프레임 RMS 에너지(dBFS)로 녹음의 앞뒤 무음을 잘라내고, 음성이 없는 녹음을 걸러냅니다.
+    - 프레임 dBFS가 energy_threshold_db보다 크면 음성 프레임 (vad.energy_threshold_db 와 같은 기준)
+    - 음성 프레임이 min_speech_ms 미만이면 '음성 없음'
+    - 처음/마지막 음성 프레임 앞뒤로 padding_ms를 남겨 자음/숨소리가 잘리지 않게 합니다.
+    프레임 에너지는 numpy로 한 번에 계산하므로 10초 녹음도 1ms 안팎입니다.
+    """
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.threshold_db = config.get("energy_threshold_db", -45.0)
+        self.frame_ms = config.get("frame_ms", 30)
+        self.min_speech_ms = config.get("min_speech_ms", 150)
+        self.padding_ms = config.get("padding_ms", 200)
+
+    def analyze(self, pcm: bytes, sample_rate: int) -> GateResult:
+        samples = np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], dtype=np.int16)
+        input_ms = len(samples) * 1000.0 / sample_rate
+        frame_length = max(1, int(sample_rate * self.frame_ms / 1000))
+        n_frames = len(samples) // frame_length
+        if n_frames == 0:
+            return GateResult(b"", sample_rate, False, input_ms, 0.0, 0.0)
+
+        db = frame_levels_db(samples, frame_length)
+        voiced = np.flatnonzero(db > self.threshold_db)
+        voiced_ms = len(voiced) * self.frame_ms
+        if voiced_ms < self.min_speech_ms:
+            return GateResult(b"", sample_rate, False, input_ms, 0.0, voiced_ms)
+
+        padding = int(sample_rate * self.padding_ms / 1000)
+        start = max(0, voiced[0] * frame_length - padding)
+        end = min(len(samples), (voiced[-1] + 1) * frame_length + padding)
+        trimmed = samples[start:end]
+        return GateResult(trimmed.tobytes(), sample_rate, True, input_ms, len(trimmed) * 1000.0 / sample_rate, voiced_ms)
+
+
+def _read_wav(audio_bytes: bytes) -> Optional[Tuple[bytes, int]]:
+    """16bit 모노 WAV면 (PCM, 샘플레이트)를, 아니면 None을 반환합니다."""
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+            if wf.getsampwidth() != 2 or wf.getnchannels() != 1:
+                return None
+            return wf.readframes(wf.getnframes()), wf.getframerate()
+    except (wave.Error, EOFError):
+        return None
+
+
+class SilenceGatedSTT(ISTT):
+    """
+    STT 엔진 앞에서 녹음을 검사하는 래퍼.
+    - 음성이 없는 녹음은 네트워크 호출 없이 빈 결과("")를 바로 반환합니다.
+      (OpenAI STT는 결과가 짧으면 한 번 더 재시도하므로, 빈 녹음 하나가 유료 요청 두 번이 되던 문제)
+    - 음성이 있으면 앞뒤 무음을 잘라낸 WAV를, 잘라낸 구간이 없으면 원본 업로드를 넘깁니다.
+      transcoder가 있으면 여기서 한 번만 엔진과 포맷을 협상합니다. (prefer_opus면 Opus로)
+      그래서 업로드 원본을 그대로 받으며(accepts_raw_upload), 압축 업로드는 검사용으로 한 번 푼 뒤
+      ffmpeg를 다시 띄우지 않습니다. (엔진이 원본 포맷을 받으면 원본, 아니면 풀어 둔/잘라낸 WAV)
+    - WAV가 아닌 업로드(webm 등)는 decode_compressed일 때만 PCM으로 풀어서 검사하고, 아니면 그대로 넘깁니다.
+    """
+
+    def __init__(self, inner: ISTT, config: Dict[str, Any], transcoder=None) -> None:
+        self.inner = inner
+        self.transcoder = transcoder
+        self.gate = EnergyGate(config)
+        self.decode_compressed = config.get("decode_compressed", True)
+        self._stats: Dict[str, float] = {
+            "checked": 0,
+            "skipped": 0,
+            "passthrough": 0,
+            "input_seconds": 0.0,
+            "trimmed_seconds": 0.0,
+        }
+
+    # --- 생명주기는 내부 엔진에 위임 ---
+    def initialize(self) -> None:
+        self.inner.initialize()
+
+    def is_initialized(self) -> bool:
+        return self.inner.is_initialized()
+
+    def supported_formats(self) -> frozenset:
+        return self.inner.supported_formats()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def accepts_raw_upload(self) -> bool:
+        return self.transcoder is not None
+
+    def stats(self) -> Dict[str, float]:
+        return dict(self._stats)
+
+    # --- 검사 ---
+    def _check(self, wav_bytes: bytes) -> Optional[GateResult]:
+        parsed = _read_wav(wav_bytes)
+        if parsed is None:
+            return None
+        started = time.perf_counter()
+        result = self.gate.analyze(*parsed)
+        record_stage("stt.gate", time.perf_counter() - started)
+
+        self._stats["checked"] += 1
+        self._stats["input_seconds"] += result.input_ms / 1000
+        self._stats["trimmed_seconds"] += (result.input_ms - result.output_ms) / 1000
+        if not result.has_speech:
+            self._stats["skipped"] += 1
+            logger.info(f"음성이 없는 녹음이라 STT를 건너뜁니다. ({result.input_ms:.0f}ms, 음성 {result.voiced_ms:.0f}ms)")
+        elif result.output_ms < result.input_ms:
+            logger.debug(f"앞뒤 무음 제거: {result.input_ms:.0f}ms → {result.output_ms:.0f}ms")
+        return result
+
+    def _trimmed_wav(self, result: GateResult) -> Optional[bytes]:
+        """잘라낸 구간이 한 프레임도 안 되면 None (원본을 그대로 보내는 편이 업로드가 작음)"""
+        if result.input_ms - result.output_ms < self.gate.frame_ms:
+            return None
+        return pcm_to_wav(result.pcm, result.sample_rate)
+
+    def _source(self, result: Optional[GateResult], audio_bytes: bytes, audio_format: str) -> Tuple[bytes, str]:
+        """엔진에 넘길 오디오: 잘라낸 구간이 있으면 잘라낸 WAV, 없으면 원본 업로드"""
+        trimmed = self._trimmed_wav(result) if result is not None else None
+        if result is None:
+            self._stats["passthrough"] += 1
+        return (trimmed, "wav") if trimmed is not None else (audio_bytes, audio_format)
+
+    def _ready(self, result: Optional[GateResult], audio_bytes: bytes, audio_format: str,
+               wav_bytes: Optional[bytes], decoded: bool) -> Tuple[Tuple[bytes, str], bool]:
+        """엔진에 넘길 (오디오, 포맷)과 transcoder로 협상할지 여부. 이미 ffmpeg로 풀었으면 다시 띄우지 않음"""
+        source = self._source(result, audio_bytes, audio_format)
+        if self.transcoder is None:
+            return source, False
+        if decoded and wav_bytes is not None:
+            wav = source[0] if source[1] == "wav" else wav_bytes
+            picked = pick_decoded(source[0], source[1], wav, self.inner.supported_formats())
+            if picked is not None:
+                return picked, False
+        return source, True
+
+    async def atranscribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        wav_bytes = audio_bytes if audio_format == "wav" else None
+        if wav_bytes is None and self.decode_compressed and self.transcoder is not None:
+            wav_bytes = (await self.transcoder.ato_wav(audio_bytes)).audio_bytes
+            return await self.atranscribe_decoded(audio_bytes, audio_format, wav_bytes, decoded=True)
+        return await self.atranscribe_decoded(audio_bytes, audio_format, wav_bytes)
+
+    async def atranscribe_decoded(self, audio_bytes: bytes, audio_format: str, wav_bytes: Optional[bytes],
+                                  decoded: bool = False) -> str:
+        """
+        이미 풀어 둔 WAV(wav_bytes, 없으면 None)로 검사한 뒤 엔진에 넘깁니다.
+        decoded면 이 녹음을 푸느라 ffmpeg를 이미 띄운 것이므로 협상(재인코딩) 없이 원본이나 WAV를 보냅니다.
+        """
+        result = self._check(wav_bytes) if wav_bytes is not None else None
+        if result is not None and not result.has_speech:
+            return ""
+        (audio_bytes, audio_format), negotiate = self._ready(result, audio_bytes, audio_format, wav_bytes, decoded)
+        if negotiate:
+            converted = await self.transcoder.aprepare(audio_bytes, f"audio/{audio_format}", self.inner.supported_formats())
+            audio_bytes, audio_format = converted.audio_bytes, converted.audio_format
+        return await self.inner.atranscribe(audio_bytes, audio_format)
+
+    def transcribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        wav_bytes = audio_bytes if audio_format == "wav" else None
+        if wav_bytes is None and self.decode_compressed and self.transcoder is not None:
+            wav_bytes = self.transcoder.to_wav(audio_bytes).audio_bytes
+            return self.transcribe_decoded(audio_bytes, audio_format, wav_bytes, decoded=True)
+        return self.transcribe_decoded(audio_bytes, audio_format, wav_bytes)
+
+    def transcribe_decoded(self, audio_bytes: bytes, audio_format: str, wav_bytes: Optional[bytes],
+                           decoded: bool = False) -> str:
+        """atranscribe_decoded의 동기 버전"""
+        result = self._check(wav_bytes) if wav_bytes is not None else None
+        if result is not None and not result.has_speech:
+            return ""
+        (audio_bytes, audio_format), negotiate = self._ready(result, audio_bytes, audio_format, wav_bytes, decoded)
+        if negotiate:
+            converted = self.transcoder.prepare(audio_bytes, f"audio/{audio_format}", self.inner.supported_formats())
+            audio_bytes, audio_format = converted.audio_bytes, converted.audio_format
+        return self.inner.transcribe(audio_bytes, audio_format)
@@ -0,0 +1,43 @@
+# Backend/Utility/STT_TTS/imp_offload.py
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from loguru import logger
+
+# 동기(블로킹) 엔진 호출을 이벤트 루프 밖에서 실행하기 위한 공용 스레드 풀
+_executor: Optional[ThreadPoolExecutor] = None
+_max_workers = 4
+
+
+def configure_offload(max_workers: int) -> None:
+    """오프로드 스레드 풀 크기를 설정합니다. 첫 사용 전에 호출해야 적용됩니다."""
+    global _max_workers
+    _max_workers = max(1, int(max_workers))
+
+
+def get_offload_executor() -> ThreadPoolExecutor:
+    """크기가 제한된 오프로드 스레드 풀을 반환합니다. (지연 생성)"""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="engine-offload")
+        logger.info(f"엔진 오프로드 스레드 풀 생성 (workers={_max_workers})")
+    return _executor
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    블로킹 함수를 제한된 스레드 풀에서 실행하고 결과를 기다립니다.
+    로컬 Whisper, MeloTTS처럼 동기 API만 있는 엔진이 이벤트 루프를 멈추지 않게 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_offload_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_offload() -> None:
+    """오프로드 스레드 풀을 정리합니다."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
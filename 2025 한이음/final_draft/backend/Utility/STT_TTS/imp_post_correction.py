@@ -0,0 +1,97 @@
+# Backend/Utility/STT_TTS/imp_post_correction.py
+import os
+import re
+from typing import Dict, FrozenSet, List, Set
+
+import yaml
+
+# 기본 치환 규칙 파일: 이 패키지 폴더의 corrections.yaml
+DEFAULT_CORRECTIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corrections.yaml")
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def load_correction_rules(path: str) -> Dict[str, str]:
+    """
+    YAML 치환 규칙 파일을 {잘못 인식된 표현: 바로잡을 표현} 사전으로 읽습니다. (파일에 적힌 순서 유지)
+    파일 구조: corrections: {바로잡을 표현: [잘못 인식된 표현, ...]}
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        data = yaml.safe_load(f) or {}
+    rules: Dict[str, str] = {}
+    for right, wrongs in (data.get("corrections") or {}).items():
+        for wrong in wrongs or []:
+            rules[str(wrong)] = str(right)
+    return rules
+
+
+def _overlaps(inserted: str, pattern: str) -> bool:
+    """inserted를 문장에 끼워 넣었을 때 pattern이 새로 나타날 수 있는지 (겹치는 부분이 있는지)"""
+    if inserted in pattern or pattern in inserted:
+        return True
+    for k in range(1, min(len(inserted), len(pattern))):
+        if inserted.endswith(pattern[:k]) or inserted.startswith(pattern[-k:]):
+            return True
+    return False
+
+
+class PostCorrector:
+    """
+    STT 결과 후처리기. 규칙 파일 순서대로 하나씩 치환하던 예전 동작과 결과가 완전히 같으면서,
+    규칙 수와 무관하게 문장을 한 번만 훑도록 컴파일합니다.
+
+    1) 모든 규칙을 합친 정규식 하나(각 위치에서 가장 긴 규칙, lookahead라 겹치는 것도 찾음)로
+       문장에 들어 있는 규칙을 한 번에 찾습니다. 대부분의 문장은 여기서 '해당 없음'으로 끝납니다.
+    2) 찾은 규칙과, 그 치환 결과가 새로 만들 수 있는 규칙(미리 계산)만 파일 순서대로 적용합니다.
+       나머지 규칙은 그 차례에 맞을 수 없으므로 건너뛰어도 결과가 같습니다.
+    (규칙 순서에 의미가 있음: 예) "오늘 비 와"는 "비 와"가 먼저 적용되어 "오늘 날씨"가 됨)
+    """
+
+    def __init__(self, rules: Dict[str, str]) -> None:
+        self.rules = dict(rules)
+        order: List[str] = list(self.rules)
+        self._replacements = [self.rules[w] for w in order]
+        self._compiled = [re.compile(re.escape(w), re.IGNORECASE) for w in order]
+        self._detector = None
+        self._expand: Dict[str, FrozenSet[int]] = {}
+        if not order:
+            return
+
+        lowered = [w.lower() for w in order]
+        alternatives = sorted(order, key=len, reverse=True)
+        self._detector = re.compile("(?=(" + "|".join(re.escape(w) for w in alternatives) + "))", re.IGNORECASE)
+
+        # 치환 결과(바로잡을 표현)별로 새로 만들어질 수 있는 규칙의 전이 폐쇄
+        enables: Dict[str, Set[int]] = {}
+        for right in set(self._replacements):
+            found: Set[int] = set()
+            frontier = [right.lower()]
+            while frontier:
+                inserted = frontier.pop()
+                for i, pattern in enumerate(lowered):
+                    if i not in found and _overlaps(inserted, pattern):
+                        found.add(i)
+                        frontier.append(self._replacements[i].lower())
+            enables[right] = found
+
+        # 찾은 규칙 → 함께 적용할 규칙 목록 (같은 위치의 더 짧은 규칙 + 치환으로 생길 수 있는 규칙)
+        for i, pattern in enumerate(lowered):
+            group = {k for k, other in enumerate(lowered) if pattern.startswith(other)}
+            for k in list(group):
+                group |= enables[self._replacements[k]]
+            self._expand[pattern] = frozenset(group)
+
+    @classmethod
+    def from_file(cls, path: str = DEFAULT_CORRECTIONS_PATH) -> "PostCorrector":
+        return cls(load_correction_rules(path))
+
+    def apply(self, text: str) -> str:
+        out = text
+        if self._detector is not None:
+            candidates: Set[int] = set()
+            for match in self._detector.finditer(text):
+                candidates |= self._expand[match.group(1).lower()]
+            for i in sorted(candidates):
+                out = self._compiled[i].sub(self._replacements[i], out)
+        # 불필요한 공백 정리
+        return _WHITESPACE.sub(" ", out).strip()
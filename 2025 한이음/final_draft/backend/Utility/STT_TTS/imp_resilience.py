@@ -0,0 +1,316 @@
+# Backend/Utility/STT_TTS/imp_resilience.py
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Type, TypeVar
+
+from loguru import logger
+
+from .def_interface import ISTT, ITTS
+from .def_exceptions import KioskException, TranscriptionError, TTSError
+from ..Metrics import record_stage
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """최근 성공 요청 window개의 지연 시간으로 분위수(기본 p95)를 추정합니다."""
+
+    def __init__(self, window: int = 200, quantile: float = 0.95, min_samples: int = 20) -> None:
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def estimate(self) -> Optional[float]:
+        """표본이 min_samples보다 적으면 None"""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(self.quantile * len(ordered)))]
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold번 나면 열림(open) 상태가 되어 reset_timeout_s 동안 호출을 바로 거절합니다.
+    시간이 지나면 반열림(half-open) 상태에서 시험 호출 하나만 통과시키고, 성공하면 닫힘으로 돌아갑니다.
+    (시험 호출이 취소되어 결과를 모르면 reset_timeout_s 뒤 다시 시험)
+    """
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout_s: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_s = reset_timeout_s
+        self.state = self.CLOSED
+        self.opened = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == self.OPEN and now - self._opened_at >= self.reset_timeout_s:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and now - self._trial_at >= self.reset_timeout_s:
+                self._trial_at = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.opened += 1
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._trial_at = 0.0
+                self._failures = 0
+
+
+class _Resilient:
+    """
+    헤지(hedged) 요청 + 서킷 브레이커 공통 구현.
+    - 첫 시도가 마감 시간(최근 p95 × deadline_multiplier, min~max로 제한) 안에 끝나지 않으면
+      같은 요청을 한 번 더 보내고 먼저 성공한 결과를 씁니다. 나머지는 취소합니다.
+      (추가 요청 비용을 묶어 두기 위해 헤지는 전체 요청의 max_hedge_ratio까지만 허용)
+    - 각 시도는 attempt_timeout_s를 넘기면 실패로 봅니다.
+    - 실패가 이어져 브레이커가 열리면 fallback 엔진으로 보내거나, 없으면 기다리지 않고 바로 실패합니다.
+    """
+    error_type: Type[KioskException] = KioskException
+    kind = "engine"
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.latency = self._new_tracker(config)
+        self.deadline_multiplier = config.get("deadline_multiplier", 1.0)
+        self.initial_deadline_s = config.get("initial_deadline_s", 3.0)
+        self.min_deadline_s = config.get("min_deadline_s", 0.5)
+        self.max_deadline_s = config.get("max_deadline_s", 8.0)
+        self.attempt_timeout_s = config.get("attempt_timeout_s", 20.0)
+        self.max_hedge_ratio = config.get("max_hedge_ratio", 0.1)
+        self.hedge_enabled = config.get("hedge", True)
+        self.breaker = CircuitBreaker(config.get("failure_threshold", 3), config.get("reset_timeout_s", 30.0))
+        self._stats: Dict[str, int] = {"requests": 0, "hedged": 0, "hedge_wins": 0, "short_circuited": 0,
+                                       "failures": 0, "fallback": 0}
+
+    @staticmethod
+    def _new_tracker(config: Dict[str, Any]) -> LatencyTracker:
+        return LatencyTracker(config.get("window", 200), config.get("quantile", 0.95), config.get("min_samples", 20))
+
+    def deadline(self, latency: Optional[LatencyTracker] = None) -> float:
+        """헤지 마감 시간. latency를 주지 않으면 기본(전체 응답) 지연 추정을 씁니다."""
+        estimate = (latency or self.latency).estimate()
+        if estimate is None:
+            return self.initial_deadline_s
+        return min(self.max_deadline_s, max(self.min_deadline_s, estimate * self.deadline_multiplier))
+
+    def _may_hedge(self) -> bool:
+        return self.hedge_enabled and self._stats["hedged"] < self.max_hedge_ratio * self._stats["requests"] + 1
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self._stats, "breaker": self.breaker.state, "breaker_opened": self.breaker.opened,
+                "deadline_s": round(self.deadline(), 3)}
+
+    async def _attempt(self, call: Callable[[], Awaitable[T]], latency: LatencyTracker) -> T:
+        started = time.perf_counter()
+        result = await asyncio.wait_for(call(), self.attempt_timeout_s)
+        latency.observe(time.perf_counter() - started)
+        return result
+
+    async def _hedged(self, call: Callable[[], Awaitable[T]], latency: LatencyTracker) -> T:
+        first = asyncio.create_task(self._attempt(call, latency))
+        pending = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.deadline(latency))
+            if not done and self._may_hedge():
+                self._stats["hedged"] += 1
+                pending.add(asyncio.create_task(self._attempt(call, latency)))
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            self._stats["hedge_wins"] += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _guarded(self, call: Callable[[], Awaitable[T]], fallback: Optional[Callable[[], Awaitable[T]]],
+                       latency: Optional[LatencyTracker] = None) -> T:
+        """latency: 이 호출 경로의 지연 추정 (경로마다 재는 시간이 다르면 따로 둠, 기본은 self.latency)"""
+        self._stats["requests"] += 1
+        if not self.breaker.allow():
+            self._stats["short_circuited"] += 1
+            if fallback is None:
+                raise self.error_type(f"{self.kind} 서킷 브레이커가 열려 있어 요청을 보내지 않았습니다.")
+            self._stats["fallback"] += 1
+            return await fallback()
+        started = time.perf_counter()
+        try:
+            result = await self._hedged(call, latency or self.latency)
+        except Exception as e:
+            self._stats["failures"] += 1
+            was_open = self.breaker.state == CircuitBreaker.OPEN
+            self.breaker.record_failure()
+            if not was_open and self.breaker.state == CircuitBreaker.OPEN:
+                logger.warning(f"{self.kind} 연속 실패로 서킷 브레이커 열림 ({self.breaker.reset_timeout_s:.0f}초): {e}")
+            if fallback is None:
+                if isinstance(e, KioskException):
+                    raise
+                raise self.error_type(f"{self.kind} 요청이 실패했습니다: {e}") from e
+            self._stats["fallback"] += 1
+            return await fallback()
+        finally:
+            record_stage(f"{self.kind}.attempts", time.perf_counter() - started)
+        self.breaker.record_success()
+        return result
+
+    def _guarded_sync(self, call: Callable[[], T], fallback: Optional[Callable[[], T]]) -> T:
+        """동기 경로: 헤지 없이 브레이커만 적용합니다."""
+        self._stats["requests"] += 1
+        if not self.breaker.allow():
+            self._stats["short_circuited"] += 1
+            if fallback is None:
+                raise self.error_type(f"{self.kind} 서킷 브레이커가 열려 있어 요청을 보내지 않았습니다.")
+            self._stats["fallback"] += 1
+            return fallback()
+        try:
+            result = call()
+        except Exception:
+            self._stats["failures"] += 1
+            self.breaker.record_failure()
+            if fallback is None:
+                raise
+            self._stats["fallback"] += 1
+            return fallback()
+        self.breaker.record_success()
+        return result
+
+
+class ResilientSTT(_Resilient, ISTT):
+    """STT 엔진에 헤지 요청과 서킷 브레이커를 적용하는 래퍼. (fallback은 선택)"""
+    error_type = TranscriptionError
+    kind = "stt"
+
+    def __init__(self, inner: ISTT, config: Dict[str, Any], fallback: Optional[ISTT] = None) -> None:
+        super().__init__(config)
+        self.inner = inner
+        self.fallback = fallback
+
+    def initialize(self) -> None:
+        self.inner.initialize()
+        if self.fallback is not None:
+            self.fallback.initialize()
+
+    def is_initialized(self) -> bool:
+        return self.inner.is_initialized()
+
+    def supported_formats(self) -> frozenset:
+        return self.inner.supported_formats()
+
+    def close(self) -> None:
+        self.inner.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+    async def atranscribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        fallback = (lambda: self.fallback.atranscribe(audio_bytes, audio_format)) if self.fallback else None
+        return await self._guarded(lambda: self.inner.atranscribe(audio_bytes, audio_format), fallback)
+
+    def transcribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        fallback = (lambda: self.fallback.transcribe(audio_bytes, audio_format)) if self.fallback else None
+        return self._guarded_sync(lambda: self.inner.transcribe(audio_bytes, audio_format), fallback)
+
+
+class ResilientTTS(_Resilient, ITTS):
+    """
+    TTS 엔진에 헤지 요청과 서킷 브레이커를 적용하는 래퍼. (fallback은 선택)
+    스트리밍 합성은 첫 청크까지의 시간으로 헤지하고, 첫 청크를 먼저 낸 스트림을 끝까지 이어 보냅니다.
+    첫 청크 시간은 전체 합성 시간보다 훨씬 짧으므로 지연 추정(stream_latency)을 따로 둡니다.
+    """
+    error_type = TTSError
+    kind = "tts"
+
+    def __init__(self, inner: ITTS, config: Dict[str, Any], fallback: Optional[ITTS] = None) -> None:
+        super().__init__(config)
+        self.inner = inner
+        self.fallback = fallback
+        self.stream_latency = self._new_tracker(config)
+        self.AUDIO_FORMAT = inner.AUDIO_FORMAT
+        # CachedTTS가 캐시 키를 만들 때 내부 엔진의 모델/음성을 사용
+        self.model = getattr(inner, "model", type(inner).__name__)
+        self.voice = getattr(inner, "voice", "")
+
+    def initialize(self) -> None:
+        self.inner.initialize()
+        if self.fallback is not None:
+            self.fallback.initialize()
+
+    def is_initialized(self) -> bool:
+        return self.inner.is_initialized()
+
+    def close(self) -> None:
+        self.inner.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "stream_deadline_s": round(self.deadline(self.stream_latency), 3)}
+
+    async def asynthesize(self, text: str) -> bytes:
+        fallback = (lambda: self.fallback.asynthesize(text)) if self.fallback else None
+        return await self._guarded(lambda: self.inner.asynthesize(text), fallback)
+
+    def synthesize(self, text: str) -> bytes:
+        fallback = (lambda: self.fallback.synthesize(text)) if self.fallback else None
+        return self._guarded_sync(lambda: self.inner.synthesize(text), fallback)
+
+    async def _open_stream(self, engine: ITTS, text: str):
+        """스트림을 열고 첫 청크까지 받아 (제너레이터, 첫 청크)를 반환합니다."""
+        stream = engine.astream_synthesize(text).__aiter__()
+        try:
+            first = await stream.__anext__()
+        except StopAsyncIteration:
+            first = b""
+        except BaseException:
+            await stream.aclose()
+            raise
+        return stream, first
+
+    async def astream_synthesize(self, text: str) -> AsyncIterator[bytes]:
+        fallback = (lambda: self._open_stream(self.fallback, text)) if self.fallback else None
+        opened = []
+
+        async def open_primary():
+            result = await self._open_stream(self.inner, text)
+            # 헤지로 진 스트림도 열려 있을 수 있으므로 모두 기록해 두고 이긴 것만 남김
+            opened.append(result[0])
+            return result
+
+        stream, first = await self._guarded(open_primary, fallback, self.stream_latency)
+        for other in opened:
+            if other is not stream:
+                await other.aclose()
+        try:
+            if first:
+                yield first
+            async for chunk in stream:
+                yield chunk
+        finally:
+            await stream.aclose()
@@ -0,0 +1,236 @@
+# Backend/Utility/STT_TTS/imp_stt_chunked.py
+import re
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from .def_interface import ISTT
+from .imp_audio_gate import SilenceGatedSTT, _read_wav, frame_levels_db
+from .imp_transcoder_ffmpeg import pcm_to_wav, pick_decoded
+from ..Metrics import record_stage
+
+_PUNCTUATION = re.compile(r"[.,!?~…·\"'()\[\]]")
+
+
+@dataclass
+class AudioChunk:
+    """긴 녹음에서 잘라낸 구간. overlapped면 앞 구간과 겹치게 잘린(쉬는 구간을 못 찾은) 구간입니다."""
+    start: int          # 샘플 위치
+    end: int
+    overlapped: bool = False
+
+
+def plan_chunks(levels_db: np.ndarray, frame_ms: int, threshold_db: float, min_chunk_ms: int,
+                max_chunk_ms: int, min_pause_ms: int, overlap_ms: int) -> List[tuple]:
+    """
+    프레임 에너지로 자를 위치를 정해 (시작 프레임, 끝 프레임, 겹침 여부) 목록을 반환합니다.
+    - 각 구간은 min_chunk_ms 이상 max_chunk_ms 이하가 되도록, 그 범위 안에서 가장 긴 쉬는 구간
+      (threshold_db 이하가 min_pause_ms 이상 이어지는 곳, 길이가 같으면 뒤쪽)의 가운데를 자릅니다.
+    - 쉬는 구간이 없으면 범위 안에서 가장 조용한 프레임을 자르고, 다음 구간을 overlap_ms 앞에서 시작해
+      잘린 단어가 양쪽 중 한 곳에는 온전히 들어가게 합니다. (겹친 단어는 이어 붙일 때 지움)
+    """
+    n = len(levels_db)
+    min_frames = max(1, min_chunk_ms // frame_ms)
+    max_frames = max(min_frames + 1, max_chunk_ms // frame_ms)
+    pause_frames = max(1, min_pause_ms // frame_ms)
+    overlap_frames = overlap_ms // frame_ms
+
+    chunks = []
+    start, overlapped = 0, False
+    while n - start > max_frames:
+        lo, hi = start + min_frames, start + max_frames
+        silent = np.concatenate(([False], levels_db[lo:hi] <= threshold_db, [False]))
+        edges = np.flatnonzero(np.diff(silent.astype(np.int8)))
+        runs = edges.reshape(-1, 2)                      # [시작, 끝) 쌍 (lo 기준)
+        lengths = runs[:, 1] - runs[:, 0] if len(runs) else np.array([], dtype=int)
+        if len(runs) and lengths.max() >= pause_frames:
+            best = len(lengths) - 1 - int(np.argmax(lengths[::-1]))
+            cut = lo + int(runs[best].sum() // 2)
+            chunks.append((start, cut, overlapped))
+            start, overlapped = cut, False
+        else:
+            window = levels_db[lo:hi]
+            cut = hi - 1 - int(np.argmin(window[::-1]))   # 같은 에너지면 뒤쪽 (구간 수를 줄임)
+            chunks.append((start, cut, overlapped))
+            start, overlapped = max(start + 1, cut - overlap_frames), overlap_frames > 0
+    chunks.append((start, n, overlapped))
+    return chunks
+
+
+def _normalize(token: str) -> str:
+    return _PUNCTUATION.sub("", token).lower()
+
+
+def merge_transcripts(texts: Sequence[str], overlapped: Sequence[bool], max_overlap_words: int = 4) -> str:
+    """
+    구간별 전사 결과를 순서대로 잇습니다. 겹치게 자른 경계에서는 같은 단어가 두 번 나오지 않도록
+    앞 결과의 끝과 뒤 결과의 시작에서 가장 긴 공통 단어열(최대 max_overlap_words개)을 지우고,
+    없으면 잘린 단어 조각("주민등" + "주민등록등본")을 하나로 합칩니다.
+    """
+    words: List[str] = []
+    for text, is_overlapped in zip(texts, overlapped):
+        tokens = text.split()
+        if not tokens:
+            continue
+        if is_overlapped and words:
+            limit = min(max_overlap_words, len(words), len(tokens))
+            for k in range(limit, 0, -1):
+                if [_normalize(w) for w in words[-k:]] == [_normalize(t) for t in tokens[:k]]:
+                    tokens = tokens[k:]
+                    break
+            else:
+                last, first = _normalize(words[-1]), _normalize(tokens[0])
+                if last and first and first.startswith(last):
+                    words.pop()
+                elif last and first and last.endswith(first):
+                    tokens = tokens[1:]
+        words.extend(tokens)
+    return " ".join(words)
+
+
+class ChunkedSTT(ISTT):
+    """
+    긴 녹음을 쉬는 구간에서 잘라 여러 구간을 동시에 전사하는 래퍼.
+    - min_duration_s 이하의 녹음은 그대로 내부 엔진에 넘깁니다. (대부분의 짧은 발화는 추가 비용 없음)
+    - 긴 녹음은 plan_chunks로 자른 구간을 max_parallel개까지 동시에 전사한 뒤 순서대로 이어 붙입니다.
+      원격 STT 지연은 녹음 길이에 비례하므로 전체 대기 시간이 대략 가장 긴 구간 하나의 시간으로 줄어듭니다.
+    - 구간은 16bit 모노 WAV로 넘기므로, 내부가 SilenceGatedSTT면 구간별로 앞뒤 무음을 자르고 빈 구간은 건너뜁니다.
+    - WAV가 아닌 업로드는 decode_compressed일 때만 PCM으로 풀어서 길이를 확인합니다. 풀어 둔 WAV는 내부
+      SilenceGatedSTT에 그대로 넘겨 다시 풀지 않습니다. 한 번 풀었거나 구간으로 나눈 녹음은 ffmpeg를 다시 띄워
+      재인코딩하지 않고 원본(엔진이 받으면)이나 WAV로 보내, 업로드 하나에 ffmpeg는 많아야 한 번입니다.
+    """
+
+    def __init__(self, inner: ISTT, config: Dict[str, Any], transcoder=None) -> None:
+        self.inner = inner
+        self.transcoder = transcoder
+        self.min_duration_s = config.get("min_duration_s", 20.0)
+        self.min_chunk_ms = int(config.get("min_chunk_s", 4.0) * 1000)
+        self.max_chunk_ms = int(config.get("max_chunk_s", 12.0) * 1000)
+        self.min_pause_ms = config.get("min_pause_ms", 300)
+        self.overlap_ms = config.get("overlap_ms", 600)
+        self.threshold_db = config.get("energy_threshold_db", -45.0)
+        self.frame_ms = config.get("frame_ms", 30)
+        self.max_parallel = max(1, config.get("max_parallel", 3))
+        self.max_overlap_words = config.get("max_overlap_words", 4)
+        self.decode_compressed = config.get("decode_compressed", True)
+        self._stats: Dict[str, int] = {"chunked": 0, "chunks": 0, "overlapped": 0}
+
+    # --- 생명주기는 내부 엔진에 위임 ---
+    def initialize(self) -> None:
+        self.inner.initialize()
+
+    def is_initialized(self) -> bool:
+        return self.inner.is_initialized()
+
+    def supported_formats(self) -> frozenset:
+        return self.inner.supported_formats()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    def accepts_raw_upload(self) -> bool:
+        return self.transcoder is not None
+
+    def stats(self) -> Dict[str, int]:
+        return dict(self._stats)
+
+    # --- 구간 나누기 ---
+    def split(self, wav_bytes: bytes) -> Optional[List[AudioChunk]]:
+        """긴 녹음이면 구간 목록을, 짧거나 WAV가 아니면 None을 반환합니다."""
+        parsed = _read_wav(wav_bytes)
+        if parsed is None:
+            return None
+        pcm, sample_rate = parsed
+        samples = np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], dtype=np.int16)
+        if len(samples) <= self.min_duration_s * sample_rate:
+            return None
+        frame_length = max(1, int(sample_rate * self.frame_ms / 1000))
+        levels = frame_levels_db(samples, frame_length)
+        planned = plan_chunks(levels, self.frame_ms, self.threshold_db, self.min_chunk_ms,
+                              self.max_chunk_ms, self.min_pause_ms, self.overlap_ms)
+        chunks = [AudioChunk(s * frame_length, e * frame_length, o) for s, e, o in planned]
+        chunks[-1].end = len(samples)
+        return chunks
+
+    def _chunk_wavs(self, wav_bytes: bytes, chunks: List[AudioChunk]) -> List[bytes]:
+        pcm, sample_rate = _read_wav(wav_bytes)
+        return [pcm_to_wav(pcm[c.start * 2:c.end * 2], sample_rate) for c in chunks]
+
+    def _merge(self, texts: List[str], chunks: List[AudioChunk], started: float) -> str:
+        self._stats["chunked"] += 1
+        self._stats["chunks"] += len(chunks)
+        self._stats["overlapped"] += sum(c.overlapped for c in chunks)
+        record_stage("stt.chunked", time.perf_counter() - started)
+        logger.info(f"긴 녹음을 {len(chunks)}개 구간으로 나눠 전사했습니다. "
+                    f"(겹쳐 자른 경계 {sum(c.overlapped for c in chunks)}곳)")
+        return merge_transcripts(texts, [c.overlapped for c in chunks], self.max_overlap_words)
+
+    def _decoded_source(self, audio_bytes: bytes, audio_format: str,
+                        wav_bytes: Optional[bytes], decoded: bool) -> Optional[tuple]:
+        """이미 풀었으면 협상 없이 보낼 (오디오, 포맷), 협상이 필요하면 None"""
+        if self.transcoder is None:
+            return audio_bytes, audio_format
+        if decoded and wav_bytes is not None:
+            return pick_decoded(audio_bytes, audio_format, wav_bytes, self.inner.supported_formats())
+        return None
+
+    async def _atranscribe_one(self, audio_bytes: bytes, audio_format: str, wav_bytes: Optional[bytes],
+                               decoded: bool) -> str:
+        """녹음(구간) 하나를 내부 엔진에 넘깁니다. 무음 검사 래퍼면 풀어 둔 WAV를 함께, 아니면 여기서 포맷을 정합니다."""
+        if isinstance(self.inner, SilenceGatedSTT):
+            return await self.inner.atranscribe_decoded(audio_bytes, audio_format, wav_bytes, decoded)
+        ready = self._decoded_source(audio_bytes, audio_format, wav_bytes, decoded)
+        if ready is None:
+            converted = await self.transcoder.aprepare(audio_bytes, f"audio/{audio_format}", self.inner.supported_formats())
+            ready = converted.audio_bytes, converted.audio_format
+        return await self.inner.atranscribe(*ready)
+
+    def _transcribe_one(self, audio_bytes: bytes, audio_format: str, wav_bytes: Optional[bytes],
+                        decoded: bool) -> str:
+        """_atranscribe_one의 동기 버전"""
+        if isinstance(self.inner, SilenceGatedSTT):
+            return self.inner.transcribe_decoded(audio_bytes, audio_format, wav_bytes, decoded)
+        ready = self._decoded_source(audio_bytes, audio_format, wav_bytes, decoded)
+        if ready is None:
+            converted = self.transcoder.prepare(audio_bytes, f"audio/{audio_format}", self.inner.supported_formats())
+            ready = converted.audio_bytes, converted.audio_format
+        return self.inner.transcribe(*ready)
+
+    async def atranscribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        wav_bytes = audio_bytes if audio_format == "wav" else None
+        decoded = False
+        if wav_bytes is None and self.decode_compressed and self.transcoder is not None:
+            wav_bytes, decoded = (await self.transcoder.ato_wav(audio_bytes)).audio_bytes, True
+        chunks = self.split(wav_bytes) if wav_bytes is not None else None
+        if not chunks or len(chunks) == 1:
+            return await self._atranscribe_one(audio_bytes, audio_format, wav_bytes, decoded)
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_parallel)
+
+        # 구간은 WAV로 보냄 (구간마다 ffmpeg를 띄워 재인코딩하지 않음)
+        async def transcribe_chunk(chunk_wav: bytes) -> str:
+            async with semaphore:
+                return await self._atranscribe_one(chunk_wav, "wav", chunk_wav, True)
+
+        texts = await asyncio.gather(*(transcribe_chunk(w) for w in self._chunk_wavs(wav_bytes, chunks)))
+        return self._merge(list(texts), chunks, started)
+
+    def transcribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        wav_bytes = audio_bytes if audio_format == "wav" else None
+        decoded = False
+        if wav_bytes is None and self.decode_compressed and self.transcoder is not None:
+            wav_bytes, decoded = self.transcoder.to_wav(audio_bytes).audio_bytes, True
+        chunks = self.split(wav_bytes) if wav_bytes is not None else None
+        if not chunks or len(chunks) == 1:
+            return self._transcribe_one(audio_bytes, audio_format, wav_bytes, decoded)
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_parallel, thread_name_prefix="stt-chunk") as pool:
+            texts = list(pool.map(lambda w: self._transcribe_one(w, "wav", w, True), self._chunk_wavs(wav_bytes, chunks)))
+        return self._merge(texts, chunks, started)
@@ -0,0 +1,180 @@
+# Backend/Utility/STT_TTS/imp_stt_failover.py
+import time
+import asyncio
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from .def_interface import ISTT
+from .def_exceptions import TranscriptionError
+from ..Metrics import record_stage
+
+
+class FailoverSTT(ISTT):
+    """
+    원격 STT(OpenAI)를 우선 사용하고, 느리거나 실패하면 로컬 STT로 넘기는 래퍼.
+    - latency_budget_s 안에 원격 결과가 없으면 로컬 변환을 함께 시작해 먼저 끝난 결과를 사용합니다.
+      (원격은 timeout_s까지 계속 기다리므로 조금 늦게라도 도착하면 그 결과를 씀)
+    - 원격 실패/예산 초과가 failure_threshold번 연속되면 cooldown_s 동안 원격을 건너뛰고 바로 로컬로 보냅니다.
+    - 로컬 엔진은 WAV만 받으므로 다른 포맷은 transcoder로 변환한 뒤 넘깁니다.
+    """
+
+    def __init__(self, primary: ISTT, fallback: ISTT, config: Dict[str, Any], transcoder=None,
+                 names: tuple = ("remote", "local")) -> None:
+        self.primary = primary
+        self.fallback = fallback
+        self.transcoder = transcoder
+        self.primary_name, self.fallback_name = names
+        self.latency_budget_s = config.get("latency_budget_s", 4.0)
+        self.timeout_s = config.get("timeout_s", 15.0)
+        self.failure_threshold = config.get("failure_threshold", 2)
+        self.cooldown_s = config.get("cooldown_s", 30.0)
+
+        self._fallback_ready = False
+        self._consecutive_failures = 0
+        self._skip_primary_until = 0.0
+        self._stats: Dict[str, Any] = {
+            "served": {self.primary_name: 0, self.fallback_name: 0},
+            "failures": {self.primary_name: 0, self.fallback_name: 0},
+            "budget_exceeded": 0,
+            "cooldown_routed": 0,
+        }
+
+    # --- 생명주기 ---
+    def initialize(self) -> None:
+        self.primary.initialize()
+        try:
+            self.fallback.initialize()
+            self._fallback_ready = True
+        except Exception as e:
+            # 로컬 엔진을 못 올려도 원격 STT만으로 계속 동작
+            logger.warning(f"로컬 STT를 사용할 수 없어 장애 대체 없이 동작합니다: {e}")
+
+    def is_initialized(self) -> bool:
+        return self.primary.is_initialized() or self._fallback_ready
+
+    def supported_formats(self) -> frozenset:
+        # 평소에는 원격 엔진이 처리하므로 원격 기준으로 협상 (로컬로 넘길 때만 WAV 변환)
+        return self.primary.supported_formats()
+
+    def close(self) -> None:
+        self.primary.close()
+        self.fallback.close()
+
+    # --- 상태 ---
+    def _primary_available(self) -> bool:
+        return self.primary.is_initialized() and time.monotonic() >= self._skip_primary_until
+
+    def _on_primary_success(self) -> None:
+        self._consecutive_failures = 0
+
+    def _on_primary_failure(self, reason: str) -> None:
+        self._stats["failures"][self.primary_name] += 1
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold and self._fallback_ready:
+            self._skip_primary_until = time.monotonic() + self.cooldown_s
+            self._consecutive_failures = 0
+            logger.warning(f"원격 STT {reason} 연속 발생 → {self.cooldown_s:.0f}초 동안 로컬 STT로 전환합니다.")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "primary_skipped_for_s": round(max(0.0, self._skip_primary_until - time.monotonic()), 1),
+            "fallback_ready": self._fallback_ready,
+        }
+
+    # --- 변환 ---
+    async def _timed(self, name: str, engine: ISTT, audio_bytes: bytes, audio_format: str) -> str:
+        started = time.perf_counter()
+        try:
+            return await engine.atranscribe(audio_bytes, audio_format)
+        finally:
+            record_stage(f"stt.{name}", time.perf_counter() - started)
+
+    async def _run_primary(self, audio_bytes: bytes, audio_format: str) -> str:
+        try:
+            return await asyncio.wait_for(
+                self._timed(self.primary_name, self.primary, audio_bytes, audio_format), self.timeout_s)
+        except asyncio.TimeoutError as e:
+            raise TranscriptionError(f"원격 STT 응답 시간({self.timeout_s:.0f}초)을 초과했습니다.") from e
+
+    async def _run_fallback(self, audio_bytes: bytes, audio_format: str) -> str:
+        if audio_format not in self.fallback.supported_formats():
+            if self.transcoder is None:
+                raise TranscriptionError(f"로컬 STT로 넘길 수 없는 포맷입니다: {audio_format}")
+            audio_bytes = (await self.transcoder.ato_wav(audio_bytes)).audio_bytes
+            audio_format = "wav"
+        try:
+            return await self._timed(self.fallback_name, self.fallback, audio_bytes, audio_format)
+        except Exception:
+            self._stats["failures"][self.fallback_name] += 1
+            raise
+
+    def _served(self, name: str, text: str) -> str:
+        self._stats["served"][name] += 1
+        return text
+
+    async def atranscribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        if not self._fallback_ready:
+            return self._served(self.primary_name, await self._run_primary(audio_bytes, audio_format))
+
+        if not self._primary_available():
+            self._stats["cooldown_routed"] += 1
+            return self._served(self.fallback_name, await self._run_fallback(audio_bytes, audio_format))
+
+        primary = asyncio.create_task(self._run_primary(audio_bytes, audio_format))
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=self.latency_budget_s)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        if done:
+            try:
+                text = primary.result()
+            except Exception as e:
+                logger.warning(f"원격 STT 실패, 로컬 STT로 대체합니다: {e}")
+                self._on_primary_failure("실패")
+                return self._served(self.fallback_name, await self._run_fallback(audio_bytes, audio_format))
+            self._on_primary_success()
+            return self._served(self.primary_name, text)
+
+        # 지연 예산 초과: 로컬 변환을 시작하고 둘 중 먼저 성공한 결과를 사용
+        self._stats["budget_exceeded"] += 1
+        logger.warning(f"원격 STT가 {self.latency_budget_s:.1f}초 안에 끝나지 않아 로컬 STT를 함께 실행합니다.")
+        fallback = asyncio.create_task(self._run_fallback(audio_bytes, audio_format))
+        names = {primary: self.primary_name, fallback: self.fallback_name}
+        pending = {primary, fallback}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is primary:
+                            self._on_primary_success()
+                        else:
+                            self._on_primary_failure("지연")
+                        return self._served(names[task], task.result())
+                    error = task.exception()
+                    if task is primary:
+                        self._on_primary_failure("실패")
+        finally:
+            for task in pending:
+                task.cancel()
+        raise TranscriptionError("원격/로컬 STT가 모두 실패했습니다.") from error
+
+    def transcribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        """동기 경로: 지연 예산 없이 원격 실패 시에만 로컬로 대체합니다."""
+        if self._primary_available() or not self._fallback_ready:
+            try:
+                text = self.primary.transcribe(audio_bytes, audio_format)
+                self._on_primary_success()
+                return self._served(self.primary_name, text)
+            except Exception as e:
+                if not self._fallback_ready:
+                    raise
+                logger.warning(f"원격 STT 실패, 로컬 STT로 대체합니다: {e}")
+                self._on_primary_failure("실패")
+        if audio_format not in self.fallback.supported_formats() and self.transcoder is not None:
+            audio_bytes, audio_format = self.transcoder.to_wav(audio_bytes).audio_bytes, "wav"
+        return self._served(self.fallback_name, self.fallback.transcribe(audio_bytes, audio_format))
@@ -1,14 +1,19 @@
 # Backend/Utility/STT_TTS/imp_stt_openai.py
 import os, io, re
-from typing import Dict, Any, List
-from openai import OpenAI
+from typing import Dict, Any, List, Callable, Optional
 from loguru import logger
 
 from .def_interface import ISTT
 from .def_exceptions import TranscriptionError
+from .imp_post_correction import PostCorrector, DEFAULT_CORRECTIONS_PATH
+from ..Metrics import stage
+from ..OpenAIGateway import create_openai_gateway
 
 
 class SpeechToText(ISTT):
+    # OpenAI 전사 API가 직접 받는 컨테이너 (브라우저 webm/ogg를 변환 없이 전달 가능)
+    SUPPORTED_FORMATS = frozenset({"flac", "m4a", "mp3", "mp4", "mpeg", "mpga", "oga", "ogg", "wav", "webm"})
+
     _LANG_MAP = {
         "korean": "ko", "ko-kr": "ko", "kr": "ko", "kor": "ko", "korea": "ko",
         "english": "en", "en-us": "en", "en-gb": "en",
@@ -20,11 +25,15 @@ class SpeechToText(ISTT):
         l = SpeechToText._LANG_MAP.get(lang.strip().lower(), lang.strip().lower())
         return l if re.fullmatch(r"[a-z]{2}", l) else default
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Dict[str, Any], fuzzy_correct: Optional[Callable[[str], str]] = None) -> None:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("환경 변수 OPENAI_API_KEY가 설정되지 않았습니다.")
-        self.client = OpenAI(api_key=api_key)
+        # 공유 OpenAI 관문의 클라이언트 (연결 풀/동시 실행 수/요청 한도를 다른 모듈과 함께 관리)
+        gateway = create_openai_gateway()
+        self.client = gateway.sync_client(api_key)
+        # 비동기 핸들러용 클라이언트 (이벤트 루프를 막지 않음)
+        self.aclient = gateway.async_client(api_key)
 
         self.model = config.get("model", "whisper-1")
         self.language = self._normalize_lang(config.get("language_code", "ko"), "ko")
@@ -34,81 +43,11 @@ class SpeechToText(ISTT):
             "주민등록등본", "주민등록초본", "가족관계증명서", "건강보험자격득실확인서",
             "주민등록번호", "서울시", "날씨", "예보", "인쇄", "키오스크"
         ])
-        # ✅ 자주 틀리는 표현 후처리 사전
-        self.corrections: Dict[str, str] = {
-            # ===== 등본 관련 =====
-            "등군": "등본",
-            "등뽄": "등본",
-            "등번": "등본",
-            "등본서": "등본",
-            "등본 좀": "등본",
-
-            # ===== 초본 관련 =====
-            "초뽄": "초본",
-            "초번": "초본",
-            "촌번": "초본",
-            "초본서": "초본",
-            "초본 좀": "초본",
-
-            # ===== 가족관계증명서 =====
-            "가족 관계 증명서": "가족관계증명서",
-            "가족증명서": "가족관계증명서",
-            "가족관계 증명": "가족관계증명서",
-            "가족관계서": "가족관계증명서",
-            "가족 증명": "가족관계증명서",
-
-            # ===== 건강보험자격득실확인서 =====
-            "건강 보험 자격 득실 확인서": "건강보험자격득실확인서",
-            "건강보험 자격 확인서": "건강보험자격득실확인서",
-            "건강보험 득실 확인서": "건강보험자격득실확인서",
-            "건강보험 확인서": "건강보험자격득실확인서",
-            "자격득실 확인서": "건강보험자격득실확인서",
-
-            # ===== 인쇄 관련 =====
-            "인쇄 해줘": "인쇄해줘",
-            "출력 해줘": "인쇄해줘",
-            "프린트 해줘": "인쇄해줘",
-
-            # ===== 날씨 관련 (광범위) =====
-            "날씨 알려 줘": "날씨",
-            "날씨 좀": "날씨",
-            "오늘 날씨": "날씨",
-            "지금 날씨": "날씨",
-            "주간 날씨": "날씨",
-            "주말 날씨": "날씨",
-            "내일 날씨": "날씨",
-            "모레 날씨": "날씨",
-            "일기 예보": "날씨",
-            "주간 예보": "날씨",
-            "날씨 예보": "날씨",
-
-            # 자연어형 질문들
-            "오늘 덥다": "날씨",
-            "오늘 더워": "날씨",
-            "더워?": "날씨",
-            "추워?": "날씨",
-            "오늘 추워": "날씨",
-            "춥다": "날씨",
-            "더운지": "날씨",
-            "추운지": "날씨",
-
-            "비 와": "날씨",
-            "비와": "날씨",
-            "비 올까": "날씨",
-            "오늘 비": "날씨",
-            "비 예보": "날씨",
-            "눈 와": "날씨",
-            "눈와": "날씨",
-            "눈 올까": "날씨",
-
-            # 기온 질문
-            "기온": "날씨",
-            "온도": "날씨",
-            "몇 도야": "날씨",
-            "몇도야": "날씨",
-            "지금 몇도": "날씨",
-            "오늘 몇도": "날씨",
-        }
+        # ✅ 자주 틀리는 표현 후처리 사전 (corrections.yaml, 한 번에 치환하는 정규식으로 컴파일)
+        self.corrector = PostCorrector.from_file(config.get("corrections_path") or DEFAULT_CORRECTIONS_PATH)
+        self.corrections: Dict[str, str] = self.corrector.rules
+        # ✅ 사전에 없는 근접 오인식은 의도 분석의 근접 키워드 색인으로 정규 키워드로 바꿈 (선택)
+        self.fuzzy_correct = fuzzy_correct
 
         self._is_initialized = False
 
@@ -125,68 +64,98 @@ class SpeechToText(ISTT):
         return f"다음 한국어 키오스크 도메인 용어가 자주 등장합니다: {terms}"
 
     def _post_correction(self, text: str) -> str:
-        out = text
-        # 단순 치환 (띄어쓰기/대소문자 관대하게)
-        for wrong, right in self.corrections.items():
-            out = re.sub(re.escape(wrong), right, out, flags=re.IGNORECASE)
-        # 불필요한 공백 정리
-        out = re.sub(r"\s+", " ", out).strip()
-        return out
-
-    def transcribe(self, audio_bytes: bytes) -> str:
+        # 사전 치환(대소문자 무시, 긴 표현 우선) + 불필요한 공백 정리 → 근접 키워드 교정
+        text = self.corrector.apply(text)
+        return self.fuzzy_correct(text) if self.fuzzy_correct else text
+
+    def _request_kwargs(self, audio_file: io.BytesIO, with_prompt: bool = True) -> Dict[str, Any]:
+        # ✅ 언어 고정 + 온도 0(가변성 최소화) + 도메인 프롬프트(선택)
+        kwargs: Dict[str, Any] = dict(
+            model=self.model,
+            file=audio_file,
+            language=self._normalize_lang(self.language, default="ko"),
+            temperature=0,
+        )
+        if with_prompt:
+            kwargs["prompt"] = self._build_prompt()
+        return kwargs
+
+    @staticmethod
+    def _open_audio(audio_bytes: bytes, audio_format: str) -> io.BytesIO:
+        audio_file = io.BytesIO(audio_bytes)
+        # OpenAI는 파일 확장자로 컨테이너를 판별하므로 협상된 포맷을 이름에 반영
+        audio_file.name = f"audio.{audio_format}"
+        return audio_file
+
+    def _finish(self, recognized_text: str) -> str:
+        if not recognized_text:
+            logger.warning("STT 응답에 text가 없습니다. (무음/잡음 가능)")
+            return ""
+        # ✅ 사전 치환 후 반환
+        with stage("stt.post_correction"):
+            corrected = self._post_correction(recognized_text)
+        logger.info(f"STT 완료 → '{recognized_text}'  => 보정 → '{corrected}'")
+        return corrected
+
+    @staticmethod
+    def _raise_error(e: Exception) -> None:
+        msg = str(e)
+        if ("invalid_language_format" in msg) or ("Invalid language" in msg) or ("ISO-639-1" in msg):
+            logger.error("언어 파라미터는 ISO-639-1 2글자 코드여야 합니다. 예: 'ko', 'en'")
+        else:
+            logger.error(f"OpenAI STT 오류: {msg}")
+        raise TranscriptionError("OpenAI 음성 변환에 실패했습니다.") from e
+
+    def transcribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
         if not self.is_initialized():
             raise RuntimeError("STT 모듈이 초기화되지 않았습니다.")
 
-        lang = self._normalize_lang(self.language, default="ko")
-
         try:
-            audio_file = io.BytesIO(audio_bytes)
-            audio_file.name = "audio.wav"
-
-            logger.info(f"STT 시작... (model={self.model}, lang={lang})")
-
-            # ✅ 1차 시도: 언어 고정 + 온도 0 + 도메인 프롬프트
-            prompt = self._build_prompt()
-            transcript = self.client.audio.transcriptions.create(
-                model=self.model,
-                file=audio_file,
-                language=lang,
-                temperature=0,  # 가변성 최소화
-                prompt=prompt  # 도메인 힌트
-            )
-            recognized_text = getattr(transcript, "text", None) or ""
-            recognized_text = recognized_text.strip()
-
-            # ✅ 너무 짧거나 빈 값이면 보강 재시도 (프롬프트만 변경/삭제 등)
+            audio_file = self._open_audio(audio_bytes, audio_format)
+            logger.info(f"STT 시작... (model={self.model}, lang={self.language})")
+
+            # ✅ 1차 시도: 도메인 프롬프트 포함
+            transcript = self.client.audio.transcriptions.create(**self._request_kwargs(audio_file))
+            recognized_text = (getattr(transcript, "text", None) or "").strip()
+
+            # ✅ 너무 짧거나 빈 값이면 보강 재시도 (prompt 제거하여 모델이 자유롭게 해석하게)
             if len(recognized_text) < 2:
                 logger.warning("1차 인식 결과가 너무 짧습니다. 보강 재시도를 수행합니다.")
                 audio_file.seek(0)
                 transcript2 = self.client.audio.transcriptions.create(
-                    model=self.model,
-                    file=audio_file,
-                    language=lang,
-                    temperature=0,
-                    # prompt 제거하여 모델이 자유롭게 해석하게
+                    **self._request_kwargs(audio_file, with_prompt=False)
                 )
-                recognized_text = getattr(transcript2, "text", None) or ""
-                recognized_text = recognized_text.strip()
+                recognized_text = (getattr(transcript2, "text", None) or "").strip()
 
-            if not recognized_text:
-                logger.warning("STT 응답에 text가 없습니다. (무음/잡음 가능)")
-                return ""
+            return self._finish(recognized_text)
 
-            # ✅ 사전 치환 후 반환
-            corrected = self._post_correction(recognized_text)
-            logger.info(f"STT 완료 → '{recognized_text}'  => 보정 → '{corrected}'")
-            return corrected
+        except Exception as e:
+            self._raise_error(e)
+
+    async def atranscribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        """transcribe와 같은 동작을 AsyncOpenAI로 수행합니다. (스레드 오프로드 불필요)"""
+        if not self.is_initialized():
+            raise RuntimeError("STT 모듈이 초기화되지 않았습니다.")
+
+        try:
+            audio_file = self._open_audio(audio_bytes, audio_format)
+            logger.info(f"STT 시작(async)... (model={self.model}, lang={self.language})")
+
+            transcript = await self.aclient.audio.transcriptions.create(**self._request_kwargs(audio_file))
+            recognized_text = (getattr(transcript, "text", None) or "").strip()
+
+            if len(recognized_text) < 2:
+                logger.warning("1차 인식 결과가 너무 짧습니다. 보강 재시도를 수행합니다.")
+                audio_file.seek(0)
+                transcript2 = await self.aclient.audio.transcriptions.create(
+                    **self._request_kwargs(audio_file, with_prompt=False)
+                )
+                recognized_text = (getattr(transcript2, "text", None) or "").strip()
+
+            return self._finish(recognized_text)
 
         except Exception as e:
-            msg = str(e)
-            if ("invalid_language_format" in msg) or ("Invalid language" in msg) or ("ISO-639-1" in msg):
-                logger.error("언어 파라미터는 ISO-639-1 2글자 코드여야 합니다. 예: 'ko', 'en'")
-            else:
-                logger.error(f"OpenAI STT 오류: {msg}")
-            raise TranscriptionError("OpenAI 음성 변환에 실패했습니다.") from e
+            self._raise_error(e)
 
     def close(self) -> None:
         pass
@@ -0,0 +1,128 @@
+# Backend/Utility/STT_TTS/imp_stt_whisper_local.py
+import io
+import os
+import time
+import wave
+import threading
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+from loguru import logger
+
+from .def_interface import ISTT
+from .def_exceptions import TranscriptionError
+from .imp_vad_segmenter import resample_pcm16
+
+try:
+    # CTranslate2 기반 Whisper (int8 양자화로 CPU/라즈베리파이에서도 실시간에 가까운 속도)
+    from faster_whisper import WhisperModel
+except ImportError:
+    WhisperModel = None
+
+SAMPLE_RATE = 16000
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+def wav_to_float32(audio_bytes: bytes) -> np.ndarray:
+    """WAV 바이트를 Whisper 입력 형식(16kHz 모노 float32, -1~1)으로 바꿉니다."""
+    with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+        if wf.getsampwidth() != 2:
+            raise TranscriptionError("로컬 STT는 16bit PCM WAV만 지원합니다.")
+        channels = wf.getnchannels()
+        rate = wf.getframerate()
+        pcm = wf.readframes(wf.getnframes())
+    if channels > 1:
+        # 채널 평균으로 모노 변환
+        samples = np.frombuffer(pcm, dtype=np.int16).reshape(-1, channels).mean(axis=1)
+        pcm = samples.astype(np.int16).tobytes()
+    pcm = resample_pcm16(pcm, rate, SAMPLE_RATE)
+    return np.frombuffer(pcm, dtype=np.int16).astype(np.float32) / 32768.0
+
+
+class LocalWhisperSTT(ISTT):
+    """
+    faster-whisper(CTranslate2) 로컬 STT 엔진. 네트워크 없이 동작하는 대체(failover) 엔진입니다.
+    - 모델은 initialize()에서 한 번만 올리고, 짧은 무음으로 예열해 첫 요청의 지연을 없앱니다.
+    - 변환은 동기 API라 atranscribe 기본 구현(엔진 오프로드 스레드 풀)으로 이벤트 루프 밖에서 실행됩니다.
+    """
+    SUPPORTED_FORMATS = frozenset({"wav"})
+
+    def __init__(self, config: Dict[str, Any], language: str = "ko", initial_prompt: Optional[str] = None,
+                 post_correct: Optional[Callable[[str], str]] = None) -> None:
+        self.model_name = config.get("model", "small")
+        self.compute_type = config.get("compute_type", "int8")
+        self.cpu_threads = config.get("cpu_threads", 4)
+        # 동시에 변환할 수 있는 요청 수 (CTranslate2 워커 수)
+        self.num_workers = config.get("num_workers", 1)
+        self.beam_size = config.get("beam_size", 1)
+        # 모델 저장 위치 (backend 폴더 기준 상대 경로, 비우면 Hugging Face 기본 캐시)
+        self.download_root = config.get("download_root") or None
+        if self.download_root and not os.path.isabs(self.download_root):
+            self.download_root = os.path.join(_BACKEND_DIR, self.download_root)
+        self.language = language
+        self.initial_prompt = initial_prompt
+        self.post_correct = post_correct
+        self.model = None
+        self._lock = threading.Lock()
+
+    def initialize(self) -> None:
+        with self._lock:
+            if self.model is not None:
+                return
+            if WhisperModel is None:
+                raise ImportError("faster-whisper가 설치되지 않았습니다. (pip install faster-whisper)")
+            started = time.perf_counter()
+            self.model = WhisperModel(
+                self.model_name,
+                device="cpu",
+                compute_type=self.compute_type,
+                cpu_threads=self.cpu_threads,
+                num_workers=self.num_workers,
+                download_root=self.download_root,
+            )
+            # 예열: 첫 변환에서 발생하는 메모리 할당/커널 준비 비용을 미리 치름
+            self._run(np.zeros(SAMPLE_RATE, dtype=np.float32))
+            logger.info(
+                f"로컬 Whisper 초기화 완료 (model={self.model_name}, compute_type={self.compute_type}, "
+                f"threads={self.cpu_threads}, {time.perf_counter() - started:.1f}s)"
+            )
+
+    def is_initialized(self) -> bool:
+        return self.model is not None
+
+    def _run(self, audio: np.ndarray) -> str:
+        segments, _ = self.model.transcribe(
+            audio,
+            language=self.language,
+            beam_size=self.beam_size,
+            initial_prompt=self.initial_prompt,
+            # 키오스크 발화는 짧으므로 이전 구간 문맥/내장 VAD 없이 한 번에 디코딩
+            condition_on_previous_text=False,
+            vad_filter=False,
+        )
+        # segments는 지연 평가 제너레이터라 여기서 끝까지 소비해야 실제 디코딩이 끝남
+        return "".join(segment.text for segment in segments).strip()
+
+    def transcribe(self, audio_bytes: bytes, audio_format: str = "wav") -> str:
+        if not self.is_initialized():
+            raise RuntimeError("로컬 STT 모델이 초기화되지 않았습니다. initialize()를 먼저 호출하세요.")
+        if audio_format != "wav":
+            raise TranscriptionError(f"로컬 STT는 WAV만 받습니다. (받은 포맷: {audio_format})")
+        try:
+            text = self._run(wav_to_float32(audio_bytes))
+        except TranscriptionError:
+            raise
+        except Exception as e:
+            logger.error(f"로컬 STT 변환 중 예외 발생: {e}")
+            raise TranscriptionError("로컬 음성 변환에 실패했습니다.") from e
+
+        if not text:
+            logger.warning("로컬 STT 결과가 비어 있습니다. (무음/잡음 가능)")
+            return ""
+        corrected = self.post_correct(text) if self.post_correct else text
+        logger.info(f"로컬 STT 완료 → '{text}'  => 보정 → '{corrected}'")
+        return corrected
+
+    def close(self) -> None:
+        # CTranslate2 모델은 참조가 사라지면 메모리를 반환
+        self.model = None
@@ -0,0 +1,327 @@
+# Backend/Utility/STT_TTS/imp_transcoder_ffmpeg.py
+import io
+import time
+import wave
+import asyncio
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Callable, Iterable, Tuple
+
+from loguru import logger
+
+from .def_interface import IModel
+from .def_exceptions import TranscodeError
+
+# MIME 타입 일부 → 컨테이너 이름 (매직 바이트로 판별하지 못했을 때의 보조 수단)
+_MIME_FORMATS = {
+    "webm": "webm", "ogg": "ogg", "opus": "ogg", "wav": "wav", "wave": "wav",
+    "mpeg": "mp3", "mp3": "mp3", "mp4": "mp4", "m4a": "m4a", "aac": "m4a", "flac": "flac",
+}
+
+# 무압축 컨테이너: 지원되더라도 Opus 재인코딩으로 업로드 크기를 줄일 여지가 있음
+_UNCOMPRESSED_FORMATS = {"wav"}
+
+
+@dataclass
+class TranscodeResult:
+    """변환 결과와 요청별 소요 시간(ms)을 함께 담는 결과 객체."""
+    audio_bytes: bytes
+    audio_format: str
+    wait_ms: float      # 워커 풀 대기 시간
+    elapsed_ms: float   # ffmpeg 실행 시간
+
+
+def pcm_to_wav(pcm_bytes: bytes, sample_rate: int, channels: int = 1) -> bytes:
+    """16bit PCM 바이트에 WAV 헤더를 붙여 메모리 상에서 WAV 바이트로 만듭니다."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as wf:
+        wf.setnchannels(channels)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(pcm_bytes)
+    return buf.getvalue()
+
+
+def sniff_format(audio_bytes: bytes, mime: Optional[str] = None) -> Optional[str]:
+    """
+    매직 바이트로 오디오 컨테이너를 판별합니다. 판별하지 못하면 MIME 타입으로 추정하고,
+    그래도 모르면 None을 반환합니다.
+    """
+    head = audio_bytes[:64]
+    if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+        return "wav"
+    if head[:4] == b"OggS":
+        return "ogg"
+    if head[:4] == b"\x1a\x45\xdf\xa3":
+        # EBML 헤더: DocType이 webm인 경우만 webm으로 인정 (그 외는 mkv)
+        return "webm" if b"webm" in head else None
+    if head[:4] == b"fLaC":
+        return "flac"
+    if head[4:8] == b"ftyp":
+        return "m4a"
+    if head[:3] == b"ID3" or (len(head) > 1 and head[0] == 0xFF and (head[1] & 0xE0) == 0xE0):
+        return "mp3"
+
+    subtype = (mime or "").lower().split(";")[0].split("/")[-1].strip()
+    return _MIME_FORMATS.get(subtype)
+
+
+def pick_decoded(audio_bytes: bytes, audio_format: str, wav_bytes: bytes,
+                 accepted: Iterable[str]) -> Optional[Tuple[bytes, str]]:
+    """
+    이미 PCM으로 풀어 둔 녹음을 ffmpeg를 다시 띄우지 않고 엔진에 넘길 (오디오, 포맷)을 고릅니다.
+    원본 포맷을 받으면 원본, 아니면 풀어 둔 WAV. 둘 다 받지 않으면 None (협상 필요)
+    """
+    accepted = frozenset(accepted)
+    if audio_format in accepted:
+        return audio_bytes, audio_format
+    if "wav" in accepted:
+        return wav_bytes, "wav"
+    return None
+
+
+class PCMStreamDecoder:
+    """
+    세션 동안 ffmpeg 프로세스 하나를 유지하며, 조각조각 도착하는 압축 오디오(webm/ogg Opus)를
+    stdin으로 밀어 넣고 16kHz 모노 PCM을 stdout에서 바로 읽어오는 스트리밍 디코더.
+    """
+    def __init__(self, command: List[str]) -> None:
+        self.command = command
+        self._proc: Optional[asyncio.subprocess.Process] = None
+
+    async def start(self) -> None:
+        try:
+            self._proc = await asyncio.create_subprocess_exec(
+                *self.command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except FileNotFoundError as e:
+            logger.error("ffmpeg를 찾을 수 없습니다. 시스템에 ffmpeg가 설치되어 있는지 확인해주세요.")
+            raise TranscodeError("ffmpeg를 찾을 수 없습니다.") from e
+
+    async def write(self, data: bytes) -> None:
+        """압축 오디오 조각을 ffmpeg에 넣습니다."""
+        try:
+            self._proc.stdin.write(data)
+            await self._proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise TranscodeError("스트리밍 오디오 디코딩이 중단되었습니다.") from e
+
+    async def read(self, size: int = 4096) -> bytes:
+        """디코딩된 PCM을 읽습니다. 스트림이 끝나면 b''를 반환합니다."""
+        return await self._proc.stdout.read(size)
+
+    async def finish(self) -> None:
+        """입력을 닫아 ffmpeg가 남은 오디오를 모두 내보내도록 합니다."""
+        if self._proc and self._proc.stdin and not self._proc.stdin.is_closing():
+            self._proc.stdin.close()
+
+    async def close(self) -> None:
+        if self._proc is None:
+            return
+        if self._proc.returncode is None:
+            self._proc.kill()
+        await self._proc.wait()
+        self._proc = None
+
+
+class AudioTranscoder(IModel):
+    """
+    ffmpeg를 stdin/stdout 파이프로 구동하여 임시 파일 없이 오디오를 변환하는 클래스.
+    업로드 바이트를 stdin으로 넣고, 16kHz/Mono PCM을 stdout으로 받아 메모리에서 WAV로 감쌉니다.
+    동시에 실행되는 ffmpeg 수는 재사용 가능한 워커 스레드 풀 크기로 제한됩니다.
+    - ffmpeg CLI는 프로세스 하나가 입력 컨테이너 하나만 처리하므로, 변환마다 프로세스를 하나 띄웁니다.
+      (스트리밍 세션은 open_stream_decoder로 세션 동안 프로세스 하나를 유지)
+      대신 변환 자체를 줄입니다. 엔진이 그대로 받는 압축 포맷은 ffmpeg를 건너뛰고, 무음 검사/구간 분할
+      래퍼는 업로드를 한 번 풀어 둔 WAV를 다시 쓰므로(pick_decoded) 업로드 하나에 ffmpeg는 많아야 한 번입니다.
+    """
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.ffmpeg_path = config.get("ffmpeg_path", "ffmpeg")
+        self.sample_rate = config.get("sample_rate", 16000)
+        self.max_workers = config.get("transcode_workers", 2)
+        self.timeout = config.get("transcode_timeout", 30)
+        self.prefer_opus = config.get("prefer_opus", True)
+        self.opus_bitrate = config.get("opus_bitrate", "24k")
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def initialize(self) -> None:
+        """변환 워커 풀을 생성합니다. 워커 스레드는 요청 간에 재사용됩니다."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="ffmpeg-worker"
+            )
+            logger.info(f"오디오 변환기 초기화 (workers={self.max_workers}, rate={self.sample_rate})")
+
+    def is_initialized(self) -> bool:
+        return self._executor is not None
+
+    def _decode_command(self) -> List[str]:
+        # pipe:0(stdin) 입력 → 모노/16kHz signed 16bit PCM → pipe:1(stdout)
+        return [
+            self.ffmpeg_path, "-hide_banner", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-ac", "1", "-ar", str(self.sample_rate),
+            "-f", "s16le", "-acodec", "pcm_s16le",
+            "pipe:1",
+        ]
+
+    def _opus_command(self) -> List[str]:
+        # pipe:0(stdin) 입력 → 모노/16kHz Opus(Ogg 컨테이너) → pipe:1(stdout)
+        return [
+            self.ffmpeg_path, "-hide_banner", "-loglevel", "error",
+            "-i", "pipe:0",
+            "-ac", "1", "-ar", str(self.sample_rate),
+            "-c:a", "libopus", "-b:a", self.opus_bitrate, "-application", "voip",
+            "-f", "ogg",
+            "pipe:1",
+        ]
+
+    def _stream_decode_command(self, input_format: str) -> List[str]:
+        # 실시간 스트림: 입력 버퍼링/탐색을 최소화하여 도착한 프레임을 바로 PCM으로 내보냄
+        return [
+            self.ffmpeg_path, "-hide_banner", "-loglevel", "error",
+            "-fflags", "nobuffer", "-probesize", "4096", "-analyzeduration", "0",
+            "-f", input_format, "-i", "pipe:0",
+            "-ac", "1", "-ar", str(self.sample_rate),
+            "-f", "s16le", "-acodec", "pcm_s16le",
+            "-flush_packets", "1",
+            "pipe:1",
+        ]
+
+    def _run_ffmpeg(self, command: List[str], input_bytes: bytes) -> bytes:
+        """ffmpeg를 파이프로 실행하고 stdout 결과를 반환합니다. (워커 스레드에서 실행)"""
+        try:
+            result = subprocess.run(
+                command,
+                input=input_bytes,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                check=True,
+                timeout=self.timeout,
+            )
+        except FileNotFoundError as e:
+            logger.error("ffmpeg를 찾을 수 없습니다. 시스템에 ffmpeg가 설치되어 있는지 확인해주세요.")
+            raise TranscodeError("ffmpeg를 찾을 수 없습니다.") from e
+        except subprocess.CalledProcessError as e:
+            error_msg = e.stderr.decode(errors="ignore") if e.stderr else "알 수 없는 ffmpeg 오류"
+            logger.error(f"ffmpeg 오디오 변환 실패: {error_msg}")
+            raise TranscodeError("오디오 변환에 실패했습니다.") from e
+        except subprocess.TimeoutExpired as e:
+            logger.error("ffmpeg 변환 시간 초과")
+            raise TranscodeError("오디오 변환 시간이 초과되었습니다.") from e
+
+        if not result.stdout:
+            raise TranscodeError("오디오 변환 결과가 비어있습니다.")
+        return result.stdout
+
+    def _timed(self, job: Callable[[], TranscodeResult], submitted_at: float) -> TranscodeResult:
+        """워커 스레드에서 변환 작업을 실행하고 대기/실행 시간을 기록합니다."""
+        started_at = time.perf_counter()
+        result = job()
+        result.wait_ms = (started_at - submitted_at) * 1000
+        result.elapsed_ms = (time.perf_counter() - started_at) * 1000
+        return result
+
+    def _wav_job(self, input_bytes: bytes) -> TranscodeResult:
+        pcm = self._run_ffmpeg(self._decode_command(), input_bytes)
+        return TranscodeResult(pcm_to_wav(pcm, self.sample_rate), "wav", 0.0, 0.0)
+
+    def _negotiate_job(self, input_bytes: bytes, source_format: Optional[str],
+                       accepted: frozenset) -> TranscodeResult:
+        """
+        업로드 포맷과 엔진의 지원 포맷을 비교해 가장 작은 업로드를 만듭니다.
+        - 지원되는 무압축 포맷(wav): Opus로 줄어들 때만 재인코딩
+        - 지원되지 않는 포맷: Opus(가능하면) 또는 WAV로 변환
+        """
+        if self.prefer_opus and "ogg" in accepted:
+            opus = self._run_ffmpeg(self._opus_command(), input_bytes)
+            if source_format not in accepted or len(opus) < len(input_bytes):
+                return TranscodeResult(opus, "ogg", 0.0, 0.0)
+            return TranscodeResult(input_bytes, source_format, 0.0, 0.0)
+        if source_format in accepted:
+            return TranscodeResult(input_bytes, source_format, 0.0, 0.0)
+        return self._wav_job(input_bytes)
+
+    def _plan(self, input_bytes: bytes, input_mime: Optional[str],
+              accepted: Iterable[str]) -> tuple:
+        """변환 없이 바로 전달 가능한지 판단합니다. (결과, 또는 워커에서 실행할 작업)"""
+        if not input_bytes:
+            raise TranscodeError("입력 오디오 데이터가 비어있습니다.")
+        accepted = frozenset(accepted)
+        source_format = sniff_format(input_bytes, input_mime)
+        if source_format in accepted and source_format not in _UNCOMPRESSED_FORMATS:
+            # 엔진이 그대로 받는 압축 포맷이면 ffmpeg 단계를 완전히 생략
+            return TranscodeResult(input_bytes, source_format, 0.0, 0.0), None
+        return None, lambda: self._negotiate_job(input_bytes, source_format, accepted)
+
+    def prepare(self, input_bytes: bytes, input_mime: Optional[str],
+                accepted: Iterable[str]) -> TranscodeResult:
+        """STT 엔진이 받을 수 있는 포맷으로 업로드 오디오를 협상합니다."""
+        if not self.is_initialized():
+            raise RuntimeError("오디오 변환기가 초기화되지 않았습니다.")
+        ready, job = self._plan(input_bytes, input_mime, accepted)
+        if ready is not None:
+            return ready
+        submitted_at = time.perf_counter()
+        return self._executor.submit(self._timed, job, submitted_at).result()
+
+    async def aprepare(self, input_bytes: bytes, input_mime: Optional[str],
+                       accepted: Iterable[str]) -> TranscodeResult:
+        """prepare의 비동기 버전. 변환이 필요할 때만 워커 풀을 사용합니다."""
+        if not self.is_initialized():
+            raise RuntimeError("오디오 변환기가 초기화되지 않았습니다.")
+        ready, job = self._plan(input_bytes, input_mime, accepted)
+        if ready is not None:
+            return ready
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+        return await loop.run_in_executor(self._executor, self._timed, job, submitted_at)
+
+    def to_wav(self, input_bytes: bytes, input_mime: Optional[str] = None) -> TranscodeResult:
+        """
+        브라우저에서 전달받은 오디오(webm, ogg 등)를 WAV(16kHz, 1채널)로 변환합니다.
+        이미 wav 형식이면 변환 없이 그대로 반환합니다.
+        """
+        if not self.is_initialized():
+            raise RuntimeError("오디오 변환기가 초기화되지 않았습니다.")
+        if not input_bytes:
+            raise TranscodeError("입력 오디오 데이터가 비어있습니다.")
+        if "wav" in (input_mime or "").lower():
+            return TranscodeResult(input_bytes, "wav", 0.0, 0.0)
+        submitted_at = time.perf_counter()
+        return self._executor.submit(self._timed, lambda: self._wav_job(input_bytes), submitted_at).result()
+
+    async def ato_wav(self, input_bytes: bytes, input_mime: Optional[str] = None) -> TranscodeResult:
+        """to_wav의 비동기 버전. 변환 작업을 워커 풀에 넘기고 이벤트 루프는 막지 않습니다."""
+        if not self.is_initialized():
+            raise RuntimeError("오디오 변환기가 초기화되지 않았습니다.")
+        if not input_bytes:
+            raise TranscodeError("입력 오디오 데이터가 비어있습니다.")
+        if "wav" in (input_mime or "").lower():
+            return TranscodeResult(input_bytes, "wav", 0.0, 0.0)
+        loop = asyncio.get_running_loop()
+        submitted_at = time.perf_counter()
+        return await loop.run_in_executor(
+            self._executor, self._timed, lambda: self._wav_job(input_bytes), submitted_at
+        )
+
+    async def open_stream_decoder(self, input_format: str) -> PCMStreamDecoder:
+        """
+        WebSocket 등으로 실시간 도착하는 압축 오디오(webm/ogg)를 16kHz PCM으로 푸는 디코더를 엽니다.
+        세션당 ffmpeg 프로세스 하나를 사용하며, 워커 풀과는 별개로 동작합니다.
+        """
+        if input_format not in ("webm", "ogg"):
+            raise TranscodeError(f"스트리밍 디코딩을 지원하지 않는 포맷입니다: {input_format}")
+        decoder = PCMStreamDecoder(self._stream_decode_command(input_format))
+        await decoder.start()
+        return decoder
+
+    def close(self) -> None:
+        """워커 풀을 정리합니다."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            logger.info("오디오 변환기 워커 풀이 정리되었습니다.")
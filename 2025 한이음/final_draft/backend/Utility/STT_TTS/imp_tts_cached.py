@@ -0,0 +1,170 @@
+# Backend/Utility/STT_TTS/imp_tts_cached.py
+import os
+import asyncio
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from loguru import logger
+
+from .def_interface import ITTS
+from .def_exceptions import TTSError
+from .imp_offload import run_blocking
+from ..Cache import DiskBytesCache, SingleFlight, content_key, create_shared_cache
+from ..OpenAIGateway import request_priority, DEFAULT_PRIORITY
+
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+class CachedTTS(ITTS):
+    """
+    다른 TTS 엔진을 감싸 합성 결과를 캐시하는 래퍼.
+    - 키: hash(텍스트, 모델, 음성, 포맷) → 같은 문장을 다시 요청하면 API 호출 없이 즉시 반환합니다.
+    - 메모리 LRU → 디스크 순으로 찾고, 디스크에서 찾으면 메모리로 올립니다.
+      (메모리 계층은 공유 상태 저장소의 "tts" 이름 공간이라 state.backend가 sqlite면 워커들이 함께 씁니다)
+    - 같은 문장이 동시에 요청되면 합성은 한 번만 수행하고 결과를 함께 나눠 씁니다.
+    - prewarm()으로 자주 쓰는 안내 문구를 미리 합성해 둘 수 있습니다.
+    """
+
+    def __init__(self, inner: ITTS, config: Dict[str, Any]) -> None:
+        self.inner = inner
+        self.AUDIO_FORMAT = inner.AUDIO_FORMAT
+        self.memory = create_shared_cache("tts", max_bytes=int(config.get("memory_max_mb", 16) * 1024 * 1024))
+
+        disk_dir = config.get("disk_dir", "cache/tts")
+        self.disk: Optional[DiskBytesCache] = None
+        if disk_dir:
+            if not os.path.isabs(disk_dir):
+                disk_dir = os.path.join(_BACKEND_DIR, disk_dir)
+            self.disk = DiskBytesCache(
+                disk_dir, int(config.get("disk_max_mb", 200) * 1024 * 1024), suffix=f".{self.AUDIO_FORMAT}"
+            )
+
+        self.prewarm_phrases: List[str] = list(config.get("prewarm") or [])
+        self.prewarm_concurrency = config.get("prewarm_concurrency", 2)
+        self.synthesized = 0
+        # 같은 문장 동시 합성 합치기. 처음 합성하던 요청이 취소되면 기다리던 요청에는 TTSError를 돌려줌
+        self._flight = SingleFlight(abort_error=lambda: TTSError("음성 합성이 중단되었습니다."))
+
+    # --- 생명주기는 내부 엔진에 위임 ---
+    def initialize(self) -> None:
+        self.inner.initialize()
+
+    def is_initialized(self) -> bool:
+        return self.inner.is_initialized()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    # --- 캐시 ---
+    def cache_key(self, text: str) -> str:
+        return content_key(
+            text.strip(),
+            getattr(self.inner, "model", type(self.inner).__name__),
+            getattr(self.inner, "voice", ""),
+            self.AUDIO_FORMAT,
+        )
+
+    def _lookup_disk(self, key: str) -> Optional[bytes]:
+        if self.disk is None:
+            return None
+        data = self.disk.get(key)
+        if data is not None:
+            self.memory.put(key, data)
+        return data
+
+    def _store(self, key: str, audio: bytes) -> None:
+        self.memory.put(key, audio)
+        if self.disk is not None:
+            self.disk.put(key, audio)
+
+    def synthesize(self, text: str) -> bytes:
+        key = self.cache_key(text)
+        data = self.memory.get(key) or self._lookup_disk(key)
+        if data is not None:
+            return data
+        audio = self.inner.synthesize(text)
+        self.synthesized += 1
+        if audio:
+            self._store(key, audio)
+        return audio
+
+    async def _acached(self, key: str, text: str) -> Optional[bytes]:
+        """메모리 → 디스크 순으로 찾고, 같은 문장을 이미 합성 중이면 그 결과를 기다립니다."""
+        data = await self.memory.aget(key)
+        if data is not None:
+            logger.info(f"TTS 캐시 적중(메모리): \"{text}\"")
+            return data
+        if self.disk is not None:
+            data = await run_blocking(self._lookup_disk, key)
+            if data is not None:
+                logger.info(f"TTS 캐시 적중(디스크): \"{text}\"")
+                return data
+        return await self._flight.wait(key)
+
+    async def _asynthesize_and_store(self, key: str, text: str) -> bytes:
+        audio = await self.inner.asynthesize(text)
+        self.synthesized += 1
+        if audio:
+            await run_blocking(self._store, key, audio)
+        return audio
+
+    async def asynthesize(self, text: str) -> bytes:
+        key = self.cache_key(text)
+        data = await self._acached(key, text)
+        if data is not None:
+            return data
+        return await self._flight.do(key, lambda: self._asynthesize_and_store(key, text))
+
+    async def astream_synthesize(self, text: str) -> AsyncIterator[bytes]:
+        """캐시에 있으면 한 번에 내보내고, 없으면 내부 엔진의 청크를 그대로 흘려보내며 모아서 저장합니다."""
+        key = self.cache_key(text)
+        data = await self._acached(key, text)
+        if data is not None:
+            yield data
+            return
+
+        # 클라이언트가 중간에 끊은 경우: 불완전한 오디오는 저장하지 않고 기다리던 쪽에 실패를 알림 (SingleFlight.lead)
+        chunks: List[bytes] = []
+        with self._flight.lead(key) as future:
+            async for chunk in self.inner.astream_synthesize(text):
+                chunks.append(chunk)
+                yield chunk
+            audio = b"".join(chunks)
+            self.synthesized += 1
+            if audio:
+                await run_blocking(self._store, key, audio)
+            future.set_result(audio)
+
+    async def prewarm(self, phrases: Optional[List[str]] = None) -> int:
+        """
+        안내 문구 목록을 미리 합성해 캐시에 넣습니다. 이미 캐시된 문구는 건너뜁니다.
+        반환값은 캐시에 준비된 문구 수입니다.
+        """
+        phrases = [p for p in (phrases if phrases is not None else self.prewarm_phrases) if p and p.strip()]
+        if not phrases:
+            return 0
+        semaphore = asyncio.Semaphore(max(1, self.prewarm_concurrency))
+
+        async def warm(phrase: str) -> bool:
+            async with semaphore:
+                try:
+                    # 미리 합성은 배경 작업: 사용자 요청이 OpenAI 대기열에서 먼저 나가도록 우선순위를 낮춤
+                    with request_priority(DEFAULT_PRIORITY["responses"]):
+                        await self.asynthesize(phrase)
+                    return True
+                except Exception as e:
+                    logger.warning(f"TTS 프리웜 실패: \"{phrase}\" ({e})")
+                    return False
+
+        results = await asyncio.gather(*(warm(p) for p in phrases))
+        ready = sum(results)
+        logger.info(f"TTS 프리웜 완료: {ready}/{len(phrases)}개 문구 준비됨 (신규 합성 {self.synthesized}건)")
+        return ready
+
+    def stats(self) -> Dict[str, Any]:
+        """계층별 적중률과 실제 합성 횟수를 반환합니다."""
+        return {
+            "memory": self.memory.stats.as_dict(),
+            "disk": self.disk.stats.as_dict() if self.disk is not None else None,
+            "synthesized": self.synthesized,
+            "coalesced": self._flight.coalesced,
+        }
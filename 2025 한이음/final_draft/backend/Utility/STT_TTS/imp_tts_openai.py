@@ -1,21 +1,27 @@
 # Backend/Utility/STT_TTS/imp_tts_openai.py
 
 import os
-from openai import OpenAI
 from loguru import logger
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 
 from .def_interface import ITTS
 from .def_exceptions import TTSError
+from ..OpenAIGateway import create_openai_gateway
 
 class TextToSpeech(ITTS):
     """OpenAI TTS API를 사용하여 텍스트를 음성으로 변환하는 클래스."""
+    STREAM_CHUNK_BYTES = 4096
+
     def __init__(self, config: Dict[str, Any]) -> None:
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("환경 변수 OPENAI_API_KEY가 설정되지 않았습니다.")
             
-        self.client = OpenAI(api_key=api_key)
+        # 공유 OpenAI 관문의 클라이언트 (연결 풀/동시 실행 수/요청 한도를 다른 모듈과 함께 관리)
+        gateway = create_openai_gateway()
+        self.client = gateway.sync_client(api_key)
+        # 비동기 핸들러용 클라이언트 (이벤트 루프를 막지 않음)
+        self.aclient = gateway.async_client(api_key)
         self.model = config.get('model', 'tts-1')
         self.voice = config.get('voice', 'fable')
         self._is_initialized = False
@@ -53,6 +59,47 @@ class TextToSpeech(ITTS):
             logger.error(f"OpenAI TTS 음성 합성 중 오류 발생: {e}")
             raise TTSError("OpenAI 음성 합성에 실패했습니다.") from e
 
+    async def asynthesize(self, text: str) -> bytes:
+        """synthesize와 같은 동작을 AsyncOpenAI로 수행합니다. (스레드 오프로드 불필요)"""
+        if not self.is_initialized():
+            raise RuntimeError("TTS 모듈이 초기화되지 않았습니다.")
+
+        logger.info(f"OpenAI TTS 변환 시작(async): \"{text}\"")
+        try:
+            response = await self.aclient.audio.speech.create(
+                model=self.model,
+                voice=self.voice,
+                input=text
+            )
+            audio_bytes = response.content
+            logger.info(f"OpenAI TTS 변환 완료: {len(audio_bytes)} bytes 생성됨.")
+            return audio_bytes
+
+        except Exception as e:
+            logger.error(f"OpenAI TTS 음성 합성 중 오류 발생: {e}")
+            raise TTSError("OpenAI 음성 합성에 실패했습니다.") from e
+
+    async def astream_synthesize(self, text: str) -> AsyncIterator[bytes]:
+        """SDK의 스트리밍 응답으로 MP3 청크를 도착하는 대로 내보냅니다. (첫 소리까지의 지연 단축)"""
+        if not self.is_initialized():
+            raise RuntimeError("TTS 모듈이 초기화되지 않았습니다.")
+
+        logger.info(f"OpenAI TTS 스트리밍 시작: \"{text}\"")
+        total = 0
+        try:
+            async with self.aclient.audio.speech.with_streaming_response.create(
+                model=self.model,
+                voice=self.voice,
+                input=text
+            ) as response:
+                async for chunk in response.iter_bytes(self.STREAM_CHUNK_BYTES):
+                    total += len(chunk)
+                    yield chunk
+        except Exception as e:
+            logger.error(f"OpenAI TTS 스트리밍 중 오류 발생: {e}")
+            raise TTSError("OpenAI 음성 합성에 실패했습니다.") from e
+        logger.info(f"OpenAI TTS 스트리밍 완료: {total} bytes")
+
     def close(self) -> None:
         """API 방식이므로 특별히 해제할 리소스가 없습니다."""
         pass
\ No newline at end of file
@@ -0,0 +1,84 @@
+# Backend/Utility/STT_TTS/imp_tts_stream.py
+import re
+import asyncio
+from typing import AsyncIterator, List
+
+from .def_interface import ITTS
+
+# 문장 경계: 마침표/물음표/느낌표/말줄임표 뒤의 공백, 또는 줄바꿈
+_SENTENCE_END = re.compile(r"(?<=[.!?。…])\s+|\n+")
+# 너무 긴 문장은 쉼표 등 구 경계에서 다시 자름
+_CLAUSE_END = re.compile(r"(?<=[,，;:])\s+")
+
+
+def split_sentences(text: str, max_chars: int = 200, min_chars: int = 8) -> List[str]:
+    """
+    TTS 스트리밍용으로 텍스트를 문장 단위로 나눕니다.
+    - min_chars보다 짧은 조각은 다음 문장과 합쳐 API 호출 수를 줄입니다. ("네." 같은 조각)
+    - max_chars보다 긴 문장은 쉼표 → 공백 순으로 다시 나눕니다.
+    """
+    pieces: List[str] = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            pieces.append(sentence)
+            continue
+        buf = ""
+        for part in _CLAUSE_END.split(sentence):
+            for word in (part.split(" ") if len(part) > max_chars else [part]):
+                if buf and len(buf) + 1 + len(word) > max_chars:
+                    pieces.append(buf)
+                    buf = word
+                else:
+                    buf = f"{buf} {word}" if buf else word
+        if buf:
+            pieces.append(buf)
+
+    merged: List[str] = []
+    for piece in pieces:
+        if merged and len(merged[-1]) < min_chars and len(merged[-1]) + 1 + len(piece) <= max_chars:
+            merged[-1] = f"{merged[-1]} {piece}"
+        else:
+            merged.append(piece)
+    return merged
+
+
+async def stream_sentences(tts: ITTS, sentences: List[str], concurrency: int = 2) -> AsyncIterator[bytes]:
+    """
+    문장들을 최대 concurrency개까지 동시에 합성하고, 오디오 청크를 원래 문장 순서대로 내보냅니다.
+    - 현재 재생 순서인 문장은 엔진이 보내는 청크를 도착 즉시 흘려보냅니다.
+    - 뒤 문장들은 미리 합성해 버퍼에 쌓아 두었다가 차례가 되면 내보냅니다.
+    - 합성 중 오류가 나면 해당 위치에서 예외를 다시 발생시키고, 남은 작업은 취소합니다.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    queues: List[asyncio.Queue] = [asyncio.Queue() for _ in sentences]
+    _DONE = object()
+
+    async def produce(index: int, sentence: str) -> None:
+        queue = queues[index]
+        async with semaphore:
+            try:
+                async for chunk in tts.astream_synthesize(sentence):
+                    if chunk:
+                        queue.put_nowait(chunk)
+            except Exception as e:
+                queue.put_nowait(e)
+            finally:
+                queue.put_nowait(_DONE)
+
+    # 문장 순서대로 작업을 만들어 앞 문장이 세마포어를 먼저 얻도록 함
+    tasks = [asyncio.create_task(produce(i, s)) for i, s in enumerate(sentences)]
+    try:
+        for queue in queues:
+            while True:
+                item = await queue.get()
+                if item is _DONE:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -12,6 +12,7 @@ from loguru import logger
 
 from .def_interface import IVAD
 from .def_exceptions import VADStreamError
+from .imp_vad_segmenter import CobraFrameScorer, UtteranceSegmenter
 
 class VoiceActivityDetector(IVAD):
     """
@@ -57,10 +58,11 @@ class VoiceActivityDetector(IVAD):
         별도의 스레드에서 실행되는 VAD 처리 루프.
         메인 스레드의 부담을 줄여 'input overflow'를 방지합니다.
         """
-        is_speaking = False
-        speech_buffer = []
-        silence_frames = 0
-        min_silence_frames = self.min_silence_duration_ms // (1000 * self.CHUNK_SAMPLES / self.VAD_RATE)
+        # 프레임 판정/발화 분리 규칙은 WebSocket 스트리밍 STT와 공유합니다. (imp_vad_segmenter)
+        segmenter = UtteranceSegmenter(
+            CobraFrameScorer(self.cobra, self.threshold),
+            min_silence_duration_ms=self.min_silence_duration_ms,
+        )
 
         while not self.stop_event.is_set():
             try:
@@ -76,22 +78,10 @@ class VoiceActivityDetector(IVAD):
                 num_frames = len(audio_int16) // self.CHUNK_SAMPLES
                 for i in range(num_frames):
                     frame = audio_int16[i * self.CHUNK_SAMPLES : (i + 1) * self.CHUNK_SAMPLES]
-                    voice_probability = self.cobra.process(frame)
-
-                    # 음성 감지 로직
-                    if voice_probability > self.threshold:
-                        if not is_speaking: is_speaking = True
-                        speech_buffer.append(frame.tobytes())
-                        silence_frames = 0
-                    elif is_speaking:
-                        silence_frames += 1
-                        if silence_frames > min_silence_frames:
-                            # 음성 구간이 끝나면, 감지된 전체 음성 데이터를 출력 큐에 넣습니다.
-                            utterance = b''.join(speech_buffer)
-                            self.output_queue.put(utterance)
-                            is_speaking = False
-                            speech_buffer = []
-                            silence_frames = 0
+                    utterance = segmenter.feed_frame(frame)
+                    if utterance:
+                        # 음성 구간이 끝나면, 감지된 전체 음성 데이터를 출력 큐에 넣습니다.
+                        self.output_queue.put(utterance)
             except queue.Empty:
                 # 큐가 비어있으면 루프를 계속 진행합니다.
                 continue
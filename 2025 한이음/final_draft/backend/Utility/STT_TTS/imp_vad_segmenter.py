@@ -0,0 +1,184 @@
+# Backend/Utility/STT_TTS/imp_vad_segmenter.py
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from .def_exceptions import VADStreamError
+from .def_interface import IFrameScorer
+
+# Cobra는 선택 의존성 (없거나 AccessKey가 없으면 에너지 기반 VAD로 대체)
+try:
+    import pvcobra
+except ImportError:
+    pvcobra = None
+
+
+class CobraFrameScorer(IFrameScorer):
+    """Picovoice Cobra VAD로 프레임을 평가합니다. (512 샘플 / 16kHz)"""
+    name = "cobra"
+
+    def __init__(self, cobra: Any, threshold: float, owns: bool = False) -> None:
+        self.cobra = cobra
+        self.sample_rate = cobra.sample_rate
+        self.frame_length = cobra.frame_length
+        self.threshold = threshold
+        self._owns = owns   # 직접 생성한 인스턴스만 close에서 해제
+
+    def score(self, frame: np.ndarray) -> float:
+        return self.cobra.process(frame)
+
+    def close(self) -> None:
+        if self._owns and self.cobra is not None:
+            self.cobra.delete()
+            self.cobra = None
+
+
+class EnergyFrameScorer(IFrameScorer):
+    """
+    프레임 RMS 에너지(dBFS)로 음성 여부를 추정하는 대체 VAD.
+    threshold_db에서 0.5가 되도록 ±10dB 구간을 0~1로 선형 변환합니다.
+    """
+    name = "energy"
+
+    def __init__(self, threshold_db: float = -45.0, sample_rate: int = 16000, frame_length: int = 512) -> None:
+        self.threshold_db = threshold_db
+        self.sample_rate = sample_rate
+        self.frame_length = frame_length
+        self.threshold = 0.5
+
+    def score(self, frame: np.ndarray) -> float:
+        samples = frame.astype(np.float32) / 32768.0
+        rms = float(np.sqrt(np.mean(samples * samples))) if samples.size else 0.0
+        db = 20.0 * np.log10(rms) if rms > 1e-10 else -200.0
+        return min(1.0, max(0.0, (db - self.threshold_db + 10.0) / 20.0))
+
+
+class UtteranceSegmenter:
+    """
+    PCM 스트림을 프레임 단위로 VAD에 통과시켜 발화(utterance) 단위로 잘라내는 상태 기계.
+    VoiceActivityDetector._processing_loop 의 판정 로직을 마이크/스레드와 분리한 것으로,
+    Cobra 마이크 입력과 WebSocket 스트림이 같은 규칙으로 끝점을 찾습니다.
+    - 음성 프레임이 나오면 발화 시작, 이후 무음이 min_silence_duration_ms를 넘으면 발화 종료
+    - 발화 사이의 짧은 쉼은 유지하고, 끝의 무음 꼬리는 잘라서 내보냅니다.
+    - pre_roll_ms: 발화 시작 직전 소리를 앞에 붙여 첫 음절이 잘리지 않게 함
+    - min_speech_ms: 이보다 짧은 음성(클릭, 잡음)은 버림 / max_utterance_ms: 넘으면 강제로 끊음 (0이면 제한 없음)
+    """
+
+    def __init__(self, scorer: IFrameScorer, min_silence_duration_ms: int = 1000,
+                 pre_roll_ms: int = 0, min_speech_ms: int = 0, max_utterance_ms: int = 0) -> None:
+        self.scorer = scorer
+        self.sample_rate = scorer.sample_rate
+        self.frame_length = scorer.frame_length
+        self.frame_bytes = self.frame_length * 2
+        frame_ms = 1000 * self.frame_length / self.sample_rate
+        self.frame_ms = frame_ms
+        self.min_silence_frames = int(min_silence_duration_ms // frame_ms)
+        self.min_speech_frames = int(min_speech_ms // frame_ms)
+        self.max_frames = int(max_utterance_ms // frame_ms) if max_utterance_ms else 0
+
+        self.is_speaking = False
+        self._pending = bytearray()
+        self._pre_roll: Deque[bytes] = deque(maxlen=max(1, int(pre_roll_ms // frame_ms)) if pre_roll_ms else 1)
+        self._use_pre_roll = bool(pre_roll_ms)
+        self._speech: List[bytes] = []
+        self._voiced_frames = 0
+        self._silence_frames = 0
+        self.dropped = 0   # min_speech_ms 미만이라 버린 발화 수
+
+    def feed(self, pcm_bytes: bytes) -> List[bytes]:
+        """PCM 바이트를 넣고, 이번 입력으로 끝난 발화들의 PCM을 반환합니다."""
+        self._pending += pcm_bytes
+        utterances: List[bytes] = []
+        while len(self._pending) >= self.frame_bytes:
+            frame = bytes(self._pending[: self.frame_bytes])
+            del self._pending[: self.frame_bytes]
+            utterance = self._process(frame)
+            if utterance:
+                utterances.append(utterance)
+        return utterances
+
+    def feed_frame(self, frame: np.ndarray) -> Optional[bytes]:
+        """정확히 frame_length 길이의 int16 프레임 하나를 처리합니다."""
+        return self._process(frame.tobytes())
+
+    def _process(self, frame: bytes) -> Optional[bytes]:
+        voice_probability = self.scorer.score(np.frombuffer(frame, dtype=np.int16))
+
+        # 음성 감지 로직
+        if voice_probability > self.scorer.threshold:
+            if not self.is_speaking:
+                self.is_speaking = True
+                self._speech = list(self._pre_roll) if self._use_pre_roll else []
+                self._pre_roll.clear()
+            self._speech.append(frame)
+            self._voiced_frames += 1
+            self._silence_frames = 0
+            if self.max_frames and len(self._speech) >= self.max_frames:
+                return self._emit()
+        elif self.is_speaking:
+            self._speech.append(frame)
+            self._silence_frames += 1
+            if self._silence_frames > self.min_silence_frames:
+                return self._emit()
+        elif self._use_pre_roll:
+            self._pre_roll.append(frame)
+        return None
+
+    def _emit(self) -> Optional[bytes]:
+        frames = self._speech[: len(self._speech) - self._silence_frames] if self._silence_frames else self._speech
+        voiced = self._voiced_frames
+        self.is_speaking = False
+        self._speech = []
+        self._voiced_frames = 0
+        self._silence_frames = 0
+        if voiced < self.min_speech_frames:
+            self.dropped += 1
+            return None
+        return b"".join(frames)
+
+    def flush(self) -> Optional[bytes]:
+        """스트림이 끝났을 때 진행 중이던 발화를 내보냅니다."""
+        self._pending.clear()
+        if not self.is_speaking:
+            return None
+        return self._emit()
+
+    def close(self) -> None:
+        self.scorer.close()
+
+
+def create_frame_scorer(config: Dict[str, Any]) -> IFrameScorer:
+    """
+    vad.engine 설정에 따라 프레임 평가기를 만듭니다.
+    - "cobra": Cobra 필수 (실패 시 VADStreamError)
+    - "energy": 에너지 기반 VAD
+    - "auto"(기본): Cobra를 시도하고, 안 되면 에너지 기반 VAD로 대체
+    """
+    engine = config.get("engine", "auto")
+    if engine in ("auto", "cobra"):
+        try:
+            if pvcobra is None:
+                raise ImportError("pvcobra가 설치되지 않았습니다.")
+            cobra = pvcobra.create(access_key=os.environ["PICOVOICE_ACCESS_KEY"])
+            return CobraFrameScorer(cobra, config.get("threshold", 0.6), owns=True)
+        except Exception as e:
+            if engine == "cobra":
+                raise VADStreamError(f"Cobra VAD 초기화 실패: {e}")
+            logger.warning(f"Cobra VAD를 사용할 수 없어 에너지 기반 VAD로 대체합니다: {e}")
+    return EnergyFrameScorer(config.get("energy_threshold_db", -45.0))
+
+
+def resample_pcm16(pcm_bytes: bytes, source_rate: int, target_rate: int = 16000) -> bytes:
+    """16bit 모노 PCM을 선형 보간으로 리샘플링합니다. (VAD/STT 입력용, 추가 의존성 없음)"""
+    if source_rate == target_rate or not pcm_bytes:
+        return pcm_bytes
+    samples = np.frombuffer(pcm_bytes, dtype=np.int16).astype(np.float32)
+    n_out = int(len(samples) * target_rate / source_rate)
+    if n_out <= 0:
+        return b""
+    positions = np.arange(n_out, dtype=np.float64) * (source_rate / target_rate)
+    resampled = np.interp(positions, np.arange(len(samples)), samples)
+    return np.clip(resampled, -32768, 32767).astype(np.int16).tobytes()
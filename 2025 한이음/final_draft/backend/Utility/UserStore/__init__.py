@@ -0,0 +1,11 @@
+# 이 파일은 'UserStore' 폴더를 파이썬 패키지로 만들어줍니다.
+# 주민등록번호/지문 ID로 등록 사용자를 조회하는 SQLite 저장소입니다.
+
+# 팩토리 함수: 설정을 읽어 공유 저장소 인스턴스를 생성합니다.
+from .factory import create_user_repository
+# 저장소 구현: WAL 모드 SQLite + 프로세스 내 LRU 캐시입니다.
+from .imp_sqlite_repo import SQLiteUserRepository
+# JSON 가져오기: 지문 모듈의 data_fp/*.json 을 DB로 옮깁니다.
+from .imp_json_import import import_json_dir
+# 타입 정의: 사용자 레코드와 설정 구조입니다.
+from .def_types import User, UserStoreConfig, normalize_rrn
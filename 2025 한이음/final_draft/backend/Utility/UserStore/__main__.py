@@ -0,0 +1,87 @@
+# Backend/Utility/UserStore/__main__.py
+"""
+사용자 저장소 관리 도구. (backend 폴더에서 실행)
+
+    python -m Utility.UserStore import <data_fp 폴더> [--db data/users.db]
+    python -m Utility.UserStore bench [--sizes 10000 100000] [--lookups 20000]
+"""
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from typing import Callable, List
+
+from .def_types import User
+from .imp_sqlite_repo import SQLiteUserRepository
+from .imp_json_import import import_json_dir
+
+
+def _percentiles_us(samples_ns: List[int]) -> str:
+    samples_ns.sort()
+    pick = lambda q: samples_ns[min(len(samples_ns) - 1, int(q * len(samples_ns)))] / 1000
+    return f"p50 {pick(0.50):7.2f}µs  p99 {pick(0.99):7.2f}µs  max {samples_ns[-1] / 1000:8.2f}µs"
+
+
+def _measure(label: str, lookup: Callable[[int], object], keys: List[int]) -> None:
+    samples = []
+    for key in keys:
+        started = time.perf_counter_ns()
+        if lookup(key) is None:
+            raise RuntimeError(f"{label}: 조회 실패 (key={key})")
+        samples.append(time.perf_counter_ns() - started)
+    print(f"  {label:<28} {_percentiles_us(samples)}")
+
+
+def bench(sizes: List[int], lookups: int) -> None:
+    """사용자 수별로 주민번호/지문 ID 조회 지연 시간을 측정합니다."""
+    rng = random.Random(42)
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = os.path.join(tmp, "users.db")
+            loader = SQLiteUserRepository(db_path, cache_size=0)
+            started = time.perf_counter()
+            loader.upsert_many(User(f"{i:013d}", f"사용자{i}", i) for i in range(1, size + 1))
+            print(f"\n[{size:,}명] 대량 저장 {time.perf_counter() - started:.2f}s")
+
+            uniform = [rng.randint(1, size) for _ in range(lookups)]
+            # 키오스크 실사용처럼 일부 사용자가 반복 조회되는 분포 (80%가 상위 200명)
+            hot = [rng.randint(1, min(200, size)) if rng.random() < 0.8 else rng.randint(1, size)
+                   for _ in range(lookups)]
+
+            _measure("user_id (캐시 없음)", lambda k: loader.get_by_user_id(f"{k:013d}"), uniform)
+            _measure("fingerprint_id (캐시 없음)", loader.get_by_fingerprint_id, uniform)
+
+            cached = SQLiteUserRepository(db_path, cache_size=1024, cache_ttl=300)
+            _measure("user_id (LRU, 편중 분포)", lambda k: cached.get_by_user_id(f"{k:013d}"), hot)
+            stats = cached.stats()["by_user_id"]
+            print(f"  LRU 적중률 {stats['hit_ratio']:.1%}")
+            loader.close()
+            cached.close()
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(prog="python -m Utility.UserStore")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_import = sub.add_parser("import", help="data_fp JSON 파일을 사용자 DB로 가져옵니다.")
+    p_import.add_argument("directory", help="data_fp 폴더 경로")
+    p_import.add_argument("--db", default=os.path.join("data", "users.db"), help="SQLite DB 경로")
+
+    p_bench = sub.add_parser("bench", help="조회 지연 시간 마이크로 벤치마크")
+    p_bench.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    p_bench.add_argument("--lookups", type=int, default=20_000)
+
+    args = parser.parse_args(argv)
+    if args.command == "import":
+        repo = SQLiteUserRepository(args.db, cache_size=0)
+        count = import_json_dir(repo, args.directory)
+        print(f"{count}명을 가져왔습니다. (전체 {repo.count()}명)")
+        repo.close()
+    else:
+        bench(args.sizes, args.lookups)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,38 @@
+import re
+from dataclasses import dataclass, asdict
+from typing import Optional, TypedDict, List
+
+
+def normalize_rrn(rrn: str) -> str:
+    """주민등록번호에서 숫자만 남깁니다. ('991231-1234567' → '9912311234567')"""
+    return re.sub(r"\D", "", rrn or "")
+
+
+@dataclass(frozen=True)
+class User:
+    """
+    키오스크 등록 사용자.
+    user_id는 하이픈을 뺀 13자리 주민등록번호이며, fingerprint_id는 센서에 등록된 지문 슬롯 번호입니다.
+    """
+    user_id: str
+    name: str
+    fingerprint_id: Optional[int] = None
+    created_at: Optional[str] = None
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+class SeedUser(TypedDict, total=False):
+    rrn: str
+    name: str
+    fingerprint_id: int
+
+
+class UserStoreConfig(TypedDict, total=False):
+    db_path: str
+    cache_size: int
+    cache_ttl: float
+    # 서버 시작 시 DB가 비어 있으면 넣을 사용자 / 가져올 data_fp JSON 폴더
+    seed: List[SeedUser]
+    seed_json_dir: str
@@ -0,0 +1,54 @@
+import os
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from .def_types import User, UserStoreConfig
+from .imp_sqlite_repo import SQLiteUserRepository
+from .imp_json_import import import_json_dir
+
+# backend 폴더 기준 기본 DB 위치
+_BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEFAULT_DB_PATH = os.path.join(_BACKEND_DIR, "data", "users.db")
+
+_repository_instance: Optional[SQLiteUserRepository] = None
+
+
+def _resolve(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(_BACKEND_DIR, path)
+
+
+def create_user_repository(config: Optional[Dict[str, Any]] = None) -> SQLiteUserRepository:
+    """
+    사용자 저장소 인스턴스를 생성합니다. (싱글턴)
+    config가 없으면 기본 설정을 사용하므로, 라우터 모듈에서는 인자 없이 호출해 공유 인스턴스를 받습니다.
+    DB가 비어 있으면 users.seed / users.seed_json_dir 로 초기 사용자를 채웁니다.
+    """
+    global _repository_instance
+    if _repository_instance is not None:
+        return _repository_instance
+
+    user_config: UserStoreConfig = (config or {}).get("users") or {}
+    db_path = _resolve(user_config.get("db_path") or DEFAULT_DB_PATH)
+    repo = SQLiteUserRepository(
+        db_path,
+        cache_size=user_config.get("cache_size", 1024),
+        cache_ttl=user_config.get("cache_ttl", 30),
+    )
+
+    if repo.count() == 0:
+        seed = user_config.get("seed") or []
+        if seed:
+            repo.upsert_many(
+                User(s["rrn"], s["name"], s.get("fingerprint_id")) for s in seed
+            )
+        seed_dir = user_config.get("seed_json_dir")
+        if seed_dir and os.path.isdir(_resolve(seed_dir)):
+            import_json_dir(repo, _resolve(seed_dir))
+        elif seed_dir:
+            logger.warning(f"users.seed_json_dir 폴더가 없어 JSON 사용자를 가져오지 못했습니다: {_resolve(seed_dir)}")
+        if repo.count():
+            logger.info(f"빈 사용자 DB에 초기 사용자 {repo.count()}명을 채웠습니다.")
+
+    _repository_instance = repo
+    return _repository_instance
@@ -0,0 +1,46 @@
+# Backend/Utility/UserStore/imp_json_import.py
+import os
+import glob
+import json
+from typing import Iterator, List
+
+from loguru import logger
+
+from .def_types import User, normalize_rrn
+from .imp_sqlite_repo import SQLiteUserRepository
+
+
+def iter_json_users(directory: str) -> Iterator[User]:
+    """data_fp 폴더의 JSON 파일을 User로 변환합니다. (형식이 잘못된 파일은 건너뜀)"""
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            rrn = normalize_rrn(data.get("rrn", ""))
+            if len(rrn) != 13 or not data.get("name"):
+                logger.warning(f"주민등록번호/이름이 올바르지 않아 건너뜀: {path}")
+                continue
+            yield User(
+                user_id=rrn,
+                name=data["name"],
+                fingerprint_id=int(data["id"]) if data.get("id") is not None else None,
+                created_at=data.get("timestamp"),
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f"JSON 사용자 파일을 읽지 못했습니다 ({path}): {e}")
+
+
+def import_json_dir(repo: SQLiteUserRepository, directory: str, batch_size: int = 1000) -> int:
+    """폴더의 JSON 사용자들을 batch_size 단위 트랜잭션으로 저장하고, 저장한 수를 반환합니다."""
+    total = 0
+    batch: List[User] = []
+    for user in iter_json_users(directory):
+        batch.append(user)
+        if len(batch) >= batch_size:
+            total += repo.upsert_many(batch)
+            batch = []
+    if batch:
+        total += repo.upsert_many(batch)
+    logger.info(f"JSON 사용자 가져오기 완료: {directory} → {total}명")
+    return total
+
@@ -0,0 +1,154 @@
+# Backend/Utility/UserStore/imp_sqlite_repo.py
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+from loguru import logger
+
+from .def_types import User, normalize_rrn
+from ..Cache import TTLCache
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id        TEXT PRIMARY KEY,
+    name           TEXT NOT NULL,
+    fingerprint_id INTEGER UNIQUE,
+    created_at     TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+# 조회 SQL은 상수로 두어 연결별 prepared statement 캐시(cached_statements)가 재사용되도록 함
+_SELECT_BY_USER_ID = "SELECT user_id, name, fingerprint_id, created_at FROM users WHERE user_id = ?"
+_SELECT_BY_FINGERPRINT_ID = "SELECT user_id, name, fingerprint_id, created_at FROM users WHERE fingerprint_id = ?"
+_UPSERT = """
+INSERT INTO users (user_id, name, fingerprint_id, created_at) VALUES (?, ?, ?, ?)
+ON CONFLICT(user_id) DO UPDATE SET name = excluded.name, fingerprint_id = excluded.fingerprint_id
+"""
+# 센서 슬롯(fingerprint_id)을 다른 사용자가 쓰고 있으면 그 사용자의 연결을 먼저 해제 (재등록 시 슬롯을 덮어쓰므로)
+_RELEASE_FINGERPRINT = "UPDATE users SET fingerprint_id = NULL WHERE fingerprint_id = ? AND user_id <> ?"
+
+
+class SQLiteUserRepository:
+    """
+    SQLite(WAL 모드) 기반 사용자 저장소.
+    - user_id(주민등록번호 13자리)는 기본 키, fingerprint_id는 UNIQUE 인덱스로 조회합니다.
+    - WAL 모드라 여러 워커 프로세스가 동시에 읽어도 쓰기와 서로 막지 않습니다.
+    - 스레드마다 연결을 따로 두고, 프로세스 안에서는 짧은 TTL의 LRU로 반복 조회를 흡수합니다.
+      (다른 프로세스가 바꾼 내용은 cache_ttl 안에 반영됨)
+    - 이미 다른 사용자에게 연결된 지문 ID로 저장하면, 같은 트랜잭션 안에서 이전 사용자의 연결을 해제하고 새 사용자에게 넘깁니다.
+    """
+
+    def __init__(self, db_path: str, cache_size: int = 1024, cache_ttl: float = 30.0) -> None:
+        self.db_path = db_path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []   # 오프로드 스레드가 연 연결까지 close()에서 닫기 위함
+        self._lock = threading.Lock()
+        self._by_user = TTLCache(cache_ttl, max_items=cache_size) if cache_size > 0 else None
+        self._by_fingerprint = TTLCache(cache_ttl, max_items=cache_size) if cache_size > 0 else None
+        if db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        with self._conn() as conn:
+            conn.executescript(_SCHEMA)
+        logger.info(f"사용자 저장소 준비 완료: {db_path} ({self.count()}명)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, cached_statements=64, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _row_to_user(row) -> Optional[User]:
+        return User(*row) if row else None
+
+    # --- 조회 ---
+    def get_by_user_id(self, user_id: str) -> Optional[User]:
+        user_id = normalize_rrn(user_id)
+        if self._by_user is not None:
+            cached = self._by_user.get(user_id)
+            if cached is not None:
+                return cached
+        user = self._row_to_user(self._conn().execute(_SELECT_BY_USER_ID, (user_id,)).fetchone())
+        if user is not None and self._by_user is not None:
+            self._by_user.put(user_id, user)
+        return user
+
+    def get_by_fingerprint_id(self, fingerprint_id: int) -> Optional[User]:
+        fingerprint_id = int(fingerprint_id)
+        if self._by_fingerprint is not None:
+            cached = self._by_fingerprint.get(fingerprint_id)
+            if cached is not None:
+                return cached
+        user = self._row_to_user(self._conn().execute(_SELECT_BY_FINGERPRINT_ID, (fingerprint_id,)).fetchone())
+        if user is not None and self._by_fingerprint is not None:
+            self._by_fingerprint.put(fingerprint_id, user)
+        return user
+
+    def count(self) -> int:
+        return self._conn().execute("SELECT COUNT(*) FROM users").fetchone()[0]
+
+    # --- 쓰기 ---
+    def upsert(self, user: User) -> None:
+        self.upsert_many([user])
+
+    def upsert_many(self, users: Iterable[User]) -> int:
+        """여러 사용자를 한 트랜잭션으로 저장합니다. (대량 가져오기용)"""
+        now = time.strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (normalize_rrn(u.user_id), u.name, u.fingerprint_id, u.created_at or now)
+            for u in users
+        ]
+        conn = self._conn()
+        with conn:
+            for row in rows:
+                user_id, _, fingerprint_id, _ = row
+                if fingerprint_id is not None:
+                    released = conn.execute(_RELEASE_FINGERPRINT, (fingerprint_id, user_id)).rowcount
+                    if released:
+                        logger.warning(f"지문 ID {fingerprint_id}를 기존 사용자에게서 해제하고 새 사용자에게 연결합니다.")
+                conn.execute(_UPSERT, row)
+        self._invalidate()
+        return len(rows)
+
+    def delete(self, user_id: str) -> bool:
+        conn = self._conn()
+        with conn:
+            deleted = conn.execute("DELETE FROM users WHERE user_id = ?", (normalize_rrn(user_id),)).rowcount
+        self._invalidate()
+        return deleted > 0
+
+    def clear_fingerprints(self) -> None:
+        """모든 사용자의 지문 연결을 해제합니다. (센서 지문 DB 초기화와 함께 사용, 사용자 정보는 유지)"""
+        conn = self._conn()
+        with conn:
+            conn.execute("UPDATE users SET fingerprint_id = NULL")
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        # 쓰기 후에는 이 프로세스의 조회 캐시를 비워 즉시 반영
+        for cache in (self._by_user, self._by_fingerprint):
+            if cache is not None:
+                cache.clear()
+
+    def stats(self) -> dict:
+        return {
+            "users": self.count(),
+            "by_user_id": self._by_user.stats.as_dict() if self._by_user else None,
+            "by_fingerprint_id": self._by_fingerprint.stats.as_dict() if self._by_fingerprint else None,
+        }
+
+    def close(self) -> None:
+        """모든 스레드가 연 연결을 닫습니다. (이후 호출은 스레드마다 새 연결을 엶)"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
@@ -0,0 +1,2 @@
+# 이 파일은 'loadtest' 폴더를 파이썬 패키지로 만들어줍니다.
+# 외부 API 대역 서버(mock_upstream)와 부하 생성기(python -m loadtest)로 백엔드 성능을 오프라인에서 측정합니다.
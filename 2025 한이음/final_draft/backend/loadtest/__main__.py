@@ -0,0 +1,381 @@
+# Backend/loadtest/__main__.py
+"""
+키오스크 백엔드 부하 테스트 하니스. (backend 폴더에서 실행, 실제 OpenAI/OpenWeatherMap 호출 없음)
+
+    python -m loadtest [--profile loadtest/profile.yaml] [--concurrency 16] [--duration 30]
+                       [--workers 1] [--state sqlite] [--json result.json] [--compare baseline.json]
+
+1) 외부 API 대역 서버(loadtest.mock_upstream)를 띄우고
+2) main.py 를 임시 설정(KIOSK_CONFIG)과 대역 서버 주소(OPENAI_BASE_URL, OPENWEATHER_URL)로 띄운 뒤
+3) /api/stt, /api/tts, /receive-text/, /weather/ 를 섞어 목표 동시성으로 요청하고
+4) 경로별 p50/p95/p99 와 처리량, 그리고 이벤트 루프 막힘 지표(가벼운 /metrics 요청의 지연)를 출력합니다.
+"""
+import io
+import os
+import sys
+import copy
+import json
+import math
+import time
+import wave
+import random
+import socket
+import asyncio
+import argparse
+import tempfile
+import subprocess
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+import yaml
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+ROOT_DIR = os.path.abspath(os.path.join(BACKEND_DIR, ".."))
+DEFAULT_PROFILE = os.path.join(os.path.dirname(__file__), "profile.yaml")
+
+# 의도 분석 입력: 키워드로 바로 끝나는 문장과 LLM까지 가는 모호한 문장을 섞음
+RECEIVE_TEXTS = [
+    "주민등록등본 떼고 싶어요", "가족관계증명서 발급", "오늘 날씨 어때", "근처 축제 알려줘",
+    "여권 재발급 하려고요", "음 그러니까 그거 있잖아요", "서류 하나 필요한데요", "어디로 가야 돼요",
+]
+TTS_FIXED = [
+    "안녕하세요! 무엇을 도와드릴까요? 아래 버튼을 누르거나 음성으로 말씀해주세요.",
+    "주민등록번호 열 세자리를 입력해주세요.",
+    "센서에 손가락을 올려주세요.",
+    "죄송합니다. 다시 한 번 말씀해주세요.",
+]
+CITIES = ["Seoul", "Busan", "Incheon", "Daegu", "Gwangju"]
+
+
+# ---------------------------------------------------------------- 준비
+def _deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    merged = copy.deepcopy(base)
+    for key, value in (override or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def _write_backend_config(profile: Dict[str, Any], workdir: str, state_backend: Optional[str] = None) -> str:
+    with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+        config = _deep_merge(yaml.safe_load(f), profile.get("backend") or {})
+    # 실제 캐시/사용자 DB/공유 상태 대신 임시 폴더 사용
+    config.setdefault("tts", {}).setdefault("cache", {})["disk_dir"] = os.path.join(workdir, "tts-cache")
+    state = config.setdefault("state", {})
+    state["sqlite_path"] = os.path.join(workdir, "state.db")
+    if state_backend:
+        state["backend"] = state_backend
+    users = config.setdefault("users", {})
+    users["db_path"] = os.path.join(workdir, "users.db")
+    users["seed_json_dir"] = ""
+    path = os.path.join(workdir, "config.yaml")
+    with open(path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(config, f, allow_unicode=True, sort_keys=False)
+    return path
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _make_wav(seconds: float, sample_rate: int = 16000) -> bytes:
+    """무음 판정에 걸리지 않도록 음성 대역의 톤 + 약한 잡음으로 채운 16bit 모노 WAV"""
+    rng = random.Random(7)
+    frames = bytearray()
+    for i in range(int(seconds * sample_rate)):
+        value = 6000 * math.sin(2 * math.pi * 220 * i / sample_rate) + rng.gauss(0, 300)
+        frames += int(max(-32768, min(32767, value))).to_bytes(2, "little", signed=True)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes(bytes(frames))
+    return buffer.getvalue()
+
+
+def _spawn(args: List[str], env: Dict[str, str], log_path: str) -> subprocess.Popen:
+    log = open(log_path, "wb")
+    return subprocess.Popen([sys.executable, "-m", "uvicorn", *args], cwd=BACKEND_DIR, env=env,
+                            stdout=log, stderr=subprocess.STDOUT)
+
+
+async def _wait_ready(url: str, proc: subprocess.Popen, name: str, log_path: str, timeout: float = 90) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"{name} 프로세스가 종료되었습니다. 로그: {log_path}")
+            try:
+                if (await client.get(url, timeout=2)).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.3)
+    raise RuntimeError(f"{name}이(가) {timeout:.0f}초 안에 준비되지 않았습니다. 로그: {log_path}")
+
+
+# ---------------------------------------------------------------- 부하 생성
+class Recorder:
+    """측정 구간(예열 이후) 안에서 끝난 요청만 경로별로 기록합니다."""
+
+    def __init__(self, measure_from: float, measure_until: float) -> None:
+        self.measure_from = measure_from
+        self.measure_until = measure_until
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+
+    def record(self, route: str, started: float, error: Optional[str] = None) -> None:
+        ended = time.perf_counter()
+        if not (self.measure_from <= started and ended <= self.measure_until):
+            return
+        self.latencies.setdefault(route, []).append(ended - started)
+        if error:
+            bucket = self.errors.setdefault(route, {})
+            bucket[error] = bucket.get(error, 0) + 1
+
+
+class LoadGenerator:
+    def __init__(self, base_url: str, load: Dict[str, Any]) -> None:
+        self.base_url = base_url
+        self.load = load
+        self.wav = _make_wav(load.get("stt_audio_seconds", 3))
+        mix = load.get("mix") or {"stt": 1, "tts": 1, "receive_text": 1, "weather": 1}
+        self.routes = list(mix.keys())
+        self.weights = [float(mix[r]) for r in self.routes]
+        self.rng = random.Random(42)
+        self._unique = 0
+
+    async def _stt(self, client: httpx.AsyncClient, rec: Recorder) -> None:
+        started = time.perf_counter()
+        r = await client.post("/api/stt", files={"file": ("audio.wav", self.wav, "audio/wav")})
+        rec.record("stt", started, None if r.status_code == 200 and "text" in r.json() else f"HTTP {r.status_code}")
+
+    async def _tts(self, client: httpx.AsyncClient, rec: Recorder) -> None:
+        if self.rng.random() < self.load.get("tts_unique_ratio", 0.5):
+            self._unique += 1
+            text = f"요청하신 서류 {self._unique}번 발급이 완료되었습니다. 출력물을 받아가세요."
+        else:
+            text = self.rng.choice(TTS_FIXED)
+        stream = self.rng.random() < self.load.get("tts_stream_ratio", 0.5)
+        route = "tts_stream" if stream else "tts"
+        started = time.perf_counter()
+        async with client.stream("POST", "/api/tts", data={"text": text, "stream": str(stream).lower()}) as r:
+            first = True
+            size = 0
+            async for chunk in r.aiter_bytes():
+                if first and stream:
+                    # 스트리밍은 첫 바이트까지의 시간(사용자가 재생을 시작하는 시점)도 따로 기록
+                    rec.record("tts_stream.first_byte", started)
+                    first = False
+                size += len(chunk)
+        ok = r.status_code == 200 and size > 0
+        rec.record(route, started, None if ok else f"HTTP {r.status_code}")
+
+    async def _receive_text(self, client: httpx.AsyncClient, rec: Recorder) -> None:
+        started = time.perf_counter()
+        r = await client.post("/receive-text/", json={"text": self.rng.choice(RECEIVE_TEXTS)})
+        ok = r.status_code == 200 and r.json().get("source") != "error"
+        rec.record("receive_text", started, None if ok else f"HTTP {r.status_code}" if r.status_code != 200 else "error")
+
+    async def _weather(self, client: httpx.AsyncClient, rec: Recorder) -> None:
+        started = time.perf_counter()
+        r = await client.post("/weather/", json={"city": self.rng.choice(CITIES)})
+        body = r.json() if r.status_code == 200 else None
+        # 라우터는 오류를 (본문, 상태) 튜플로 돌려주므로 200이어도 본문을 확인
+        ok = isinstance(body, dict) and "error" not in body
+        rec.record("weather", started, None if ok else f"HTTP {r.status_code}" if r.status_code != 200 else "error")
+
+    async def _user(self, client: httpx.AsyncClient, rec: Recorder, stop_at: float) -> None:
+        handlers = {"stt": self._stt, "tts": self._tts, "receive_text": self._receive_text, "weather": self._weather}
+        while time.perf_counter() < stop_at:
+            route = self.rng.choices(self.routes, self.weights)[0]
+            started = time.perf_counter()
+            try:
+                await handlers[route](client, rec)
+            except (httpx.HTTPError, ValueError) as e:
+                rec.record(route, started, type(e).__name__)
+
+    async def _probe(self, client: httpx.AsyncClient, rec: Recorder, stop_at: float) -> None:
+        # /metrics 는 계산이 거의 없으므로 지연이 늘면 이벤트 루프가 다른 일로 막혀 있다는 뜻
+        interval = self.load.get("probe_interval_ms", 100) / 1000
+        while time.perf_counter() < stop_at:
+            started = time.perf_counter()
+            try:
+                r = await client.get("/metrics")
+                rec.record("probe", started, None if r.status_code == 200 else f"HTTP {r.status_code}")
+            except httpx.HTTPError as e:
+                rec.record("probe", started, type(e).__name__)
+            await asyncio.sleep(interval)
+
+    async def run(self, concurrency: int, duration: float, warmup: float) -> Tuple[Recorder, float]:
+        now = time.perf_counter()
+        rec = Recorder(now + warmup, now + warmup + duration)
+        limits = httpx.Limits(max_connections=concurrency + 4, max_keepalive_connections=concurrency + 4)
+        async with httpx.AsyncClient(base_url=self.base_url, timeout=60, limits=limits) as client, \
+                httpx.AsyncClient(base_url=self.base_url, timeout=60) as probe_client:
+            stop_at = rec.measure_until
+            await asyncio.gather(
+                self._probe(probe_client, rec, stop_at),
+                *(self._user(client, rec, stop_at) for _ in range(concurrency)),
+            )
+        return rec, duration
+
+
+# ---------------------------------------------------------------- 보고
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))]
+
+
+def summarize(rec: Recorder, duration: float) -> Dict[str, Dict[str, float]]:
+    summary = {}
+    for route, values in sorted(rec.latencies.items()):
+        values = sorted(values)
+        errors = sum(rec.errors.get(route, {}).values())
+        summary[route] = {
+            "count": len(values),
+            "errors": errors,
+            "rps": round(len(values) / duration, 2),
+            "p50_ms": round(_percentile(values, 0.50) * 1000, 1),
+            "p95_ms": round(_percentile(values, 0.95) * 1000, 1),
+            "p99_ms": round(_percentile(values, 0.99) * 1000, 1),
+            "max_ms": round(values[-1] * 1000, 1),
+        }
+    return summary
+
+
+def _stage_means(metrics_text: str) -> Dict[str, Tuple[int, float]]:
+    """/metrics 의 kiosk_stage_seconds 합계/개수로 단계별 평균(ms)을 계산합니다."""
+    sums: Dict[str, float] = {}
+    counts: Dict[str, int] = {}
+    for line in metrics_text.splitlines():
+        if not line.startswith(("kiosk_stage_seconds_sum", "kiosk_stage_seconds_count")):
+            continue
+        name, value = line.rsplit(" ", 1)
+        stage = name.split('stage="', 1)[1].split('"', 1)[0]
+        if name.startswith("kiosk_stage_seconds_sum"):
+            sums[stage] = float(value)
+        else:
+            counts[stage] = int(float(value))
+    return {s: (counts[s], sums.get(s, 0.0) / counts[s] * 1000) for s in counts if counts[s]}
+
+
+def print_report(summary: Dict[str, Dict[str, float]], rec: Recorder, duration: float,
+                 stages: Dict[str, Tuple[int, float]], mock_stats: Dict[str, Any],
+                 baseline: Optional[Dict[str, Any]]) -> None:
+    header = f"{'route':<24}{'count':>7}{'err':>6}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    print("\n" + header + ("   Δp95" if baseline else ""))
+    print("-" * (len(header) + (7 if baseline else 0)))
+    total = 0
+    for route, s in summary.items():
+        line = (f"{route:<24}{s['count']:>7}{s['errors']:>6}{s['rps']:>8.2f}"
+                f"{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}{s['p99_ms']:>9.1f}{s['max_ms']:>9.1f}")
+        base = (baseline or {}).get("routes", {}).get(route)
+        if base and base.get("p95_ms"):
+            line += f"  {(s['p95_ms'] / base['p95_ms'] - 1) * 100:+6.1f}%"
+        print(line)
+        if route not in ("probe", "tts_stream.first_byte"):
+            total += s["count"]
+    print(f"\n처리량: {total / duration:.2f} req/s (측정 {duration:.0f}초, 지연 단위 ms)")
+
+    probe = summary.get("probe")
+    if probe:
+        verdict = "정상" if probe["p99_ms"] < 50 else "이벤트 루프 막힘 의심"
+        print(f"이벤트 루프 지연(probe): p50 {probe['p50_ms']}ms / p99 {probe['p99_ms']}ms → {verdict}")
+    for route, errors in sorted(rec.errors.items()):
+        print(f"  오류 {route}: {errors}")
+    if stages:
+        print("\n단계별 평균 (서버 /metrics, 예열 포함):")
+        for stage, (count, mean_ms) in sorted(stages.items()):
+            print(f"  {stage:<28}{count:>7}회 {mean_ms:>9.1f}ms")
+    if mock_stats:
+        print(f"\n대역 서버 호출 수: {json.dumps(mock_stats, ensure_ascii=False)}")
+
+
+# ---------------------------------------------------------------- 실행
+async def run(args: argparse.Namespace) -> int:
+    with open(args.profile, "r", encoding="utf-8") as f:
+        profile = yaml.safe_load(f) or {}
+    load = profile.get("load") or {}
+    concurrency = args.concurrency or load.get("concurrency", 16)
+    duration = args.duration or load.get("duration", 30)
+    warmup = load.get("warmup", 3) if args.warmup is None else args.warmup
+
+    workdir = tempfile.mkdtemp(prefix="kiosk-loadtest-")
+    mock_port, backend_port = _free_port(), _free_port()
+    mock_url = f"http://127.0.0.1:{mock_port}"
+    backend_url = f"http://127.0.0.1:{backend_port}"
+
+    env = dict(os.environ)
+    env.update({
+        "LOADTEST_PROFILE": os.path.abspath(args.profile),
+        "KIOSK_CONFIG": _write_backend_config(profile, workdir, args.state),
+        "OPENAI_API_KEY": "sk-loadtest",
+        "OPENAI_BASE_URL": f"{mock_url}/v1",
+        "OPENWEATHER_API_KEY": "loadtest",
+        "OPENWEATHER_URL": f"{mock_url}/data/2.5/weather",
+    })
+    mock_log = os.path.join(workdir, "mock.log")
+    backend_log = os.path.join(workdir, "backend.log")
+    mock = _spawn(["loadtest.mock_upstream:app", "--host", "127.0.0.1", "--port", str(mock_port),
+                   "--log-level", "warning"], env, mock_log)
+    backend = _spawn(["main:app", "--host", "127.0.0.1", "--port", str(backend_port),
+                      "--workers", str(args.workers), "--log-level", "warning"], env, backend_log)
+    print(f"대역 서버 {mock_url}, 백엔드 {backend_url} (workers={args.workers}, state={args.state or '설정값'}), "
+          f"로그: {workdir}")
+
+    try:
+        await _wait_ready(f"{mock_url}/mock/stats", mock, "대역 서버", mock_log)
+        await _wait_ready(f"{backend_url}/metrics", backend, "백엔드", backend_log)
+        print(f"부하 시작: 동시성 {concurrency}, 예열 {warmup}초 + 측정 {duration}초")
+
+        rec, measured = await LoadGenerator(backend_url, load).run(concurrency, duration, warmup)
+        summary = summarize(rec, measured)
+        async with httpx.AsyncClient(timeout=10) as client:
+            stages = _stage_means((await client.get(f"{backend_url}/metrics")).text)
+            mock_stats = (await client.get(f"{mock_url}/mock/stats")).json()
+
+        baseline = None
+        if args.compare:
+            with open(args.compare, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        print_report(summary, rec, measured, stages, mock_stats, baseline)
+
+        if args.json:
+            with open(args.json, "w", encoding="utf-8") as f:
+                json.dump({"concurrency": concurrency, "duration": measured, "workers": args.workers, "state": args.state,
+                           "routes": summary, "stages_ms": {k: v[1] for k, v in stages.items()}},
+                          f, ensure_ascii=False, indent=2)
+            print(f"결과 저장: {args.json}")
+        return 0
+    finally:
+        for proc in (backend, mock):
+            proc.terminate()
+        for proc in (backend, mock):
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest", description="키오스크 백엔드 부하 테스트")
+    parser.add_argument("--profile", default=DEFAULT_PROFILE, help="부하/대역 서버 프로필 YAML")
+    parser.add_argument("--concurrency", type=int, help="동시 가상 사용자 수 (프로필 값 덮어쓰기)")
+    parser.add_argument("--duration", type=float, help="측정 시간(초)")
+    parser.add_argument("--warmup", type=float, help="예열 시간(초)")
+    parser.add_argument("--workers", type=int, default=1, help="백엔드 uvicorn 워커 수")
+    parser.add_argument("--state", choices=["memory", "sqlite"], help="공유 상태 저장소 (config.yaml의 state.backend 덮어쓰기)")
+    parser.add_argument("--json", help="결과를 JSON으로 저장 (다음 실행의 --compare 기준)")
+    parser.add_argument("--compare", help="이전 결과 JSON과 p95 비교")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,205 @@
+# Backend/loadtest/chunk_bench.py
+"""
+긴 녹음 구간 분할 전사(ChunkedSTT)와 한 번에 전사(single-shot) 비교 벤치마크. (backend 폴더에서 실행)
+
+    python -m loadtest.chunk_bench [--seconds 30 60 90] [--clips 5] [--run-on 0.3]
+    python -m loadtest.chunk_bench --clip-dir clips/ --engine local
+
+기본은 합성 녹음을 씁니다. 단어마다 주파수가 다른 톤으로 문장을 만들고(loadtest.mock_upstream.TONE_WORDS),
+대역 서버가 그 톤을 풀어 전사하므로 네트워크/API 키 없이 정답과 비교한 단어 오류율(WER)을 잴 수 있습니다.
+대역 서버 전사 지연 = 기본 지연 + 녹음 길이 × --ms-per-audio-s (원격 Whisper처럼 길이에 비례)
+--run-on 비율의 문장 사이에는 쉬는 구간을 두지 않아, 겹쳐 자르기 + 경계 중복 제거 경로도 함께 확인합니다.
+
+--clip-dir를 주면 폴더의 WAV(16bit 모노)와 같은 이름의 .txt 정답으로 측정합니다. (--engine local: 로컬 Whisper)
+구간 분할 설정은 config.yaml의 stt.chunked 를 그대로 쓰며, 짧은 녹음도 나누도록 min_duration_s만 0으로 둡니다.
+"""
+import io
+import os
+import sys
+import glob
+import math
+import time
+import wave
+import random
+import asyncio
+import argparse
+import tempfile
+from typing import Any, List, Optional, Tuple
+
+import yaml
+
+from loadtest.__main__ import ROOT_DIR, _free_port, _spawn, _wait_ready
+from loadtest.mock_upstream import TONE_BASE_HZ, TONE_STEP_HZ, TONE_WORDS
+
+SAMPLE_RATE = 16000
+
+
+# ---------------------------------------------------------------- 합성 녹음
+def _tone_clip(seconds: float, run_on: float, rng: random.Random) -> Tuple[bytes, List[str]]:
+    """목표 길이를 채울 때까지 4~10단어 문장을 이어 붙인 16bit 모노 WAV와 정답 단어열"""
+    frames = bytearray()
+    words: List[str] = []
+
+    def pad(ms: float) -> None:
+        for _ in range(int(SAMPLE_RATE * ms / 1000)):
+            frames.extend(int(rng.gauss(0, 30)).to_bytes(2, "little", signed=True))
+
+    while len(frames) < seconds * SAMPLE_RATE * 2:
+        for _ in range(rng.randint(4, 10)):
+            index = rng.randrange(len(TONE_WORDS))
+            freq = TONE_BASE_HZ + index * TONE_STEP_HZ
+            for i in range(int(SAMPLE_RATE * rng.uniform(0.25, 0.45))):
+                value = 6000 * math.sin(2 * math.pi * freq * i / SAMPLE_RATE) + rng.gauss(0, 30)
+                frames.extend(int(value).to_bytes(2, "little", signed=True))
+            words.append(TONE_WORDS[index])
+            pad(rng.uniform(60, 100))             # 단어 사이 (쉬는 구간으로 보지 않을 길이)
+        pad(rng.uniform(100, 150) if rng.random() < run_on else rng.uniform(400, 900))
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(SAMPLE_RATE)
+        wf.writeframes(bytes(frames))
+    return buffer.getvalue(), words
+
+
+def _clip_dir(path: str) -> List[Tuple[str, bytes, List[str]]]:
+    clips = []
+    for wav_path in sorted(glob.glob(os.path.join(path, "*.wav"))):
+        txt_path = os.path.splitext(wav_path)[0] + ".txt"
+        if not os.path.exists(txt_path):
+            continue
+        with open(wav_path, "rb") as f, open(txt_path, "r", encoding="utf-8") as t:
+            clips.append((os.path.basename(wav_path), f.read(), t.read().split()))
+    return clips
+
+
+# ---------------------------------------------------------------- 측정
+def word_error_rate(reference: List[str], hypothesis: List[str]) -> float:
+    """단어 단위 편집 거리 / 정답 단어 수"""
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp in enumerate(hypothesis, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref != hyp))
+        previous = current
+    return previous[-1] / max(1, len(reference))
+
+
+def _duration(wav_bytes: bytes) -> float:
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+        return wf.getnframes() / wf.getframerate()
+
+
+async def _measure(engine, wav_bytes: bytes) -> Tuple[float, str]:
+    started = time.perf_counter()
+    text = await engine.atranscribe(wav_bytes, "wav")
+    return time.perf_counter() - started, text
+
+
+async def _compare(clips: List[Tuple[str, bytes, List[str]]], single, chunked, normalize) -> None:
+    print(f"{'clip':<14}{'길이':>7}{'구간':>6}{'single ms':>11}{'chunked ms':>12}{'배속':>7}"
+          f"{'WER single':>12}{'WER chunked':>13}")
+    totals = {"single": 0.0, "chunked": 0.0, "wer_single": 0.0, "wer_chunked": 0.0}
+    for name, wav_bytes, reference in clips:
+        reference = normalize(" ".join(reference)).split()
+        chunks = chunked.split(wav_bytes) or []
+        single_s, single_text = await _measure(single, wav_bytes)
+        chunked_s, chunked_text = await _measure(chunked, wav_bytes)
+        wer_single = word_error_rate(reference, single_text.split())
+        wer_chunked = word_error_rate(reference, chunked_text.split())
+        totals["single"] += single_s
+        totals["chunked"] += chunked_s
+        totals["wer_single"] += wer_single
+        totals["wer_chunked"] += wer_chunked
+        print(f"{name:<14}{_duration(wav_bytes):6.1f}s{len(chunks):6d}{single_s * 1000:11.0f}{chunked_s * 1000:12.0f}"
+              f"{single_s / chunked_s:6.2f}x{wer_single:12.1%}{wer_chunked:13.1%}")
+    n = len(clips)
+    print(f"{'평균':<14}{'':7}{'':6}{totals['single'] / n * 1000:11.0f}{totals['chunked'] / n * 1000:12.0f}"
+          f"{totals['single'] / totals['chunked']:6.2f}x{totals['wer_single'] / n:12.1%}{totals['wer_chunked'] / n:13.1%}")
+    print(f"ChunkedSTT 통계: {chunked.stats()}")
+
+
+async def run(args: argparse.Namespace) -> int:
+    with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    chunk_config = {**(config["stt"].get("chunked") or {}), "min_duration_s": 0}
+    if args.max_parallel:
+        chunk_config["max_parallel"] = args.max_parallel
+
+    from Utility.STT_TTS.imp_stt_chunked import ChunkedSTT
+
+    if args.clip_dir:
+        clips = _clip_dir(args.clip_dir)
+        if not clips:
+            print(f"{args.clip_dir} 에 WAV + .txt 쌍이 없습니다.")
+            return 1
+    else:
+        rng = random.Random(args.seed)
+        clips = []
+        for seconds in args.seconds:
+            for i in range(args.clips):
+                wav_bytes, words = _tone_clip(seconds, args.run_on, rng)
+                clips.append((f"tone{seconds:.0f}s-{i}", wav_bytes, words))
+
+    mock: Optional[Any] = None
+    try:
+        if args.engine == "local":
+            from Utility.STT_TTS.imp_stt_whisper_local import LocalWhisperSTT
+            local_config = config["stt"].get("local") or {}
+            single = LocalWhisperSTT(local_config, language="ko")
+            single.initialize()
+            normalize = lambda text: text
+        else:
+            workdir = tempfile.mkdtemp(prefix="kiosk-chunk-")
+            profile_path = os.path.join(workdir, "profile.yaml")
+            with open(profile_path, "w", encoding="utf-8") as f:
+                yaml.safe_dump({"mock": {"transcription": {
+                    "median_ms": args.median_ms, "p95_ms": args.median_ms * 1.5,
+                    "ms_per_audio_s": args.ms_per_audio_s, "decode_tones": True,
+                }}}, f)
+            port = _free_port()
+            log_path = os.path.join(workdir, "mock.log")
+            mock = _spawn(["loadtest.mock_upstream:app", "--port", str(port), "--log-level", "warning"],
+                          {**os.environ, "LOADTEST_PROFILE": profile_path}, log_path)
+            os.environ["OPENAI_BASE_URL"] = f"http://127.0.0.1:{port}/v1"
+            os.environ.setdefault("OPENAI_API_KEY", "sk-loadtest")
+            await _wait_ready(f"http://127.0.0.1:{port}/mock/stats", mock, "mock_upstream", log_path)
+
+            from Utility.OpenAIGateway import create_openai_gateway
+            from Utility.STT_TTS.imp_stt_openai import SpeechToText
+            create_openai_gateway(config)
+            single = SpeechToText(config["stt"])
+            single.initialize()
+            # 정답도 엔진과 같은 후처리 사전을 거쳐 비교
+            normalize = single._post_correction
+
+        chunked = ChunkedSTT(single, chunk_config)
+        print(f"엔진 {args.engine}, 구간 설정 {chunk_config}")
+        await _compare(clips, single, chunked, normalize)
+    finally:
+        if mock is not None:
+            from Utility.OpenAIGateway import create_openai_gateway
+            await create_openai_gateway().aclose()
+            mock.terminate()
+            mock.wait(10)
+    return 0
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest.chunk_bench", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seconds", type=float, nargs="+", default=[30, 60, 90], help="합성 녹음 길이 (초)")
+    parser.add_argument("--clips", type=int, default=3, help="길이별 합성 녹음 수")
+    parser.add_argument("--run-on", type=float, default=0.3, help="쉬는 구간 없이 이어지는 문장 비율")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--median-ms", type=float, default=400, help="대역 서버 전사 기본 지연")
+    parser.add_argument("--ms-per-audio-s", type=float, default=120, help="녹음 1초당 추가 지연")
+    parser.add_argument("--max-parallel", type=int, help="stt.chunked.max_parallel 덮어쓰기")
+    parser.add_argument("--clip-dir", help="실제 녹음 폴더 (WAV + 같은 이름의 .txt 정답)")
+    parser.add_argument("--engine", choices=["remote", "local"], default="remote")
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,200 @@
+# Backend/loadtest/hedge_bench.py
+"""
+헤지 요청/서킷 브레이커 비교 벤치마크. (backend 폴더에서 실행, 실제 OpenAI 호출 없음)
+
+    python -m loadtest.hedge_bench [--requests 300] [--concurrency 4] [--slow-rate 0.05] [--slow-ms 4000]
+
+외부 API 대역 서버(loadtest.mock_upstream)를 꼬리 지연이 있는 프로필로 띄우고,
+같은 요청을 원래 엔진(OpenAI STT/TTS)과 ResilientSTT/ResilientTTS로 감싼 엔진에 보내
+1) 꼬리 지연 구간: p50/p95/p99와 추가로 보낸 업스트림 요청 수
+2) 장애 구간(오류 100%): 요청 하나가 실패를 돌려받기까지 걸린 시간과 업스트림 요청 수
+를 비교합니다. 헤지/브레이커 설정은 config.yaml의 stt.resilience / tts.resilience 를 그대로 씁니다.
+다음을 확인하고, 하나라도 어긋나면 종료 코드 1로 끝냅니다.
+- 꼬리 지연: resilient p99 < plain p99, 헤지 수 ≤ max_hedge_ratio × 요청 수 + 1
+- 장애: 브레이커가 열려 failure_threshold번 이후의 요청은 업스트림 호출 없이 바로 실패,
+  resilient의 업스트림 요청 수와 실패까지 걸린 시간 < plain
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+from typing import Any, Callable, Dict, List, Tuple
+
+import httpx
+import yaml
+
+from loadtest.__main__ import ROOT_DIR, _free_port, _make_wav, _percentile, _spawn, _wait_ready
+
+# 엔진 종류 → 대역 서버 통계 키
+_TARGETS = {"stt": "transcription", "tts": "speech"}
+
+
+def _profile(args: argparse.Namespace) -> Dict[str, Any]:
+    spec = {"median_ms": args.median_ms, "p95_ms": args.p95_ms, "error_rate": 0.0,
+            "slow_rate": args.slow_rate, "slow_ms": args.slow_ms}
+    return {"mock": {"transcription": dict(spec), "speech": {**spec, "bytes_per_char": 200}}}
+
+
+def _engines(config: Dict[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+    """(원래 엔진, 헤지/브레이커 엔진) 쌍. 같은 공유 관문을 쓰므로 연결 조건이 같음"""
+    from Utility.STT_TTS.imp_stt_openai import SpeechToText
+    from Utility.STT_TTS.imp_tts_openai import TextToSpeech
+    from Utility.STT_TTS.imp_resilience import ResilientSTT, ResilientTTS
+
+    pairs = {
+        "stt": (SpeechToText(config["stt"]), SpeechToText(config["stt"]), ResilientSTT),
+        "tts": (TextToSpeech(config["tts"]), TextToSpeech(config["tts"]), ResilientTTS),
+    }
+    engines = {}
+    for kind, (plain, inner, wrapper) in pairs.items():
+        resilient = wrapper(inner, config[kind].get("resilience") or {})
+        plain.initialize()
+        resilient.initialize()
+        engines[kind] = (plain, resilient)
+    return engines
+
+
+async def _upstream_requests(client: httpx.AsyncClient, endpoint: str) -> int:
+    return ((await client.get("/mock/stats")).json().get(endpoint) or {}).get("requests", 0)
+
+
+async def _drive(call: Callable[[], Any], requests: int, concurrency: int) -> Tuple[List[float], int]:
+    """concurrency개 작업자가 요청을 나눠 보내고 (성공 지연 목록, 실패 수)를 반환합니다."""
+    latencies: List[float] = []
+    failures = 0
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal failures
+        for _ in remaining:
+            started = time.perf_counter()
+            try:
+                await call()
+                latencies.append(time.perf_counter() - started)
+            except Exception:
+                failures += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return sorted(latencies), failures
+
+
+def _expect(failed: List[str], ok: bool, message: str) -> None:
+    print(f"  {'✓' if ok else '✗'} {message}")
+    if not ok:
+        failed.append(message)
+
+
+def _row(name: str, latencies: List[float], failures: int, upstream: int, requests: int) -> str:
+    ms = [_percentile(latencies, q) * 1000 for q in (0.5, 0.95, 0.99)]
+    return (f"  {name:<10} p50 {ms[0]:7.0f}  p95 {ms[1]:7.0f}  p99 {ms[2]:7.0f} ms  "
+            f"실패 {failures:3d}  업스트림 요청 {upstream:4d} (+{(upstream - requests) / requests:.0%})")
+
+
+async def run(args: argparse.Namespace) -> int:
+    with open(os.path.join(ROOT_DIR, "config.yaml"), "r", encoding="utf-8") as f:
+        config = yaml.safe_load(f)
+    workdir = tempfile.mkdtemp(prefix="kiosk-hedge-")
+    profile_path = os.path.join(workdir, "profile.yaml")
+    with open(profile_path, "w", encoding="utf-8") as f:
+        yaml.safe_dump(_profile(args), f)
+
+    port = _free_port()
+    log_path = os.path.join(workdir, "mock.log")
+    mock = _spawn(["loadtest.mock_upstream:app", "--port", str(port), "--log-level", "warning"],
+                  {**os.environ, "LOADTEST_PROFILE": profile_path}, log_path)
+    base_url = f"http://127.0.0.1:{port}"
+    os.environ["OPENAI_BASE_URL"] = f"{base_url}/v1"
+    os.environ.setdefault("OPENAI_API_KEY", "sk-loadtest")
+    try:
+        await _wait_ready(f"{base_url}/mock/stats", mock, "mock_upstream", log_path)
+        from Utility.OpenAIGateway import create_openai_gateway
+        # 벤치마크 동시성이 관문 제한에 걸리지 않도록 넉넉하게 (헤지 요청까지 포함)
+        create_openai_gateway({"openai": {**(config.get("openai") or {}),
+                                          "concurrency": {"stt": args.concurrency * 4, "tts": args.concurrency * 4}}})
+        engines = _engines(config)
+        wav = _make_wav(args.audio_seconds)
+        calls = {
+            "stt": lambda engine: engine.atranscribe(wav, "wav"),
+            "tts": lambda engine: engine.asynthesize("요청하신 서류 발급이 완료되었습니다. 출력물을 받아가세요."),
+        }
+
+        failed: List[str] = []
+        async with httpx.AsyncClient(base_url=base_url, timeout=10) as client:
+            print(f"\n=== 꼬리 지연: 중앙값 {args.median_ms}ms, p95 {args.p95_ms}ms, "
+                  f"{args.slow_rate:.0%} 요청에 +{args.slow_ms}ms, 요청 {args.requests}개 × 동시 {args.concurrency} ===")
+            for kind, (plain, resilient) in engines.items():
+                print(f"[{kind}]")
+                p99 = {}
+                for name, engine in (("plain", plain), ("resilient", resilient)):
+                    # p95 추정에 필요한 표본을 먼저 채움 (원래 엔진도 같은 조건으로 예열)
+                    await _drive(lambda: calls[kind](engine), args.warmup, args.concurrency)
+                    before = await _upstream_requests(client, _TARGETS[kind])
+                    latencies, failures = await _drive(lambda: calls[kind](engine), args.requests, args.concurrency)
+                    upstream = await _upstream_requests(client, _TARGETS[kind]) - before
+                    print(_row(name, latencies, failures, upstream, args.requests))
+                    p99[name] = _percentile(latencies, 0.99)
+                stats = resilient.stats()
+                print(f"  resilient 상태: {stats}")
+                _expect(failed, p99["resilient"] < p99["plain"],
+                        f"{kind} 헤지로 p99 감소 ({p99['plain'] * 1000:.0f} → {p99['resilient'] * 1000:.0f} ms)")
+                _expect(failed, stats["hedged"] <= resilient.max_hedge_ratio * stats["requests"] + 1,
+                        f"{kind} 헤지 수 {stats['hedged']} ≤ {resilient.max_hedge_ratio:.0%} × 요청 {stats['requests']} + 1")
+
+            print(f"\n=== 장애: 오류 100% (HTTP 500), 요청 {args.outage_requests}개 순차 ===")
+            await client.put("/mock/profile", json={endpoint: {"error_rate": 1.0, "slow_rate": 0.0}
+                                                    for endpoint in _TARGETS.values()})
+            for kind, (plain, resilient) in engines.items():
+                print(f"[{kind}]")
+                outage = {}
+                short_circuited = resilient.stats()["short_circuited"]
+                for name, engine in (("plain", plain), ("resilient", resilient)):
+                    before = await _upstream_requests(client, _TARGETS[kind])
+                    started = time.perf_counter()
+                    _, failures = await _drive(lambda: calls[kind](engine), args.outage_requests, 1)
+                    elapsed = time.perf_counter() - started
+                    upstream = await _upstream_requests(client, _TARGETS[kind]) - before
+                    print(f"  {name:<10} 실패까지 평균 {elapsed / args.outage_requests * 1000:7.1f} ms  "
+                          f"실패 {failures:3d}  업스트림 요청 {upstream:4d}")
+                    outage[name] = (failures, upstream, elapsed)
+                stats = resilient.stats()
+                print(f"  resilient 상태: {stats}")
+                expected = args.outage_requests - resilient.breaker.failure_threshold
+                _expect(failed, outage["resilient"][0] == args.outage_requests,
+                        f"{kind} 장애 중 요청 {args.outage_requests}개 모두 실패로 반환")
+                _expect(failed, stats["breaker"] != "closed" and stats["short_circuited"] - short_circuited >= expected,
+                        f"{kind} 브레이커 열림, 업스트림 없이 바로 실패 "
+                        f"{stats['short_circuited'] - short_circuited} ≥ {expected}")
+                _expect(failed, outage["resilient"][1] < outage["plain"][1],
+                        f"{kind} 업스트림 요청 {outage['plain'][1]} → {outage['resilient'][1]}")
+                _expect(failed, outage["resilient"][2] < outage["plain"][2],
+                        f"{kind} 실패까지 걸린 시간 {outage['plain'][2]:.2f} → {outage['resilient'][2]:.2f} s")
+        await create_openai_gateway().aclose()
+    finally:
+        mock.terminate()
+        mock.wait(10)
+    if failed:
+        print(f"\n확인 실패 {len(failed)}건: " + "; ".join(failed))
+        return 1
+    print("\n모든 확인 통과")
+    return 0
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog="python -m loadtest.hedge_bench", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--median-ms", type=float, default=300)
+    parser.add_argument("--p95-ms", type=float, default=600)
+    parser.add_argument("--slow-rate", type=float, default=0.05)
+    parser.add_argument("--slow-ms", type=float, default=4000)
+    parser.add_argument("--outage-requests", type=int, default=20)
+    parser.add_argument("--audio-seconds", type=float, default=2)
+    return asyncio.run(run(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,229 @@
+# Backend/loadtest/mock_upstream.py
+"""
+부하 테스트용 외부 API 대역 서버.
+OpenAI(전사/음성 합성/chat.completions/responses)와 OpenWeatherMap 현재 날씨를 흉내 내며,
+엔드포인트별 지연 시간 분포(로그정규: 중앙값/p95)와 오류 비율을 프로필로 조정합니다.
+slow_rate 비율의 요청은 slow_ms만큼 더 멈춰 꼬리 지연(네트워크 정체, 서버 큐잉)을 흉내 냅니다.
+PUT /mock/profile 로 실행 중에 엔드포인트 설정을 바꿀 수 있습니다. (장애 구간 재현)
+전사는 ms_per_audio_s로 녹음 길이에 비례하는 지연을 더할 수 있고, decode_tones면 TONE_WORDS 규칙으로
+만든 합성 녹음(단어마다 다른 주파수의 톤)을 실제로 풀어 돌려줍니다. (loadtest.chunk_bench 정확도 측정용)
+
+    LOADTEST_PROFILE=loadtest/profile.yaml uvicorn loadtest.mock_upstream:app --port 18001
+"""
+import io
+import os
+import math
+import wave
+import time
+import random
+import asyncio
+from typing import Any, Dict, List
+
+import numpy as np
+import yaml
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+_DEFAULT_PROFILE = os.path.join(os.path.dirname(__file__), "profile.yaml")
+
+# 전사 결과로 돌려줄 키오스크 발화 예시
+_TRANSCRIPTS = [
+    "주민등록등본 떼고 싶어요",
+    "가족관계증명서 발급해 주세요",
+    "오늘 날씨 알려줘",
+    "근처 축제 뭐 있어",
+    "여권 신청하려고 하는데요",
+    "음 그러니까 그거 있잖아요",
+]
+
+
+# 합성 녹음 규칙: i번째 단어 = TONE_BASE_HZ + i × TONE_STEP_HZ 사인파
+TONE_WORDS = [
+    "주민등록등본", "가족관계증명서", "발급", "신청", "하고", "싶어요", "어디서", "받을", "수", "있나요",
+    "서류", "여권", "재발급", "날씨", "알려주세요", "그리고", "인감증명서", "필요해요", "창구", "번호",
+]
+TONE_BASE_HZ = 300.0
+TONE_STEP_HZ = 45.0
+_TONE_FRAME_MS = 20
+_TONE_MIN_WORD_MS = 100
+
+
+def decode_tones(pcm: bytes, sample_rate: int) -> List[str]:
+    """소리가 이어지는 구간(100ms 이상)마다 주 주파수를 찾아 단어로 바꿉니다."""
+    samples = np.frombuffer(pcm[:len(pcm) - len(pcm) % 2], dtype=np.int16).astype(np.float32) / 32768.0
+    frame = int(sample_rate * _TONE_FRAME_MS / 1000)
+    n = len(samples) // frame
+    if n == 0:
+        return []
+    rms = np.sqrt(np.mean(samples[:n * frame].reshape(n, frame) ** 2, axis=1))
+    voiced = np.concatenate(([False], 20 * np.log10(np.maximum(rms, 1e-10)) > -35, [False]))
+    runs = np.flatnonzero(np.diff(voiced.astype(np.int8))).reshape(-1, 2)
+    words = []
+    for start, end in runs:
+        if (end - start) * _TONE_FRAME_MS < _TONE_MIN_WORD_MS:
+            continue
+        segment = samples[start * frame:end * frame]
+        spectrum = np.abs(np.fft.rfft(segment * np.hanning(len(segment))))
+        freq = np.argmax(spectrum) * sample_rate / len(segment)
+        index = int(round((freq - TONE_BASE_HZ) / TONE_STEP_HZ))
+        if 0 <= index < len(TONE_WORDS):
+            words.append(TONE_WORDS[index])
+    return words
+
+
+def _load_profile() -> Dict[str, Any]:
+    with open(os.getenv("LOADTEST_PROFILE", _DEFAULT_PROFILE), "r", encoding="utf-8") as f:
+        return (yaml.safe_load(f) or {}).get("mock") or {}
+
+
+_profile = _load_profile()
+_counters: Dict[str, Dict[str, int]] = {}
+
+app = FastAPI()
+
+
+class _Injected(Exception):
+    def __init__(self, status: int) -> None:
+        self.status = status
+
+
+async def _simulate(endpoint: str, audio_seconds: float = 0.0) -> Dict[str, Any]:
+    """
+    프로필에 따라 지연시키고, 오류 비율만큼 _Injected를 발생시킵니다.
+    지연은 중앙값 m, p95 값 p인 로그정규 분포 (sigma = ln(p/m) / 1.645) + 녹음 길이 × ms_per_audio_s
+    """
+    spec = _profile.get(endpoint) or {}
+    counter = _counters.setdefault(endpoint, {"requests": 0, "errors": 0})
+    counter["requests"] += 1
+
+    median = float(spec.get("median_ms", 100))
+    p95 = max(float(spec.get("p95_ms", median)), median)
+    sigma = math.log(p95 / median) / 1.645 if median > 0 else 0.0
+    delay_ms = median * math.exp(random.gauss(0.0, sigma)) if median > 0 else 0.0
+    delay_ms += audio_seconds * float(spec.get("ms_per_audio_s", 0))
+    if random.random() < float(spec.get("slow_rate", 0.0)):
+        counter["slow"] = counter.get("slow", 0) + 1
+        delay_ms += float(spec.get("slow_ms", 5000))
+    await asyncio.sleep(delay_ms / 1000)
+
+    if random.random() < float(spec.get("error_rate", 0.0)):
+        counter["errors"] += 1
+        raise _Injected(int(spec.get("error_status", 500)))
+    return spec
+
+
+@app.exception_handler(_Injected)
+async def _injected_error(request: Request, exc: _Injected):
+    # OpenAI 오류 응답 형식 (429면 SDK가 재시도 간격을 바로 쓰도록 retry-after 포함)
+    headers = {"retry-after": "0.2"} if exc.status == 429 else None
+    return JSONResponse(
+        {"error": {"message": "injected by mock_upstream", "type": "mock_error", "code": exc.status}},
+        status_code=exc.status, headers=headers,
+    )
+
+
+@app.post("/v1/audio/transcriptions")
+async def transcriptions(request: Request):
+    form = await request.form()   # 업로드 본문을 끝까지 읽음 (실제 서버와 같은 입력 처리 비용)
+    spec = _profile.get("transcription") or {}
+    audio_seconds, words = 0.0, None
+    if spec.get("ms_per_audio_s") or spec.get("decode_tones"):
+        try:
+            with wave.open(io.BytesIO(await form["file"].read()), "rb") as wf:
+                pcm, rate = wf.readframes(wf.getnframes()), wf.getframerate()
+            audio_seconds = len(pcm) / 2 / rate
+            words = decode_tones(pcm, rate) if spec.get("decode_tones") else None
+        except (KeyError, wave.Error, EOFError):
+            pass
+    await _simulate("transcription", audio_seconds)
+    if words is not None:
+        return {"text": " ".join(words)}
+    return {"text": random.choice(_TRANSCRIPTS)}
+
+
+@app.post("/v1/audio/speech")
+async def speech(request: Request):
+    body = await request.json()
+    spec = await _simulate("speech")
+    size = max(1024, len(body.get("input", "")) * int(spec.get("bytes_per_char", 600)))
+
+    async def audio():
+        # 실제 API처럼 조각 단위로 흘려보냄 (MP3 프레임 동기 헤더로 시작하는 더미 데이터)
+        chunk = b"\xff\xf3" + os.urandom(4094)
+        sent = 0
+        while sent < size:
+            yield chunk[: size - sent]
+            sent += len(chunk)
+            await asyncio.sleep(0)
+
+    return StreamingResponse(audio(), media_type="audio/mpeg")
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: Request):
+    body = await request.json()
+    await _simulate("chat")
+    return {
+        "id": f"chatcmpl-mock-{time.time_ns()}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": body.get("model", "mock"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": "민원 목적을 알 수 없음"},
+            "finish_reason": "stop",
+        }],
+        "usage": {"prompt_tokens": 300, "completion_tokens": 10, "total_tokens": 310},
+    }
+
+
+@app.post("/v1/responses")
+async def responses(request: Request):
+    body = await request.json()
+    await _simulate("responses")
+    text = "서울은 맑고 기온은 21도입니다.\n습도는 40%이고 바람은 약합니다."
+    return {
+        "id": f"resp-mock-{time.time_ns()}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": body.get("model", "mock"),
+        "status": "completed",
+        "output": [{
+            "type": "message",
+            "id": "msg-mock",
+            "status": "completed",
+            "role": "assistant",
+            "content": [{"type": "output_text", "text": text, "annotations": []}],
+        }],
+        "parallel_tool_calls": False,
+        "tool_choice": "auto",
+        "tools": [],
+    }
+
+
+@app.get("/data/2.5/weather")
+async def weather(q: str = "Seoul"):
+    await _simulate("weather")
+    now = int(time.time())
+    return {
+        "name": q,
+        "dt": now - now % 600,   # 관측 시각은 10분 단위로 바뀜 (요약 캐시 키)
+        "weather": [{"id": 800, "main": "Clear", "description": "맑음", "icon": "01d"}],
+        "main": {"temp": 21.3, "feels_like": 20.8, "humidity": 40, "pressure": 1015},
+        "wind": {"speed": 2.1, "deg": 180},
+        "sys": {"country": "KR"},
+    }
+
+
+@app.get("/mock/stats")
+async def stats():
+    """엔드포인트별 요청/주입 오류 횟수 (하니스가 종료 전에 수집)"""
+    return _counters
+
+
+@app.put("/mock/profile")
+async def update_profile(request: Request):
+    """{"transcription": {"error_rate": 1.0}} 처럼 엔드포인트별 설정 일부를 덮어씁니다."""
+    for endpoint, spec in (await request.json()).items():
+        _profile[endpoint] = {**(_profile.get(endpoint) or {}), **spec}
+    return _profile
@@ -1,8 +1,7 @@
 # -*- coding: utf-8 -*-
-from fastapi import FastAPI, Request, UploadFile, File, Form, Response
+from fastapi import FastAPI, Request, UploadFile, File, Form, Response, Query, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from openai import OpenAI
+from fastapi.responses import JSONResponse, StreamingResponse
 from dotenv import load_dotenv
 from loguru import logger
 from recognition import router as recognition_router
@@ -10,22 +9,38 @@ from weather import router as weather_router
 
 import os
 import json
-import httpx
-import tempfile
-import subprocess
+import time
+import asyncio
 
 BACKEND_DIR = os.path.abspath(os.path.dirname(__file__))
 ROOT_DIR = os.path.abspath(os.path.join(BACKEND_DIR, ".."))
 
 # --- STT/TTS 통합: 모듈 import ---
 # factory_backup -> factory로 경로를 수정하고, 필요한 예외 클래스를 import합니다.
-from Utility.STT_TTS.factory import load_config, create_stt, create_tts, setup_logging
-from Utility.STT_TTS.def_exceptions import TranscriptionError, TTSError
+from Utility.STT_TTS.factory import load_config, create_stt, create_tts, create_segmenter, create_transcoder, setup_logging
+from Utility.STT_TTS.def_exceptions import TranscriptionError, TTSError, TranscodeError
+from Utility.STT_TTS.imp_offload import configure_offload, shutdown_offload
+from Utility.STT_TTS.imp_tts_cached import CachedTTS
+from Utility.STT_TTS.imp_stt_failover import FailoverSTT
+from Utility.STT_TTS.imp_audio_gate import SilenceGatedSTT
+from Utility.STT_TTS.imp_stt_chunked import ChunkedSTT
+from Utility.STT_TTS.imp_resilience import ResilientSTT, ResilientTTS
+from Utility.STT_TTS.imp_tts_stream import split_sentences, stream_sentences
+from Utility.STT_TTS.imp_transcoder_ffmpeg import TranscodeResult, pcm_to_wav, sniff_format
+from Utility.STT_TTS.imp_vad_segmenter import resample_pcm16
+# --- 의도 분석: 키워드 → LLM 계층형 파이프라인 ---
+from Utility.Intent import create_intent_pipeline, create_keyword_table
+# --- 등록 사용자 저장소 (SQLite) ---
+from Utility.UserStore import create_user_repository
+# --- 요청/단계별 소요 시간 측정 (/metrics) ---
+from Utility.Metrics import REGISTRY, TimingMiddleware, stage
+from Utility.OpenAIGateway import create_openai_gateway
+# --- 워커 간 공유 상태 (TTS/날씨 캐시) ---
+from Utility.Cache import create_state_backend
 
 # 환경변수 불러오기
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-client = OpenAI(api_key=OPENAI_API_KEY)
 
 app = FastAPI()
 app.include_router(recognition_router)
@@ -44,56 +59,122 @@ app.add_middleware(
 # 프로젝트의 루트 디렉토리 경로를 계산하여 설정 파일을 올바르게 찾도록 합니다.
 _stt = None
 _tts = None
+_transcoder = None
+_prewarm_task = None
 
 try:
     # .env와 config.yaml 파일 로드
     # load_dotenv(os.path.join(ROOT_DIR, ".env"))
-    config = load_config(os.path.join(ROOT_DIR, "config.yaml"))
+    # KIOSK_CONFIG: 다른 설정 파일로 실행 (부하 테스트 하니스 등)
+    config = load_config(os.getenv("KIOSK_CONFIG") or os.path.join(ROOT_DIR, "config.yaml"))
     setup_logging()
+    # 블로킹 엔진 호출을 오프로드할 스레드 풀 크기
+    configure_offload((config.get('general') or {}).get('offload_workers', 4))
+    # 모든 OpenAI 호출이 함께 쓰는 관문 (엔진보다 먼저 만들어야 설정이 적용됨)
+    _openai = create_openai_gateway(config)
+    # TTS/날씨 캐시가 쓰는 상태 저장소 (state.backend: sqlite면 여러 워커가 같은 캐시를 공유)
+    _state = create_state_backend(config)
+    logger.info(f"공유 상태 저장소: {_state.name}")
 
     # 설정 파일을 기반으로 STT, TTS 엔진 인스턴스 생성
     _stt = create_stt(config)
     _tts = create_tts(config)
+    # 업로드 오디오를 파이프로 변환하는 ffmpeg 워커 풀
+    _transcoder = create_transcoder(config)
     logger.info("STT/TTS 엔진 인스턴스 생성 완료.")
+    # 주민번호 인증(/recognition/)이 사용하는 공유 사용자 저장소
+    _users = create_user_repository(config)
+
+    # /metrics 에 캐시 적중률 노출 (값은 수집 요청 때만 읽음)
+    if isinstance(_tts, CachedTTS):
+        REGISTRY.register_cache_stats("tts.memory", lambda: _tts.stats()["memory"])
+        REGISTRY.register_cache_stats("tts.disk", lambda: _tts.stats()["disk"])
+    REGISTRY.register_cache_stats("users.by_user_id", lambda: _users.stats()["by_user_id"])
+    REGISTRY.register_collector(
+        "kiosk_openai_in_flight", "gauge", "엔드포인트별 OpenAI 진행 중 요청 수",
+        lambda: [({"endpoint": name}, s["in_flight"]) for name, s in _openai.stats().items()],
+    )
+    REGISTRY.register_collector(
+        "kiosk_openai_queued", "gauge", "엔드포인트별 OpenAI 관문 대기 요청 수",
+        lambda: [({"endpoint": name}, s["queued"]) for name, s in _openai.stats().items()],
+    )
+    # "total"은 전체 자리 사용량(in_flight/queued/limit)만 있으므로 엔드포인트별 응답 수/대기 시간에서는 뺌
+    REGISTRY.register_collector(
+        "kiosk_openai_requests_total", "counter", "엔드포인트/상태 코드별 OpenAI 응답 수",
+        lambda: [({"endpoint": name, "status": status}, count)
+                 for name, s in _openai.stats().items() if name != "total"
+                 for status, count in s["requests"].items()],
+    )
+    REGISTRY.register_collector(
+        "kiosk_openai_throttled_seconds_total", "counter", "요청 한도(토큰 버킷/429) 때문에 기다린 시간 합",
+        lambda: [({"endpoint": name}, s["throttled_seconds"]) for name, s in _openai.stats().items()
+                 if name != "total"],
+    )
+    # 래퍼 순서: ChunkedSTT → SilenceGatedSTT → (FailoverSTT | ResilientSTT →) 엔진
+    _stt_gate = _stt.inner if isinstance(_stt, ChunkedSTT) else _stt
+    _stt_engine = _stt_gate.inner if isinstance(_stt_gate, SilenceGatedSTT) else _stt_gate
+    if isinstance(_stt, ChunkedSTT):
+        REGISTRY.register_collector(
+            "kiosk_stt_chunked_total", "counter",
+            "구간 분할 전사 수 (chunked: 나눈 녹음 | chunks: 구간 | overlapped: 겹쳐 자른 경계)",
+            lambda: [({"kind": key}, count) for key, count in _stt.stats().items()],
+        )
+    if isinstance(_stt_engine, FailoverSTT):
+        REGISTRY.register_collector(
+            "kiosk_stt_served_total", "counter", "결과를 돌려준 STT 엔진별 요청 수 (remote | local)",
+            lambda: [({"engine": name}, count) for name, count in _stt_engine.stats()["served"].items()],
+        )
+    if isinstance(_stt_gate, SilenceGatedSTT):
+        REGISTRY.register_collector(
+            "kiosk_stt_gate_total", "counter", "STT 전 무음 검사 결과별 녹음 수 (checked | skipped | passthrough)",
+            lambda: [({"result": key}, _stt_gate.stats()[key]) for key in ("checked", "skipped", "passthrough")],
+        )
+        REGISTRY.register_collector(
+            "kiosk_stt_gate_seconds_total", "counter", "무음 검사한 녹음 길이와 잘라낸 앞뒤 무음 길이 (input | trimmed)",
+            lambda: [({"kind": "input"}, _stt_gate.stats()["input_seconds"]),
+                     ({"kind": "trimmed"}, _stt_gate.stats()["trimmed_seconds"])],
+        )
+    # 헤지 요청/서킷 브레이커 상태 (CachedTTS 안의 원격 엔진까지 찾아 봄, FailoverSTT를 쓰면 STT는 해당 없음)
+    _resilient = {
+        "stt": _stt_engine,
+        "tts": _tts.inner if isinstance(_tts, CachedTTS) else _tts,
+    }
+    _resilient = {kind: engine for kind, engine in _resilient.items() if isinstance(engine, (ResilientSTT, ResilientTTS))}
+    if _resilient:
+        REGISTRY.register_collector(
+            "kiosk_resilience_total", "counter",
+            "헤지/서킷 브레이커 이벤트 수 (requests | hedged | hedge_wins | short_circuited | failures | fallback)",
+            lambda: [({"engine": kind, "event": key}, engine.stats()[key]) for kind, engine in _resilient.items()
+                     for key in ("requests", "hedged", "hedge_wins", "short_circuited", "failures", "fallback")],
+        )
+        REGISTRY.register_collector(
+            "kiosk_resilience_breaker_open", "gauge", "서킷 브레이커가 열려(또는 반열림) 원격 호출을 막는 중이면 1",
+            lambda: [({"engine": kind}, int(engine.breaker.state != "closed")) for kind, engine in _resilient.items()],
+        )
+        REGISTRY.register_collector(
+            "kiosk_resilience_hedge_deadline_seconds", "gauge", "현재 헤지 마감 시간 (최근 p95 기반)",
+            lambda: [({"engine": kind}, engine.deadline()) for kind, engine in _resilient.items()],
+        )
 
 except Exception as e:
     logger.error(f"설정 파일 로드 또는 엔진 생성 실패: {e}")
     config = None
 
+# ✅ 요청 전체/단계별 소요 시간 기록 (운영 중에도 켜 두는 것을 전제로 한 가벼운 순수 ASGI 미들웨어)
+# server_timing: true 이면 브라우저 개발자 도구에서 단계별 시간을 볼 수 있도록 Server-Timing 헤더를 붙임
+_metrics_config = (config or {}).get('metrics') or {}
+if _metrics_config.get('enabled', True):
+    app.add_middleware(TimingMiddleware, server_timing=_metrics_config.get('server_timing', False))
+
 # ✅ 주요 키워드 사전
-MINWON_KEYWORDS = {
-    "등본": "주민등록등본 발급 요청",
-    "주민등록등본": "주민등록등본 발급 요청",
-    "주민등본": "주민등록등본 발급 요청",
-    "초본": "주민등록초본 발급 요청",
-    "주민등록초본": "주민등록초본 발급 요청",
-    "주민초본": "주민등록초본 발급 요청",
-    "가족관계증명서": "가족관계증명서 발급 요청",
-    "가족관계증명": "가족관계증명서 발급 요청",
-    "가족관계": "가족관계증명서 발급 요청",
-    "가족증명": "가족관계증명서 발급 요청",
-    "건강보험득실확인서": "건강보험득실확인서 발급 요청",
-    "건강보험": "건강보험득실확인서 발급 요청",
-    "건보": "건강보험득실확인서 발급 요청",
-    "보험득실": "건강보험득실확인서 발급 요청",
-    "보험득실확인": "건강보험득실확인서 발급 요청",
-    "날씨": "날씨 정보 조회 요청",
-    "오늘날씨": "날씨 정보 조회 요청",
-    "내일날씨": "날씨 정보 조회 요청",
-    "강수확률": "날씨 정보 조회 요청",
-    "행사": "행사 정보 조회 요청",
-    "축제": "행사 정보 조회 요청",
-    "이벤트": "행사 정보 조회 요청",
-    "페스티벌": "행사 정보 조회 요청",
-}
-
-
-# ✅ 키워드 기반 분석 함수
+# 키워드/별칭은 Utility/Intent/keywords.yaml 에서 관리하며, 한 번 컴파일한 오토마톤으로 매칭합니다.
+# 서버 실행 중 파일을 수정하면 재시작 없이 자동으로 다시 컴파일됩니다.
+_keywords = create_keyword_table(config)
+
+
+# ✅ 키워드 기반 분석 함수 (가장 왼쪽·가장 긴 키워드 우선, 입력 1회 순회)
 def get_purpose_by_keyword(user_input: str) -> str | None:
-    for keyword, purpose in MINWON_KEYWORDS.items():
-        if keyword in user_input:
-            return purpose
-    return None
+    return _keywords.purpose_of(user_input)
 
 
 # ✅ LLM 프롬프트
@@ -127,94 +208,42 @@ LLM_PROMPT = """
 - 설명, 부가 텍스트, 인삿말 절대 금지.
 """
 
+# 키워드가 충분히 확실하면 즉시 응답하고, 아니면 LLM을 비동기로 호출하는 파이프라인
+_intent = create_intent_pipeline(config, LLM_PROMPT, OPENAI_API_KEY)
+
 
 @app.on_event("startup")
 async def startup_event():
     """FastAPI 앱 시작 시 STT/TTS 엔진을 초기화합니다."""
+    global _prewarm_task
     if _stt:
         _stt.initialize()
         logger.info("STT 엔진 초기화 완료.")
     if _tts:
         _tts.initialize()
         logger.info("TTS 엔진 초기화 완료.")
-
-
-def _ensure_wav(input_bytes: bytes, input_mime: str | None) -> bytes:
-    """
-    브라우저에서 전달받은 오디오 파일(webm, ogg 등)을 ETRI STT API가 요구하는
-    WAV (16kHz, 1채널) 형식으로 변환합니다. 시스템에 ffmpeg가 설치되어 있어야 합니다.
-    """
-    mime = (input_mime or "").lower()
-
-    # --- STT 문제 해결: 입력 데이터 유효성 검사 ---
-    if not input_bytes or len(input_bytes) == 0:
-        logger.error("입력 오디오 데이터가 비어있습니다.")
-        raise ValueError("입력 오디오 데이터가 비어있습니다.")
-
-    # 이미 wav 형식이면 변환 없이 바로 반환
-    if "wav" in mime:
-        return input_bytes
-
-    # 임시 파일 생성하여 변환 작업 수행
-    # delete=False: with 블록이 끝나도 파일이 지워지지 않도록 설정
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as src:
-        src.write(input_bytes)
-        src_path = src.name
-
-    dst_path = src_path + ".wav"
-
-    try:
-        # --- STT 문제 해결: ffmpeg 명령어 실행 전 파일 존재 확인 ---
-        if not os.path.exists(src_path):
-            raise FileNotFoundError(f"임시 파일 생성 실패: {src_path}")
-        # --- 수정 완료 ---
-
-        # ffmpeg 명령어 실행: -y(덮어쓰기), -i(입력), -ac 1(모노), -ar 16000(16kHz 샘플링)
-        command = ["ffmpeg", "-y", "-i", src_path, "-ac", "1", "-ar", "16000", dst_path]
-        result = subprocess.run(
-            command,
-            stdout=subprocess.DEVNULL,  # 성공 로그는 출력 안 함
-            stderr=subprocess.PIPE,  # 에러 로그는 캡처
-            check=True,  # 오류 발생 시 CalledProcessError 예외 발생
-            timeout=30  # 30초 타임아웃 설정
-        )
-
-        # --- STT 문제 해결: 변환 결과 파일 존재 확인 ---
-        if not os.path.exists(dst_path):
-            raise FileNotFoundError(f"오디오 변환 결과 파일이 생성되지 않았습니다: {dst_path}")
-
-        if os.path.getsize(dst_path) == 0:
-            raise ValueError("변환된 오디오 파일이 비어있습니다.")
-        # --- 수정 완료 ---
-
-        with open(dst_path, "rb") as f:
-            converted_bytes = f.read()
-
-        # --- STT 문제 해결: 변환 결과 유효성 검사 ---
-        if not converted_bytes or len(converted_bytes) == 0:
-            raise ValueError("오디오 변환 결과가 비어있습니다.")
-        # --- 수정 완료 ---
-
-        return converted_bytes
-
-    except FileNotFoundError:
-        logger.error("ffmpeg를 찾을 수 없습니다. 시스템에 ffmpeg가 설치되어 있는지 확인해주세요.")
-        raise
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr.decode() if e.stderr else "알 수 없는 ffmpeg 오류"
-        logger.error(f"ffmpeg 오디오 변환 실패: {error_msg}")
-        raise
-    except subprocess.TimeoutExpired:
-        logger.error("ffmpeg 변환 시간 초과")
-        raise
-    finally:
-        # 임시 파일 삭제
-        for file_path in [src_path, dst_path]:
-            if os.path.exists(file_path):
-                try:
-                    os.remove(file_path)
-                except OSError as e:
-                    logger.warning(f"임시 파일 삭제 실패: {file_path}, 오류: {e}")
+        # 고정 안내 문구를 미리 합성해 캐시에 넣음 (기본: 백그라운드로 진행)
+        if isinstance(_tts, CachedTTS) and _tts.prewarm_phrases:
+            if (config['tts'].get('cache') or {}).get('prewarm_background', True):
+                _prewarm_task = asyncio.create_task(_tts.prewarm())
+            else:
+                await _tts.prewarm()
+    if _transcoder:
+        _transcoder.initialize()
+    # 로컬 임베딩 의도 분석 단계: few-shot 예시를 한 번만 임베딩
+    _intent.initialize()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """FastAPI 앱 종료 시 오디오 변환 워커 풀과 엔진 오프로드 스레드 풀을 정리합니다."""
+    if _prewarm_task and not _prewarm_task.done():
+        _prewarm_task.cancel()
+    if _transcoder:
+        _transcoder.close()
+    await create_openai_gateway().aclose()
+    create_state_backend().close()
+    shutdown_offload()
 
 
 # ✅ 텍스트 분석 API
@@ -226,34 +255,31 @@ async def receive_text(request: Request):
         user_input = data.get("text", "")
         print("📨 받은 텍스트:", user_input)
 
-        # 1차 키워드 의포 파악
-        keyword_purpose = get_purpose_by_keyword(user_input)
-        print("🔍 키워드 매칭:", keyword_purpose)
-
-        # 2차 LLM 의도 파악 요청
-        system_prompt = ("너는 공공기관 키오스크 AI야. 사용자 목적만 예시처럼 "
-                         "한 줄로 써줘. 예시 없는 건 '민원 목적을 알 수 없음'만 쓰면 된다.")
-        if keyword_purpose:
-            user_prompt = f"{LLM_PROMPT}\n[예상 목적: {keyword_purpose}]\n\"{user_input}\""
-        else:
-            user_prompt = f"{LLM_PROMPT}\n\"{user_input}\""
-
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ]
-        )
-
-        summary = response.choices[0].message.content.strip()
-        print("🧐 LLM 결과:", summary)
+        # 1차 키워드 → (신뢰도가 낮거나 매칭 실패 시) 2차 LLM 순서로 의도 파악
+        decision = await _intent.classify(user_input)
+        result = decision.result
+        print("🔍 의도 분석:", result, decision.timings_ms)
+
+        if result is None:
+            return {
+                "source": "none",
+                "tier": None,
+                "summary": None,
+                "purpose": None,
+                "matched_keyword": None,
+                "confidence": 0.0,
+                "timings_ms": decision.timings_ms,
+            }
 
         return {
-            "source": "llm",
-            "summary": keyword_purpose,
-            "purpose": keyword_purpose,
-            "matched_keyword": keyword_purpose
+            "source": result.tier,
+            "tier": result.tier,
+            "summary": result.purpose,
+            "purpose": result.purpose,
+            "matched_keyword": result.matched_keyword,
+            "matched_spans": result.spans,
+            "confidence": result.confidence,
+            "timings_ms": decision.timings_ms,
         }
 
     except Exception as e:
@@ -291,13 +317,32 @@ async def stt_once(file: UploadFile = File(...)):
             return JSONResponse({"error": "오디오 파일이 비어있습니다."}, status_code=400)
         # --- 수정 완료 ---
 
-        # 오디오를 STT API가 요구하는 16kHz/Mono WAV 형식으로 변환
-        wav_bytes = _ensure_wav(raw_bytes, file.content_type)
-        # STT 엔진으로 텍스트 변환 수행
-        text = _stt.transcribe(wav_bytes)
+        source_format = sniff_format(raw_bytes, file.content_type)
+        if source_format is not None and _stt.accepts_raw_upload():
+            # 무음 검사/긴 녹음 분할 래퍼가 업로드를 한 번만 풀어 검사하고 엔진 포맷 협상도 직접 함 (여기서 변환하면 두 번 풀게 됨)
+            converted = TranscodeResult(raw_bytes, source_format, 0.0, 0.0)
+        else:
+            # STT 엔진이 직접 받는 포맷이면 그대로 전달, 아니면 Opus/WAV로 변환 (임시 파일 없이 파이프 처리)
+            with stage("transcode"):
+                converted = await _transcoder.aprepare(raw_bytes, file.content_type, _stt.supported_formats())
+            logger.info(
+                f"오디오 포맷 협상 완료: {converted.audio_format} "
+                f"({len(raw_bytes)} → {len(converted.audio_bytes)} bytes, "
+                f"대기 {converted.wait_ms:.1f}ms, 변환 {converted.elapsed_ms:.1f}ms)"
+            )
+        # STT 엔진으로 텍스트 변환 수행 (비동기: 이벤트 루프를 막지 않음)
+        with stage("stt"):
+            text = await _stt.atranscribe(converted.audio_bytes, converted.audio_format)
         logger.info(f"STT 변환 결과: '{text}'")
-        return JSONResponse({"text": text})
-
+        return JSONResponse({
+            "text": text,
+            "audio_format": converted.audio_format,
+            "transcode_ms": round(converted.wait_ms + converted.elapsed_ms, 1),
+        })
+
+    except TranscodeError as e:
+        logger.error(f"오디오 변환 오류: {e}")
+        return JSONResponse({"error": str(e)}, status_code=400)
     except TranscriptionError as e:
         logger.error(f"STT 변환 오류: {e}")
         return JSONResponse({"error": str(e)}, status_code=502)
@@ -306,11 +351,175 @@ async def stt_once(file: UploadFile = File(...)):
         return JSONResponse({"error": "알 수 없는 STT 오류가 발생했습니다."}, status_code=500)
 
 
+# --- 스트리밍 STT: 서버 측 VAD로 발화 끝을 찾아 바로 전사 ---
+@app.websocket("/ws/stt")
+async def stt_stream(websocket: WebSocket, audio_format: str = Query("pcm16", alias="format"),
+                     rate: int = Query(16000)):
+    """
+    마이크 프레임을 실시간으로 받아 서버에서 발화 끝점을 찾고, 발화가 끝날 때마다 STT 결과를 보냅니다.
+    - 쿼리: format=pcm16(16bit 모노 PCM, rate로 샘플링 레이트 지정) | webm | ogg (MediaRecorder Opus)
+    - 클라이언트 → 서버: 바이너리 오디오 프레임, 종료 시 텍스트 {"event": "end"}
+    - 서버 → 클라이언트: ready / speech_start / speech_end / partial(발화별 결과) / final(전체 결과) / error
+    """
+    await websocket.accept()
+    if not _stt or not _stt.is_initialized() or config is None:
+        await websocket.send_json({"type": "error", "message": "STT 엔진이 준비되지 않았습니다."})
+        await websocket.close(code=1011)
+        return
+    if audio_format not in ("pcm16", "webm", "ogg"):
+        await websocket.send_json({"type": "error", "message": f"지원하지 않는 오디오 포맷입니다: {audio_format}"})
+        await websocket.close(code=1003)
+        return
+
+    segmenter = create_segmenter(config)
+    sample_rate = segmenter.sample_rate
+    utterances: asyncio.Queue = asyncio.Queue()
+    texts = []
+    decoder = None
+    pump = None
+
+    async def send(event: str, **data):
+        await websocket.send_json({"type": event, **data})
+
+    async def handle_pcm(pcm: bytes):
+        was_speaking = segmenter.is_speaking
+        for utterance in segmenter.feed(pcm):
+            await send("speech_end", audio_ms=round(len(utterance) / 2 / sample_rate * 1000))
+            utterances.put_nowait(utterance)
+        if segmenter.is_speaking and not was_speaking:
+            await send("speech_start")
+
+    async def transcribe_worker():
+        # 발화 순서대로 하나씩 전사 (결과 순서 보장), 수신 루프와는 독립적으로 동작
+        index = 0
+        while True:
+            pcm = await utterances.get()
+            if pcm is None:
+                return
+            started = time.perf_counter()
+            try:
+                with stage("stt"):
+                    text = await _stt.atranscribe(pcm_to_wav(pcm, sample_rate), "wav")
+            except TranscriptionError as e:
+                await send("error", index=index, message=str(e))
+                index += 1
+                continue
+            if text:
+                texts.append(text)
+            await send(
+                "partial", index=index, text=text,
+                audio_ms=round(len(pcm) / 2 / sample_rate * 1000),
+                stt_ms=round((time.perf_counter() - started) * 1000, 1),
+            )
+            index += 1
+
+    async def pump_decoder():
+        while True:
+            pcm = await decoder.read()
+            if not pcm:
+                return
+            await handle_pcm(pcm)
+
+    worker = asyncio.create_task(transcribe_worker())
+    try:
+        if audio_format != "pcm16":
+            decoder = await _transcoder.open_stream_decoder(audio_format)
+            pump = asyncio.create_task(pump_decoder())
+        await send("ready", format=audio_format, sample_rate=sample_rate, vad=segmenter.scorer.name)
+
+        ended_by_client = False
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+            if message.get("bytes"):
+                if decoder:
+                    await decoder.write(message["bytes"])
+                else:
+                    await handle_pcm(resample_pcm16(message["bytes"], rate, sample_rate))
+            elif message.get("text"):
+                try:
+                    event = json.loads(message["text"]).get("event")
+                except (ValueError, AttributeError):
+                    event = None
+                if event == "end":
+                    ended_by_client = True
+                    break
+
+        if ended_by_client:
+            # 입력 종료: 디코더에 남은 오디오와 진행 중인 발화까지 전사한 뒤 최종 결과 전송
+            if decoder:
+                await decoder.finish()
+                await pump
+            tail = segmenter.flush()
+            if tail:
+                utterances.put_nowait(tail)
+            utterances.put_nowait(None)
+            await worker
+            await send("final", text=" ".join(texts), dropped=segmenter.dropped)
+            await websocket.close()
+        logger.info(f"스트리밍 STT 세션 종료: 발화 {len(texts)}개 (VAD={segmenter.scorer.name})")
+
+    except WebSocketDisconnect:
+        logger.info("스트리밍 STT: 클라이언트 연결이 끊어졌습니다.")
+    except TranscodeError as e:
+        logger.error(f"스트리밍 오디오 디코딩 오류: {e}")
+        try:
+            await send("error", message=str(e))
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+    finally:
+        for task in (worker, pump):
+            if task and not task.done():
+                task.cancel()
+        if decoder:
+            await decoder.close()
+        segmenter.close()
+
+
+async def _stream_tts(text: str):
+    """
+    텍스트를 문장 단위로 나눠 동시에 합성하고, MP3 청크를 문장 순서대로 chunked 응답으로 흘려보냅니다.
+    첫 청크가 나올 때까지는 기다렸다가 응답을 시작하므로, 첫 문장부터 실패하면 일반 오류 응답을 줄 수 있습니다.
+    """
+    stream_config = ((config or {}).get('tts') or {}).get('stream') or {}
+    sentences = split_sentences(text, max_chars=stream_config.get('max_sentence_chars', 200))
+    chunks = stream_sentences(_tts, sentences, concurrency=stream_config.get('concurrency', 2))
+
+    try:
+        # 첫 문장이 나오기까지의 시간 = 사용자가 체감하는 TTS 대기 시간
+        with stage("tts.first_chunk"):
+            first = await chunks.__anext__()
+    except StopAsyncIteration:
+        logger.error("TTS 변환 결과가 비어있습니다.")
+        return JSONResponse({"error": "TTS 변환에 실패했습니다."}, status_code=502)
+
+    async def body():
+        yield first
+        try:
+            async for chunk in chunks:
+                yield chunk
+        except Exception as e:
+            # 이미 응답 헤더가 나간 뒤라 상태 코드를 바꿀 수 없으므로 스트림을 여기서 끝냄
+            logger.error(f"TTS 스트리밍 중단: {e}")
+        finally:
+            await chunks.aclose()
+
+    logger.info(f"TTS 스트리밍 시작: {len(sentences)}개 문장")
+    return StreamingResponse(
+        body(),
+        media_type="audio/mpeg",
+        headers={"X-TTS-Sentences": str(len(sentences)), "Cache-Control": "no-store"},
+    )
+
+
 # --- STT/TTS 통합: TTS API 엔드포인트 (수정) ---
 @app.post("/api/tts")
-async def tts_once(text: str = Form(...)):
+async def tts_once(text: str = Form(...), stream: bool = Form(False)):
     """
     프론트엔드에서 텍스트를 받아 음성 데이터(MP3)로 변환하여 반환합니다.
+    stream=true면 문장 단위로 합성해 첫 문장이 준비되는 즉시 재생할 수 있도록 흘려보냅니다.
     """
     try:
         # 텍스트 유효성 검사
@@ -327,8 +536,12 @@ async def tts_once(text: str = Form(...)):
             return JSONResponse({"error": "TTS 엔진이 준비되지 않았습니다."}, status_code=503)
         # --- 수정 완료 ---
 
-        # synthesize 메서드를 호출하여 음성 데이터를 바이트로 직접 받음
-        audio_bytes = _tts.synthesize(text)
+        if stream:
+            return await _stream_tts(text)
+
+        # asynthesize 메서드를 호출하여 음성 데이터를 바이트로 직접 받음 (비동기, 캐시 적중 시 API 호출 없음)
+        with stage("tts"):
+            audio_bytes = await _tts.asynthesize(text)
 
         # --- TTS 문제 해결: 오디오 바이트 유효성 검사 ---
         if not audio_bytes or len(audio_bytes) == 0:
@@ -347,3 +560,15 @@ async def tts_once(text: str = Form(...)):
     except Exception as e:
         logger.error(f"TTS 처리 중 알 수 없는 오류: {e}")
         return JSONResponse({"error": "알 수 없는 TTS 오류가 발생했습니다."}, status_code=500)
+
+
+# ✅ Prometheus 수집 엔드포인트: 요청/단계별 소요 시간 히스토그램과 캐시 통계
+@app.get("/metrics")
+async def metrics():
+    return Response(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# <audio src="/api/tts?text=..."> 로 바로 재생할 수 있는 스트리밍 TTS
+@app.get("/api/tts")
+async def tts_stream(text: str):
+    return await tts_once(text=text, stream=True)
@@ -2,6 +2,9 @@ import re
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from Utility.UserStore import create_user_repository
+from Utility.Metrics import stage
+
 router = APIRouter()
 
 
@@ -19,7 +22,7 @@ class VerifyResponse(BaseModel):
 async def verify_jumin(request: JuminRequest):
     """
     - request.jumin: 순수 13자리 숫자 문자열
-    - fake_user_lookup에서 조회
+    - 사용자 저장소(SQLite, 주민등록번호 인덱스)에서 조회
     - 매칭되면 success=True + name, 아니면 success=False + error
     """
     jumin = request.jumin
@@ -31,8 +34,9 @@ async def verify_jumin(request: JuminRequest):
             error="잘못된 형식입니다. 13자리 숫자(YYMMDDXXXXXXX)만 입력해주세요."
         )
 
-    # 2) 사용자 조회 (더미 함수)
-    user = fake_user_lookup(jumin)
+    # 2) 사용자 조회 (main에서 설정으로 생성한 공유 저장소, 반복 조회는 LRU에서 응답)
+    with stage("user_lookup"):
+        user = create_user_repository().get_by_user_id(jumin)
     if not user:
         return VerifyResponse(
             success=False,
@@ -42,17 +46,5 @@ async def verify_jumin(request: JuminRequest):
     # 3) 통과 시 이름 포함 반환
     return VerifyResponse(
         success=True,
-        name=user["name"]
+        name=user.name
     )
-
-
-def fake_user_lookup(jumin: str) -> dict | None:
-    """
-    데모용 더미 조회 함수. 실제 DB 로직으로 교체하세요.
-    """
-    fake_db = {
-        "9011111111111": {"name": "홍길동"},
-        "8505051222222": {"name": "김상철"},
-        "9701012345678": {"name": "이영희"},
-    }
-    return fake_db.get(jumin)
@@ -0,0 +1,61 @@
+# Backend/tests/test_fuzzy_correction.py
+"""
+근접 키워드 교정 회귀 테스트. (backend 폴더에서 실행: python -m pytest tests)
+실제 keywords.yaml 로 만든 색인을 씁니다.
+"""
+import asyncio
+
+from Utility.Intent.def_interface import IIntentTier
+from Utility.Intent.factory import DEFAULT_KEYWORDS_PATH
+from Utility.Intent.imp_fuzzy_tier import FuzzyKeywordIntentTier
+from Utility.Intent.imp_keyword_automaton import KeywordTable
+from Utility.Intent.imp_keyword_tier import KeywordIntentTier
+from Utility.Intent.imp_pipeline import IntentPipeline
+
+
+def _tier() -> FuzzyKeywordIntentTier:
+    return FuzzyKeywordIntentTier(KeywordTable(DEFAULT_KEYWORDS_PATH, 0), {})
+
+
+class _HintRecorder(IIntentTier):
+    """다음 단계(임베딩/LLM) 대신 받은 힌트만 기록하는 단계"""
+    name = "recorder"
+
+    def __init__(self) -> None:
+        self.hint = None
+
+    async def classify(self, text, hint=None):
+        self.hint = hint
+        return None
+
+
+def test_short_keyword_allows_one_edit_only():
+    # "오늘날짜"는 "오늘날씨"와 자모 2개 차이 → 4글자 키워드는 거리 1까지만 허용
+    tier = _tier()
+    assert tier.correct("오늘 날짜 알려줘") == "오늘 날짜 알려줘"
+    assert tier.match("오늘 날짜 알려줘") is None
+
+
+def test_correction_keeps_extra_syllables():
+    # "등본 발급해"를 "등본 발급"으로 바꾸며 "해"를 떨어뜨리지 않음
+    assert _tier().correct("등본 발급해 주세요") == "등본 발급해 주세요"
+
+
+def test_correction_still_fixes_misheard_syllables():
+    tier = _tier()
+    assert tier.correct("가족관개증명서 떼주세요") == "가족관계증명서 떼주세요"
+    assert tier.correct("주민등록등뽄을 주세요") == "주민등록등본을 주세요"
+
+
+def test_fuzzy_match_alone_does_not_clear_threshold():
+    tier = _tier()
+    result = tier.match("가족관개증명서 떼주세요")
+    assert result.purpose == "가족관계증명서 발급 요청"
+    assert result.confidence < 0.7
+
+    recorder = _HintRecorder()
+    pipeline = IntentPipeline([KeywordIntentTier(tier.table), tier, recorder], {"min_confidence": 0.7})
+    decision = asyncio.run(pipeline.classify("가족관개증명서 떼주세요"))
+    # 근접 단계에서 끝나지 않고 다음 단계까지 내려가, 근접 결과를 힌트로 넘김
+    assert recorder.hint is not None and recorder.hint.purpose == "가족관계증명서 발급 요청"
+    assert decision.result.purpose == "가족관계증명서 발급 요청"
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+import os
+import json
+import httpx
+from typing import Optional, Dict, Any
+
+# ✅ OpenAI SDK (>=1.x) - 비동기 클라이언트 (이벤트 루프를 막지 않음)
+from openai import AsyncOpenAI
+from openai import APIConnectionError, APIStatusError, AuthenticationError, RateLimitError
+
+from Utility.Cache import ISharedCache, SingleFlight, create_shared_cache
+from Utility.Metrics import stage
+from Utility.OpenAIGateway import create_openai_gateway
+
+# ---- Config ----
+# OPENWEATHER_URL: 부하 테스트 때 대역 서버로 바꿀 수 있음
+OWM_URL = os.getenv("OPENWEATHER_URL", "https://api.openweathermap.org/data/2.5/weather")
+OWM_TIMEOUT = 10  # seconds
+OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4.1-mini")
+# 같은 도시의 관측값/요약을 재사용하는 시간 (초). OpenWeatherMap 관측값은 대략 10분 주기로 갱신됨
+OBSERVATION_TTL = int(os.getenv("WEATHER_OBSERVATION_TTL", "600"))
+SUMMARY_TTL = int(os.getenv("WEATHER_SUMMARY_TTL", "1800"))
+
+# ---- Lazy OpenAI Client ----
+_openai_client: Optional[AsyncOpenAI] = None
+def get_openai_client() -> Optional[AsyncOpenAI]:
+    global _openai_client
+    if _openai_client is not None:
+        return _openai_client
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        return None
+    # 공유 OpenAI 관문 사용: 요약(responses)은 배경 우선순위라 STT/TTS보다 뒤에 나감
+    _openai_client = create_openai_gateway().async_client(api_key)
+    return _openai_client
+
+def _extract_openai_text(resp) -> str:
+    """
+    OpenAI responses.create 응답에서 텍스트 안전 추출
+    - 일부 버전은 resp.output_text가 속성, 일부는 메서드일 수 있음 → 모두 커버
+    - 실패 시 output/content 구조로 폴백
+    """
+    if hasattr(resp, "output_text"):
+        ot = getattr(resp, "output_text")
+        try:
+            return (ot() if callable(ot) else ot) or ""
+        except Exception:
+            pass
+    try:
+        parts = []
+        for item in getattr(resp, "output", []) or []:
+            for c in getattr(item, "content", []) or []:
+                t = getattr(c, "text", None)
+                if t:
+                    parts.append(t)
+        if parts:
+            return "\n".join(parts)
+    except Exception:
+        pass
+    try:
+        return resp.choices[0].message.content or ""
+    except Exception:
+        return ""
+
+async def summarize_weather_2lines(city: str, weather_json: Dict[str, Any]) -> Optional[str]:
+    """
+    OpenAI로 한국어 '정확히 2줄' 요약 생성 (실패/키없음 시 None)
+    """
+    client = get_openai_client()
+    if not client:
+        return None
+
+    prompt = f"""
+다음 OpenWeather 날씨 JSON을 참고해 한국어로 '정확히 2줄' 요약을 작성해줘.
+1줄: 현재/체감, 강수/바람 등 핵심 상황 (60자 내외)
+2줄: 외출 준비물/주의사항 (60자 내외)
+불필요한 서두/결론/이모지/문장번호/따옴표 없이, 두 줄만 출력.
+
+사람에게 말해주듯이 존댓말 써줘야함
+
+도시: {city}
+JSON:
+{json.dumps(weather_json, ensure_ascii=False)}
+""".strip()
+
+    try:
+        resp = await client.responses.create(model=OPENAI_MODEL, input=prompt)
+        text = _extract_openai_text(resp).strip()
+
+        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+        if len(lines) >= 2:
+            return "\n".join(lines[:2])
+        if len(lines) == 1:
+            return lines[0] + "\n우산/겉옷 등 기본 준비물 점검하세요."
+        return None
+    except (APIConnectionError, APIStatusError, AuthenticationError, RateLimitError) as e:
+        print(f"⚠️ OpenAI 요약 실패: {type(e).__name__}: {e}")
+        return None
+    except Exception as e:
+        print(f"⚠️ OpenAI 요약 처리 예외: {e}")
+        return None
+
+
+class WeatherService:
+    """
+    날씨 조회 서비스 계층.
+    - 공유 httpx.AsyncClient (연결 풀 재사용, 요청마다 새 연결을 만들지 않음)
+    - 도시별 TTL 캐시: 관측값(OBSERVATION_TTL)과 AI 요약(SUMMARY_TTL, 같은 관측값 기준)
+      (공유 상태 저장소의 이름 공간이라 state.backend가 sqlite면 워커들이 함께 씀)
+    - singleflight: 같은 도시를 동시에 요청하면 OpenWeatherMap 조회와 LLM 요약은 각각 한 번만 실행
+    """
+
+    def __init__(self, observation_ttl: int = OBSERVATION_TTL, summary_ttl: int = SUMMARY_TTL) -> None:
+        self.observation_ttl = observation_ttl
+        self.summary_ttl = summary_ttl
+        self._observations: Optional[ISharedCache] = None
+        self._summaries: Optional[ISharedCache] = None
+        self._flight = SingleFlight()
+        self._http: Optional[httpx.AsyncClient] = None
+
+    # 라우터는 main.py가 설정을 읽기 전에 import되므로, 저장소는 처음 쓸 때 엽니다.
+    @property
+    def observations(self) -> ISharedCache:
+        if self._observations is None:
+            self._observations = create_shared_cache("weather.observation", self.observation_ttl, max_items=256)
+        return self._observations
+
+    @property
+    def summaries(self) -> ISharedCache:
+        if self._summaries is None:
+            self._summaries = create_shared_cache("weather.summary", self.summary_ttl, max_items=256)
+        return self._summaries
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                timeout=OWM_TIMEOUT,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+            )
+        return self._http
+
+    @staticmethod
+    def _city_key(city: str) -> str:
+        return city.strip().lower()
+
+    async def fetch_observation(self, city: str, api_key: str) -> Dict[str, Any]:
+        """OpenWeatherMap 현재 날씨를 조회합니다. (캐시 → 진행 중인 요청 공유 → 실제 조회)"""
+        key = self._city_key(city)
+        cached = await self.observations.aget(key)
+        if cached is not None:
+            return cached
+
+        async def load() -> Dict[str, Any]:
+            # OpenWeatherMap API (units=metric: 섭씨, lang=kr: 한국어)
+            response = await self._client().get(
+                OWM_URL, params={"q": city, "appid": api_key, "units": "metric", "lang": "kr"}
+            )
+            response.raise_for_status()  # 200 OK가 아니면 에러 발생 (오류 응답은 캐시하지 않음)
+            data = response.json()
+            await self.observations.aput(key, data)
+            print(f"✅ 날씨 정보 조회 성공: {city}")
+            return data
+
+        return await self._flight.do(("observation", key), load)
+
+    async def summarize(self, city: str, observation: Dict[str, Any]) -> Optional[str]:
+        """관측값에 대한 2줄 요약을 반환합니다. 같은 관측 시각(dt)이면 이전 요약을 재사용합니다."""
+        key = (self._city_key(city), observation.get("dt"))
+        cached = await self.summaries.aget(key)
+        if cached is not None:
+            return cached
+
+        async def load() -> Optional[str]:
+            summary = await summarize_weather_2lines(city, observation)
+            if summary:
+                await self.summaries.aput(key, summary)
+            return summary
+
+        return await self._flight.do(("summary",) + key, load)
+
+    async def get_weather(self, city: str, api_key: str) -> Dict[str, Any]:
+        """관측값에 AI 요약을 붙여 반환합니다. 캐시된 원본은 수정하지 않도록 복사본에 합칩니다."""
+        with stage("weather.observation"):
+            observation = await self.fetch_observation(city, api_key)
+        weather_data = dict(observation)
+        with stage("weather.summary"):
+            ai_summary = await self.summarize(city, observation)
+        if ai_summary:
+            meta = dict(weather_data.get("_meta") or {})
+            meta["ai_summary_ko"] = ai_summary
+            weather_data["_meta"] = meta
+        return weather_data
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 카운터와 동시 요청 합치기 횟수를 반환합니다."""
+        return {
+            "observation": self.observations.stats.as_dict(),
+            "summary": self.summaries.stats.as_dict(),
+            "coalesced": self._flight.coalesced,
+        }
+
+    async def aclose(self) -> None:
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
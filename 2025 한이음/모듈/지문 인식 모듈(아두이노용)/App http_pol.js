@@ -35,6 +35,7 @@ function App() {
     const ws = useRef(null); // 1. 웹소켓 인스턴스 저장용
     const verificationTaskId = useRef(null); // 2. HTTP 방식에서 사용할 작업 ID
     const pollingInterval = useRef(null); // 2. HTTP 폴링 인터벌 저장용
+    const eventSource = useRef(null); // 2. 인증 상태 SSE 연결 저장용 (실패하면 폴링으로 전환)
     // ====================================================================
 
 
@@ -208,6 +209,7 @@ function App() {
             clearInterval(pollingInterval.current);
         pollingInterval.current = null;
         }
+        closeVerificationEvents();
         if (verificationTaskId.current) {
             verificationTaskId.current = null;
         }
@@ -574,8 +576,8 @@ function App() {
             if (response.ok) {
                 verificationTaskId.current = data.task_id;
                 setAuthMessage('지문 인증을 시작합니다. 센서에 손가락을 대주세요.');
-                // 2초마다 상태를 확인하는 폴링 시작
-                pollingInterval.current = setInterval(pollVerificationStatus, 2000);
+                // 상태가 바뀔 때마다 서버가 보내주는 SSE 구독 (안 되면 2초마다 폴링)
+                subscribeVerificationEvents();
             } else {
                 throw new Error(data.detail || '인증 시작에 실패했습니다.');
             }
@@ -586,24 +588,59 @@ function App() {
         }
     };
     
+    // 작업 상태 하나를 화면에 반영 (SSE/폴링 공통). 끝난 상태면 true
+    const applyVerificationStatus = (data) => {
+        setAuthMessage(data.message);
+        if (data.attempts_left !== undefined) setAuthAttempts(data.attempts_left);
+
+        if (data.status === 'pos_auth' || data.status === 'neg_auth' || data.status === 'canceled' || data.status === 'expired') {
+            verificationTaskId.current = null;
+            if (data.status === 'pos_auth') {
+                setUserName(data.userName);
+                setFlowState('DOCUMENT_VIEW');
+            } else {
+                setTimeout(handleBackToHome, 2000);
+            }
+            return true;
+        }
+        return false;
+    };
+
+    const closeVerificationEvents = () => {
+        if (eventSource.current) {
+            eventSource.current.close();
+            eventSource.current = null;
+        }
+    };
+
+    const subscribeVerificationEvents = () => {
+        if (typeof EventSource === 'undefined') {
+            pollingInterval.current = setInterval(pollVerificationStatus, 2000);
+            return;
+        }
+        const source = new EventSource(`http://localhost:8000/verification-events/${verificationTaskId.current}`);
+        eventSource.current = source;
+        source.onmessage = (event) => {
+            if (applyVerificationStatus(JSON.parse(event.data))) closeVerificationEvents();
+        };
+        source.onerror = () => {
+            // 연결이 끊기거나 서버가 SSE를 지원하지 않으면, 아직 진행 중인 작업은 폴링으로 이어서 확인
+            closeVerificationEvents();
+            if (verificationTaskId.current && !pollingInterval.current) {
+                pollingInterval.current = setInterval(pollVerificationStatus, 2000);
+            }
+        };
+    };
+    
     const pollVerificationStatus = async () => {
         if (!verificationTaskId.current) return;
         try {
             const response = await fetch(`http://localhost:8000/verification-status/${verificationTaskId.current}`);
             const data = await response.json();
             
-            setAuthMessage(data.message);
-            if (data.attempts_left !== undefined) setAuthAttempts(data.attempts_left);
-
-            if (data.status === 'pos_auth' || data.status === 'neg_auth' || data.status === 'canceled') {
+            if (applyVerificationStatus(data)) {
                 clearInterval(pollingInterval.current); // 폴링 중단
-                verificationTaskId.current = null;
-                if (data.status === 'pos_auth') {
-                    setUserName(data.userName);
-                    setFlowState('DOCUMENT_VIEW');
-                } else {
-                    setTimeout(handleBackToHome, 2000);
-                }
+                pollingInterval.current = null;
             }
         } catch (error) {
             console.error('Polling error:', error);
@@ -626,6 +663,7 @@ function App() {
         if (verificationTaskId.current) {
             fetch(`http://localhost:8000/stop-verification/${verificationTaskId.current}`, { method: 'POST' });
             clearInterval(pollingInterval.current);
+            closeVerificationEvents();
         }
 
         setTimeout(handleBackToHome, 1500);
@@ -85,6 +85,7 @@ void verifyFingerprint() {
   Serial.println("PLACE_FINGER");
   
   while (finger.getImage() != FINGERPRINT_OK);
+  Serial.println("IMAGE_TAKEN");
 
   if (finger.image2Tz() != FINGERPRINT_OK) {
     Serial.println("VERIFY_FAIL");
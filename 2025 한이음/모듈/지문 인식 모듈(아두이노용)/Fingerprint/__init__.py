@@ -8,5 +8,17 @@ from .fp_factory import (
     get_sensor_connection,
     enroll_fingerprint,
     verify_fingerprint,
-    reset_database
-)
\ No newline at end of file
+    reset_database,
+    get_sensor_broker,
+    get_broker_stats,
+    averify_fingerprint
+)
+
+# 시리얼 포트를 asyncio 이벤트 루프에 연결하는 수신기 (데이터가 도착할 때만 깨어남)
+from .imp_fp_serial import AsyncSerialLink, SensorEvent, parse_line
+# 시리얼 포트를 혼자 소유하고 명령을 한 번에 하나씩 보내는 중개자
+from .imp_fp_broker import SensorBroker, SensorBusyError
+# HTTP 폴링 인증 작업 저장소 (상태별 보관 시간, 끝난 작업 LRU, 만료 ID 구분)
+from .imp_fp_tasks import VerificationTaskStore, TaskStoreFull, TERMINAL_STATES
+# 인증 작업 상태 변화를 Server-Sent Events로 내보내는 스트림
+from .imp_fp_events import task_event_stream, format_sse
\ No newline at end of file
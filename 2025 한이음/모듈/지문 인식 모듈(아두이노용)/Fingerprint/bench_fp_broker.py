@@ -0,0 +1,152 @@
+# bench_fp_broker.py
+"""
+동시 지문 확인 요청 처리량 비교: 포트 공유(기존) vs SensorBroker. (Fingerprint 폴더에서 실행, 리눅스/맥)
+
+    python bench_fp_broker.py [--clients 4] [--requests 10] [--finger 0.05 0.1] [--timeout 3]
+
+가짜 아두이노(sim_fp_arduino)가 VERIFY마다 VERIFY_START,<순번>과 결과 ID <순번>을 보내므로,
+호출자가 받은 시작과 결과가 같은 명령의 것인지(다른 사람의 인증 결과를 받지 않았는지) 확인할 수 있습니다.
+- shared : 기존 main http_pol.py처럼 작업마다 스레드에서 같은 포트에 쓰고 readline으로 결과를 기다림
+- broker : 작업마다 SensorBroker.request("VERIFY") (포트는 워커 하나만 사용)
+ok = 자기 명령의 결과, misrouted = 다른 명령의 결과(시작 순번 ≠ 결과 ID), corrupt = 깨진 줄/중복 결과,
+timeout = 마감 안에 결과 없음
+"""
+import re
+import sys
+import time
+import asyncio
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import serial
+
+from imp_fp_serial import AsyncSerialLink
+from imp_fp_broker import SensorBroker, TERMINAL_EVENTS
+from sim_fp_arduino import ArduinoSimulator
+
+BAUD_RATE = 9600
+_RESULT = re.compile(r"^VERIFY_SUCCESS,(\d+),\d+$")
+
+
+def _start_sequence(line: str) -> Optional[str]:
+    kind, _, sequence = line.partition(',')
+    return sequence if kind == "VERIFY_START" else None
+
+
+def _shared_port_verify(ser, timeout: float) -> Tuple[Optional[str], Optional[str]]:
+    """기존 verify의 수신 루프 (다른 스레드와 같은 포트를 함께 읽음). (시작 순번, 결과 줄)을 반환"""
+    ser.write(b"VERIFY\n")
+    started = None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        line = ser.readline().decode(errors="ignore").strip()
+        started = started or _start_sequence(line)
+        if line.split(',')[0] in TERMINAL_EVENTS["VERIFY"] or "FAIL" in line:
+            return started, line
+    return started, None
+
+
+def _tally(results: List[Tuple[Optional[str], Optional[str], float]]) -> Dict[str, float]:
+    seen, tally = set(), {"ok": 0, "misrouted": 0, "corrupt": 0, "timeout": 0}
+    for started, line, _ in results:
+        if line is None:
+            tally["timeout"] += 1
+            continue
+        match = _RESULT.match(line)
+        if not match or match.group(1) in seen:
+            tally["corrupt"] += 1
+            continue
+        seen.add(match.group(1))
+        tally["ok" if match.group(1) == started else "misrouted"] += 1
+    return tally
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] if ordered else 0.0
+
+
+def _open(port: str):
+    ser = serial.Serial(port, BAUD_RATE, timeout=0.2)
+    ser.readline()  # FOUND_SENSOR
+    return ser
+
+
+def _run_shared(port: str, clients: int, requests: int, timeout: float):
+    ser = _open(port)
+
+    def client() -> List[Tuple[Optional[str], Optional[str], float]]:
+        out = []
+        for _ in range(requests):
+            started = time.monotonic()
+            out.append((*_shared_port_verify(ser, timeout), time.monotonic() - started))
+        return out
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        results = [r for rs in pool.map(lambda _: client(), range(clients)) for r in rs]
+    elapsed = time.monotonic() - started
+    ser.close()
+    return results, elapsed, {}
+
+
+async def _run_broker(port: str, clients: int, requests: int, timeout: float):
+    ser = _open(port)
+    link = await AsyncSerialLink(ser).start()
+    broker = await SensorBroker(link, max_queue=clients).start()
+
+    async def client() -> List[Tuple[Optional[str], Optional[str], float]]:
+        out = []
+        for _ in range(requests):
+            started, sequence = time.monotonic(), []
+            on_event = lambda event: sequence.append(_start_sequence(event.line))
+            try:
+                line = (await broker.request("VERIFY", timeout * clients, on_event=on_event)).line
+            except asyncio.TimeoutError:
+                line = None
+            out.append((next(filter(None, sequence), None), line, time.monotonic() - started))
+        return out
+
+    started = time.monotonic()
+    results = [r for rs in await asyncio.gather(*(client() for _ in range(clients))) for r in rs]
+    elapsed = time.monotonic() - started
+    stats = broker.stats()
+    broker.close()
+    link.close()
+    ser.close()
+    return results, elapsed, stats
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=4, help="동시에 인증을 요청하는 작업 수")
+    parser.add_argument("--requests", type=int, default=10, help="작업마다 보내는 VERIFY 수")
+    parser.add_argument("--finger", type=float, nargs=2, default=[0.05, 0.1], help="센서가 VERIFY 하나를 처리하는 시간 범위 (초)")
+    parser.add_argument("--timeout", type=float, default=3.0, help="요청당 마감 (broker는 대기열 몫으로 × clients)")
+    args = parser.parse_args(argv)
+
+    print(f"{'방식':<8}{'ok':>6}{'misrouted':>11}{'corrupt':>9}{'timeout':>9}{'ok/s':>8}{'p50 ms':>9}{'p95 ms':>9}"
+          f"  ({args.clients} clients × {args.requests})")
+    for name in ("shared", "broker"):
+        sim = ArduinoSimulator(finger_delay=tuple(args.finger), match_id=0)
+        sim.start()
+        try:
+            if name == "shared":
+                results, elapsed, stats = _run_shared(sim.port, args.clients, args.requests, args.timeout)
+            else:
+                results, elapsed, stats = asyncio.run(_run_broker(sim.port, args.clients, args.requests, args.timeout))
+        finally:
+            sim.stop()
+        tally = _tally(results)
+        latencies = [seconds for _, line, seconds in results if line is not None]
+        print(f"{name:<8}{tally['ok']:6d}{tally['misrouted']:11d}{tally['corrupt']:9d}{tally['timeout']:9d}{tally['ok'] / elapsed:8.1f}"
+              f"{_percentile(latencies, 0.5) * 1000:9.0f}{_percentile(latencies, 0.95) * 1000:9.0f}")
+        if stats:
+            print(f"         대기열 대기 평균 {stats['wait_seconds_avg'] * 1000:.0f}ms, 최대 {stats['wait_seconds_max'] * 1000:.0f}ms, "
+                  f"완료 {stats['completed']:.0f}, 마감 초과 {stats['timeouts']:.0f}, 버린 늦은 응답 {stats['stale']:.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
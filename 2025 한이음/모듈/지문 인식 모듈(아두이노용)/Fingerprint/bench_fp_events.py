@@ -0,0 +1,169 @@
+# bench_fp_events.py
+"""
+인증 상태 전달 방식별 요청 수와 알림 지연 비교: 폴링 vs SSE. (Fingerprint 폴더에서 실행, fastapi/uvicorn/httpx 필요)
+
+    python bench_fp_events.py [--clients 8] [--verifications 5] [--poll-s 2 0.5] [--queue 0.1 0.5] [--finger 2 10]
+
+main http_pol.py와 같은 /verification-status, /verification-events 엔드포인트를 VerificationTaskStore 위에 띄우고
+(uvicorn, 같은 이벤트 루프), 가짜 워커가 _run_verification_task처럼 상태를 바꿉니다.
+    pending → QUEUED → (센서 대기열) AWAITING_FINGER → (손가락) SCANNING → (대조) pos_auth
+- poll N s : 기존 App http_pol.js처럼 N초마다 /verification-status
+- sse      : /verification-events 연결 하나로 상태를 받음
+요청 = 인증 하나당 상태 확인 HTTP 요청 수, 지연 = 워커가 결과를 저장한 시각 → 클라이언트가 결과를 받은 시각,
+상태 = 클라이언트가 본 상태 수 / 워커가 거친 상태 수 (폴링은 짧은 상태를 건너뜀)
+"""
+import sys
+import json
+import time
+import random
+import socket
+import asyncio
+import argparse
+from typing import Dict, List, Tuple
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
+
+from imp_fp_tasks import VerificationTaskStore, TERMINAL_STATES
+from imp_fp_events import task_event_stream
+
+_STATES = ("pending", "QUEUED", "AWAITING_FINGER", "SCANNING", "pos_auth")
+# 센서가 지문 이미지를 대조하는 시간 (IMAGE_TAKEN → 결과, 초)
+_MATCH_SECONDS = 0.3
+
+
+def _build_app(store: VerificationTaskStore) -> FastAPI:
+    """main http_pol.py의 상태 확인 엔드포인트 두 개만 옮긴 앱"""
+    app = FastAPI()
+    app.state.requests = 0
+
+    @app.get("/verification-status/{task_id}")
+    async def get_verification_status(task_id: str):
+        app.state.requests += 1
+        task = store.get(task_id)
+        if task is None:
+            raise HTTPException(status_code=404)
+        return task
+
+    @app.get("/verification-events/{task_id}")
+    async def verification_events(task_id: str):
+        app.state.requests += 1
+        if store.get(task_id) is None:
+            raise HTTPException(status_code=404)
+        return StreamingResponse(task_event_stream(store, task_id), media_type="text/event-stream")
+
+    return app
+
+
+async def _fake_worker(store: VerificationTaskStore, task_id: str, rng: random.Random,
+                       queue_delay: Tuple[float, float], finger_delay: Tuple[float, float],
+                       changed_at: Dict[str, float]) -> None:
+    await asyncio.sleep(0.01)
+    store.update(task_id, status="QUEUED")
+    await asyncio.sleep(rng.uniform(*queue_delay))
+    store.update(task_id, status="AWAITING_FINGER")
+    await asyncio.sleep(rng.uniform(*finger_delay))
+    store.update(task_id, status="SCANNING")
+    await asyncio.sleep(_MATCH_SECONDS)
+    store.update(task_id, status="pos_auth", userName="홍길동")
+    changed_at[task_id] = time.monotonic()
+
+
+async def _poll_client(client: httpx.AsyncClient, task_id: str, interval: float) -> Tuple[int, float, set]:
+    seen, requests = set(), 0
+    while True:
+        await asyncio.sleep(interval)  # setInterval처럼 첫 확인도 한 간격 뒤
+        response = await client.get(f"/verification-status/{task_id}")
+        requests += 1
+        data = response.json()
+        seen.add(data["status"])
+        if data["status"] in TERMINAL_STATES:
+            return requests, time.monotonic(), seen
+
+
+async def _sse_client(client: httpx.AsyncClient, task_id: str) -> Tuple[int, float, set]:
+    seen = set()
+    async with client.stream("GET", f"/verification-events/{task_id}") as response:
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = json.loads(line[6:])
+            seen.add(data["status"])
+            if data["status"] in TERMINAL_STATES:
+                return 1, time.monotonic(), seen
+    return 1, time.monotonic(), seen
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def _run(args) -> List[Tuple[str, float, List[float], float, int]]:
+    store = VerificationTaskStore()
+    app = _build_app(store)
+    port = _free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="off"))
+    serving = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    modes = [(f"poll {s:g}s", s) for s in args.poll_s] + [("sse", None)]
+    rows = []
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+        for name, interval in modes:
+            rng, changed_at = random.Random(0), {}
+            latencies, seen_states, requests_before = [], 0, app.state.requests
+
+            async def one_client() -> None:
+                nonlocal seen_states
+                for _ in range(args.verifications):
+                    task_id, _ = store.create(message="인증 작업을 시작합니다.", attempts_left=5, stop_flag=False)
+                    worker = asyncio.create_task(_fake_worker(store, task_id, rng, tuple(args.queue),
+                                                              tuple(args.finger), changed_at))
+                    if interval is None:
+                        _, received_at, seen = await _sse_client(client, task_id)
+                    else:
+                        _, received_at, seen = await _poll_client(client, task_id, interval)
+                    await worker
+                    latencies.append(received_at - changed_at[task_id])
+                    seen_states += len(seen)
+
+            await asyncio.gather(*(one_client() for _ in range(args.clients)))
+            total = args.clients * args.verifications
+            rows.append((name, (app.state.requests - requests_before) / total, latencies,
+                         seen_states / (total * len(_STATES)), store.stats()["listeners"]))
+
+    server.should_exit = True
+    await serving
+    return rows
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=8, help="동시에 인증하는 키오스크 수")
+    parser.add_argument("--verifications", type=int, default=5, help="키오스크마다 인증 횟수")
+    parser.add_argument("--poll-s", type=float, nargs="+", default=[2.0, 0.5], help="폴링 간격 (초, App http_pol.js는 2초)")
+    parser.add_argument("--queue", type=float, nargs=2, default=[0.1, 0.5], help="QUEUED → AWAITING_FINGER 시간 범위 (초, 센서 대기열)")
+    parser.add_argument("--finger", type=float, nargs=2, default=[2.0, 10.0], help="AWAITING_FINGER → SCANNING 시간 범위 (초, 키오스크 앞에서 손가락을 올리기까지)")
+    args = parser.parse_args(argv)
+
+    print(f"{'방식':<10}{'요청/인증':>10}{'지연 p50':>11}{'p95':>9}{'max':>9}{'상태':>8}"
+          f"  (ms, {args.clients} clients × {args.verifications})")
+    for name, requests, latencies, seen, listeners in asyncio.run(_run(args)):
+        print(f"{name:<10}{requests:10.1f}{_percentile(latencies, 0.5) * 1000:11.1f}"
+              f"{_percentile(latencies, 0.95) * 1000:9.1f}{max(latencies) * 1000:9.1f}{seen:8.0%}")
+    print(f"남은 SSE 구독: {listeners}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
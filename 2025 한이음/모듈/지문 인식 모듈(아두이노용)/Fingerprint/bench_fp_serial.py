@@ -0,0 +1,124 @@
+# bench_fp_serial.py
+"""
+지문 확인 시리얼 처리 방식별 CPU 사용량과 응답 지연 비교. (Fingerprint 폴더에서 실행, 리눅스/맥)
+
+    python bench_fp_serial.py [--trials 10] [--poll-ms 0 10 50] [--finger 0.5 1.5]
+
+가짜 아두이노(sim_fp_arduino, pty)를 별도 프로세스로 띄우고, 같은 VERIFY 요청을 방식마다 반복합니다.
+- poll N ms : 기존 방식. in_waiting을 돌며 확인 (0ms = 기존 verify, 슬립 없이 계속 돎)
+- blocking  : verify (readline 블로킹, 응답이 올 때만 깨어남)
+- asyncio   : averify + SensorBroker/AsyncSerialLink (이벤트 루프가 포트 fd를 감시)
+CPU = 측정 프로세스의 CPU 시간 / 경과 시간, 지연 = 결과 줄을 쓴 시각 → verify가 결과를 돌려준 시각.
+"""
+import io
+import sys
+import time
+import asyncio
+import argparse
+import resource
+import contextlib
+from typing import Callable, List, Tuple
+
+import serial
+
+from imp_fp_serial import AsyncSerialLink
+from imp_fp_broker import SensorBroker
+from imp_fp_verify import verify, averify, _handle_response
+from sim_fp_arduino import ArduinoSimulator
+
+BAUD_RATE = 9600
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _legacy_verify(ser, poll_s: float):
+    """변경 전 verify의 수신 루프 (in_waiting 폴링, poll_s만큼 슬립)"""
+    ser.write(b"VERIFY\n")
+    while True:
+        if ser.in_waiting > 0:
+            response = ser.readline().decode().strip()
+            result = _handle_response(response)
+            if result is not None:
+                return result
+        elif poll_s:
+            time.sleep(poll_s)
+
+
+def _open(port: str):
+    ser = serial.Serial(port, BAUD_RATE, timeout=1)
+    ser.readline()  # FOUND_SENSOR
+    return ser
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _run_sync(sim: ArduinoSimulator, trials: int, call: Callable) -> Tuple[float, List[float]]:
+    ser = _open(sim.port)
+    cpu, wall, latencies = 0.0, 0.0, []
+    try:
+        for _ in range(trials):
+            started, cpu_started = time.monotonic(), _cpu_seconds()
+            with contextlib.redirect_stdout(io.StringIO()):
+                call(ser)
+            done = time.monotonic()
+            cpu += _cpu_seconds() - cpu_started
+            wall += done - started
+            latencies.append(done - sim.result_time()[1])
+    finally:
+        ser.close()
+    return cpu / wall, latencies
+
+
+async def _run_async(sim: ArduinoSimulator, trials: int) -> Tuple[float, List[float]]:
+    ser = _open(sim.port)
+    link = await AsyncSerialLink(ser).start()
+    broker = await SensorBroker(link).start()
+    cpu, wall, latencies = 0.0, 0.0, []
+    try:
+        for _ in range(trials):
+            started, cpu_started = time.monotonic(), _cpu_seconds()
+            with contextlib.redirect_stdout(io.StringIO()):
+                await averify(broker, timeout=10)
+            done = time.monotonic()
+            cpu += _cpu_seconds() - cpu_started
+            wall += done - started
+            latencies.append(done - sim.result_time()[1])
+    finally:
+        broker.close()
+        link.close()
+        ser.close()
+    return cpu / wall, latencies
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--trials", type=int, default=10, help="방식별 VERIFY 반복 횟수")
+    parser.add_argument("--poll-ms", type=float, nargs="+", default=[0, 10, 50], help="기존 폴링 방식의 슬립 간격")
+    parser.add_argument("--finger", type=float, nargs=2, default=[0.5, 1.5], help="손가락을 올리기까지 걸리는 시간 범위 (초)")
+    args = parser.parse_args(argv)
+
+    modes = [(f"poll {ms:g}ms", lambda ser, s=ms / 1000: _legacy_verify(ser, s)) for ms in args.poll_ms]
+    modes.append(("blocking", verify))
+
+    sim = ArduinoSimulator(finger_delay=tuple(args.finger))
+    sim.start()
+    try:
+        print(f"{'방식':<12}{'CPU':>8}{'지연 p50':>11}{'p95':>9}{'max':>9}  (ms, {args.trials}회)")
+        rows = [(name, *_run_sync(sim, args.trials, call)) for name, call in modes]
+        rows.append(("asyncio", *asyncio.run(_run_async(sim, args.trials))))
+        for name, cpu, latencies in rows:
+            print(f"{name:<12}{cpu:8.1%}{_percentile(latencies, 0.5) * 1000:11.2f}"
+                  f"{_percentile(latencies, 0.95) * 1000:9.2f}{max(latencies) * 1000:9.2f}")
+    finally:
+        sim.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -11,6 +11,7 @@ def handle_error(error_code):
         "FINGER_NOT_FOUND": "등록된 지문이 아닙니다.",
         "RESET_FAIL": "지문 데이터 초기화에 실패했습니다.",
         "NOT_FOUND": "등록된 지문이 아닙니다.",
-        "TIMEOUT": "센서 응답이 지연되었습니다. 다시 시도해주세요."
+        "TIMEOUT": "센서 응답이 지연되었습니다. 다시 시도해주세요.",
+        "SENSOR_BUSY": "다른 인증이 진행 중입니다. 잠시 후 다시 시도해주세요."
     }
     return error_messages.get(error_code, "알 수 없는 오류가 발생했습니다.")
\ No newline at end of file
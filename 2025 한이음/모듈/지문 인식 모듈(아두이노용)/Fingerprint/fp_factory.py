@@ -4,14 +4,25 @@ import os
 import yaml
 import serial
 import time
+import asyncio
 
 # Fingerprint 폴더 내의 다른 모듈들을 상대 경로로 가져옵니다.
 from .imp_fp_enroll import enroll
-from .imp_fp_verify import verify
+from .imp_fp_verify import verify, averify
 from .imp_fp_reset import reset
+from .imp_fp_serial import AsyncSerialLink
+from .imp_fp_broker import SensorBroker
 
 # 전역 변수로 시리얼 연결 객체를 관리합니다.
 ser = None
+# asyncio 수신기 (ser를 이벤트 루프에 연결)와 포트를 혼자 쓰는 명령 중개자 (averify_fingerprint에서 처음 쓸 때 생성)
+link = None
+broker = None
+_broker_lock = asyncio.Lock()
+# averify_fingerprint 기본 제한 시간 (초, config.yaml fingerprint.verify_timeout_s, 대기열 대기 포함)
+verify_timeout_s = 30.0
+# 센서 명령 대기열 길이 (config.yaml fingerprint.max_queue, 넘치면 SENSOR_BUSY)
+max_queue = 8
 
 def _load_config():
     """
@@ -39,7 +50,7 @@ def initialize_sensor():
     config.yaml에서 설정을 읽어 지문 센서를 초기화하고 연결합니다.
     성공하면 시리얼 객체를, 실패하면 None을 반환합니다.
     """
-    global ser
+    global ser, verify_timeout_s, max_queue
     
     # 이미 연결되어 있다면 기존 연결을 반환합니다.
     if ser and ser.is_open:
@@ -50,6 +61,8 @@ def initialize_sensor():
         config = _load_config()
         port = config.get('serial_port', 'COM4')
         baud = config.get('baud_rate', 9600)
+        verify_timeout_s = config.get('verify_timeout_s', verify_timeout_s)
+        max_queue = config.get('max_queue', max_queue)
         
         ser = serial.Serial(port, baud, timeout=1)
         print(f"{port}에 연결되었습니다. 잠시 후 아두이노가 준비됩니다...")
@@ -81,7 +94,13 @@ def close_sensor_connection():
     """
     활성화된 시리얼 포트 연결을 닫습니다.
     """
-    global ser
+    global ser, link, broker
+    if broker is not None:
+        broker.close()
+        broker = None
+    if link is not None:
+        link.close()
+        link = None
     if ser and ser.is_open:
         ser.close()
         ser = None
@@ -96,26 +115,76 @@ def get_sensor_connection():
 
 # --- 각 기능을 수행하는 래퍼(wrapper) 함수 ---
 
+def _owned_by_broker(ser_instance):
+    """포트를 중개자가 쓰고 있으면 True (동기 함수가 같은 포트를 직접 읽으면 응답이 섞임)"""
+    if broker is not None and broker.is_open and broker.link.ser is ser_instance:
+        print("오류: 센서 포트를 중개자가 사용 중입니다. averify_fingerprint를 사용하세요.")
+        return True
+    return False
+
 def enroll_fingerprint(ser_instance):
     """지문 등록 프로세스를 실행합니다."""
     if not ser_instance or not ser_instance.is_open:
         print("오류: 센서가 연결되지 않았습니다.")
         return
+    if _owned_by_broker(ser_instance):
+        return
     enroll(ser_instance)
 
 def verify_fingerprint(ser_instance):
-    """지문 확인 프로세스를 실행합니다."""
+    """지문 확인 프로세스를 실행합니다. (단독 실행용, 서버에서는 averify_fingerprint 사용)"""
     if not ser_instance or not ser_instance.is_open:
         print("오류: 센서가 연결되지 않았습니다.")
         return {"success": False, "error": "SENSOR_NOT_CONNECTED"}
+    if _owned_by_broker(ser_instance):
+        return {"success": False, "error": "SENSOR_BUSY"}
     
     return verify(ser_instance)
 
+async def get_sensor_broker():
+    """
+    시리얼 포트를 혼자 소유하는 명령 중개자(SensorBroker)를 반환합니다.
+    연결이 없거나 끊겼으면 (블로킹 재연결은 스레드에서) 재연결하고 수신기와 중개자를 새로 만듭니다.
+    동시에 불려도 중개자는 하나만 만들어지도록 잠금을 겁니다.
+    """
+    global link, broker
+    if broker is not None and broker.is_open and ser is broker.link.ser and ser.is_open:
+        return broker
+    async with _broker_lock:
+        ser_instance = await asyncio.to_thread(get_sensor_connection)
+        if not ser_instance or not ser_instance.is_open:
+            return None
+        if broker is None or broker.link.ser is not ser_instance or not broker.is_open:
+            if broker is not None:
+                broker.close()
+                broker.link.close()
+            link = await AsyncSerialLink(ser_instance).start()
+            broker = await SensorBroker(link, max_queue).start()
+        return broker
+
+async def averify_fingerprint(timeout=None, on_event=None):
+    """
+    지문 확인을 중개자를 거쳐 asyncio로 실행합니다. (동시에 요청해도 한 번에 하나씩 센서에 보냄)
+    timeout(초)을 주지 않으면 config.yaml의 fingerprint.verify_timeout_s(기본 30초)를 씁니다.
+    on_event는 중간 응답(PLACE_FINGER 등)마다 SensorEvent를 받아 호출됩니다.
+    """
+    sensor_broker = await get_sensor_broker()
+    if sensor_broker is None:
+        print("오류: 센서가 연결되지 않았습니다.")
+        return {"success": False, "error": "SENSOR_NOT_CONNECTED"}
+    return await averify(sensor_broker, verify_timeout_s if timeout is None else timeout, on_event)
+
+def get_broker_stats():
+    """중개자 대기열 길이/대기 시간 통계를 반환합니다. (중개자가 없으면 빈 dict)"""
+    return broker.stats() if broker is not None else {}
+
 def reset_database(ser_instance):
     """지문 데이터베이스 초기화 프로세스를 실행합니다."""
     if not ser_instance or not ser_instance.is_open:
         print("오류: 센서가 연결되지 않았습니다.")
         return
+    if _owned_by_broker(ser_instance):
+        return
     reset(ser_instance)
 
 def get_sensor_connection():
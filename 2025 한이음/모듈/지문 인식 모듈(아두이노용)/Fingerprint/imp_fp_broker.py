@@ -0,0 +1,174 @@
+# imp_fp_broker.py
+
+import time
+import asyncio
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+from imp_fp_serial import AsyncSerialLink, SensorEvent
+
+# 명령별 마지막 응답 (이 중 하나가 오면 아두이노가 그 명령을 끝낸 것으로 봄, Aduino_code/fingerprint_rec.ino 기준)
+TERMINAL_EVENTS = {
+    "VERIFY": frozenset({"VERIFY_SUCCESS", "VERIFY_FAIL", "FINGER_NOT_FOUND"}),
+    "ENROLL": frozenset({"ENROLL_SUCCESS", "ENROLL_FAIL"}),
+    "RESET": frozenset({"RESET_SUCCESS", "RESET_FAIL"}),
+}
+_ALL_TERMINAL = frozenset().union(*TERMINAL_EVENTS.values())
+
+
+class SensorBusyError(Exception):
+    """대기열이 가득 차 명령을 받을 수 없을 때 발생합니다."""
+
+
+@dataclass
+class SensorCommand:
+    """대기열에 들어간 명령 하나. future에는 마지막 응답(SensorEvent)이 들어갑니다."""
+    command: str
+    deadline: float                       # time.monotonic() 기준, 대기 시간 포함
+    future: asyncio.Future
+    on_event: Optional[Callable[[SensorEvent], None]] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def terminal(self) -> frozenset:
+        return TERMINAL_EVENTS.get(self.command.split(',')[0], _ALL_TERMINAL)
+
+
+class SensorBroker:
+    """
+    시리얼 포트를 혼자 소유하고 명령을 한 번에 하나씩 보내는 중개자.
+    - 호출자는 request()로 명령을 대기열에 넣고 마지막 응답을 기다립니다. 워커 하나만 포트에 쓰고 읽으므로
+      동시에 들어온 인증 요청의 바이트가 섞이지 않고, 각 응답은 그 명령을 보낸 호출자에게만 돌아갑니다.
+    - timeout은 대기열에서 기다린 시간을 포함한 명령별 마감입니다. 마감이 지난 명령은 보내지 않고 버리며,
+      보낸 뒤 마감이 지나면 아두이노가 아직 그 명령을 처리 중이므로 늦게 오는 마지막 응답을 다음 명령 전에 버립니다.
+    - 중간 응답(PLACE_FINGER 등)은 on_event로 바로 넘겨, 화면에 진행 상태를 보여줄 수 있게 합니다.
+    - stats()로 대기열 길이와 대기 시간을 확인할 수 있습니다.
+    """
+
+    def __init__(self, link: AsyncSerialLink, max_queue: int = 8) -> None:
+        self.link = link
+        self.max_queue = max_queue
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._current: Optional[SensorCommand] = None
+        self._owed = 0  # 마감이 지나 버렸지만 아두이노가 아직 보낼 마지막 응답 수
+        self._stats: Dict[str, float] = {
+            "submitted": 0, "completed": 0, "timeouts": 0, "expired": 0, "rejected": 0, "canceled": 0,
+            "errors": 0, "stale": 0, "wait_seconds_total": 0.0, "wait_seconds_max": 0.0,
+        }
+
+    # --- 시작/종료 ---
+    async def start(self) -> "SensorBroker":
+        self._queue = asyncio.Queue(self.max_queue)
+        self._worker = asyncio.create_task(self._run(), name="fp-sensor-broker")
+        return self
+
+    @property
+    def is_open(self) -> bool:
+        return self._worker is not None and not self._worker.done() and self.link.is_open
+
+    def close(self) -> None:
+        """워커를 멈추고 기다리던 명령에는 ConnectionError를 돌려줍니다. (포트와 수신기는 닫지 않음)"""
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        error = ConnectionError("센서 중개자가 닫혔습니다.")
+        if self._current is not None and not self._current.future.done():
+            self._current.future.set_exception(error)
+        self._fail_all(error)
+
+    def stats(self) -> Dict[str, float]:
+        stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize() if self._queue is not None else 0
+        stats["in_flight"] = 1 if self._current is not None else 0
+        started = stats["completed"] + stats["timeouts"] + stats["errors"] + stats["canceled"]
+        stats["wait_seconds_avg"] = stats["wait_seconds_total"] / started if started else 0.0
+        return stats
+
+    # --- 호출자 API ---
+    async def request(self, command: str, timeout: float,
+                      on_event: Optional[Callable[[SensorEvent], None]] = None) -> SensorEvent:
+        """
+        명령을 대기열에 넣고 마지막 응답을 반환합니다.
+        대기열이 가득 차면 SensorBusyError, 마감(timeout초, 대기 시간 포함)이 지나면 asyncio.TimeoutError,
+        포트가 끊기면 ConnectionError를 일으킵니다.
+        """
+        if not self.is_open:
+            raise ConnectionError("센서 중개자가 실행 중이 아닙니다.")
+        future = asyncio.get_running_loop().create_future()
+        item = SensorCommand(command, time.monotonic() + timeout, future, on_event)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            raise SensorBusyError(f"센서 대기열이 가득 찼습니다. ({self.max_queue}개)")
+        self._stats["submitted"] += 1
+        # 마감이 지나거나 호출자가 취소되면 future가 취소되고, 워커는 그 명령을 건너뜁니다.
+        return await asyncio.wait_for(future, timeout)
+
+    # --- 워커 ---
+    async def _run(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item.future.done():
+                self._stats["expired"] += 1
+                continue
+            waited = time.monotonic() - item.enqueued_at
+            self._stats["wait_seconds_total"] += waited
+            self._stats["wait_seconds_max"] = max(self._stats["wait_seconds_max"], waited)
+            self._current = item
+            try:
+                event = await self._execute(item)
+            except asyncio.TimeoutError:
+                self._stats["timeouts"] += 1
+                self._owed += 1
+                if not item.future.done():
+                    item.future.set_exception(asyncio.TimeoutError())
+            except (ConnectionError, OSError) as e:
+                self._stats["errors"] += 1
+                if not item.future.done():
+                    item.future.set_exception(e)
+                self._fail_all(e)
+                return
+            else:
+                if item.future.done():
+                    self._stats["canceled"] += 1
+                else:
+                    self._stats["completed"] += 1
+                    item.future.set_result(event)
+            finally:
+                self._current = None
+
+    def _is_stale(self, event: SensorEvent) -> bool:
+        """마감이 지나 버린 명령의 응답이면 True (그 명령의 마지막 응답까지 버림)"""
+        if self._owed <= 0:
+            return False
+        self._stats["stale"] += 1
+        if event.kind in _ALL_TERMINAL:
+            self._owed -= 1
+        return True
+
+    async def _execute(self, item: SensorCommand) -> SensorEvent:
+        # 명령 사이에 도착한 응답은 모두 이전 명령의 것
+        for event in self.link.pop_pending():
+            self._is_stale(event)
+        await self.link.write(item.command)
+        while True:
+            event = await self.link.next_event(item.deadline - time.monotonic())
+            if self._is_stale(event):
+                continue
+            if event.kind in item.terminal:
+                return event
+            if item.on_event is not None and not item.future.done():
+                try:
+                    item.on_event(event)
+                except Exception as e:
+                    print(f"진행 상태 콜백 오류: {e}")
+
+    def _fail_all(self, error: BaseException) -> None:
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            item = self._queue.get_nowait()
+            if not item.future.done():
+                item.future.set_exception(error)
@@ -7,6 +7,12 @@ import time
 import re  # 주민등록번호 형식 검사를 위해 re 모듈 추가
 from def_fp_err import handle_error
 
+# 사용자 저장소(SQLite)는 backend/Utility 아래에 배치되었을 때만 사용 (단독 실행 시에는 data_fp JSON만 사용)
+try:
+    from Utility.UserStore import create_user_repository, User, normalize_rrn
+except ImportError:
+    create_user_repository = None
+
 def get_user_info():
     """
     사용자로부터 이름과 주민등록번호를 입력받고 유효성을 검사합니다.
@@ -79,6 +85,12 @@ def enroll(ser):
                     # 한글 깨짐 방지를 위해 encoding='utf-8' 및 ensure_ascii=False 추가
                     with open(f'data_fp/{enrolled_id}.json', 'w', encoding='utf-8') as f:
                         json.dump(fingerprint_data, f, indent=4, ensure_ascii=False)
+
+                    # 사용자 DB에도 저장 (지문 ID 인덱스로 바로 조회 가능)
+                    if create_user_repository is not None:
+                        create_user_repository().upsert(
+                            User(normalize_rrn(rrn), user_name, int(enrolled_id), fingerprint_data["timestamp"])
+                        )
                         
                     print(f"\n🎉 지문 등록 성공! (ID: {enrolled_id}, 이름: {user_name})")
                     break
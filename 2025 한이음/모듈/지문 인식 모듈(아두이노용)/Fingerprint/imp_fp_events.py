@@ -0,0 +1,52 @@
+# imp_fp_events.py
+
+import json
+import asyncio
+from typing import AsyncIterator, Optional
+
+from imp_fp_tasks import VerificationTaskStore, TERMINAL_STATES, EXPIRED_MESSAGE
+
+# 프록시/브라우저가 유휴 연결을 끊지 않도록 보내는 주석 줄 간격 (초)
+HEARTBEAT_SECONDS = 15.0
+# 연결이 끊겼을 때 EventSource가 다시 연결하기까지 기다리는 시간 (밀리초)
+RETRY_MILLISECONDS = 2000
+
+
+def format_sse(data: dict, event_id: Optional[int] = None) -> str:
+    """작업 dict 하나를 SSE 메시지(data: JSON 한 줄)로 만듭니다."""
+    lines = [] if event_id is None else [f"id: {event_id}"]
+    lines.append("data: " + json.dumps(data, ensure_ascii=False))
+    return "\n".join(lines) + "\n\n"
+
+
+async def task_event_stream(store: VerificationTaskStore, task_id: str,
+                            heartbeat: float = HEARTBEAT_SECONDS) -> AsyncIterator[str]:
+    """
+    인증 작업의 상태 변화를 SSE 메시지로 내보냅니다. (main http_pol.py의 /verification-events)
+    먼저 현재 상태를 한 번 보내고, 그 뒤로는 워커가 store.update로 상태를 바꿀 때마다 바로 보냅니다.
+    끝난 상태(pos_auth/neg_auth/canceled)나 expired를 보내면 스트림을 닫습니다.
+    변화가 없는 동안에는 heartbeat초마다 주석 줄만 보냅니다.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    listener = queue.put_nowait
+    # 구독을 먼저 걸고 (await 없이 바로) 현재 상태를 읽어, 그 사이에 바뀐 상태를 놓치지 않게 함
+    if not store.subscribe(task_id, listener):
+        yield format_sse({"status": "expired", "message": EXPIRED_MESSAGE})
+        return
+    task = dict(store.get(task_id))
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        sequence = 0
+        while True:
+            sequence += 1
+            yield format_sse(task, sequence)
+            if task.get("status") in TERMINAL_STATES or task.get("status") == "expired":
+                return
+            while True:
+                try:
+                    task = await asyncio.wait_for(queue.get(), heartbeat)
+                    break
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+    finally:
+        store.unsubscribe(task_id, listener)
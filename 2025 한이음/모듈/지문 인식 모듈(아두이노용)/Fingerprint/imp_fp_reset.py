@@ -5,6 +5,12 @@ import os
 import shutil
 from def_fp_err import handle_error
 
+# 사용자 저장소(SQLite)는 backend/Utility 아래에 배치되었을 때만 사용 (단독 실행 시에는 data_fp JSON만 사용)
+try:
+    from Utility.UserStore import create_user_repository
+except ImportError:
+    create_user_repository = None
+
 def reset(ser):
     """
     센서의 모든 지문 데이터와 로컬 데이터를 삭제합니다.
@@ -29,6 +35,9 @@ def reset(ser):
                     if os.path.exists('data_fp'):
                         shutil.rmtree('data_fp')
                         print("로컬 데이터 폴더(data_fp)를 삭제했습니다.")
+                    # 사용자 DB의 지문 연결도 해제 (사용자 정보는 유지)
+                    if create_user_repository is not None:
+                        create_user_repository().clear_fingerprints()
                     print("\n✨ 모든 데이터가 성공적으로 초기화되었습니다.")
                     break
                 elif "FAIL" in response:
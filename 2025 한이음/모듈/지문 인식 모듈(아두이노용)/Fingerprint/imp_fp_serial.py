@@ -0,0 +1,179 @@
+# imp_fp_serial.py
+
+import os
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Tuple
+
+# 줄바꿈 없이 이만큼 쌓이면 잡음으로 보고 버립니다. (아두이노 응답은 한 줄에 수십 바이트)
+MAX_LINE_BYTES = 4096
+
+
+@dataclass
+class SensorEvent:
+    """
+    아두이노가 보낸 한 줄을 나눈 이벤트.
+    예: "VERIFY_SUCCESS,3,87" → kind="VERIFY_SUCCESS", args=("3", "87")
+    """
+    kind: str
+    args: Tuple[str, ...]
+    line: str
+    received_at: float  # time.monotonic() 기준 수신 시각
+
+
+def parse_line(line: str) -> SensorEvent:
+    """아두이노 응답 한 줄을 SensorEvent로 나눕니다."""
+    kind, *args = line.split(',')
+    return SensorEvent(kind.strip(), tuple(a.strip() for a in args), line, time.monotonic())
+
+
+class AsyncSerialLink:
+    """
+    시리얼 포트를 asyncio 이벤트 루프에 직접 연결한 줄 단위 수신기.
+    - 리눅스(라즈베리파이)에서는 포트의 파일 디스크립터를 loop.add_reader에 등록해,
+      데이터가 도착했을 때만 깨어납니다. (in_waiting 폴링/슬립 없음)
+    - fileno를 쓸 수 없는 포트(윈도우 COM 포트 등)는 전용 스레드가 블로킹 read로 기다렸다가 루프에 넘깁니다.
+    - 받은 줄은 SensorEvent로 나눠 큐에 쌓고, next_event / wait_for 가 호출마다 제한 시간을 두고 기다립니다.
+    포트를 열고 닫는 것은 fp_factory의 몫이며, close()는 수신만 멈추고 포트는 닫지 않습니다.
+    """
+
+    def __init__(self, ser) -> None:
+        self.ser = ser
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._buffer = bytearray()
+        self._fd: Optional[int] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._error: Optional[BaseException] = None
+
+    # --- 시작/종료 ---
+    async def start(self) -> "AsyncSerialLink":
+        """현재 이벤트 루프에 수신기를 붙입니다."""
+        self._loop = asyncio.get_running_loop()
+        self._queue = asyncio.Queue()
+        self._fd = self._fileno()
+        if self._fd is not None:
+            self._loop.add_reader(self._fd, self._on_readable)
+        else:
+            self._thread = threading.Thread(target=self._read_thread, name="fp-serial-reader", daemon=True)
+            self._thread.start()
+        return self
+
+    def _fileno(self) -> Optional[int]:
+        if os.name != "posix" or not hasattr(self.ser, "fileno"):
+            return None
+        try:
+            fd = self.ser.fileno()
+            os.set_blocking(fd, False)
+            return fd
+        except Exception:
+            return None
+
+    def close(self) -> None:
+        """수신을 멈추고, 기다리던 호출에는 ConnectionError를 돌려줍니다."""
+        if self._fd is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        self._stop.set()
+        if self._error is None:
+            self._fail(ConnectionError("시리얼 수신기가 닫혔습니다."))
+
+    @property
+    def is_open(self) -> bool:
+        return self._queue is not None and self._error is None
+
+    # --- 수신 ---
+    def _on_readable(self) -> None:
+        try:
+            data = os.read(self._fd, 4096)
+        except BlockingIOError:
+            return
+        except OSError as e:
+            self._fail(e)
+            return
+        if not data:
+            self._fail(ConnectionError("시리얼 포트 연결이 끊어졌습니다."))
+            return
+        self._feed(data)
+
+    def _read_thread(self) -> None:
+        while not self._stop.is_set():
+            try:
+                # 포트 timeout 동안 블로킹 (첫 바이트가 오면 바로 반환)
+                data = self.ser.read(max(1, self.ser.in_waiting))
+            except Exception as e:
+                self._loop.call_soon_threadsafe(self._fail, e)
+                return
+            if data:
+                self._loop.call_soon_threadsafe(self._feed, data)
+
+    def _feed(self, data: bytes) -> None:
+        self._buffer.extend(data)
+        while True:
+            end = self._buffer.find(b"\n")
+            if end < 0:
+                break
+            line = self._buffer[:end].decode("utf-8", errors="ignore").strip()
+            del self._buffer[:end + 1]
+            if line:
+                self._queue.put_nowait(parse_line(line))
+        if len(self._buffer) > MAX_LINE_BYTES:
+            self._buffer.clear()
+
+    def _fail(self, error: BaseException) -> None:
+        if self._error is not None:
+            return
+        self._error = error
+        if self._fd is not None and self._loop is not None and not self._loop.is_closed():
+            self._loop.remove_reader(self._fd)
+            self._fd = None
+        if self._queue is not None:
+            self._queue.put_nowait(None)  # 기다리던 호출을 깨움
+
+    # --- 호출자 API ---
+    async def write(self, command: str) -> None:
+        """명령 한 줄을 보냅니다. (아두이노 명령은 짧아 바로 끝나므로 루프에서 직접 씀)"""
+        if self._error is not None:
+            raise ConnectionError(str(self._error))
+        self.ser.write(f"{command}\n".encode("utf-8"))
+
+    def pop_pending(self) -> List[SensorEvent]:
+        """아직 읽지 않은 이벤트를 모두 꺼내 반환합니다. (기다리지 않음)"""
+        events = []
+        while not self._queue.empty():
+            event = self._queue.get_nowait()
+            if event is None:
+                self._queue.put_nowait(None)
+                break
+            events.append(event)
+        return events
+
+    def drain(self) -> int:
+        """이전 명령의 늦은 응답 등 아직 읽지 않은 이벤트를 버리고, 버린 개수를 반환합니다."""
+        return len(self.pop_pending())
+
+    async def next_event(self, timeout: Optional[float] = None) -> SensorEvent:
+        """
+        다음 이벤트를 기다립니다.
+        timeout(초) 안에 없으면 asyncio.TimeoutError, 포트가 끊기면 ConnectionError를 일으킵니다.
+        """
+        if timeout is not None and timeout <= 0:
+            raise asyncio.TimeoutError()
+        event = await asyncio.wait_for(self._queue.get(), timeout)
+        if event is None:
+            self._queue.put_nowait(None)
+            raise ConnectionError(str(self._error))
+        return event
+
+    async def wait_for(self, kinds: Iterable[str], timeout: Optional[float] = None) -> SensorEvent:
+        """kinds 중 하나가 올 때까지 다른 이벤트는 건너뛰며 기다립니다. (timeout은 전체 대기 시간)"""
+        kinds = set(kinds)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            event = await self.next_event(remaining)
+            if event.kind in kinds:
+                return event
@@ -0,0 +1,198 @@
+# imp_fp_tasks.py
+
+import time
+import uuid
+import heapq
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 작업이 끝난 상태 (이 상태의 작업만 LRU로 밀어냄)
+TERMINAL_STATES = frozenset({"pos_auth", "neg_auth", "canceled"})
+
+# 상태별 보관 시간 (초). 상태가 바뀔 때마다 그 상태의 시간으로 다시 계산합니다.
+# 진행 중 상태는 워커가 멈춘 작업을 치우는 용도, 끝난 상태는 결과를 폴링/재사용할 수 있는 시간입니다.
+DEFAULT_STATE_TTLS = {
+    "pending": 60.0,
+    "QUEUED": 300.0,            # 센서 중개자 대기열에서 차례를 기다림
+    "AWAITING_FINGER": 300.0,   # 센서가 손가락을 기다림 (PLACE_FINGER)
+    "SCANNING": 60.0,           # 지문 이미지를 읽어 대조 중 (IMAGE_TAKEN)
+    "RETRY": 300.0,
+    "pos_auth": 60.0,
+    "neg_auth": 60.0,
+    "canceled": 30.0,
+}
+
+
+# 만료/밀려난 작업을 구독 중인 쪽에 알릴 때 보내는 내용
+EXPIRED_MESSAGE = "인증 작업이 만료되었습니다. 처음부터 다시 시도해주세요."
+
+
+class TaskStoreFull(Exception):
+    """진행 중인 작업만으로 max_tasks가 찼을 때 발생합니다. (밀어낼 끝난 작업이 없음)"""
+
+
+class _Entry:
+    __slots__ = ("task", "user_identifier", "expires_at", "listeners")
+
+    def __init__(self, task: dict, user_identifier: Optional[str], expires_at: float) -> None:
+        self.task = task
+        self.user_identifier = user_identifier
+        self.expires_at = expires_at
+        self.listeners: List[Callable[[dict], None]] = []
+
+
+class VerificationTaskStore:
+    """
+    HTTP 폴링 지문 인증 작업 저장소. (main http_pol.py의 verification_tasks)
+    - 작업 ID와 사용자 식별자로 O(1) 조회합니다. (진행 중 작업 중복 확인에 전체 순회 없음)
+    - 상태별 보관 시간(state_ttls)이 지나면 지우고, 지운 ID는 묘비(tombstone)로 잠시 기억해
+      만료된 작업을 조회하면 "없음"과 구분된 "expired" 상태를 돌려줄 수 있게 합니다.
+    - 작업 수가 max_tasks를 넘으면 끝난 작업(pos_auth/neg_auth/canceled) 중 가장 오래 안 본 것부터 밀어냅니다.
+      진행 중인 작업은 밀어내지 않으며, 진행 중 작업만으로 가득 차면 TaskStoreFull을 일으킵니다.
+    - subscribe로 등록한 listener는 update마다 바뀐 작업의 복사본을, 만료/밀려날 때 status "expired"를 받습니다. (SSE 상태 스트림용)
+    만료는 호출할 때마다 만료 시각 힙에서 지난 것만 꺼내 처리하므로, 별도 청소 작업 없이 메모리가 일정하게 유지됩니다.
+    이벤트 루프 하나에서만 쓰므로 잠금은 두지 않습니다.
+    """
+
+    def __init__(self, state_ttls: Optional[Dict[str, float]] = None, default_ttl: float = 300.0,
+                 max_tasks: int = 1000, max_tombstones: int = 10000,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.state_ttls = {**DEFAULT_STATE_TTLS, **(state_ttls or {})}
+        self.default_ttl = default_ttl
+        self.max_tasks = max_tasks
+        self.max_tombstones = max_tombstones
+        self.clock = clock
+        self._entries: Dict[str, _Entry] = {}
+        self._completed: "OrderedDict[str, None]" = OrderedDict()   # 끝난 작업 LRU (오래된 것이 앞)
+        self._by_user: Dict[str, str] = {}                          # 사용자 식별자 → 가장 최근 작업 ID
+        self._expiry: List[Tuple[float, str]] = []                  # (만료 시각, 작업 ID) 힙, 지난 항목은 꺼낼 때 건너뜀
+        self._tombstones: "OrderedDict[str, str]" = OrderedDict()   # 지운 작업 ID → 이유 (expired | evicted)
+        self._stats = {"created": 0, "expired": 0, "evicted": 0, "rejected": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # --- 생성/조회/갱신 ---
+    def create(self, user_identifier: Optional[str] = None, **fields) -> Tuple[str, dict]:
+        """새 작업을 만들고 (작업 ID, 작업 dict)를 반환합니다."""
+        now = self.clock()
+        self._expire(now)
+        if len(self._entries) >= self.max_tasks:
+            self._evict(len(self._entries) - self.max_tasks + 1)
+            if len(self._entries) >= self.max_tasks:
+                self._stats["rejected"] += 1
+                raise TaskStoreFull(f"진행 중인 인증 작업이 너무 많습니다. ({self.max_tasks}개)")
+        task_id = str(uuid.uuid4())
+        task = {"status": "pending", **fields}
+        if user_identifier:  # 주민등록번호가 들어 있으므로 작업 dict(응답)에는 넣지 않음
+            self._by_user[user_identifier] = task_id
+        self._entries[task_id] = _Entry(task, user_identifier, 0.0)
+        self._schedule(task_id, self._entries[task_id], now)
+        self._stats["created"] += 1
+        return task_id, task
+
+    def get(self, task_id: str) -> Optional[dict]:
+        """작업 dict를 반환합니다. 없거나 만료되었으면 None (이유는 lookup으로 확인)"""
+        return self.lookup(task_id)[0]
+
+    def lookup(self, task_id: str) -> Tuple[Optional[dict], str]:
+        """(작업 dict, 상태)를 반환합니다. 상태: ok | expired | evicted | unknown"""
+        self._expire(self.clock())
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None, self._tombstones.get(task_id, "unknown")
+        if task_id in self._completed:
+            self._completed.move_to_end(task_id)
+        return entry.task, "ok"
+
+    def update(self, task_id: str, **fields) -> Optional[dict]:
+        """
+        작업 필드를 고치고 새 상태의 보관 시간으로 만료 시각을 다시 잡습니다.
+        작업이 이미 만료/밀려났으면 None을 반환합니다. (워커는 이때 작업을 그만두면 됨)
+        """
+        now = self.clock()
+        self._expire(now)
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return None
+        entry.task.update(fields)
+        if entry.task.get("status") in TERMINAL_STATES:
+            self._completed[task_id] = None
+            self._completed.move_to_end(task_id)
+        else:
+            self._completed.pop(task_id, None)
+        self._schedule(task_id, entry, now)
+        self._notify(entry, dict(entry.task))
+        return entry.task
+
+    def find_by_user(self, user_identifier: str) -> Optional[Tuple[str, dict]]:
+        """사용자의 가장 최근 작업 (작업 ID, 작업 dict)을 반환합니다. (만료되었으면 None)"""
+        task_id = self._by_user.get(user_identifier)
+        task = self.get(task_id) if task_id else None
+        return (task_id, task) if task is not None else None
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            **self._stats,
+            "tasks": len(self._entries),
+            "completed": len(self._completed),
+            "tombstones": len(self._tombstones),
+            "expiry_heap": len(self._expiry),
+            "listeners": sum(len(e.listeners) for e in self._entries.values()),
+        }
+
+    # --- 상태 변경 알림 ---
+    def subscribe(self, task_id: str, listener: Callable[[dict], None]) -> bool:
+        """작업 상태가 바뀔 때마다 listener(작업 복사본)를 호출하게 등록합니다. 작업이 없으면 False"""
+        self._expire(self.clock())
+        entry = self._entries.get(task_id)
+        if entry is None:
+            return False
+        entry.listeners.append(listener)
+        return True
+
+    def unsubscribe(self, task_id: str, listener: Callable[[dict], None]) -> None:
+        entry = self._entries.get(task_id)
+        if entry is not None and listener in entry.listeners:
+            entry.listeners.remove(listener)
+
+    @staticmethod
+    def _notify(entry: _Entry, snapshot: dict) -> None:
+        for listener in list(entry.listeners):
+            try:
+                listener(snapshot)
+            except Exception as e:
+                print(f"작업 상태 알림 오류: {e}")
+
+    # --- 만료/밀어내기 ---
+    def _schedule(self, task_id: str, entry: _Entry, now: float) -> None:
+        entry.expires_at = now + self.state_ttls.get(entry.task.get("status"), self.default_ttl)
+        heapq.heappush(self._expiry, (entry.expires_at, task_id))
+        # 상태가 자주 바뀌면 지난 힙 항목이 쌓이므로, 살아 있는 작업 수의 4배를 넘으면 다시 만듦
+        if len(self._expiry) > 4 * max(64, len(self._entries)):
+            self._expiry = [(e.expires_at, tid) for tid, e in self._entries.items()]
+            heapq.heapify(self._expiry)
+
+    def _expire(self, now: float) -> None:
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, task_id = heapq.heappop(self._expiry)
+            entry = self._entries.get(task_id)
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(task_id, "expired")
+
+    def _evict(self, count: int) -> None:
+        for _ in range(min(count, len(self._completed))):
+            task_id, _ = self._completed.popitem(last=False)
+            self._remove(task_id, "evicted")
+
+    def _remove(self, task_id: str, reason: str) -> None:
+        entry = self._entries.pop(task_id)
+        self._completed.pop(task_id, None)
+        if entry.user_identifier and self._by_user.get(entry.user_identifier) == task_id:
+            del self._by_user[entry.user_identifier]
+        self._stats[reason] += 1
+        self._tombstones[task_id] = reason
+        if entry.listeners:
+            self._notify(entry, {"status": "expired", "message": EXPIRED_MESSAGE})
+        if len(self._tombstones) > self.max_tombstones:
+            self._tombstones.popitem(last=False)
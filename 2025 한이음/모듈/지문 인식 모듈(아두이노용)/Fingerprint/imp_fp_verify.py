@@ -2,42 +2,102 @@
 
 import serial
 import json
+import time
+import asyncio
 from def_fp_err import handle_error
+from imp_fp_broker import SensorBusyError
 
-def verify(ser):
+# 사용자 저장소(SQLite)는 backend/Utility 아래에 배치되었을 때만 사용 (단독 실행 시에는 data_fp JSON만 사용)
+try:
+    from Utility.UserStore import create_user_repository
+except ImportError:
+    create_user_repository = None
+
+
+def _lookup_user_name(verified_id: str):
+    """센서 지문 ID로 사용자 이름을 찾습니다. (사용자 DB 인덱스 조회 → data_fp JSON 순)"""
+    if create_user_repository is not None:
+        user = create_user_repository().get_by_fingerprint_id(int(verified_id))
+        if user:
+            return user.name
+    try:
+        with open(f'data_fp/{verified_id}.json', 'r', encoding='utf-8') as f:
+            return json.load(f)['name']
+    except FileNotFoundError:
+        return None
+
+def _handle_response(response: str):
+    """
+    아두이노 응답 한 줄을 처리합니다. 인증이 끝났으면 결과 dict를, 계속 기다려야 하면 None을 반환합니다.
+    """
+    print(f"아두이노 응답: {response}")
+
+    if response == "PLACE_FINGER":
+        print("확인할 지문을 센서에 올려주세요...")
+
+    elif response.startswith("VERIFY_SUCCESS"):
+        _, verified_id, confidence = response.split(',')
+        user_name = _lookup_user_name(verified_id)
+        if user_name:
+            print(f"\n인증 성공! 환영합니다, {user_name}님.")
+            return {"success": True, "userName": user_name}
+        print(f"\n경고: 센서 ID {verified_id} 확인, 로컬 데이터 없음.")
+        return {"success": False, "error": "USER_DATA_NOT_FOUND"}
+
+    elif "FAIL" in response or "NOT_FOUND" in response:
+        error_msg = handle_error(response)
+        print(f"\n인증 실패: {error_msg}")
+        return {"success": False, "error": response}
+
+    return None
+
+def verify(ser, timeout=None):
     """
     지문 확인 프로세스를 진행하고, 결과를 dict 형태로 반환합니다.
+    in_waiting을 돌며 폴링하지 않고 readline으로 블로킹해, 응답이 올 때만 깨어납니다. (포트 timeout마다 한 번 확인)
+    timeout(초)을 주면 그 안에 결과가 없을 때 TIMEOUT을 반환합니다. (None이면 손가락을 올릴 때까지 기다림)
     """
+    deadline = None if timeout is None else time.monotonic() + timeout
     try:
         print("\n지문 확인을 시작합니다.")
         ser.write(b"VERIFY\n")
         
-        while True:
-            if ser.in_waiting > 0:
-                response = ser.readline().decode().strip()
-                print(f"아두이노 응답: {response}")
-
-                if response == "PLACE_FINGER":
-                    print("확인할 지문을 센서에 올려주세요...")
-                
-                elif response.startswith("VERIFY_SUCCESS"):
-                    _, verified_id, confidence = response.split(',')
-                    try:
-                        with open(f'data_fp/{verified_id}.json', 'r', encoding='utf-8') as f:
-                            user_data = json.load(f)
-                        print(f"\n인증 성공! 환영합니다, {user_data['name']}님.")
-                        return {"success": True, "userName": user_data['name']}
-                    except FileNotFoundError:
-                        print(f"\n경고: 센서 ID {verified_id} 확인, 로컬 데이터 없음.")
-                        return {"success": False, "error": "USER_DATA_NOT_FOUND"}
-                
-                elif "FAIL" in response or "NOT_FOUND" in response:
-                    error_msg = handle_error(response)
-                    print(f"\n인증 실패: {error_msg}")
-                    return {"success": False, "error": response}
+        while deadline is None or time.monotonic() < deadline:
+            response = ser.readline().decode().strip()
+            if not response:
+                continue
+            result = _handle_response(response)
+            if result is not None:
+                return result
 
     except Exception as e:
         print(f"확인 중 예외 발생: {e}")
         return {"success": False, "error": str(e)}
 
-    return {"success": False, "error": "TIMEOUT"}
\ No newline at end of file
+    return {"success": False, "error": "TIMEOUT"}
+
+async def averify(broker, timeout, on_event=None):
+    """
+    verify의 asyncio 버전. 포트를 소유한 SensorBroker(imp_fp_broker)에 VERIFY를 맡기고,
+    센서 응답이 도착할 때만 깨어납니다. timeout(초, 대기열에서 기다린 시간 포함) 안에 결과가 없으면 TIMEOUT,
+    대기열이 가득 차 있으면 SENSOR_BUSY를 반환합니다. on_event는 중간 응답(PLACE_FINGER 등)마다 호출됩니다.
+    """
+    def progress(event):
+        _handle_response(event.line)
+        if on_event is not None:
+            on_event(event)
+
+    try:
+        print("\n지문 확인을 시작합니다.")
+        event = await broker.request("VERIFY", timeout, on_event=progress)
+        return _handle_response(event.line)
+
+    except asyncio.TimeoutError:
+        print(f"\n인증 실패: {handle_error('TIMEOUT')}")
+        return {"success": False, "error": "TIMEOUT"}
+    except SensorBusyError:
+        print(f"\n인증 실패: {handle_error('SENSOR_BUSY')}")
+        return {"success": False, "error": "SENSOR_BUSY"}
+    except Exception as e:
+        print(f"확인 중 예외 발생: {e}")
+        return {"success": False, "error": str(e)}
\ No newline at end of file
@@ -0,0 +1,132 @@
+# sim_fp_arduino.py
+"""
+pty(가상 터미널) 한 쌍으로 Aduino_code/fingerprint_rec.ino의 시리얼 응답을 흉내 내는 가짜 아두이노. (리눅스/맥 전용)
+실제 센서 없이 시리얼 처리 방식(폴링/블로킹/asyncio)을 비교할 때 씁니다.
+
+    sim = ArduinoSimulator(finger_delay=(0.5, 1.5))
+    port = sim.start()                          # 별도 프로세스에서 실행
+    ser = serial.Serial(port, 9600, timeout=1)
+    ...
+    sim.stop()
+
+별도 프로세스에서 돌기 때문에 측정하는 쪽 프로세스의 CPU 사용량에 섞이지 않으며,
+결과 줄을 쓴 시각(time.monotonic)을 result_times()로 돌려줘 응답 지연을 잴 수 있습니다.
+"""
+import os
+import tty
+import time
+import random
+import multiprocessing as mp
+from typing import List, Optional, Tuple
+
+
+def _run_device(master_fd: int, finger_delay: Tuple[float, float], match_id: int, confidence: int,
+                fail_rate: float, boot_delay: float, seed: int, results) -> None:
+    rng = random.Random(seed)
+
+    def send(line: str) -> None:
+        os.write(master_fd, (line + "\r\n").encode())  # Serial.println과 같은 줄 끝
+
+    def wait_finger() -> None:
+        time.sleep(rng.uniform(*finger_delay))
+
+    # 포트를 열면 아두이노가 재시작되는 것처럼, 잠시 뒤 센서 확인 결과를 보냄
+    time.sleep(boot_delay)
+    send("FOUND_SENSOR")
+
+    sequence = 0
+    buffer = b""
+    while True:
+        try:
+            data = os.read(master_fd, 1024)
+        except OSError:
+            return  # 읽는 쪽이 포트를 닫음
+        if not data:
+            return
+        buffer += data
+        while b"\n" in buffer:
+            line, buffer = buffer.split(b"\n", 1)
+            command = line.decode(errors="ignore").strip()
+            if command == "VERIFY":
+                sequence += 1
+                send("VERIFY_START" if match_id else f"VERIFY_START,{sequence}")
+                send("PLACE_FINGER")
+                wait_finger()
+                send("IMAGE_TAKEN")
+                verified_id = match_id or sequence
+                result = "FINGER_NOT_FOUND" if rng.random() < fail_rate else f"VERIFY_SUCCESS,{verified_id},{confidence}"
+                send(result)
+                results.put((result, time.monotonic()))
+            elif command.startswith("ENROLL"):
+                enroll_id = command[7:] or "0"
+                send("ENROLL_START")
+                for step in ("PLACE_FINGER", "IMAGE_TAKEN", "REMOVE_FINGER", "PLACE_AGAIN"):
+                    send(step)
+                    if step.startswith("PLACE"):
+                        wait_finger()
+                send("IMAGE_TAKEN")
+                result = f"ENROLL_SUCCESS,{enroll_id}"
+                send(result)
+                results.put((result, time.monotonic()))
+            elif command == "RESET":
+                send("RESET_SUCCESS")
+                results.put(("RESET_SUCCESS", time.monotonic()))
+
+
+class ArduinoSimulator:
+    """
+    fingerprint_rec.ino와 같은 줄 단위 프로토콜로 응답하는 가짜 아두이노.
+    - VERIFY: VERIFY_START, PLACE_FINGER 뒤 finger_delay(초) 범위의 임의 시간만큼 기다렸다가
+      IMAGE_TAKEN, VERIFY_SUCCESS,<match_id>,<confidence> (fail_rate 비율로 FINGER_NOT_FOUND)
+      match_id=0이면 VERIFY마다 1, 2, 3... 순번을 VERIFY_START,<순번>과 결과 ID로 돌려줘,
+      한 호출자가 받은 시작/결과가 같은 명령의 것인지 확인할 수 있습니다.
+    - ENROLL,<id> / RESET 도 같은 순서의 응답을 보냅니다.
+    """
+
+    def __init__(self, finger_delay: Tuple[float, float] = (0.5, 1.5), match_id: int = 1, confidence: int = 87,
+                 fail_rate: float = 0.0, boot_delay: float = 0.3, seed: int = 0) -> None:
+        self.finger_delay = finger_delay
+        self.match_id = match_id
+        self.confidence = confidence
+        self.fail_rate = fail_rate
+        self.boot_delay = boot_delay
+        self.seed = seed
+        self.port: Optional[str] = None
+        self._ctx = mp.get_context("fork")
+        self._results = self._ctx.Queue()
+        self._process = None
+        self._slave_fd: Optional[int] = None
+
+    def start(self) -> str:
+        """가짜 아두이노를 띄우고 serial.Serial로 열 포트 경로를 반환합니다."""
+        master_fd, self._slave_fd = os.openpty()
+        tty.setraw(self._slave_fd)  # 줄 편집/에코 없이 바이트 그대로 (실제 USB 시리얼과 같게)
+        self.port = os.ttyname(self._slave_fd)
+        self._process = self._ctx.Process(
+            target=_run_device, name="fake-arduino", daemon=True,
+            args=(master_fd, self.finger_delay, self.match_id, self.confidence,
+                  self.fail_rate, self.boot_delay, self.seed, self._results),
+        )
+        self._process.start()
+        os.close(master_fd)
+        return self.port
+
+    def result_time(self, timeout: float = 5.0) -> Tuple[str, float]:
+        """다음 결과 줄과 그 줄을 쓴 시각(time.monotonic)을 기다려 반환합니다."""
+        return self._results.get(timeout=timeout)
+
+    def result_times(self) -> List[Tuple[str, float]]:
+        """지금까지 쌓인 (결과 줄, 쓴 시각) 목록을 모두 꺼냅니다."""
+        items = []
+        while not self._results.empty():
+            items.append(self._results.get_nowait())
+        return items
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join(5)
+            self._process = None
+        if self._slave_fd is not None:
+            os.close(self._slave_fd)
+            self._slave_fd = None
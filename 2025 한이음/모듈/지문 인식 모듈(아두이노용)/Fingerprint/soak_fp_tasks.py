@@ -0,0 +1,121 @@
+# soak_fp_tasks.py
+"""
+HTTP 폴링 인증 작업 저장소 장시간 부하 확인. (Fingerprint 폴더에서 실행)
+
+    python soak_fp_tasks.py [--cycles 1000000] [--sample 100000] [--rate 50] [--baseline 200000]
+
+main http_pol.py의 작업 흐름(시작 → QUEUED → AWAITING_FINGER → SCANNING → 결과, 몇 번 폴링)을 가짜 시계로 cycles번 돌리며
+sample번마다 저장된 작업 수와 tracemalloc 메모리를 출력합니다. 가짜 시계는 1초에 rate개 작업이 시작되는 속도로 흐릅니다.
+store 방식은 첫 sample(예열) 뒤로 저장 수가 max_tasks 이하이고 메모리가 예열 시점의 (1 + max-growth)배를
+넘지 않는지 확인하고, 어긋나면 종료 코드 1로 끝냅니다.
+- dict  : 변경 전 방식 (verification_tasks dict + completed_tasks_cache, 지우지 않음), baseline번만 실행
+- store : VerificationTaskStore (상태별 보관 시간, 끝난 작업 LRU)
+사용자는 매번 새로 만들어(주민등록번호가 모두 다름), 실제로 지워지지 않으면 그대로 쌓이게 합니다.
+"""
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from imp_fp_tasks import VerificationTaskStore
+
+_OUTCOMES = ("pos_auth", "neg_auth", "canceled")
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _dict_cycle(tasks: dict, cache: dict, n: int, rng: random.Random, clock: _FakeClock) -> None:
+    """변경 전 main http_pol.py와 같은 dict 조작"""
+    user_identifier = f"user{n}-{n:013d}"
+    task_id = f"{n:032x}"
+    tasks[task_id] = {"status": "pending", "message": "인증 작업을 시작합니다.", "attempts_left": 5,
+                      "stop_flag": False, "user_identifier": user_identifier}
+    task = tasks[task_id]
+    task["status"] = "AWAITING_FINGER"
+    task["status"] = rng.choice(_OUTCOMES)
+    cache[user_identifier] = (task_id, task, clock.now)
+
+
+def _store_cycle(store: VerificationTaskStore, n: int, rng: random.Random, clock: _FakeClock) -> None:
+    user_identifier = f"user{n}-{n:013d}"
+    found = store.find_by_user(user_identifier)
+    if found is None:
+        task_id, _ = store.create(user_identifier, message="인증 작업을 시작합니다.", attempts_left=5, stop_flag=False)
+    else:
+        task_id, _ = found
+    store.update(task_id, status="QUEUED", message="센서 차례를 기다리고 있습니다.")
+    store.update(task_id, status="AWAITING_FINGER", message="센서에 손가락을 올려주세요.")
+    store.get(task_id)
+    store.update(task_id, status="SCANNING", message="지문을 확인하고 있습니다.")
+    store.update(task_id, status=rng.choice(_OUTCOMES), message="끝")
+    for _ in range(rng.randint(0, 2)):  # 화면이 결과를 몇 번 더 폴링
+        store.lookup(task_id)
+
+
+def _soak(name: str, cycles: int, sample: int, rate: float, size: Callable[[], int],
+          step: Callable[[int], None], clock: _FakeClock) -> List[Tuple[int, int]]:
+    """sample번마다 (저장 수, 현재 메모리 바이트)를 모아 반환합니다."""
+    samples: List[Tuple[int, int]] = []
+    tracemalloc.start()
+    started = time.perf_counter()
+    for n in range(1, cycles + 1):
+        clock.now += 1.0 / rate
+        step(n)
+        if n % sample == 0:
+            current, peak = tracemalloc.get_traced_memory()
+            elapsed = time.perf_counter() - started
+            print(f"{name:<6}{n:>10,}{size():>10,}{current / 1e6:>11.1f}{peak / 1e6:>11.1f}{n / elapsed:>12,.0f}")
+            samples.append((size(), current))
+    tracemalloc.stop()
+    return samples
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cycles", type=int, default=1_000_000, help="store 방식의 인증 작업 수")
+    parser.add_argument("--sample", type=int, default=100_000, help="이 작업 수마다 메모리 출력")
+    parser.add_argument("--rate", type=float, default=50.0, help="가짜 시계 기준 초당 시작되는 작업 수")
+    parser.add_argument("--baseline", type=int, default=200_000, help="dict 방식의 인증 작업 수 (0이면 건너뜀)")
+    parser.add_argument("--max-tasks", type=int, default=1000, help="VerificationTaskStore max_tasks")
+    parser.add_argument("--max-growth", type=float, default=0.2, help="예열 뒤 허용하는 메모리 증가 비율")
+    args = parser.parse_args(argv)
+
+    print(f"{'방식':<6}{'작업':>10}{'저장 수':>10}{'현재 MB':>11}{'최대 MB':>11}{'작업/s':>12}")
+    if args.baseline:
+        tasks, cache, rng, clock = {}, {}, random.Random(0), _FakeClock()
+        _soak("dict", args.baseline, args.sample, args.rate, lambda: len(tasks),
+              lambda n: _dict_cycle(tasks, cache, n, rng, clock), clock)
+        del tasks, cache
+
+    rng, clock = random.Random(0), _FakeClock()
+    store = VerificationTaskStore(max_tasks=args.max_tasks, clock=clock)
+    samples = _soak("store", args.cycles, args.sample, args.rate, lambda: len(store),
+                    lambda n: _store_cycle(store, n, rng, clock), clock)
+    print(f"store 통계: {store.stats()}")
+
+    failed = []
+    largest = max(count for count, _ in samples)
+    if largest > args.max_tasks:
+        failed.append(f"저장 수 {largest:,} > max_tasks {args.max_tasks:,}")
+    if len(samples) > 1:
+        warm = samples[0][1]
+        highest = max(current for _, current in samples[1:])
+        if highest > warm * (1 + args.max_growth):
+            failed.append(f"예열 뒤 메모리 {warm / 1e6:.1f} → {highest / 1e6:.1f} MB (+{args.max_growth:.0%} 초과)")
+    for message in failed:
+        print(f"확인 실패: {message}")
+    if not failed:
+        print("확인 통과: 저장 수와 메모리가 예열 뒤 일정 범위 안에 머묾")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from fastapi import FastAPI, Request, UploadFile, File, Form, Response, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from openai import OpenAI
 from dotenv import load_dotenv
 from loguru import logger
@@ -23,13 +23,16 @@ from Utility.STT_TTS.factory import load_config, create_stt, create_tts, setup_l
 from Utility.STT_TTS.def_exceptions import TranscriptionError, TTSError
 
 # ==================== 지문 인증 모듈 임포트 (주석 처리) ====================
-import glob
-import uuid
 import asyncio
-import time
 from pydantic import BaseModel
 # # 아래 함수들은 Utility/Fingerprint/fp_factory.py 와 같은 모듈에 구현되어야 합니다.
-from Utility.Fingerprint import initialize_sensor, close_sensor_connection, get_sensor_connection, verify_fingerprint
+from Utility.Fingerprint import initialize_sensor, close_sensor_connection, averify_fingerprint, get_broker_stats
+# 등록 사용자 저장소 (SQLite, 주민등록번호 인덱스)
+from Utility.UserStore import create_user_repository
+# HTTP 폴링 인증 작업 저장소 (상태별 보관 시간, 끝난 작업 LRU)
+from Utility.Fingerprint import VerificationTaskStore, TaskStoreFull, TERMINAL_STATES
+# 인증 상태를 폴링 대신 푸시로 받는 SSE 스트림
+from Utility.Fingerprint import task_event_stream
 from pydantic import BaseModel
 # ======================================================================
 
@@ -39,7 +42,6 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 client = OpenAI(api_key=OPENAI_API_KEY)
 
 app = FastAPI()
-verification_tasks = {} # HTTP 폴링 방식의 지문 인증에서, 진행 중인 작업들을 저장하고 관리
 app.include_router(recognition_router)
 app.include_router(weather_router)
 
@@ -67,11 +69,21 @@ try:
     _stt = create_stt(config)
     _tts = create_tts(config)
     logger.info("STT/TTS 엔진 인스턴스 생성 완료.")
+    # 지문 인증 시작 시 사용자 조회에 쓰는 공유 사용자 저장소
+    create_user_repository(config)
 
 except Exception as e:
     logger.error(f"설정 파일 로드 또는 엔진 생성 실패: {e}")
     config = None
 
+# HTTP 폴링 방식의 지문 인증에서, 진행 중인 작업들을 저장하고 관리
+# 상태별 보관 시간이 지나면 지우고, 끝난 작업은 max_tasks를 넘을 때 오래 안 본 것부터 밀어냄 (config.yaml fingerprint.tasks)
+_task_config = ((config or {}).get("fingerprint") or {}).get("tasks") or {}
+verification_tasks = VerificationTaskStore(
+    state_ttls=_task_config.get("state_ttls"),
+    max_tasks=_task_config.get("max_tasks", 1000),
+)
+
 # ✅ 주요 키워드 사전
 MINWON_KEYWORDS = {
     "등본": "주민등록등본 발급 요청",
@@ -385,23 +397,38 @@ class UserAuthInfo(BaseModel):
 # ================= 2. 실시간 화면 전환 미구현 (HTTP 폴링) ===============
 # ======================================================================
 
-# 진행 중인 인증 작업을 저장할 딕셔너리
-verification_tasks = {}
-
 # 백그라운드에서 실제 지문 인증을 수행하는 함수
+# 상태는 verification_tasks.update로만 바꿔, 상태가 바뀔 때마다 그 상태의 보관 시간으로 다시 잡히게 합니다.
+#   QUEUED(센서 대기열) → AWAITING_FINGER(PLACE_FINGER: 손가락을 기다림) → SCANNING(IMAGE_TAKEN: 대조 중) → 결과
+# 중단 요청(stop_verification이 바로 canceled로 바꿈)이나 만료/밀려남이 확인되면 결과를 덮어쓰지 않고 그만둡니다.
+def _is_stopped(task_id: str) -> bool:
+    task = verification_tasks.get(task_id)
+    return task is None or bool(task.get("stop_flag"))
+
 async def _run_verification_task(task_id: str, user_data: dict):
-    global verification_tasks
-    task = verification_tasks[task_id]
-    
     max_attempts = 5
     for attempt in range(max_attempts):
-        if task.get("stop_flag"):
-            task["status"] = "canceled"
-            task["message"] = "사용자에 의해 중단되었습니다."
+        if _is_stopped(task_id):
+            return
+
+        task = verification_tasks.update(
+            task_id, status="QUEUED",
+            message="센서 차례를 기다리고 있습니다.",
+        )
+        if task is None:
             return
 
-        task["status"] = "AWAITING_FINGER"
-        task["message"] = f"센서에 손가락을 올려주세요. (남은 횟수: {task['attempts_left']}회)"
+        # 센서의 중간 응답을 상태로 바꿔 바로 알림 (대기열을 지나 명령을 받으면 PLACE_FINGER, 손가락을 읽으면 IMAGE_TAKEN)
+        def on_sensor_event(event):
+            if _is_stopped(task_id):
+                return
+            if event.kind == "PLACE_FINGER":
+                verification_tasks.update(
+                    task_id, status="AWAITING_FINGER",
+                    message=f"센서에 손가락을 올려주세요. (남은 횟수: {task['attempts_left']}회)",
+                )
+            elif event.kind == "IMAGE_TAKEN":
+                verification_tasks.update(task_id, status="SCANNING", message="지문을 확인하고 있습니다. 손가락을 그대로 두세요.")
         
         # 👇 [수정] 아래 3줄을 통째로 교체합니다.
         # -----------------------------------------------------------------
@@ -412,31 +439,34 @@ async def _run_verification_task(task_id: str, user_data: dict):
         # (새 코드)
         # 'verify_fingerprint_api'가 아니라 'verify_fingerprint'일 수 있습니다.
         # Utility/Fingerprint/__init__.py 에 정의된 함수 이름과 일치시키세요.
-        result = await asyncio.to_thread(verify_fingerprint, get_sensor_connection())
+        # 스레드에서 in_waiting을 폴링하는 대신, 센서 응답이 도착할 때만 깨어나는 asyncio 버전을 사용합니다.
+        # 포트는 중개자가 혼자 쓰므로 여러 작업이 동시에 불러도 명령이 차례로 처리됩니다. (가득 차면 SENSOR_BUSY)
+        result = await averify_fingerprint(on_event=on_sensor_event)
         # -----------------------------------------------------------------
+        if _is_stopped(task_id):
+            return
 
         if result.get("success"):
-            task["status"] = "pos_auth"
-            task["message"] = "인증에 성공했습니다!"
-            task["userName"] = user_data.get("name")
+            verification_tasks.update(task_id, status="pos_auth", message="인증에 성공했습니다!",
+                                      userName=user_data.get("name"))
             return
         else:
-            task["attempts_left"] -= 1
+            task = verification_tasks.update(task_id, attempts_left=task["attempts_left"] - 1)
+            if task is None:
+                return
             if task["attempts_left"] > 0:
-                task["status"] = "RETRY"
-                task["message"] = "인증 실패. 잠시 후 다시 시도합니다."
+                verification_tasks.update(task_id, status="RETRY", message="인증 실패. 잠시 후 다시 시도합니다.")
                 await asyncio.sleep(2) # 다음 시도 전 2초 대기
             else:
                 break # 시도 횟수 소진
     
-    task["status"] = "neg_auth"
-    task["message"] = "인증에 최종 실패했습니다."
+    if not _is_stopped(task_id):
+        verification_tasks.update(task_id, status="neg_auth", message="인증에 최종 실패했습니다.")
 
 
 # ======================================================================
 # ======== 지문 인증 작업을 시작하고 task_id를 반환하는 엔드포인트 ========
 # ======================================================================
-completed_tasks_cache = {}
 
 @app.post("/start-verification")
 async def start_verification(userInfo: UserAuthInfo):
@@ -444,43 +474,34 @@ async def start_verification(userInfo: UserAuthInfo):
     # --- 진행 중인 작업 확인 로직 추가 ---
     user_identifier = f"{userInfo.name}-{userInfo.rrn}"
 
-    # 1. 이미 진행 중인 작업이 있는지 확인
-    for task_id, task in verification_tasks.items():
-        if task.get("user_identifier") == user_identifier and task.get("status") not in ["pos_auth", "neg_auth", "canceled"]:
+    # 1. 이미 진행 중인 작업 또는 보관 시간 안의 성공한 작업이 있는지 확인 (사용자 인덱스로 바로 조회)
+    existing = verification_tasks.find_by_user(user_identifier)
+    if existing:
+        task_id, task = existing
+        if task.get("status") not in TERMINAL_STATES:
             logger.info(f"기존 인증 작업 발견. Task ID: {task_id}")
             return {"task_id": task_id} # 기존 task_id 반환
-
-    # 2. 캐시에 완료된 작업 결과가 있는지 확인 (예: 60초)
-    if user_identifier in completed_tasks_cache:
-        task_id, result, timestamp = completed_tasks_cache[user_identifier]
-        if time.time() - timestamp < 60:
-             # 완료된 작업이라도 상태 확인을 위해 task 딕셔너리에 다시 추가
-            verification_tasks[task_id] = result
+        # 2. 완료된 작업은 성공한 결과만 재사용 (실패/중단 뒤에는 바로 다시 시도할 수 있게)
+        if task.get("status") == "pos_auth":
             logger.info(f"캐시된 완료 작업 발견. Task ID: {task_id}")
             return {"task_id": task_id}
 
-    # 3. 사용자 정보 조회
-    user_data = None
-    data_fp_path = os.path.join(BACKEND_DIR, "Utility", "Fingerprint", "data_fp")
-    plain_rrn_from_frontend = userInfo.rrn.replace('-', '')
-    for file_path in glob.glob(os.path.join(data_fp_path, "*.json")):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            current_user = json.load(f)
-            plain_rrn_from_db = current_user.get("rrn", "").replace('-', '')
-            if current_user.get("name") == userInfo.name and current_user.get("rrn", "").replace('-', '') == plain_rrn_from_frontend:
-                user_data = current_user
-                break
-    if not user_data:
+    # 3. 사용자 정보 조회 (data_fp 폴더 전체를 훑는 대신 주민등록번호 인덱스로 한 번에 조회)
+    user = create_user_repository().get_by_user_id(userInfo.rrn)
+    if not user or user.name != userInfo.name:
         raise HTTPException(status_code=404, detail="등록되지 않은 사용자입니다.")
+    user_data = user.as_dict()
 
     #4 . 고유한 작업 ID 생성 및 상태 초기화
-    task_id = str(uuid.uuid4())
-    verification_tasks[task_id] = {
-        "status": "pending",
-        "message": "인증 작업을 시작합니다.",
-        "attempts_left": 5,
-        "stop_flag": False
-    }
+    try:
+        task_id, _ = verification_tasks.create(
+            user_identifier,
+            message="인증 작업을 시작합니다.",
+            attempts_left=5,
+            stop_flag=False,
+        )
+    except TaskStoreFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
 
     # 5. 백그라운드에서 지문 인증 작업 실행
     asyncio.create_task(_run_verification_task(task_id, user_data))
@@ -488,33 +509,64 @@ async def start_verification(userInfo: UserAuthInfo):
     # 6. 프론트엔드에 작업 ID 즉시 반환
     return {"task_id": task_id}
 
-# --- 작업 완료 시 캐시에 저장하는 콜백 함수 ---
-def cache_completed_task(task_id: str):
-    if task_id in verification_tasks:
-        task_result = verification_tasks[task_id]
-        user_identifier = task_result.get("user_identifier")
-        if user_identifier:
-            completed_tasks_cache[user_identifier] = (task_id, task_result, time.time())
-
 # ======================================================================
 # =================== 현재 인증 상태를 확인하는 엔드포인트 ================
 # ======================================================================
 
+def _missing_task_response(reason: str):
+    """보관 시간이 지나 지운 작업은 410 + status "expired", 처음부터 없던 작업은 404"""
+    if reason in ("expired", "evicted"):
+        return JSONResponse(
+            {"status": "expired", "message": "인증 작업이 만료되었습니다. 처음부터 다시 시도해주세요."},
+            status_code=410,
+        )
+    raise HTTPException(status_code=404, detail="존재하지 않는 작업 ID입니다.")
+
 @app.get("/verification-status/{task_id}")
 async def get_verification_status(task_id: str):
-    task = verification_tasks.get(task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="존재하지 않는 작업 ID입니다.")
+    task, reason = verification_tasks.lookup(task_id)
+    if task is None:
+        return _missing_task_response(reason)
     return task
 
+# ======================================================================
+# ============ 인증 상태 변화를 SSE로 푸시하는 엔드포인트 ================
+# ======================================================================
+
+@app.get("/verification-events/{task_id}")
+async def verification_events(task_id: str):
+    """
+    /verification-status를 반복해서 부르는 대신, 연결 하나로 상태가 바뀔 때마다 바로 받습니다. (text/event-stream)
+    각 메시지의 data는 /verification-status 응답과 같은 작업 JSON이며, 끝난 상태나 expired를 보내면 스트림이 닫힙니다.
+    """
+    task, reason = verification_tasks.lookup(task_id)
+    if task is None:
+        return _missing_task_response(reason)
+    return StreamingResponse(
+        task_event_stream(verification_tasks, task_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 # ======================================================================
 # =================== 진행 중인 인증을 중단하는 엔드포인트 ================
 # ======================================================================
 
 @app.post("/stop-verification/{task_id}")
 async def stop_verification(task_id: str):
-    task = verification_tasks.get(task_id)
-    if not task:
-        raise HTTPException(status_code=404, detail="존재하지 않는 작업 ID입니다.")
-    task["stop_flag"] = True
+    task, reason = verification_tasks.lookup(task_id)
+    if task is None:
+        return _missing_task_response(reason)
+    # update로 바꿔야 보관 시간이 다시 잡히고 SSE 구독자에게 바로 알림이 감
+    # (센서가 손가락을 기다리는 중이어도 화면은 바로 중단되고, 워커는 결과가 와도 덮어쓰지 않음)
+    if task.get("status") not in TERMINAL_STATES:
+        verification_tasks.update(task_id, stop_flag=True, status="canceled", message="사용자에 의해 중단되었습니다.")
     return {"message": "작업 중단 요청이 접수되었습니다."}
+
+# ======================================================================
+# ============ 센서 명령 중개자 상태 (대기열 길이, 대기 시간) =============
+# ======================================================================
+
+@app.get("/fingerprint/broker-stats")
+async def fingerprint_broker_stats():
+    return {**get_broker_stats(), "tasks": verification_tasks.stats()}
@@ -29,7 +29,7 @@ import uuid
 from pydantic import BaseModel
 from starlette.websockets import WebSocketDisconnect
 # # 아래 함수들은 Utility/Fingerprint/fp_factory.py 와 같은 모듈에 구현되어야 합니다.
-from Utility.Fingerprint import initialize_sensor, close_sensor_connection, get_sensor_connection, verify_fingerprint
+from Utility.Fingerprint import initialize_sensor, close_sensor_connection, averify_fingerprint
 # ======================================================================
 
 # 환경변수 불러오기
@@ -411,17 +411,14 @@ async def websocket_fingerprint_endpoint(websocket: WebSocket):
                 "attempts_left": attempts_left
             })
 
-            # 1. 현재 활성화된 시리얼(ser) 객체를 가져옵니다.
-            ser = get_sensor_connection()
-            if not ser:
+            # 1. 센서 연결 확인 및 지문 확인을 asyncio로 실행 (센서 응답이 도착할 때만 깨어남, 스레드 사용 안 함)
+            #    averify_fingerprint는 {"success": True/False, ...} 형태의 딕셔너리를 반환합니다.
+            result = await averify_fingerprint()
+            if result.get("error") == "SENSOR_NOT_CONNECTED":
                 logger.error("지문 센서 연결을 찾을 수 없습니다.")
                 # 센서 연결 실패 처리 로직 추가 (예: 에러 메시지 전송 후 종료)
                 await websocket.send_json({"status": "error", "message": "센서가 준비되지 않았습니다."})
                 break
-
-            # 2. 블로킹 함수인 verify_fingerprint를 비동기적으로 실행하여 서버 멈춤 방지
-            #    위에서 수정한 verify_fingerprint 함수는 이제 {"success": True/False, ...} 형태의 딕셔너리를 반환합니다.
-            result = await asyncio.to_thread(verify_fingerprint, ser)
             
 
             logger.info(f"지문 인증 시도 {attempt + 1}: 결과: {result}")